@@ -0,0 +1,141 @@
+"""Benchmark of the JSON decoding of the responses (see `mantis._requests.json_codec`).
+
+Decodes pages of issues (with the full `history` and notes) as `Response.json()`
+of requests does, with each codec installed (`json`, `orjson`, `msgspec`), without any request
+to a Mantis server. The objects building from the decoded page is measured too.
+
+Recorded responses (e.g: saved with `curl .../api/rest/issues?page_size=250`)
+can be used instead of the fake pages.
+
+Use:
+    python benchmarks/json_decoding.py [number of issues by page]
+    python benchmarks/json_decoding.py recorded_page.json [other_page.json ...]
+"""
+# autopep8: off
+import gc
+import json
+import sys
+import time
+from os import path
+
+from requests import Response
+
+project_path = path.join(path.abspath(__file__).rsplit(path.sep, 2)[0])
+sys.path.insert(0, project_path)
+
+from mantis.api.v1 import objects
+from mantis._requests import MantisRequests, get_json_codec
+# autopep8: on
+
+
+def history_payload(id_, index):
+    return {
+        'created_at': '2024-01-01T10:00:00+00:00',
+        'user': {'id': 1, 'name': 'administrator', 'real_name': 'Administrator'},
+        'field': {'name': 'status', 'label': 'Status'},
+        'type': {'name': 'field-updated'},
+        'old_value': {'id': 10, 'name': 'new', 'label': 'new'},
+        'new_value': {'id': 50, 'name': 'assigned', 'label': 'assigned'},
+        'message': f'Status of {id_} changed ({index})', 'change': 'new => assigned'
+    }
+
+
+def issue_payload(id_, history_size):
+    return {
+        'id': id_, 'summary': f'Issue {id_} é☃', 'description': 'description ' * 20,
+        'project': {'id': 1, 'name': 'Project'}, 'steps_to_reproduce': '',
+        'category': {'id': 1, 'name': 'General'},
+        'reporter': {'id': 1, 'name': 'administrator'},
+        'handler': {'id': 2, 'name': 'developer'},
+        'status': {'id': 10, 'name': 'new', 'label': 'new', 'color': '#fcbdbd'},
+        'resolution': {'id': 10, 'name': 'open', 'label': 'open'},
+        'view_state': {'id': 10, 'name': 'public', 'label': 'public'},
+        'priority': {'id': 30, 'name': 'normal', 'label': 'normal'},
+        'severity': {'id': 50, 'name': 'minor', 'label': 'minor'},
+        'reproducibility': {'id': 70, 'name': 'have not tried', 'label': 'have not tried'},
+        'sticky': False, 'created_at': '2024-01-01T10:00:00+00:00',
+        'updated_at': '2024-02-01T10:00:00+00:00',
+        'custom_fields': [{'field': {'id': 1, 'name': 'Version'}, 'value': '1.0'}],
+        'notes': [{'id': id_ * 10 + i, 'text': 'note ' * 30,
+                   'reporter': {'id': 1, 'name': 'administrator'},
+                   'view_state': {'id': 10, 'name': 'public'}, 'attachments': [],
+                   'type': 'note', 'created_at': '2024-01-01T10:00:00+00:00',
+                   'updated_at': '2024-01-01T10:00:00+00:00'} for i in range(3)],
+        'history': [history_payload(id_, i) for i in range(history_size)]
+    }
+
+
+def fake_pages(count):
+    page = {'issues': [issue_payload(id_, 40) for id_ in range(count)]}
+    # As sent by PHP `json_encode` (escaped slashes and unicode)
+    return [json.dumps(page).replace('/', '\\/').encode()]
+
+
+def requests_json(content):
+    # The default decoding: `Response.json()` of requests
+    response = Response()
+    response._content = content
+    response.headers['Content-Type'] = 'application/json'
+    return response.json()
+
+
+def measure(func, contents, repeat=7):
+    best = float('inf')
+    for _ in range(repeat):
+        # As `timeit`: the garbage collector doesn't run while timing
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            results = [func(content) for content in contents]
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+        del results
+
+    return best
+
+
+def report(name, elapsed, size, baseline=None):
+    speedup = f'{baseline / elapsed:5.2f}x' if baseline else '    -'
+    print(f'{name:<34} {elapsed * 1000:9.2f} ms  {size / elapsed / 2 ** 20:8.1f} MB/s  {speedup}')
+
+
+def main():
+    args = sys.argv[1:]
+    if args and not args[0].isdigit():
+        contents = []
+        for file_path in args:
+            with open(file_path, 'rb') as f:
+                contents.append(f.read())
+    else:
+        contents = fake_pages(int(args[0]) if args else 250)
+
+    size = sum(len(content) for content in contents)
+    print(f'pages={len(contents)} size={size / 2 ** 20:.2f} MB\n')
+
+    codecs = []
+    for name in ('json', 'orjson', 'msgspec'):
+        try:
+            codecs.append(get_json_codec(name))
+        except ImportError:
+            print(f'{name}: not installed')
+
+    baseline = measure(requests_json, contents)
+    report('Response.json() (requests)', baseline, size)
+
+    for codec in codecs:
+        report(f'{codec.name}: loads', measure(codec.loads, contents), size, baseline)
+
+    print()
+    for codec in codecs:
+        request = MantisRequests('http://localhost/api/rest', None, None, json_codec=codec)
+        manager = objects.IssueManager(request)
+
+        report(f'{codec.name}: decode + build objects', measure(
+            lambda content: manager._build_objs(codec.loads(content)),
+            contents), size, baseline)
+
+
+if '__main__' in __name__:
+    main()
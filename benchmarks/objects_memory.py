@@ -0,0 +1,147 @@
+"""Benchmark of the memory and construction time of the Mantis objects.
+
+Builds `IssueObj`, `NoteObj` and `ProjectObj` objects from fake (but realistic)
+payloads, without any request to a Mantis server, side by side with the objects
+of the original `ObjectBase` (attributes in a `__dict__`, see `DictObjectBase`).
+
+Use:
+    python benchmarks/objects_memory.py [number of objects]
+"""
+# autopep8: off
+import sys
+import time
+import tracemalloc
+from os import path
+
+project_path = path.join(path.abspath(__file__).rsplit(path.sep, 2)[0])
+sys.path.insert(0, project_path)
+
+from mantis.api.v1 import objects
+from mantis._requests import MantisRequests
+# autopep8: on
+
+
+def issue_payload(id_):
+    return {
+        'id': id_, 'summary': f'Issue {id_}', 'description': 'description',
+        'project': {'id': 1, 'name': 'Project'}, 'steps_to_reproduce': '',
+        'category': {'id': 1, 'name': 'General'},
+        'reporter': {'id': 1, 'name': 'administrator'},
+        'handler': {'id': 2, 'name': 'developer'},
+        'status': {'id': 10, 'name': 'new'},
+        'resolution': {'id': 10, 'name': 'open'},
+        'view_state': {'id': 10, 'name': 'public'},
+        'priority': {'id': 30, 'name': 'normal'},
+        'severity': {'id': 50, 'name': 'minor'},
+        'reproducibility': {'id': 70, 'name': 'have not tried'},
+        'platform': '', 'sticky': False,
+        'created_at': '2024-01-01T10:00:00+00:00',
+        'updated_at': '2024-02-01T10:00:00+00:00',
+        'custom_fields': [], 'history': []
+    }
+
+
+def note_payload(id_):
+    return {
+        'id': id_, 'text': f'Note {id_}',
+        'reporter': {'id': 1, 'name': 'administrator'},
+        'view_state': {'id': 10, 'name': 'public'}, 'attachments': [],
+        'type': 'note', 'created_at': '2024-01-01T10:00:00+00:00',
+        'updated_at': '2024-01-01T10:00:00+00:00'
+    }
+
+
+def project_payload(id_):
+    return {'id': id_, 'name': f'Project {id_}', 'enabled': True,
+            'status': {'id': 10, 'name': 'development'}}
+
+
+class DictObjectBase:
+    """The baseline: a copy of the original (dict based) `ObjectBase`, reduced
+        to the attributes storage and construction (the same of the objects
+        built before the `__slots__` layout).
+    """
+
+    _read_only_obj = False
+    _parent = None
+
+    def __init__(self, manager, attrs, _parent=None):
+        self.manager = manager
+        self._parent = _parent
+
+        for attr_name in self._get_all_attrs_definition():
+            self.__setitem__(attr_name, attrs.get(attr_name, None), True)
+
+    def __getitem__(self, item):
+        return self.__dict__[item]
+
+    def __setitem__(self, key, value, force=False):
+        if not force:
+            if self._read_only_obj:
+                raise AttributeError(f'Object {self.__class__.__name__} is read only')
+            if key in self.readonly_attr:
+                raise AttributeError(f'Attribute {key} is read only')
+
+        self.__dict__[key] = value
+
+    @property
+    def mandatory_attrs(self):
+        return self.manager._mandatory_attr
+
+    @property
+    def optional_attrs(self):
+        return self.manager._optional_attr
+
+    @property
+    def readonly_attr(self):
+        return self.manager._readonly_attr
+
+    def _get_all_attrs_definition(self):
+        return (list(self.mandatory_attrs)
+                + list(self.optional_attrs))
+
+
+def measure(obj_cls, manager, payloads):
+    tracemalloc.start()
+    objs = [obj_cls(manager, payload) for payload in payloads]
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objs
+
+    # Timing without tracemalloc overhead (the best of some runs)
+    elapsed = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        objs = [obj_cls(manager, payload) for payload in payloads]
+        elapsed = min(elapsed, time.perf_counter() - start)
+        del objs
+
+    count = len(payloads)
+    return memory / count, elapsed / count * 1e6
+
+
+def benchmark(manager, payload_func, count):
+    payloads = [payload_func(i) for i in range(count)]
+    name = manager._obj_cls.__name__
+
+    before = measure(type(name, (DictObjectBase, ), {}), manager, payloads)
+    after = measure(manager._obj_cls, manager, payloads)
+
+    print(f'{name:<10} {before[0]:10.1f} B {after[0]:10.1f} B {after[0] / before[0]:7.2f}x'
+          f'   {before[1]:8.2f} us {after[1]:8.2f} us {after[1] / before[1]:7.2f}x')
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    request = MantisRequests('http://localhost/api/rest', None, None)
+
+    print(f'objects={count}')
+    print(f'{"":<10} {"memory/object":^33}   {"construction/object":^33}')
+    print(f'{"":<10} {"before":>12} {"after":>12} {"ratio":>8}   {"before":>11} {"after":>11} {"ratio":>8}')
+    benchmark(objects.IssueManager(request), issue_payload, count)
+    benchmark(objects.NoteManager(request), note_payload, count)
+    benchmark(objects.ProjectManager(request), project_payload, count)
+
+
+if '__main__' in __name__:
+    main()
@@ -8,6 +8,12 @@ from mantis.__version import (
     __version__
 )
 from mantis.client import MantisBT
+from mantis.async_client import AsyncMantisBT
+from mantis.mirror import MantisMirror
+from mantis._requests import (
+    CircuitBreaker, DiskHTTPCache, MemoryHTTPCache, RateLimiter, RetryPolicy,
+    SingleFlight
+)
 from mantis.exceptions import *
 
 __all__ = [
@@ -17,6 +23,14 @@ __all__ = [
     '__license__',
     '__title__',
     '__version__',
-    'MantisBT'
+    'MantisBT',
+    'AsyncMantisBT',
+    'MantisMirror',
+    'CircuitBreaker',
+    'DiskHTTPCache',
+    'MemoryHTTPCache',
+    'RateLimiter',
+    'RetryPolicy',
+    'SingleFlight'
 ]
 __all__.extend(mantis.exceptions.__all__)
@@ -1,3 +1,15 @@
 from mantis._requests.mantis_requests import MantisRequests
+from mantis._requests.async_mantis_requests import AsyncMantisRequests
+from mantis._requests.circuit_breaker import CircuitBreaker
+from mantis._requests.http_cache import (
+    HTTPCache, HTTPCacheEntry, MemoryHTTPCache, DiskHTTPCache
+)
+from mantis._requests.json_codec import JSONCodec, get_json_codec
+from mantis._requests.rate_limit import RateLimiter
+from mantis._requests.retry import RetryPolicy, RetryStats
+from mantis._requests.single_flight import SingleFlight
 
-__all__ = ['MantisRequests']
+__all__ = ['MantisRequests', 'AsyncMantisRequests', 'CircuitBreaker',
+           'HTTPCache', 'HTTPCacheEntry', 'MemoryHTTPCache', 'DiskHTTPCache',
+           'JSONCodec', 'get_json_codec', 'RateLimiter', 'RetryPolicy',
+           'RetryStats', 'SingleFlight']
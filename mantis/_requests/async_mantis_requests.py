@@ -0,0 +1,247 @@
+"""This module provides the AsyncMantisRequests class for making HTTP requests
+        from asyncio applications without blocking the event loop.
+
+Classes:
+    AsyncMantisRequests: A class for making awaitable HTTP requests, using a
+        MantisRequests object executed in a bounded pool of connections.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Awaitable, Callable, Union
+
+from mantis import const
+from mantis._requests.mantis_requests import MantisRequests
+
+
+class AsyncMantisRequests:
+    """A class for making awaitable HTTP requests.
+
+    The requests are sent by a MantisRequests object (so, the same headers,
+    error handling and session are used) in a pool of worker threads. The event
+    loop is never blocked and the pool size bounds the number of connections
+    (and requests in flight) to the Mantis server.
+
+    With the `single_flight` of the MantisRequests object, the identical GET
+    requests of the tasks are coalesced before the pool (the waiting tasks don't
+    hold a worker), then with the requests of other threads.
+
+    Attributes:
+        requests (MantisRequests): The object used to send the HTTP requests.
+        max_connections (int): Maximum number of simultaneous connections.
+        _executor (ThreadPoolExecutor): The pool of workers to send the requests.
+        _flights (dict[tuple, asyncio.Task]): The coalesced GET requests in flight,
+                                                          by event loop and key.
+
+    Methods:
+        http_request(self, method: str, sufix_url_path: str,
+                params: Union[dict, None] = None, data: Union[dict, None] = None,
+                extra_headers: Union[dict, None] = None, **kwargs):
+            A generic (awaitable) method for making HTTP requests
+
+        http_get(self, sufix_path: str, params: Union[dict, None] = None,
+                                                                    **kwargs):
+            Make an (awaitable) HTTP GET request
+
+        http_post(self, sufix_path: str, params: Union[dict, None] = None,
+                                     data: Union[dict, None] = None, **kwargs):
+            Makes an (awaitable) HTTP POST request
+
+        close(self):
+            Release the pool of workers and connections
+    """
+
+    def __init__(
+        self,
+        requests: MantisRequests,
+        max_connections: int = const.ASYNC_DEFAULT_MAX_CONNECTIONS
+    ) -> None:
+        """Initializes the AsyncMantisRequests instance
+
+        Args:
+            requests (MantisRequests): The object used to send the HTTP requests.
+                Its `pool_maxsize` must be at least `max_connections`, otherwise
+                the connections are discarded (and opened again) after each request.
+            max_connections (int, optional): Maximum number of simultaneous
+                connections. Defaults to const.ASYNC_DEFAULT_MAX_CONNECTIONS.
+        """
+        self.requests = requests
+        self.max_connections = max_connections
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_connections,
+            thread_name_prefix='mantis-async-requests'
+        )
+        self._flights: dict[tuple, asyncio.Task] = {}
+
+    async def _run(self, func, *args, **kwargs) -> Any:
+        """Run a blocking function in the pool of workers.
+
+        Args:
+            func (Callable): The blocking function to run
+
+        Returns:
+            Any: The function result
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(func, *args, **kwargs))
+
+    async def _coalesce(self, key: tuple, request: Callable[[], Awaitable]) -> Any:
+        """Await a request, shared with the identical requests in flight (of the
+            same event loop).
+
+        Args:
+            key (tuple): The key of the request (see `MantisRequests.get_flight_key`)
+            request (Callable[[], Awaitable]): The request to be awaited
+
+        Returns:
+            Any: The (shared) result of the request
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+
+        task = self._flights.get(flight_key)
+        if task is None:
+            task = self._flights[flight_key] = loop.create_task(request())
+            task.add_done_callback(partial(self._end_flight, flight_key))
+        else:
+            self.requests.single_flight.add_deduplicated()
+
+        # Shielded: a cancelled task doesn't cancel the request of the others
+        return await asyncio.shield(task)
+
+    def _end_flight(self, flight_key: tuple, task: asyncio.Task) -> None:
+        """Remove a request ended from the requests in flight."""
+        self._flights.pop(flight_key, None)
+        # Retrieved, even if all awaiting tasks were cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def http_request(
+            self,
+            method: str,
+            sufix_url_path: str,
+            params: Union[dict, None] = None,
+            data: Union[dict, None] = None,
+            extra_headers: Union[dict, None] = None,
+            **kwargs
+    ) -> dict[Any]:
+        """A generic (awaitable) method for making HTTP requests.
+
+        Args:
+            method (str): The HTTP method name to use for the request.
+            sufix_url_path (str): The URL path to append to the base URL.
+            params (Union[dict, None], optional): Parameters to include in the
+                request. Defaults to None.
+            data (Union[dict, None], optional): Data to include in the request.
+                Defaults to None.
+            extra_headers (Union[dict, None], optional): Extra headers to include
+                in the request. Defaults to None.
+            **kwargs: Additional keyword arguments to pass to the request.
+
+        Returns:
+            dict[Any]: The JSON response from the HTTP request.
+        """
+        request = partial(
+            self._run, self.requests.http_request, method, sufix_url_path,
+            params=params, data=data, extra_headers=extra_headers, **kwargs)
+
+        flight_key = self.requests.get_flight_key(
+            method, sufix_url_path, params, data, extra_headers, **kwargs)
+        if flight_key is None:
+            return await request()
+
+        return await self._coalesce(flight_key, request)
+
+    async def http_get(
+            self,
+            sufix_path: str,
+            params: Union[dict, None] = None,
+            **kwargs
+    ) -> dict[Any]:
+        """Make an (awaitable) HTTP GET request.
+
+        Args:
+            sufix_path (str): The URL path to append to the base URL.
+            params (Union[dict, None], optional): Parameters to include in the
+                request. Defaults to None.
+            **kwargs: Additional keyword arguments to pass to the request.
+
+        Returns:
+            dict[Any]: The JSON response from the HTTP request.
+        """
+        return await self.http_request(
+            const.HTTP_METHOD_GET, sufix_path, params=params, **kwargs)
+
+    async def http_post(
+            self,
+            sufix_path: str,
+            params: Union[dict, None] = None,
+            data: Union[dict, None] = None,
+            **kwargs
+    ) -> dict[Any]:
+        """Makes an (awaitable) HTTP POST request.
+
+        Args:
+            sufix_path (str): The URL path to append to the base URL.
+            params (Union[dict, None], optional): Parameters to include in the
+                request. Defaults to None.
+            data (Union[dict, None], optional): Data to include in the request.
+                Defaults to None.
+            **kwargs: Additional keyword arguments to pass to the request.
+
+        Returns:
+            dict[Any]: The JSON response from the HTTP request.
+        """
+        return await self._run(
+            self.requests.http_post, sufix_path, params=params, data=data,
+            **kwargs)
+
+    async def http_patch(
+            self,
+            sufix_path: str,
+            data: dict,
+            params: Union[dict, None] = None,
+            **kwargs
+    ) -> dict[Any]:
+        """Makes an (awaitable) HTTP PATCH request, with a JSON body.
+
+        Args:
+            sufix_path (str): The URL path to append to the base URL.
+            data (dict): The attributes to be updated (encoded as JSON).
+            params (Union[dict, None], optional): Parameters to include in the
+                request. Defaults to None.
+            **kwargs: Additional keyword arguments to pass to the request.
+
+        Returns:
+            dict[Any]: The JSON response from the HTTP request.
+        """
+        return await self._run(
+            self.requests.http_patch, sufix_path, data, params=params, **kwargs)
+
+    async def http_delete(
+            self,
+            sufix_path: str,
+            params: Union[dict, None] = None,
+            **kwargs
+    ) -> Union[dict[Any], None]:
+        """Makes an (awaitable) HTTP DELETE request.
+
+        Args:
+            sufix_path (str): The URL path to append to the base URL.
+            params (Union[dict, None], optional): Parameters to include in the
+                request. Defaults to None.
+            **kwargs: Additional keyword arguments to pass to the request.
+
+        Returns:
+            Union[dict[Any], None]: The JSON response from the HTTP request (None if empty).
+        """
+        return await self._run(
+            self.requests.http_delete, sufix_path, params=params, **kwargs)
+
+    async def close(self) -> None:
+        """Release the pool of workers and the HTTP connections."""
+        await self._run(self.requests.close)
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,121 @@
+"""This module provides the circuit breaker of the HTTP requests.
+
+Classes:
+    CircuitBreaker: Fails fast (without sending requests) while the Mantis
+        server is failing, probing it again after a interval.
+"""
+
+from threading import Lock
+from time import monotonic
+
+from mantis import const
+from mantis.exceptions import MantisCircuitOpenError
+
+
+__all__ = ['CircuitBreaker']
+
+
+class CircuitBreaker:
+    """Fails fast (without sending requests) while the Mantis server is failing.
+
+    States:
+        closed: The requests are sent. After `failure_threshold` consecutive
+            failures (connection errors, timeouts or 5xx responses, after the
+            retries: a request retried counts once), the circuit is opened.
+        open: The requests fail immediately with `MantisCircuitOpenError`.
+            After `open_interval` seconds, the circuit is half-opened.
+        half_open: Only `half_open_max_calls` requests (probes) are sent, the
+            others fail immediately. A successful probe closes the circuit, a
+            failed probe opens it again.
+
+    Attributes:
+        failure_threshold (int): Consecutive failures to open the circuit.
+        open_interval (float): Time (in seconds) before probing the server again.
+        half_open_max_calls (int): Number of probe requests in half open state.
+        state (str): The current state (closed, open or half_open).
+        failures (int): Number of consecutive failures.
+        rejected (int): Number of requests that failed fast (circuit open).
+    """
+
+    STATE_CLOSED = 'closed'
+    STATE_OPEN = 'open'
+    STATE_HALF_OPEN = 'half_open'
+
+    def __init__(
+        self,
+        failure_threshold: int = const.CIRCUIT_BREAKER_DEFAULT_FAILURE_THRESHOLD,
+        open_interval: float = const.CIRCUIT_BREAKER_DEFAULT_OPEN_INTERVAL,
+        half_open_max_calls: int = 1
+    ) -> None:
+        """Initializes the CircuitBreaker instance
+
+        Args:
+            failure_threshold (int, optional): Consecutive failures to open the
+                circuit. Defaults to const.CIRCUIT_BREAKER_DEFAULT_FAILURE_THRESHOLD.
+            open_interval (float, optional): Time (in seconds) before probing the
+                server again. Defaults to const.CIRCUIT_BREAKER_DEFAULT_OPEN_INTERVAL.
+            half_open_max_calls (int, optional): Number of probe requests in
+                                                 half open state. Defaults to 1.
+        """
+        self.failure_threshold = failure_threshold
+        self.open_interval = open_interval
+        self.half_open_max_calls = half_open_max_calls
+
+        self.state = self.STATE_CLOSED
+        self.failures = 0
+        self.rejected = 0
+
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._lock = Lock()
+
+    def before_request(self) -> None:
+        """Check if a request can be sent (must be called before each request).
+
+        Raises:
+            MantisCircuitOpenError: Raised while the circuit is open (or half
+                                           open, with all probes in flight).
+        """
+        with self._lock:
+            if self.state == self.STATE_OPEN:
+                remaining = self._opened_at + self.open_interval - monotonic()
+                if remaining > 0:
+                    self.rejected += 1
+                    raise MantisCircuitOpenError(self.failures, remaining)
+
+                self.state = self.STATE_HALF_OPEN
+                self._half_open_calls = 0
+
+            if self.state == self.STATE_HALF_OPEN:
+                if self._half_open_calls >= self.half_open_max_calls:
+                    self.rejected += 1
+                    raise MantisCircuitOpenError(self.failures, 0)
+
+                self._half_open_calls += 1
+
+    def record_success(self) -> None:
+        """Record a successful request (closes the circuit)."""
+        with self._lock:
+            self.state = self.STATE_CLOSED
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        """Record a failed request (may open the circuit)."""
+        with self._lock:
+            self.failures += 1
+            if (self.state == self.STATE_HALF_OPEN
+                    or self.failures >= self.failure_threshold):
+                self.state = self.STATE_OPEN
+                self._opened_at = monotonic()
+
+    def reset(self) -> None:
+        """Close the circuit and reset the counters."""
+        with self._lock:
+            self.state = self.STATE_CLOSED
+            self.failures = 0
+            self.rejected = 0
+
+    def __repr__(self) -> str:
+        """Return string representation of the circuit breaker."""
+        return (f'CircuitBreaker(state={self.state}, failures={self.failures}, '
+                f'rejected={self.rejected})')
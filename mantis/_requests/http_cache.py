@@ -0,0 +1,322 @@
+"""This module provides the HTTP response cache of the GET requests, revalidated
+        with conditional requests (`If-None-Match`/`If-Modified-Since`).
+
+Classes:
+    HTTPCacheEntry: A cached response (parsed payload + validators).
+    HTTPCache: The base class of the cache backends.
+    MemoryHTTPCache: A in-memory cache backend (LRU, limited by entries/size).
+    DiskHTTPCache: A on-disk cache backend (limited by size).
+"""
+
+import json
+import os
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from hashlib import sha256
+from threading import Lock
+from typing import Any, Union
+
+from mantis import const
+
+
+__all__ = ['HTTPCacheEntry', 'HTTPCache', 'MemoryHTTPCache', 'DiskHTTPCache']
+
+
+class HTTPCacheEntry:
+    """A cached response (parsed payload + validators).
+
+    Attributes:
+        body (Any): The parsed (JSON) payload of the response.
+        etag (Union[str, None]): The `ETag` header of the response.
+        last_modified (Union[str, None]): The `Last-Modified` header of the response.
+        size (int): The size (in bytes) of the response body.
+    """
+
+    __slots__ = ('body', 'etag', 'last_modified', 'size')
+
+    def __init__(
+        self,
+        body: Any,
+        etag: Union[str, None] = None,
+        last_modified: Union[str, None] = None,
+        size: int = 0
+    ) -> None:
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.size = size
+
+    def get_validation_headers(self) -> dict[str, str]:
+        """Get the headers of a conditional request to revalidate this entry.
+
+        Returns:
+            dict[str, str]: The `If-None-Match`/`If-Modified-Since` headers.
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+
+        return headers
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the entry."""
+        return {attr: getattr(self, attr) for attr in self.__slots__}
+
+
+class HTTPCache(ABC):
+    """The base class of the cache backends.
+
+    The cached payloads are shared by all requests with the same key, so they
+    must not be changed by the caller.
+
+    Attributes:
+        hits (int): Number of responses revalidated by the server (304).
+        misses (int): Number of responses downloaded (not cached or changed).
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+
+    @staticmethod
+    def build_key(url: str, auth: Union[str, None] = None) -> str:
+        """Build the cache key of a request.
+
+        The authentication is part of the key, because each user can see
+        different data.
+
+        Args:
+            url (str): The full URL (including the params) of the request.
+            auth (Union[str, None], optional): The authentication token of the
+                                                     request. Defaults to None.
+
+        Returns:
+            str: The cache key.
+        """
+        return sha256(f'{auth}|{url}'.encode()).hexdigest()
+
+    @abstractmethod
+    def get(self, key: str) -> Union[HTTPCacheEntry, None]:
+        """Get a entry of the cache.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Union[HTTPCacheEntry, None]: The entry or None.
+        """
+
+    @abstractmethod
+    def set(self, key: str, entry: HTTPCacheEntry) -> None:
+        """Add (or replace) a entry of the cache.
+
+        Args:
+            key (str): The cache key.
+            entry (HTTPCacheEntry): The entry to be cached.
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove a entry of the cache (if exists).
+
+        Args:
+            key (str): The cache key.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries of the cache."""
+
+    def add_hit(self) -> None:
+        """Count a response revalidated by the server."""
+        with self._lock:
+            self.hits += 1
+
+    def add_miss(self) -> None:
+        """Count a response downloaded."""
+        with self._lock:
+            self.misses += 1
+
+    def __repr__(self) -> str:
+        """Return string representation of the cache."""
+        return f'{self.__class__.__name__}(hits={self.hits}, misses={self.misses})'
+
+
+class MemoryHTTPCache(HTTPCache):
+    """A in-memory cache backend. The least recently used entries are evicted
+        when the limits (number of entries or total size) are reached.
+
+    Attributes:
+        max_entries (int): Maximum number of entries.
+        max_size (int): Maximum total size (in bytes) of the responses.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = const.HTTP_CACHE_DEFAULT_MAX_ENTRIES,
+        max_size: int = const.HTTP_CACHE_DEFAULT_MAX_SIZE
+    ) -> None:
+        """Initializes the MemoryHTTPCache instance
+
+        Args:
+            max_entries (int, optional): Maximum number of entries.
+                                  Defaults to const.HTTP_CACHE_DEFAULT_MAX_ENTRIES.
+            max_size (int, optional): Maximum total size (in bytes) of the
+                         responses. Defaults to const.HTTP_CACHE_DEFAULT_MAX_SIZE.
+        """
+        super().__init__()
+        self.max_entries = max_entries
+        self.max_size = max_size
+
+        self._entries: OrderedDict[str, HTTPCacheEntry] = OrderedDict()
+        self._size = 0
+
+    def get(self, key: str) -> Union[HTTPCacheEntry, None]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+            return entry
+
+    def set(self, key: str, entry: HTTPCacheEntry) -> None:
+        if entry.size > self.max_size:
+            return
+
+        with self._lock:
+            old_entry = self._entries.pop(key, None)
+            if old_entry is not None:
+                self._size -= old_entry.size
+
+            self._entries[key] = entry
+            self._size += entry.size
+
+            while (len(self._entries) > self.max_entries
+                   or self._size > self.max_size):
+                _, old_entry = self._entries.popitem(last=False)
+                self._size -= old_entry.size
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._size -= entry.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        """Get number of entries of the cache."""
+        return len(self._entries)
+
+
+class DiskHTTPCache(HTTPCache):
+    """A on-disk cache backend (one JSON file by entry). The least recently used
+        entries are removed when the total size limit is reached.
+
+    The directory can be shared by many processes (e.g: workers of a dashboard).
+
+    Attributes:
+        directory (str): The directory of the cache files.
+        max_size (int): Maximum total size (in bytes) of the cache files.
+    """
+
+    _file_suffix = '.json'
+
+    def __init__(
+        self,
+        directory: str,
+        max_size: int = const.HTTP_CACHE_DEFAULT_MAX_SIZE
+    ) -> None:
+        """Initializes the DiskHTTPCache instance
+
+        Args:
+            directory (str): The directory of the cache files (created if needed).
+            max_size (int, optional): Maximum total size (in bytes) of the cache
+                             files. Defaults to const.HTTP_CACHE_DEFAULT_MAX_SIZE.
+        """
+        super().__init__()
+        self.directory = directory
+        self.max_size = max_size
+
+        os.makedirs(directory, exist_ok=True)
+
+    def _get_path(self, key: str) -> str:
+        """Get the path of the file of a entry."""
+        return os.path.join(self.directory, f'{key}{self._file_suffix}')
+
+    def get(self, key: str) -> Union[HTTPCacheEntry, None]:
+        path = self._get_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = HTTPCacheEntry(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+        # The modification time is the last use (for the eviction)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return entry
+
+    def set(self, key: str, entry: HTTPCacheEntry) -> None:
+        if entry.size > self.max_size:
+            return
+
+        path = self._get_path(key)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry.to_dict(), f)
+            # Atomic: other processes never read a partial file
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently used files while the size limit is exceeded."""
+        files = []
+        total_size = 0
+        with os.scandir(self.directory) as it:
+            for dir_entry in it:
+                if not dir_entry.name.endswith(self._file_suffix):
+                    continue
+                try:
+                    stat = dir_entry.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, dir_entry.path))
+                total_size += stat.st_size
+
+        for _, size, path in sorted(files):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._get_path(key))
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        with os.scandir(self.directory) as it:
+            for dir_entry in it:
+                if dir_entry.name.endswith(self._file_suffix):
+                    try:
+                        os.remove(dir_entry.path)
+                    except OSError:
+                        pass
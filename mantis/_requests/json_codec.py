@@ -0,0 +1,182 @@
+"""This module provides the JSON codecs of the request bodies and responses.
+
+The responses are decoded directly from the bytes received (without the text
+decoding of `Response.json()`). The default codec is the standard library
+`json`; faster decoders are used when installed and selected (`orjson`, with
+`pip install python-mantis[fast-json]`, or `msgspec`), they decode the bytes
+without a intermediate text copy.
+
+Classes:
+    JSONCodec: The base class of the codecs.
+    StdlibJSONCodec: The codec of the standard library (`json`), the default.
+    OrjsonCodec: The codec of the `orjson` package.
+    MsgspecCodec: The codec of the `msgspec` package.
+
+Functions:
+    get_json_codec: Get a codec by name (or the fastest installed).
+"""
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Union
+
+
+__all__ = ['JSONCodec', 'StdlibJSONCodec', 'OrjsonCodec', 'MsgspecCodec',
+           'get_json_codec']
+
+
+class JSONCodec(ABC):
+    """The base class of the codecs.
+
+    Attributes:
+        name (str): The name of the codec (see `get_json_codec`).
+    """
+
+    name = ''
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode a JSON document.
+
+        Args:
+            data (Union[bytes, str]): The document (UTF-8 bytes, e.g: the body of a response).
+
+        Raises:
+            ValueError: If the document isn't valid JSON.
+
+        Returns:
+            Any: The decoded value.
+        """
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> Union[bytes, str]:
+        """Encode a value as a (compact) JSON document.
+
+        Args:
+            obj (Any): The value to be encoded.
+
+        Returns:
+            Union[bytes, str]: The document (bytes or text, both can be sent as a request body).
+        """
+
+    def __repr__(self) -> str:
+        """Return string representation of the codec."""
+        return f'{self.__class__.__name__}()'
+
+
+class StdlibJSONCodec(JSONCodec):
+    """The codec of the standard library (`json`), the default."""
+
+    name = 'json'
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        # The bytes are decoded to text by `json` (no encoding detection of requests)
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj, separators=(',', ':'))
+
+
+class OrjsonCodec(JSONCodec):
+    """The codec of the `orjson` package (`pip install python-mantis[fast-json]`).
+
+    The bytes are decoded without a intermediate text copy.
+    """
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        """Initializes the OrjsonCodec instance
+
+        Raises:
+            ImportError: If the package `orjson` isn't installed.
+        """
+        self._orjson = _import_codec_package('orjson')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> Union[bytes, str]:
+        try:
+            return self._orjson.dumps(obj, option=self._orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # E.g: a integer out of the 64-bit range
+            return json.dumps(obj, separators=(',', ':'))
+
+
+class MsgspecCodec(JSONCodec):
+    """The codec of the `msgspec` package.
+
+    The bytes are decoded without a intermediate text copy.
+    """
+
+    name = 'msgspec'
+
+    def __init__(self) -> None:
+        """Initializes the MsgspecCodec instance
+
+        Raises:
+            ImportError: If the package `msgspec` isn't installed.
+        """
+        msgspec = _import_codec_package('msgspec')
+        self._decoder = msgspec.json.Decoder()
+        self._decode_error = msgspec.DecodeError
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as e:
+            # The same error of the other codecs
+            raise ValueError(str(e)) from e
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+
+# By speed, the first installed is used by `get_json_codec('auto')`
+_CODECS = {codec.name: codec for codec in (OrjsonCodec, MsgspecCodec, StdlibJSONCodec)}
+
+
+def _import_codec_package(name: str) -> Any:
+    try:
+        return __import__(name)
+    except ImportError as e:
+        raise ImportError(
+            f'The package `{name}` is required to use the {name!r} JSON codec '
+            '(pip install python-mantis[fast-json])') from e
+
+
+def get_json_codec(codec: Union[str, JSONCodec, None] = None) -> JSONCodec:
+    """Get a codec by name (or the fastest installed).
+
+    Args:
+        codec (Union[str, JSONCodec, None], optional): The name of the codec (`json`, `orjson`,
+                  `msgspec` or `auto`, the fastest installed), a codec object (returned as is)
+                  or None (the standard library). Defaults to None.
+
+    Raises:
+        ValueError: If the name is unknown.
+        ImportError: If the package of the codec isn't installed.
+
+    Returns:
+        JSONCodec: The codec.
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec is None:
+        return StdlibJSONCodec()
+
+    if codec == 'auto':
+        for codec_cls in _CODECS.values():
+            try:
+                return codec_cls()
+            except ImportError:
+                continue
+
+    if codec not in _CODECS:
+        raise ValueError(
+            f'Unknown JSON codec {codec!r}, use one of: {", ".join(_CODECS)} or auto')
+
+    return _CODECS[codec]()
+
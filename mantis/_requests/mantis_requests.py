@@ -12,21 +12,33 @@ Raises:
     MantisConnectionTimeout: Raised when a connection times out.
     MantisConnectionError: Raised for connection errors.
     MantisReadTimeout: Raised when a read operation times out.
+    MantisCircuitOpenError: Raised while the circuit breaker is open.
 """
 
 from copy import deepcopy
-from json import dumps as json_dumps
+from functools import partial
 from sys import version_info
+from threading import Lock, local
+from time import sleep
+from weakref import WeakSet
 from typing import Union, Any
 
-from requests import Session, Request, Response
+from requests import Session, Request, Response, PreparedRequest
+from requests.adapters import BaseAdapter, HTTPAdapter
 from requests.exceptions import ConnectionError, ConnectTimeout, ReadTimeout
 
 from mantis import const, __title__
 from mantis.exceptions import (
     MantisConnectionError, MantisConnectionTimeout, MantisReadTimeout,
-    MantisHTTPReponseClientError, MantisHTTPReponseServerError, MantisHTTPError
+    MantisHTTPReponseClientError, MantisHTTPReponseServerError, MantisHTTPError,
+    MantisHTTPConnError
 )
+from mantis._requests.circuit_breaker import CircuitBreaker
+from mantis._requests.http_cache import HTTPCache, HTTPCacheEntry
+from mantis._requests.json_codec import JSONCodec, get_json_codec
+from mantis._requests.rate_limit import RateLimiter
+from mantis._requests.retry import RetryPolicy, RetryStats
+from mantis._requests.single_flight import SingleFlight
 
 
 class MantisRequests:
@@ -38,11 +50,37 @@ class MantisRequests:
         auth (str): The authentication token for the HTTP requests.
         timeout (Union[float, int]): The timeout duration for the HTTP requests.
         http_header (dict): The default HTTP headers for the requests.
-        _session (Session): The session object for managing HTTP connections.
+        transport (BaseAdapter): The transport adapter mounted for HTTP and HTTPS URLs
+                       (shared by all sessions, so the connections are reused).
+        session_per_thread (bool): If True, each thread uses its own session.
+        retry_policy (RetryPolicy): When and how long to wait before retrying a
+                                           failed request (None means no retries).
+        retry_stats (RetryStats): Counters of the attempts and retries made.
+        rate_limiter (RateLimiter): Limit of requests per second and in flight
+                                                       (None means no limit).
+        circuit_breaker (CircuitBreaker): Fails fast while the server is failing
+                                                         (None means disabled).
+        http_cache (HTTPCache): The cache of the GET responses, revalidated with
+                           conditional requests (None means disabled).
+        single_flight (SingleFlight): Coalesces the identical GET requests in flight,
+                    sharing one response (None means disabled).
+        json_codec (JSONCodec): The codec of the request bodies and responses.
+        _session (Session): The session object for managing HTTP connections
+                                       (of the current thread, if session_per_thread).
 
     Methods:
-        __init__(self, base_url: str, auth: str, timeout: Union[float, int]) -> None:
-            Initializes the MantisRequests instance with base URL, authentication, and timeout.
+        __init__(self, base_url: str, auth: str, timeout: Union[float, int],
+                 pool_connections: int = 10, pool_maxsize: int = 10,
+                 max_retries: int = 0, transport: Union[BaseAdapter, None] = None,
+                 session_per_thread: bool = False,
+                 retry_policy: Union[RetryPolicy, None] = None,
+                 rate_limiter: Union[RateLimiter, None] = None,
+                 circuit_breaker: Union[CircuitBreaker, None] = None,
+                 http_cache: Union[HTTPCache, None] = None,
+                 single_flight: Union[SingleFlight, None] = None,
+                 json_codec: Union[str, JSONCodec, None] = None) -> None:
+            Initializes the MantisRequests instance with base URL, authentication, timeout
+                                                                and transport options.
 
         get_http_header(self) -> dict[Any]:
             Returns the default HTTP headers for requests.
@@ -55,6 +93,11 @@ class MantisRequests:
                 extra_headers: Union[dict, None] = None, **kwargs):
             A generic method for making HTTP requests
 
+        get_flight_key(self, method: str, sufix_url_path: str, params: Union[dict, None] = None,
+                data: Union[dict, None] = None, extra_headers: Union[dict, None] = None,
+                stream: bool = False, **kwargs):
+            Get the key of a request to be coalesced with the identical requests in flight
+
         http_get(self, sufix_path: str, params: Union[dict, None] = None,
                                                                     **kwargs):
             Make an HTTP GET request
@@ -62,13 +105,35 @@ class MantisRequests:
         http_post(self, sufix_path: str, params: Union[dict, None] = None,
                                      data: Union[dict, None] = None, **kwargs):
             Makes an HTTP POST request
+
+        http_patch(self, sufix_path: str, data: dict, params: Union[dict, None] = None,
+                                                                    **kwargs):
+            Makes an HTTP PATCH request (JSON body)
+
+        http_delete(self, sufix_path: str, params: Union[dict, None] = None,
+                                                                    **kwargs):
+            Makes an HTTP DELETE request
+
+        close(self):
+            Closes all sessions and the connections of the transport adapter
     """
 
     def __init__(
         self,
         base_url: str,
         auth: str,
-        timeout: Union[float, int]
+        timeout: Union[float, int],
+        pool_connections: int = const.HTTP_DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = const.HTTP_DEFAULT_POOL_MAXSIZE,
+        max_retries: int = const.HTTP_DEFAULT_MAX_RETRIES,
+        transport: Union[BaseAdapter, None] = None,
+        session_per_thread: bool = False,
+        retry_policy: Union[RetryPolicy, None] = None,
+        rate_limiter: Union[RateLimiter, None] = None,
+        circuit_breaker: Union[CircuitBreaker, None] = None,
+        http_cache: Union[HTTPCache, None] = None,
+        single_flight: Union[SingleFlight, None] = None,
+        json_codec: Union[str, JSONCodec, None] = None
     ) -> None:
         """Initializes the MantisRequests instance
 
@@ -78,6 +143,37 @@ class MantisRequests:
                                               in headers `Authorization` field).
             timeout (Union[float, int]): Timeout duration for the HTTP requests
                                                        (in seconds). (optional)
+            pool_connections (int, optional): Number of connection pools (hosts)
+                      to cache. Defaults to const.HTTP_DEFAULT_POOL_CONNECTIONS.
+            pool_maxsize (int, optional): Maximum number of connections kept
+                   alive per host. Use at least the number of threads sending
+                   requests. Defaults to const.HTTP_DEFAULT_POOL_MAXSIZE.
+            max_retries (int, optional): Number of retries of each connection
+                (failed DNS lookups, socket connections and connection timeouts).
+                Defaults to const.HTTP_DEFAULT_MAX_RETRIES.
+            transport (Union[BaseAdapter, None], optional): A custom transport
+                adapter (ignores the pool and retries options). Defaults to None.
+            session_per_thread (bool, optional): If True, each thread uses its own
+                session (the transport adapter and its connections are shared).
+                Defaults to False.
+            retry_policy (Union[RetryPolicy, None], optional): When and how long
+                to wait before retrying a failed request. Defaults to None (no
+                retries).
+            rate_limiter (Union[RateLimiter, None], optional): Limit of requests
+                per second and in flight, applied to each attempt. Defaults to
+                None (no limit).
+            circuit_breaker (Union[CircuitBreaker, None], optional): Fails fast
+                while the server is failing. Defaults to None (disabled).
+            http_cache (Union[HTTPCache, None], optional): The cache of the GET
+                responses, revalidated with conditional requests. Defaults to
+                None (disabled).
+            single_flight (Union[SingleFlight, None], optional): Coalesces the
+                identical GET requests in flight (across threads and asyncio
+                tasks), sharing one response. Defaults to None (disabled).
+            json_codec (Union[str, JSONCodec, None], optional): The codec of the
+                request bodies and responses, a codec object or its name (`json`,
+                `orjson`, `msgspec` or `auto`, see `get_json_codec`). Defaults to
+                None (the standard library `json`).
         """
         self.base_url = base_url
         self.auth = auth
@@ -85,7 +181,69 @@ class MantisRequests:
 
         self.http_header = self.get_http_header()
 
-        self._session = Session()
+        if transport is None:
+            transport = HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                max_retries=max_retries
+            )
+        self.transport = transport
+        self.session_per_thread = session_per_thread
+
+        self.retry_policy = retry_policy
+        self.retry_stats = RetryStats()
+
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.http_cache = http_cache
+        self.single_flight = single_flight
+        self.json_codec = get_json_codec(json_codec)
+
+        # Weak references: the sessions of finished threads are discarded
+        self._sessions: WeakSet[Session] = WeakSet()
+        self._sessions_lock = Lock()
+        self._thread_local = local()
+        self._shared_session = None
+
+        if not session_per_thread:
+            self._shared_session = self._create_session()
+
+    def _create_session(self) -> Session:
+        """Create a new session, with the transport adapter mounted.
+
+        Returns:
+            Session: The new session object.
+        """
+        session = Session()
+        for prefix in ('http://', 'https://'):
+            session.mount(prefix, self.transport)
+
+        with self._sessions_lock:
+            self._sessions.add(session)
+
+        return session
+
+    @property
+    def _session(self) -> Session:
+        """The session object (of the current thread, if session_per_thread)."""
+        if self._shared_session is not None:
+            return self._shared_session
+
+        session = getattr(self._thread_local, 'session', None)
+        if session is None:
+            session = self._thread_local.session = self._create_session()
+
+        return session
+
+    def close(self) -> None:
+        """Closes all sessions and the connections of the transport adapter."""
+        with self._sessions_lock:
+            sessions, self._sessions = list(self._sessions), WeakSet()
+
+        for session in sessions:
+            session.close()
+
+        self.transport.close()
 
     def _get_user_agent(self) -> str:
         """Returns the user agent string for the HTTP requests. (Including 
@@ -133,16 +291,16 @@ class MantisRequests:
         return f'{self.base_url}/{sufix_url_path}'
 
     # TODO: Review: any other validation/manipulation needed for data?
-    def _prepare_data(self, data: dict[Any]) -> str:
+    def _prepare_data(self, data: dict[Any]) -> Union[bytes, str]:
         """Prepare the data  for the HTTP requests.
 
         Args:
             data (dict[Any]): The data to be sent in the request.
 
         Returns:
-            str: The JSON string representation of the data.
+            Union[bytes, str]: The JSON representation of the data (see `json_codec`).
         """
-        return json_dumps(data)
+        return self.json_codec.dumps(data)
 
     def _get_header_for_request(
         self,
@@ -194,6 +352,191 @@ class MantisRequests:
         else:
             raise MantisHTTPError(response, self, e)
 
+    def _send(self, preparred_request: PreparedRequest, stream: bool = False) -> Response:
+        """Send a prepared request (a single attempt), respecting the rate limiter.
+
+        Args:
+            preparred_request (PreparedRequest): The request to be sent.
+            stream (bool, optional): If True, the body of the response isn't read. Defaults to False.
+
+        Raises:
+            MantisConnectionTimeout: Raised when a connection with Mantis API
+                                                                     times out.
+            MantisConnectionError: Raised for connection errors with Mantis API.
+            MantisReadTimeout: Raised when a read operation with Mantis API 
+                                                                      times out.
+
+        Returns:
+            Response: The response of the request.
+        """
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
+        try:
+            return self._session.send(preparred_request, timeout=self.timeout,
+                                      stream=stream)
+        except ConnectTimeout as e:
+            raise MantisConnectionTimeout(preparred_request, self, e)
+        except ConnectionError as e:
+            raise MantisConnectionError(preparred_request, self, e)
+        except ReadTimeout as e:
+            raise MantisReadTimeout(preparred_request, self, e)
+        finally:
+            if self.rate_limiter:
+                self.rate_limiter.release()
+
+    def _is_server_error(self, response: Response) -> bool:
+        """Check if a response is a HTTP server error (5xx).
+
+        Args:
+            response (Response): The response object from the HTTP request.
+
+        Returns:
+            bool: True if is a server error, False otherwise
+        """
+        return (const.HTTP_MIN_SERVER_ERROR_STATUS_CODE
+                <= response.status_code
+                <= const.HTTP_MAX_SERVER_ERROR_STATUS_CODE)
+
+    def _send_with_retry(
+        self,
+        preparred_request: PreparedRequest,
+        stream: bool = False
+    ) -> Response:
+        """Send a prepared request, retrying it according to the retry policy.
+
+        The circuit breaker is checked once, before the first attempt, and the
+        outcome of the last attempt is recorded once (a request retried is one
+        success or failure), so the error raised is always the real one. Any
+        other exception of the transport is recorded as a failure too.
+
+        Args:
+            preparred_request (PreparedRequest): The request to be sent.
+            stream (bool, optional): If True, the body of the response isn't read. Defaults to False.
+
+        Raises:
+            MantisHTTPConnError: Raised for connection errors with Mantis API
+                                                   (after all attempts).
+            MantisCircuitOpenError: Raised while the circuit breaker is open.
+
+        Returns:
+            Response: The response of the last attempt.
+        """
+        if self.circuit_breaker:
+            self.circuit_breaker.before_request()
+
+        try:
+            attempt = 1
+            while True:
+                self.retry_stats.add_attempt()
+
+                response = error = None
+                try:
+                    response = self._send(preparred_request, stream)
+                except MantisHTTPConnError as e:
+                    error = e
+
+                if not (self.retry_policy and self.retry_policy.must_retry(
+                        preparred_request.method, attempt, response, error)):
+                    break
+
+                delay = self.retry_policy.get_delay(attempt, response)
+                self.retry_stats.add_retry(delay)
+
+                # Release the connection before waiting
+                if response is not None:
+                    response.close()
+                sleep(delay)
+
+                attempt += 1
+        except BaseException:
+            # Any other error (e.g: a body not complete, too many redirects) is
+            #   a failure too, so a probe of the half open circuit always ends
+            if self.circuit_breaker:
+                self.circuit_breaker.record_failure()
+            raise
+
+        if self.circuit_breaker:
+            if error or self._is_server_error(response):
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+
+        if attempt > 1 and (error or response.status_code
+                            in self.retry_policy.retry_status_codes):
+            self.retry_stats.add_exhausted()
+
+        if error:
+            raise error
+        return response
+
+    def _update_http_cache(
+        self,
+        cache_key: str,
+        response: Response,
+        body: Any
+    ) -> None:
+        """Store a response in the HTTP cache (if it has validators).
+
+        Args:
+            cache_key (str): The cache key of the request.
+            response (Response): The response object from the HTTP request.
+            body (Any): The parsed (JSON) payload of the response.
+        """
+        self.http_cache.add_miss()
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not (etag or last_modified):
+            return
+
+        self.http_cache.set(cache_key, HTTPCacheEntry(
+            body, etag, last_modified, len(response.content)))
+
+    def get_flight_key(
+            self,
+            method: str,
+            sufix_url_path: str,
+            params: Union[dict, None] = None,
+            data: Union[dict, None] = None,
+            extra_headers: Union[dict, None] = None,
+            stream: bool = False,
+            **kwargs
+    ) -> Union[tuple, None]:
+        """Get the key of a request to be coalesced with the identical requests
+            in flight (see `single_flight`).
+
+        Only the GET requests (not streamed, without body) are coalesced.
+
+        Args:
+            method (str): The HTTP method name to use for the request.
+            sufix_url_path (str): The URL path to append to the base URL.
+            params (Union[dict, None], optional): Parameters to include in the
+                request. Defaults to None.
+            data (Union[dict, None], optional): Data to include in the request.
+                Defaults to None.
+            extra_headers (Union[dict, None], optional): Extra headers to include
+                in the request. Defaults to None.
+            stream (bool, optional): If the response is streamed. Defaults to False.
+            **kwargs: Additional keyword arguments to pass to the request.
+
+        Returns:
+            Union[tuple, None]: The key (method, full URL, authentication and extra
+                          headers) or None, if the request must not be coalesced.
+        """
+        if (
+            self.single_flight is None or method != const.HTTP_METHOD_GET
+            or stream or data is not None or kwargs
+        ):
+            return None
+
+        # The same encoding of the params of the sent request
+        preparred_url = PreparedRequest()
+        preparred_url.prepare_url(self._prepare_url(sufix_url_path), params)
+
+        return (method, preparred_url.url, self.auth,
+                tuple(sorted((extra_headers or {}).items())))
+
     def http_request(
             self,
             method: str,
@@ -201,10 +544,14 @@ class MantisRequests:
             params: Union[dict, None] = None,
             data: Union[dict, None] = None,
             extra_headers: Union[dict, None] = None,
+            stream: bool = False,
             **kwargs
     ) -> dict[Any]:
         """A generic method for making HTTP requests.
 
+        The identical GET requests in flight at the same time are sent only once,
+        sharing the same response (if `single_flight` is enabled).
+
         Args:
             method (str): The HTTP method name to use for the request.
             sufix_url_path (str): The URL path to append to the base URL.
@@ -214,6 +561,9 @@ class MantisRequests:
                 Defaults to None.
             extra_headers (Union[dict, None], optional): Extra headers to include
                 in the request. Defaults to None.
+            stream (bool, optional): If True, the response isn't parsed (nor cached): the
+                `Response` is returned with the body not read yet, to be consumed by
+                chunks (e.g: the attachments). The caller must close it. Defaults to False.
             **kwargs: Additional keyword arguments to pass to the request. (
                                                during mount of `Request` object)
 
@@ -225,8 +575,30 @@ class MantisRequests:
                                                                       times out.
 
         Returns:
-            dict[Any]: The JSON response from the HTTP request.
+            dict[Any]: The JSON response from the HTTP request (the `Response`, if stream).
         """
+        send = partial(self._http_request, method, sufix_url_path, params=params,
+                       data=data, extra_headers=extra_headers, stream=stream,
+                       **kwargs)
+
+        flight_key = self.get_flight_key(method, sufix_url_path, params, data,
+                                         extra_headers, stream, **kwargs)
+        if flight_key is None:
+            return send()
+
+        return self.single_flight.do(flight_key, send)
+
+    def _http_request(
+            self,
+            method: str,
+            sufix_url_path: str,
+            params: Union[dict, None] = None,
+            data: Union[dict, None] = None,
+            extra_headers: Union[dict, None] = None,
+            stream: bool = False,
+            **kwargs
+    ) -> dict[Any]:
+        """Make a HTTP request (not coalesced), see `http_request`."""
         url = self._prepare_url(sufix_url_path)
         headers = self._get_header_for_request(extra_headers)
 
@@ -240,26 +612,55 @@ class MantisRequests:
         )
         preparred_request = self._session.prepare_request(request_obj)
 
-        try:
-            response = self._session.send(
-                preparred_request, timeout=self.timeout)
-        except ConnectTimeout as e:
-            raise MantisConnectionTimeout(preparred_request, self, e)
-        except ConnectionError as e:
-            raise MantisConnectionError(preparred_request, self, e)
-        except ReadTimeout as e:
-            raise MantisReadTimeout(preparred_request, self, e)
+        cache_key = cache_entry = None
+        if (
+            self.http_cache is not None and method == const.HTTP_METHOD_GET
+            and not stream
+        ):
+            cache_key = self.http_cache.build_key(
+                preparred_request.url, self.auth)
+            cache_entry = self.http_cache.get(cache_key)
+
+            # Conditional request: the server only sends the body if changed
+            if cache_entry:
+                preparred_request.headers.update(
+                    cache_entry.get_validation_headers())
+
+        response = self._send_with_retry(preparred_request, stream)
 
         try:
             response.raise_for_status()
         except Exception as e:
+            if stream:
+                # The error body is small: read it, releasing the connection
+                response.content
             self.raise_http_error_by_status_code(response, e)
 
+        if stream:
+            return response
+
+        if (
+            cache_entry
+            and response.status_code == const.HTTP_NOT_MODIFIED_STATUS_CODE
+        ):
+            self.http_cache.add_hit()
+            return cache_entry.body
+
         if (
                 response.status_code >= const.HTTP_MIN_SUCCESS_STATUS_CODE
             and response.status_code <= const.HTTP_MAX_SUCCESS_STATUS_CODE
         ):
-            return response.json()
+            # E.g: 204 (No Content) of a DELETE
+            if not response.content:
+                return None
+
+            # Decoded from the bytes (no text copy, with the fast codecs)
+            body = self.json_codec.loads(response.content)
+
+            if cache_key:
+                self._update_http_cache(cache_key, response, body)
+
+            return body
 
         # TODO: Validate redirections, etc.
         return response
@@ -306,13 +707,67 @@ class MantisRequests:
         Returns:
             dict[Any]: The JSON response from the HTTP request.
         """
-        extra_headers = kwargs.get('extra_headers', None)
+        extra_headers = kwargs.pop('extra_headers', None)
         if data:
             extra_headers = extra_headers or {}
             extra_headers.update({
-                'Content-Type': const.REST.HEADER_CONTENT_TYPE_JSON
+                'Content-Type': const.REST.HEADER_CONTENT_TYPE_JSON.value
             })
 
+            # A dict is sent as JSON (not as a form)
+            if isinstance(data, dict):
+                data = self._prepare_data(data)
+
         return self.http_request(const.HTTP_METHOD_POST,
                                  sufix_path, params=params, data=data,
                                  extra_headers=extra_headers, **kwargs)
+
+    def http_patch(
+            self,
+            sufix_path: str,
+            data: dict,
+            params: Union[dict, None] = None,
+            **kwargs
+    ) -> dict[Any]:
+        """Makes an HTTP PATCH request, with a JSON body.
+
+        Args:
+            sufix_path (str): The URL path to append to the base URL.
+            data (dict): The attributes to be updated (encoded as JSON).
+            params (Union[dict, None], optional): Parameters to include in the
+                request. Defaults to None.
+            **kwargs: Additional keyword arguments to pass to the request. (
+                                               during mount of `Request` object)
+
+        Returns:
+            dict[Any]: The JSON response from the HTTP request.
+        """
+        extra_headers = {
+            **(kwargs.pop('extra_headers', None) or {}),
+            'Content-Type': const.REST.HEADER_CONTENT_TYPE_JSON.value
+        }
+
+        return self.http_request(const.HTTP_METHOD_PATCH, sufix_path,
+                                 params=params, data=self._prepare_data(data),
+                                 extra_headers=extra_headers, **kwargs)
+
+    def http_delete(
+            self,
+            sufix_path: str,
+            params: Union[dict, None] = None,
+            **kwargs
+    ) -> Union[dict[Any], None]:
+        """Makes an HTTP DELETE request.
+
+        Args:
+            sufix_path (str): The URL path to append to the base URL.
+            params (Union[dict, None], optional): Parameters to include in the
+                request. Defaults to None.
+            **kwargs: Additional keyword arguments to pass to the request. (
+                                               during mount of `Request` object)
+
+        Returns:
+            Union[dict[Any], None]: The JSON response from the HTTP request (None if empty).
+        """
+        return self.http_request(const.HTTP_METHOD_DELETE,
+                                 sufix_path, params=params, **kwargs)
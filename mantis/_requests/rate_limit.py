@@ -0,0 +1,144 @@
+"""This module provides the client-side rate limiter of the HTTP requests.
+
+Classes:
+    RateLimiter: A token bucket (requests per second) + a limit of requests in
+        flight, shared by threads and asyncio tasks.
+"""
+
+import asyncio
+from threading import BoundedSemaphore, Lock
+from time import monotonic, sleep
+from typing import Union
+
+from mantis import const
+
+
+__all__ = ['RateLimiter']
+
+
+class RateLimiter:
+    """A token bucket (requests per second) + a limit of requests in flight.
+
+    The bucket has room for `burst` tokens and is refilled at `rate` tokens per
+    second. Each request takes one token, when the bucket is empty the request
+    waits its turn (the turns are reserved in order of arrival, so the waiting
+    requests don't compete with each other).
+
+    The same limiter can be used by many threads (`with limiter:`) and asyncio
+    tasks (`async with limiter:`). Use one limiter by token/server, e.g: all
+    managers of a `MantisBT` client share the limiter of its `MantisRequests`.
+
+    Attributes:
+        rate (Union[float, None]): Requests per second. None means no limit.
+        burst (int): Maximum number of requests sent at once (bucket size).
+        max_in_flight (Union[int, None]): Maximum number of requests in flight
+                                                        (None means no limit).
+        waits (int): Number of requests that waited for a token or a slot.
+        wait_time (float): Time (in seconds) spent waiting for tokens.
+    """
+
+    def __init__(
+        self,
+        rate: Union[float, None] = None,
+        burst: Union[int, None] = None,
+        max_in_flight: Union[int, None] = None
+    ) -> None:
+        """Initializes the RateLimiter instance
+
+        Args:
+            rate (Union[float, None], optional): Requests per second. Defaults
+                                                          to None (no limit).
+            burst (Union[int, None], optional): Maximum number of requests sent
+                                   at once. Defaults to None (same of the rate).
+            max_in_flight (Union[int, None], optional): Maximum number of
+                           requests in flight. Defaults to None (no limit).
+        """
+        self.rate = rate
+        self.burst = burst or max(int(rate or 1), 1)
+        self.max_in_flight = max_in_flight
+
+        self.waits = 0
+        self.wait_time = 0.0
+
+        self._tokens = float(self.burst)
+        self._updated_at = monotonic()
+        self._lock = Lock()
+
+        self._in_flight = (BoundedSemaphore(max_in_flight) if max_in_flight
+                           else None)
+
+    def _reserve(self) -> float:
+        """Take a token from the bucket (reserving the next turn if empty).
+
+        Returns:
+            float: The time (in seconds) to wait until the reserved turn.
+        """
+        if not self.rate:
+            return 0.0
+
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+
+            # A negative number of tokens is the queue of reserved turns
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+
+            wait = -self._tokens / self.rate
+            self.waits += 1
+            self.wait_time += wait
+
+            return wait
+
+    def acquire(self) -> None:
+        """Wait (blocking the thread) for a token and a slot of requests in flight."""
+        wait = self._reserve()
+        if wait:
+            sleep(wait)
+
+        if self._in_flight and not self._in_flight.acquire(blocking=False):
+            with self._lock:
+                self.waits += 1
+            self._in_flight.acquire()
+
+    async def acquire_async(self) -> None:
+        """Wait (without blocking the event loop) for a token and a slot of
+            requests in flight."""
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+        if self._in_flight and not self._in_flight.acquire(blocking=False):
+            with self._lock:
+                self.waits += 1
+            # The slots are shared with threads, so check them periodically
+            while not self._in_flight.acquire(blocking=False):
+                await asyncio.sleep(const.RATE_LIMIT_ASYNC_POLL_INTERVAL)
+
+    def release(self) -> None:
+        """Release the slot of requests in flight."""
+        if self._in_flight:
+            self._in_flight.release()
+
+    def __enter__(self) -> 'RateLimiter':
+        self.acquire()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.release()
+
+    async def __aenter__(self) -> 'RateLimiter':
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self.release()
+
+    def __repr__(self) -> str:
+        """Return string representation of the limiter."""
+        return (f'RateLimiter(rate={self.rate}, burst={self.burst}, '
+                f'max_in_flight={self.max_in_flight}, waits={self.waits}, '
+                f'wait_time={self.wait_time:.3f})')
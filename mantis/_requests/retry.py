@@ -0,0 +1,216 @@
+"""This module provides the retry policy of the HTTP requests.
+
+Classes:
+    RetryPolicy: When and how long to wait before retrying a failed request
+        (exponential backoff, jitter and `Retry-After` header).
+    RetryStats: Thread-safe counters of the attempts and retries made.
+"""
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from random import uniform
+from threading import Lock
+from typing import Iterable, Union
+
+from requests import Response
+
+from mantis import const
+
+
+__all__ = ['RetryPolicy', 'RetryStats']
+
+
+class RetryPolicy:
+    """When and how long to wait before retrying a failed request.
+
+    A request is retried when the connection fails (or times out) or the
+    server responds with one of `retry_status_codes`, only for the
+    `retry_methods` (idempotent methods, by default).
+
+    The delay before the attempt `n` is `backoff_base * 2 ** (n - 1)`, limited
+    to `backoff_cap`. With `jitter`, a random delay between 0 and that value is
+    used ("full jitter"), so many clients don't retry at the same time. When
+    the response has the `Retry-After` header, its value is used instead.
+
+    Attributes:
+        max_attempts (int): Maximum number of attempts (including the first one).
+        backoff_base (float): Base delay (in seconds) of the exponential backoff.
+        backoff_cap (float): Maximum delay (in seconds) of the exponential backoff.
+        jitter (bool): If True, use a random delay up to the backoff delay.
+        retry_status_codes (frozenset[int]): HTTP status codes to retry.
+        retry_methods (frozenset[str]): HTTP methods to retry.
+        respect_retry_after (bool): If True, use the `Retry-After` header delay.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = const.RETRY_DEFAULT_MAX_ATTEMPTS,
+        backoff_base: float = const.RETRY_DEFAULT_BACKOFF_BASE,
+        backoff_cap: float = const.RETRY_DEFAULT_BACKOFF_CAP,
+        jitter: bool = True,
+        retry_status_codes: Iterable[int] = const.RETRY_DEFAULT_STATUS_CODES,
+        retry_methods: Iterable[str] = const.RETRY_DEFAULT_METHODS,
+        respect_retry_after: bool = True
+    ) -> None:
+        """Initializes the RetryPolicy instance
+
+        Args:
+            max_attempts (int, optional): Maximum number of attempts (including
+                     the first one). Defaults to const.RETRY_DEFAULT_MAX_ATTEMPTS.
+            backoff_base (float, optional): Base delay (in seconds) of the
+                  exponential backoff. Defaults to const.RETRY_DEFAULT_BACKOFF_BASE.
+            backoff_cap (float, optional): Maximum delay (in seconds) of the
+                   exponential backoff. Defaults to const.RETRY_DEFAULT_BACKOFF_CAP.
+            jitter (bool, optional): If True, use a random delay up to the
+                                               backoff delay. Defaults to True.
+            retry_status_codes (Iterable[int], optional): HTTP status codes to
+                                  retry. Defaults to const.RETRY_DEFAULT_STATUS_CODES.
+            retry_methods (Iterable[str], optional): HTTP methods to retry.
+                                       Defaults to const.RETRY_DEFAULT_METHODS.
+            respect_retry_after (bool, optional): If True, use the `Retry-After`
+                                               header delay. Defaults to True.
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.retry_status_codes = frozenset(retry_status_codes)
+        self.retry_methods = frozenset(m.upper() for m in retry_methods)
+        self.respect_retry_after = respect_retry_after
+
+    def must_retry(
+        self,
+        method: str,
+        attempt: int,
+        response: Union[Response, None] = None,
+        error: Union[Exception, None] = None
+    ) -> bool:
+        """Check if a request must be retried.
+
+        Args:
+            method (str): The HTTP method of the request.
+            attempt (int): The number of the attempt that failed (starting at 1).
+            response (Union[Response, None], optional): The response of the
+                                                  attempt. Defaults to None.
+            error (Union[Exception, None], optional): The connection error of
+                                                  the attempt. Defaults to None.
+
+        Returns:
+            bool: True if the request must be retried, False otherwise
+        """
+        if attempt >= self.max_attempts:
+            return False
+
+        if method.upper() not in self.retry_methods:
+            return False
+
+        if error is not None:
+            return True
+
+        return (response is not None
+                and response.status_code in self.retry_status_codes)
+
+    def _get_retry_after(self, response: Response) -> Union[float, None]:
+        """Get the delay (in seconds) of the `Retry-After` header.
+
+        Args:
+            response (Response): The response with the header.
+
+        Returns:
+            Union[float, None]: The delay or None (header missing or invalid).
+        """
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+
+        # The value can be seconds or a HTTP date
+        if value.strip().isdigit():
+            return float(value)
+
+        try:
+            retry_date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        return max((retry_date - datetime.now(timezone.utc)).total_seconds(), 0)
+
+    def get_delay(
+        self,
+        attempt: int,
+        response: Union[Response, None] = None
+    ) -> float:
+        """Get the delay (in seconds) before the next attempt.
+
+        Args:
+            attempt (int): The number of the attempt that failed (starting at 1).
+            response (Union[Response, None], optional): The response of the
+                                                  attempt. Defaults to None.
+
+        Returns:
+            float: The delay (in seconds)
+        """
+        if self.respect_retry_after and response is not None:
+            retry_after = self._get_retry_after(response)
+            if retry_after is not None:
+                return retry_after
+
+        delay = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = uniform(0, delay)
+
+        return delay
+
+    def __repr__(self) -> str:
+        """Return string representation of the policy."""
+        return (f'RetryPolicy(max_attempts={self.max_attempts}, '
+                f'backoff_base={self.backoff_base}, '
+                f'backoff_cap={self.backoff_cap}, jitter={self.jitter})')
+
+
+class RetryStats:
+    """Thread-safe counters of the attempts and retries made.
+
+    Attributes:
+        attempts (int): Number of requests sent (including the retries).
+        retries (int): Number of retries.
+        retry_time (float): Time (in seconds) spent waiting before the retries.
+        exhausted (int): Number of requests that still failed after being retried.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the RetryStats instance"""
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        with self._lock:
+            self.attempts = 0
+            self.retries = 0
+            self.retry_time = 0.0
+            self.exhausted = 0
+
+    def add_attempt(self) -> None:
+        """Count a request sent."""
+        with self._lock:
+            self.attempts += 1
+
+    def add_retry(self, delay: float) -> None:
+        """Count a retry.
+
+        Args:
+            delay (float): The time (in seconds) waited before the retry.
+        """
+        with self._lock:
+            self.retries += 1
+            self.retry_time += delay
+
+    def add_exhausted(self) -> None:
+        """Count a request that still failed after being retried."""
+        with self._lock:
+            self.exhausted += 1
+
+    def __repr__(self) -> str:
+        """Return string representation of the counters."""
+        return (f'RetryStats(attempts={self.attempts}, retries={self.retries}, '
+                f'retry_time={self.retry_time:.3f}, exhausted={self.exhausted})')
@@ -0,0 +1,119 @@
+"""This module provides the coalescing (single-flight) of identical requests in
+        flight at the same time.
+
+While a request is in flight, the identical requests (same key, e.g: method,
+URL with params and authentication) don't go to the network: they wait for
+the first one and share its result (or its error). Nothing is kept after the
+request ends, it isn't a cache.
+
+Classes:
+    SingleFlight: Coalesce the identical calls in flight, with counters of the
+        calls deduplicated.
+"""
+
+from threading import Event, Lock
+from typing import Any, Callable, Hashable
+
+
+__all__ = ['SingleFlight']
+
+
+class _Call:
+    """A call in flight (the result is shared by the waiting calls)."""
+
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self) -> None:
+        self.event = Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesce the identical calls in flight: only the first is executed, the
+        others wait for it and share its result (or its error).
+
+    Thread-safe. The shared results must not be changed by the callers (the same
+    rule of the `HTTPCache` payloads).
+
+    Attributes:
+        calls (int): Number of calls received.
+        executed (int): Number of calls executed (e.g: requests sent).
+        deduplicated (int): Number of calls that shared the result of other call.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the SingleFlight instance"""
+        self._lock = Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        with self._lock:
+            self.calls = 0
+            self.executed = 0
+            self.deduplicated = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls in flight (distinct keys)."""
+        return len(self._calls)
+
+    @property
+    def dedup_ratio(self) -> float:
+        """The fraction of the calls that were deduplicated (0.0 if no calls)."""
+        return self.deduplicated / self.calls if self.calls else 0.0
+
+    def add_deduplicated(self) -> None:
+        """Count a call deduplicated by other layer (e.g: the asyncio tasks)."""
+        with self._lock:
+            self.calls += 1
+            self.deduplicated += 1
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Execute a call, unless a identical call is in flight (then, wait for it).
+
+        Args:
+            key (Hashable): The key of the call (the identical calls have the same key).
+            func (Callable[[], Any]): The call to be executed.
+
+        Raises:
+            Exception: The error of the call (the same for all waiting calls).
+
+        Returns:
+            Any: The result of the call (the same object for all waiting calls).
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.deduplicated += 1
+
+        if not is_leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            # The next calls are executed again (the result isn't kept)
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+        return call.result
+
+    def __repr__(self) -> str:
+        """Return string representation of the counters."""
+        return (f'{self.__class__.__name__}(calls={self.calls}, '
+                f'executed={self.executed}, deduplicated={self.deduplicated})')
@@ -0,0 +1,294 @@
+"""This module provides the streaming of the base64 contents of the Mantis REST
+        payloads (e.g: the attachments), with bounded memory.
+
+The MantisBT REST API sends/receives the files as base64 strings inside JSON
+documents, so a file is never decoded (or encoded) as a whole: the JSON is
+read/written chunk by chunk and only one chunk is in memory at a time.
+
+Classes:
+    Base64JSONStringDecoder: Decode, chunk by chunk, the base64 string of a key of a streamed JSON document.
+    Base64FilesBody: A JSON body (`{"files": [{"name": ..., "content": ...}]}`) with the
+        files encoded to base64 on the fly, while the body is sent.
+"""
+from __future__ import annotations
+
+import binascii
+import json
+import mmap
+import os
+from typing import IO, Any, Callable, Iterable, Iterator, Union
+
+from mantis import const
+
+
+__all__ = ['Base64JSONStringDecoder', 'Base64FilesBody']
+
+_QUOTE = ord('"')
+_BACKSLASH = ord('\\')
+_COLON = ord(':')
+_WHITESPACE = frozenset(b' \t\r\n')
+
+
+class Base64JSONStringDecoder:
+    """Decode, chunk by chunk, the base64 string value of a key of a streamed JSON
+        document (e.g: the `content` of a attachment), writing the decoded bytes.
+
+    Only the bytes before the value are scanned one by one (the metadata is small),
+    the value itself is decoded by slices. The escaped slashes (`\\/`, escaped by
+    the PHP `json_encode`) are supported. The first occurrence of the key is used.
+
+    Atributes:
+        key (bytes): The key of the base64 string
+        write (Callable[[bytes], Any]): The function called with each decoded chunk
+        size (int): The number of decoded bytes written
+        done (bool): True when the whole string was decoded
+    """
+
+    # States of the scan
+    _SCAN, _STRING, _AFTER_STRING, _AFTER_KEY, _VALUE, _DONE = range(6)
+
+    def __init__(self, write: Callable[[bytes], Any], key: str = 'content') -> None:
+        """Create a new Base64JSONStringDecoder instance.
+
+        Args:
+            write (Callable[[bytes], Any]): The function called with each decoded chunk
+            key (str, optional): The key of the base64 string. Defaults to 'content'.
+        """
+        self.key = key.encode()
+        self.write = write
+        self.size = 0
+
+        self._state = self._SCAN
+        self._string = bytearray()
+        self._escape = False
+        # The base64 characters not decoded yet (less than 4) and a pending backslash
+        self._remainder = b''
+        self._pending = b''
+
+    @property
+    def done(self) -> bool:
+        return self._state == self._DONE
+
+    def _scan(self, data: bytes, pos: int) -> int:
+        """Scan the bytes before the value. Returns the position of the first byte of the value."""
+        key = self.key
+        max_len = len(key)
+        for pos in range(pos, len(data)):
+            byte = data[pos]
+            state = self._state
+            if state == self._STRING:
+                if self._escape:
+                    self._escape = False
+                elif byte == _BACKSLASH:
+                    self._escape = True
+                elif byte == _QUOTE:
+                    self._state = self._AFTER_STRING
+                elif len(self._string) <= max_len:
+                    self._string.append(byte)
+            elif byte in _WHITESPACE:
+                continue
+            elif state == self._AFTER_STRING:
+                is_key = byte == _COLON and self._string == key
+                self._state = self._AFTER_KEY if is_key else self._SCAN
+                if not is_key and byte == _QUOTE:
+                    self._start_string()
+            elif state == self._AFTER_KEY:
+                if byte != _QUOTE:
+                    raise ValueError(
+                        f'The value of {self.key.decode()!r} is not a string')
+                self._state = self._VALUE
+                return pos + 1
+            elif byte == _QUOTE:
+                self._start_string()
+
+        return len(data)
+
+    def _start_string(self) -> None:
+        self._state = self._STRING
+        self._string.clear()
+
+    def _decode(self, data: bytes) -> None:
+        """Decode a slice of the base64 string (multiple of 4 chars, the rest is kept)."""
+        if self._pending:
+            data = self._pending + data
+            self._pending = b''
+        if data.endswith(b'\\'):
+            data, self._pending = data[:-1], b'\\'
+        if b'\\' in data:
+            data = data.replace(b'\\/', b'/')
+
+        data = self._remainder + data
+        end = len(data) - len(data) % 4
+        self._remainder = data[end:]
+        if end:
+            chunk = binascii.a2b_base64(data[:end])
+            self.size += len(chunk)
+            self.write(chunk)
+
+    def feed(self, data: bytes) -> None:
+        """Feed the next chunk of the JSON document.
+
+        Args:
+            data (bytes): The chunk
+
+        Raises:
+            ValueError: If the value isn't a valid base64 string
+        """
+        pos = 0
+        if self._state not in (self._VALUE, self._DONE):
+            pos = self._scan(data, pos)
+
+        if self._state != self._VALUE or pos >= len(data):
+            return
+
+        end = data.find(b'"', pos)
+        if end < 0:
+            self._decode(data[pos:] if pos else data)
+            return
+
+        self._decode(data[pos:end])
+        self._state = self._DONE
+        if self._remainder or self._pending:
+            raise ValueError(f'Invalid base64 string of {self.key.decode()!r}')
+
+    def close(self) -> None:
+        """Check the document ended after the whole string.
+
+        Raises:
+            ValueError: If the key (or the end of its string) wasn't found
+        """
+        if not self.done:
+            raise ValueError(
+                f'The string of {self.key.decode()!r} was not found (or is incomplete)')
+
+
+# Any bytes-like object (bytes, bytearray, memoryview, mmap), a file path or a binary file
+FileSource = Union[bytes, bytearray, memoryview, mmap.mmap, str, os.PathLike, IO[bytes]]
+
+
+class Base64FilesBody:
+    """A JSON body (`{"files": [{"name": ..., "content": ...}]}`) with the files
+        encoded to base64 on the fly, while the body is sent.
+
+    The files are read by chunks (the paths are memory-mapped), so the encoded
+    body is never in memory. The length of the body is known in advance (the
+    `Content-Length` is sent, not a chunked body), except when a file object
+    isn't seekable (`len()` is 0). The body can be iterated again (e.g: retries),
+    the file objects are rewound to their initial position.
+
+    Atributes:
+        files (list[tuple[str, FileSource]]): The names and sources of the files
+        extra (dict[str, Any]): Other top level attributes of the body
+        chunk_size (int): Number of bytes read by chunk (multiple of 3)
+    """
+
+    _file_tail = b'"}'
+    _tail = b']}'
+
+    def __init__(
+        self,
+        files: Iterable[tuple[str, FileSource]],
+        extra: Union[dict[str, Any], None] = None,
+        chunk_size: int = const.ATTACHMENT_UPLOAD_CHUNK_SIZE
+    ) -> None:
+        """Create a new Base64FilesBody instance.
+
+        Args:
+            files (Iterable[tuple[str, FileSource]]): The names and sources of the files
+            extra (Union[dict[str, Any], None], optional): Other top level attributes of the body. Defaults to None.
+            chunk_size (int, optional): Number of bytes read by chunk (rounded to a
+                        multiple of 3). Defaults to const.ATTACHMENT_UPLOAD_CHUNK_SIZE.
+        """
+        self.files = list(files)
+        self.extra = extra or {}
+        # Each chunk is encoded alone, without padding in the middle of the string
+        self.chunk_size = max(3, chunk_size - chunk_size % 3)
+
+        self._starts = [self._get_position(source) for _, source in self.files]
+
+    @staticmethod
+    def _get_position(source: FileSource) -> Union[int, None]:
+        if hasattr(source, 'read') and not isinstance(source, mmap.mmap):
+            return source.tell() if source.seekable() else None
+
+        return 0
+
+    @staticmethod
+    def _get_size(source: FileSource, start: Union[int, None]) -> Union[int, None]:
+        if isinstance(source, (str, os.PathLike)):
+            return os.path.getsize(source)
+        if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+            return len(source)
+        if start is None:
+            return None
+
+        size = source.seek(0, os.SEEK_END) - start
+        source.seek(start)
+        return size
+
+    def _get_parts(self) -> tuple[bytes, list[bytes]]:
+        """Get the fixed parts of the body: the head and the prefix of each file."""
+        head = '{'
+        if self.extra:
+            head = json.dumps(self.extra)[:-1] + ','
+        head += '"files":['
+
+        prefixes = [
+            f'{"," if index else ""}{{"name":{json.dumps(name)},"content":"'.encode()
+            for index, (name, _) in enumerate(self.files)
+        ]
+        return head.encode(), prefixes
+
+    def __len__(self) -> int:
+        """The length of the body (in bytes), 0 if unknown."""
+        head, prefixes = self._get_parts()
+        length = len(head) + len(self._tail)
+        for (_, source), start, prefix in zip(self.files, self._starts, prefixes):
+            size = self._get_size(source, start)
+            if size is None:
+                return 0
+            length += len(prefix) + (size + 2) // 3 * 4 + len(self._file_tail)
+
+        return length
+
+    def _iter_encoded(self, source: FileSource, start: Union[int, None]) -> Iterator[bytes]:
+        """Read (by chunks) and encode the bytes of a file source."""
+        chunk_size = self.chunk_size
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'rb') as file:
+                if not os.fstat(file.fileno()).st_size:
+                    return
+                # Memory-mapped: the pages are read (and discarded) by the OS on demand
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    yield from self._iter_encoded(mapped, 0)
+            return
+
+        if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+            # Slices without copy, released before the next chunk (the mmap can be closed)
+            with memoryview(source) as view:
+                for pos in range(0, len(view), chunk_size):
+                    yield binascii.b2a_base64(view[pos:pos + chunk_size], newline=False)
+            return
+
+        if start is not None:
+            source.seek(start)
+        while True:
+            chunk = source.read(chunk_size)
+            # A short read in the middle would add padding inside the base64 string
+            while chunk and len(chunk) % 3:
+                more = source.read(chunk_size - len(chunk))
+                if not more:
+                    break
+                chunk += more
+            if not chunk:
+                return
+            yield binascii.b2a_base64(chunk, newline=False)
+
+    def __iter__(self) -> Iterator[bytes]:
+        head, prefixes = self._get_parts()
+        yield head
+        for (_, source), start, prefix in zip(self.files, self._starts, prefixes):
+            yield prefix
+            yield from self._iter_encoded(source, start)
+            yield self._file_tail
+        yield self._tail
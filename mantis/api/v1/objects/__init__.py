@@ -1,4 +1,6 @@
+from .attachment import AttachmentManager, AttachmentObj
 from .config import ConfigManager, ConfigObj
+from .enums import IssuePriority, IssueSeverity, IssueStatus
 from .filter import FilterManager, FilterObj
 from .issue import IssueManager, IssueObj
 from .note import NoteManager, NoteObj
@@ -12,12 +14,17 @@ from .user import UserManager, UserObj
 # TODO: How to get the tags?
 
 __all__ = [
+    'AttachmentManager',
+    'AttachmentObj',
     'ConfigManager',
     'ConfigObj',
     'FilterManager',
     'FilterObj',
     'IssueManager',
     'IssueObj',
+    'IssuePriority',
+    'IssueSeverity',
+    'IssueStatus',
     'NoteManager',
     'NoteObj',
     'ProjectManager',
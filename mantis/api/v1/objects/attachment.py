@@ -0,0 +1,333 @@
+"""The attachments (files) of the issues and notes.
+
+The metadata of the attachments are received with the issues/notes (the
+`attachments` attribute), so listing them doesn't download any content. The
+contents (base64 strings in the REST payloads) are streamed: decoded/encoded
+chunk by chunk, with bounded memory (see `mantis._requests.streaming`).
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Iterable, Union
+
+from mantis import const
+from mantis.base import ObjectBase, ObjectListManager, ObjectManagerBase
+from mantis.decoders import decode_datetime, ObjectRefDecoder
+from mantis.exceptions import MantisAttachmentError
+from mantis._requests.streaming import (
+    Base64FilesBody, Base64JSONStringDecoder, FileSource
+)
+from .user import UserManager
+
+
+# A file path or a tuple (name, source), see `FileSource`
+UploadFile = Union[str, os.PathLike, tuple[str, FileSource]]
+
+
+def _get_issue_manager_cls():
+    # The issue module imports this module
+    from .issue import IssueManager
+
+    return IssueManager
+
+
+def _get_note_obj_cls():
+    # The note module imports this module
+    from .note import NoteObj
+
+    return NoteObj
+
+
+class AttachmentObj(ObjectBase):
+    __slots__ = ()
+
+    _repr_attrs = ['id', 'filename']
+    # The REST API has no update of the files (only upload and delete)
+    _read_only_obj = True
+
+    def download(
+        self,
+        output: Union[str, os.PathLike, IO[bytes]],
+        chunk_size: int = const.ATTACHMENT_DOWNLOAD_CHUNK_SIZE
+    ) -> int:
+        """Download the content of the attachment (see `AttachmentManager.download`)."""
+        return self.manager.download(self, output, chunk_size)
+
+
+class AttachmentManager(ObjectManagerBase):
+    _path = 'issues'
+    _id_attr = 'id'
+    _key_response = ('files', )
+
+    _mandatory_attr = ('id', 'filename')
+    _optional_attr = ('size', 'content_type', 'reporter', 'created_at')
+
+    _readonly_attr = ('id', )
+
+    _obj_cls = AttachmentObj
+
+    _decoders = {
+        'reporter': ObjectRefDecoder(UserManager),
+        'created_at': decode_datetime
+    }
+
+    def _get_issue(self, issue: Union[ObjectBase, int]) -> ObjectBase:
+        """Get a issue object (requested, if a ID is received)."""
+        if isinstance(issue, ObjectBase):
+            return issue
+
+        return self._get_related_manager(_get_issue_manager_cls()).get_by_id(issue)
+
+    def _get_attachment_issue(self, attachment: AttachmentObj) -> ObjectBase:
+        """Get the issue of a attachment (the parent of the attachment or of its note).
+
+        Raises:
+            MantisAttachmentError: If the attachment has no issue (e.g: built by hand)
+        """
+        parent = attachment._parent
+        if isinstance(parent, _get_note_obj_cls()):
+            parent = parent._parent
+
+        if parent is None:
+            raise MantisAttachmentError(
+                attachment._id, 'the issue of the attachment is unknown')
+
+        return parent
+
+    def get_for_issue(
+        self,
+        issue: Union[ObjectBase, int],
+        include_notes: bool = False
+    ) -> ObjectListManager:
+        """Get the attachments of a issue (only the metadata, no content is downloaded).
+
+        Args:
+            issue (Union[ObjectBase, int]): The issue (`IssueObj`) or its ID
+            include_notes (bool, optional): If True, the attachments of the notes are
+                                            included too. Defaults to False.
+
+        Returns:
+            ObjectListManager: The attachments (`AttachmentObj`)
+        """
+        issue = self._get_issue(issue)
+        attachments = list(issue.attachments or [])
+        if include_notes:
+            for note in issue.get_notes():
+                attachments.extend(note.attachments or [])
+
+        return ObjectListManager(attachments)
+
+    @staticmethod
+    def _get_filename(attachment: AttachmentObj) -> str:
+        """Get a safe file name of a attachment (without directories)."""
+        filename = os.path.basename(str(attachment.filename or '').replace('\\', '/'))
+        if filename in ('', '.', '..'):
+            filename = str(attachment._id)
+
+        return filename
+
+    def _download_to(
+        self,
+        attachment: AttachmentObj,
+        stream: IO[bytes],
+        chunk_size: int
+    ) -> int:
+        """Download the content of a attachment to a binary stream, chunk by chunk."""
+        issue = self._get_attachment_issue(attachment)
+        decoder = Base64JSONStringDecoder(stream.write)
+
+        response = self.request.http_get(
+            f'{self._path}/{issue._id}/files/{attachment._id}', stream=True)
+        try:
+            for chunk in response.iter_content(chunk_size):
+                decoder.feed(chunk)
+                if decoder.done:
+                    break
+            decoder.close()
+        except ValueError as e:
+            raise MantisAttachmentError(attachment._id, str(e)) from e
+        finally:
+            response.close()
+
+        size = attachment.get_raw('size')
+        if size is not None and decoder.size != size:
+            raise MantisAttachmentError(
+                attachment._id, f'{decoder.size} bytes received, expected {size}')
+
+        return decoder.size
+
+    def download(
+        self,
+        attachment: AttachmentObj,
+        output: Union[str, os.PathLike, IO[bytes]],
+        chunk_size: int = const.ATTACHMENT_DOWNLOAD_CHUNK_SIZE
+    ) -> int:
+        """Download the content of a attachment, streamed to a file (or binary
+            stream): only one chunk is in memory at a time.
+
+        A file is written atomically: the content is written to a temporary file
+        (same directory), renamed when the download is complete and verified.
+
+        Args:
+            attachment (AttachmentObj): The attachment
+            output (Union[str, os.PathLike, IO[bytes]]): The file path, a directory (the
+                                file name of the attachment is used) or a binary stream
+            chunk_size (int, optional): Number of bytes read by chunk from the
+                        response. Defaults to const.ATTACHMENT_DOWNLOAD_CHUNK_SIZE.
+
+        Raises:
+            MantisAttachmentError: If the content is invalid or incomplete
+
+        Returns:
+            int: The number of bytes written
+        """
+        if not isinstance(output, (str, os.PathLike)):
+            return self._download_to(attachment, output, chunk_size)
+
+        path = os.fspath(output)
+        if os.path.isdir(path):
+            path = os.path.join(path, self._get_filename(attachment))
+
+        temp_path = f'{path}{const.ATTACHMENT_TEMP_SUFFIX}'
+        try:
+            with open(temp_path, 'wb') as stream:
+                size = self._download_to(attachment, stream, chunk_size)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        return size
+
+    def download_many(
+        self,
+        attachments: Iterable[AttachmentObj],
+        directory: Union[str, os.PathLike],
+        max_workers: int = const.ATTACHMENT_DEFAULT_MAX_WORKERS,
+        chunk_size: int = const.ATTACHMENT_DOWNLOAD_CHUNK_SIZE
+    ) -> ObjectListManager:
+        """Download many attachments to a directory, concurrently.
+
+        The files are named with the file name of the attachments (prefixed with
+        the attachment ID, e.g: `12-screenshot.png`, when two attachments have the same name).
+
+        Args:
+            attachments (Iterable[AttachmentObj]): The attachments
+            directory (Union[str, os.PathLike]): The directory (created if needed)
+            max_workers (int, optional): Maximum number of downloads at the same
+                                time. Defaults to const.ATTACHMENT_DEFAULT_MAX_WORKERS.
+            chunk_size (int, optional): Number of bytes read by chunk from the
+                        response. Defaults to const.ATTACHMENT_DOWNLOAD_CHUNK_SIZE.
+
+        Returns:
+            ObjectListManager: The attachments downloaded. The attachments that couldn't
+                be downloaded are in the `errors` attribute (attachment id -> exception).
+        """
+        attachments = list(attachments)
+        os.makedirs(directory, exist_ok=True)
+
+        filenames = [self._get_filename(attachment) for attachment in attachments]
+        duplicated = {name for name in filenames if filenames.count(name) > 1}
+        paths = [
+            os.path.join(directory, f'{attachment._id}-{name}' if name in duplicated else name)
+            for attachment, name in zip(attachments, filenames)
+        ]
+
+        errors = {}
+
+        def _download(attachment, path):
+            try:
+                self.download(attachment, path, chunk_size)
+                return attachment
+            except Exception as e:
+                errors[attachment._id] = e
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            downloaded = [attachment for attachment in
+                          executor.map(_download, attachments, paths) if attachment]
+
+        return ObjectListManager(downloaded, errors=errors)
+
+    @staticmethod
+    def _get_upload_files(files: Iterable[UploadFile]) -> list[tuple[str, FileSource]]:
+        """Get the names and sources of the files to be uploaded."""
+        upload_files = []
+        for file in files:
+            if isinstance(file, (str, os.PathLike)):
+                file = (os.path.basename(os.fspath(file)), file)
+            upload_files.append(file)
+
+        return upload_files
+
+    def upload(
+        self,
+        issue: Union[ObjectBase, int],
+        files: Iterable[UploadFile],
+        chunk_size: int = const.ATTACHMENT_UPLOAD_CHUNK_SIZE
+    ) -> ObjectListManager:
+        """Upload files to a issue (one request), streamed: the files are read and
+            encoded to base64 by chunks, while the request is sent.
+
+        Args:
+            issue (Union[ObjectBase, int]): The issue (`IssueObj`) or its ID
+            files (Iterable[UploadFile]): The file paths (memory-mapped) or tuples `(name, source)`,
+                        the source is a path, a bytes-like object (e.g: `mmap`) or a binary file
+            chunk_size (int, optional): Number of bytes read by chunk from the
+                        files. Defaults to const.ATTACHMENT_UPLOAD_CHUNK_SIZE.
+
+        Returns:
+            ObjectListManager: The new attachments of the issue (the `attachments` of the issue
+                                                                     are requested again)
+        """
+        issue = self._get_issue(issue)
+        known_ids = {attachment._id for attachment in self.get_for_issue(issue)}
+
+        body = Base64FilesBody(self._get_upload_files(files), chunk_size=chunk_size)
+        response = self.request.http_request(
+            const.HTTP_METHOD_POST, f'{self._path}/{issue._id}/files', data=body,
+            extra_headers={'Content-Type': const.REST.HEADER_CONTENT_TYPE_JSON.value},
+            stream=True)
+        # The body of the response is empty (or small), reading it the connection is reused
+        response.content
+
+        issue.manager._load_fields(issue, ['attachments'])
+
+        return ObjectListManager([attachment for attachment in self.get_for_issue(issue)
+                                  if attachment._id not in known_ids])
+
+    def upload_many(
+        self,
+        uploads: Iterable[tuple[Union[ObjectBase, int], Iterable[UploadFile]]],
+        max_workers: int = const.ATTACHMENT_DEFAULT_MAX_WORKERS,
+        chunk_size: int = const.ATTACHMENT_UPLOAD_CHUNK_SIZE
+    ) -> ObjectListManager:
+        """Upload files to many issues, concurrently (one request by issue, see `upload`).
+
+        Args:
+            uploads (Iterable[tuple[Union[ObjectBase, int], Iterable[UploadFile]]]): The issues
+                                                          (or IDs) and their files
+            max_workers (int, optional): Maximum number of uploads at the same
+                                time. Defaults to const.ATTACHMENT_DEFAULT_MAX_WORKERS.
+            chunk_size (int, optional): Number of bytes read by chunk from the
+                        files. Defaults to const.ATTACHMENT_UPLOAD_CHUNK_SIZE.
+
+        Returns:
+            ObjectListManager: The new attachments. The issues whose files couldn't be
+                uploaded are in the `errors` attribute (issue id -> exception).
+        """
+        errors = {}
+
+        def _upload(upload):
+            issue, files = upload
+            try:
+                return self.upload(issue, files, chunk_size)
+            except Exception as e:
+                errors[issue._id if isinstance(issue, ObjectBase) else issue] = e
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_upload, uploads))
+
+        return ObjectListManager([attachment for attachments in results if attachments
+                                  for attachment in attachments], errors=errors)
@@ -0,0 +1,100 @@
+"""Enumerations of the Mantis issue fields (status, priority, severity).
+
+The values are the default ids of MantisBT (config `*_enum_string`). The
+custom values of a server (e.g: a new status) are decoded to pseudo members,
+named as the server names them.
+"""
+from __future__ import annotations
+
+from enum import IntEnum
+from typing import Any, Union
+
+
+__all__ = ['MantisEnum', 'IssueStatus', 'IssuePriority', 'IssueSeverity']
+
+
+class MantisEnum(IntEnum):
+    """Base of the Mantis enumerations.
+
+    The members are compared (and sorted) as integers and keep the dict-like
+    access of the raw values, e.g: `issue.status['name']`.
+    """
+
+    @classmethod
+    def decode(cls, value: Any) -> Union[MantisEnum, Any]:
+        """Decode a raw value (e.g: {'id': 10, 'name': 'new'} or 10) to a member.
+
+        A dict without `id` (e.g: {'name': 'new'}) is decoded by its name.
+
+        Args:
+            value (Any): The raw value (dict with `id`/`name` or the id)
+
+        Returns:
+            Union[MantisEnum, Any]: The member (or a pseudo member, for custom values),
+                                    or the raw value if it can't be decoded
+        """
+        if isinstance(value, cls):
+            return value
+
+        raw, name = value, None
+        if isinstance(value, dict):
+            name = value.get('name')
+            value = value.get('id')
+            if value is None:
+                # Only the name: a default member, the custom ones are unknown
+                return cls.__members__.get(name, raw) if isinstance(name, str) else raw
+
+        if not isinstance(value, int) or isinstance(value, bool):
+            return raw
+
+        try:
+            return cls(value)
+        except ValueError:
+            # Custom value of the server
+            member = int.__new__(cls, value)
+            member._name_ = name or str(value)
+            member._value_ = value
+
+            return member
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the member (as received from the server)."""
+        return {'id': self.value, 'name': self.name}
+
+    def __getitem__(self, key: str) -> Any:
+        """Get the `id` or `name` of the member."""
+        return self.to_dict()[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get the `id` or `name` of the member."""
+        return self.to_dict().get(key, default)
+
+
+class IssueStatus(MantisEnum):
+    new = 10
+    feedback = 20
+    acknowledged = 30
+    confirmed = 40
+    assigned = 50
+    resolved = 80
+    closed = 90
+
+
+class IssuePriority(MantisEnum):
+    none = 10
+    low = 20
+    normal = 30
+    high = 40
+    urgent = 50
+    immediate = 60
+
+
+class IssueSeverity(MantisEnum):
+    feature = 10
+    trivial = 20
+    text = 30
+    tweak = 40
+    minor = 50
+    major = 60
+    crash = 70
+    block = 80
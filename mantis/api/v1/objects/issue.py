@@ -5,18 +5,81 @@
 from mantis.base import ObjectBase, ObjectManagerBase
 from mantis.mixins import (
     ManagerBaseMixins,
-    GetByCriteriaMixins
+    ChangesSinceMixins,
+    CreateMixins,
+    DeleteMixins,
+    GetByCriteriaMixins,
+    UpdateMixins
 )
+from mantis.sync import SyncChanges
+from mantis.decoders import (
+    decode_datetime, EnumDecoder, ObjectListDecoder, ObjectRefDecoder
+)
+from .attachment import AttachmentManager
+from .enums import IssuePriority, IssueSeverity, IssueStatus
 from .note import NoteManager
+from .user import UserManager
 from typing import Any
 
 
+def _get_project_manager_cls():
+    # The project module imports this module
+    from .project import ProjectManager
+
+    return ProjectManager
+
+
 class IssueObj(ObjectBase):
+    # The notes received/requested, see `get_notes`
+    __slots__ = ('_notes', )
+
     _repr_attrs = ['id', 'summary']
 
-    def get_notes(self):
-        return self.manager._child_manager_obj.get_by_crit({'id': self.id}, self)
-    # TODO: Add method to update issue status
+    def get_notes(self, refresh=False):
+        """Get the notes of the issue. The notes are kept in the issue, so the next
+            calls don't request them (also the notes received with `include_notes`).
+
+        Args:
+            refresh (bool, optional): If True, the notes are requested again. Defaults to False.
+
+        Returns:
+            ObjectListManager: The notes of the issue
+        """
+        notes = None if refresh else self._get_cached_notes()
+        if notes is None:
+            notes = self.manager._child_manager_obj.get_by_crit({'id': self.id}, self)
+            self._notes = notes
+
+        return notes
+
+    def save(self):
+        """Send the attributes changed (`issue[attr] = value`) to the server, only
+            them (see `UpdateMixins.update_one`). The issue is refreshed with the response.
+
+        Returns:
+            IssueObj: The issue updated
+        """
+        return self.manager.update_one(self)
+
+    def get_attachments(self, include_notes=False):
+        """Get the attachments of the issue (see `AttachmentManager.get_for_issue`)."""
+        return self.manager._get_related_manager(AttachmentManager).get_for_issue(
+            self, include_notes=include_notes)
+
+    def _get_cached_notes(self):
+        return getattr(self, '_notes', None)
+
+    def _set_children(self, notes):
+        self._notes = notes
+
+    def _set_fields(self, attrs, fields):
+        updated_at = self.get_raw('updated_at') if self.is_loaded('updated_at') else None
+        super()._set_fields(attrs, fields)
+
+        # The notes kept are outdated when the issue was updated
+        if 'updated_at' in fields and attrs.get('updated_at') != updated_at:
+            self._notes = None
+
     # TODO: Add method to add/update tags
     # TODO: Add method to monitor/unmonitor issue
     # TODO: Add method to assign issue to user
@@ -25,10 +88,15 @@ class IssueObj(ObjectBase):
 class IssueManager(
         ManagerBaseMixins,
         GetByCriteriaMixins,
+        ChangesSinceMixins,
+        CreateMixins,
+        UpdateMixins,
+        DeleteMixins,
         ObjectManagerBase):
     _path = 'issues'
     _id_attr = 'id'
     _key_response = ('issues', )
+    _key_create_response = ('issue', )
 
     # TODO: Review mandatory, optional and readonly attributes
     _mandatory_attr = (
@@ -36,22 +104,101 @@ class IssueManager(
     _optional_attr = ('category', 'reporter', 'handler', 'status', 'resolution',
                       'view_state', 'priority', 'severity', 'reproducibility',
                       'platform', 'sticky', 'created_at', 'updated_at',
-                      'custom_fields', 'history')
+                      'custom_fields', 'history', 'attachments')
 
     _readonly_attr = tuple()
 
     _obj_cls = IssueObj
-    _parent_id_attr = 'id'
+    _parent_id_attr = ('project', 'id')
 
     _child_manager_cls = NoteManager
+    _children_attr = 'notes'
+
+    _paginated = True
+
+    _select_param = 'select'
+
+    _decoders = {
+        'project': ObjectRefDecoder(_get_project_manager_cls),
+        'reporter': ObjectRefDecoder(UserManager),
+        'handler': ObjectRefDecoder(UserManager),
+        'status': EnumDecoder(IssueStatus),
+        'priority': EnumDecoder(IssuePriority),
+        'severity': EnumDecoder(IssueSeverity),
+        'created_at': decode_datetime,
+        'updated_at': decode_datetime,
+        'attachments': ObjectListDecoder(AttachmentManager)
+    }
 
     _fixed_criteria = {
         'select': ('id,summary,description,project,steps_to_reproduce,category,'
                    'reporter,handler,status,resolution,view_state,priority,'
                    'severity,reproducibility,platform,sticky,created_at,'
-                   'updated_at,custom_fields,history')
+                   'updated_at,custom_fields,history,attachments')
     }
 
+    def changes_since(self, since=None, project=None, **kwargs) -> SyncChanges:
+        """Get the issues created/updated since a watermark (see `ChangesSinceMixins.changes_since`).
+
+        Args:
+            since (Union[SyncWatermark, datetime, str, None], optional): The watermark of the last
+                                                 synchronization (or its token). Defaults to None.
+            project (Union[ProjectObj, int, None], optional): Only the issues of this project
+                                                           (object or ID). Defaults to None.
+            include_notes (bool, optional): If True, the notes are received in the same pages
+                        and kept in the issues (see `IssueObj.get_notes`). Defaults to False.
+            **kwargs: See `ChangesSinceMixins.changes_since`
+
+        Returns:
+            SyncChanges: The created/updated issues and the new watermark
+        """
+        if project is not None:
+            project_id = project if isinstance(project, int) else project.id
+            kwargs['crit'] = {**(kwargs.get('crit') or {}), 'project_id': project_id}
+
+        kwargs['include_children'] = kwargs.pop('include_notes', False)
+
+        return super().changes_since(since, **kwargs)
+
+    def get_all(self, _parent=None, limit=None, page_size=None, resolve_parent=True,
+                fields=None, include_notes=False):
+        """Get all issues (see `GetMixins.get_all`).
+
+        Args:
+            include_notes (bool, optional): If True, the notes are received in the same pages
+                        and kept in the issues (see `IssueObj.get_notes`). Defaults to False.
+        """
+        return self._get(self._path, _parent=_parent, limit=limit,
+                         page_size=page_size, resolve_parent=resolve_parent,
+                         fields=fields, include_children=include_notes)
+
+    def iter_all(self, _parent=None, limit=None, page_size=None, resolve_parent=True,
+                 fields=None, include_notes=False):
+        """Lazily iterates over all issues (see `GetMixins.iter_all` and `get_all`)."""
+        return self._iter(self._path, _parent=_parent, limit=limit,
+                          page_size=page_size, resolve_parent=resolve_parent,
+                          fields=fields, include_children=include_notes)
+
+    def get_by_crit(self, crit, _parent=None, limit=None, page_size=None,
+                    resolve_parent=True, fields=None, include_notes=False):
+        """Get the issues matching the criteria (see `GetByCriteriaMixins.get_by_crit`).
+
+        Args:
+            include_notes (bool, optional): If True, the notes are received in the same pages
+                        and kept in the issues (see `IssueObj.get_notes`). Defaults to False.
+        """
+        return self._get(self._path, crit, _parent, limit=limit,
+                         page_size=page_size, resolve_parent=resolve_parent,
+                         fields=fields, include_children=include_notes)
+
+    def iter_by_crit(self, crit, _parent=None, limit=None, page_size=None,
+                     resolve_parent=True, fields=None, include_notes=False):
+        """Lazily iterates over the issues matching the criteria (see
+            `GetByCriteriaMixins.iter_by_crit` and `get_by_crit`)."""
+        return self._iter(self._path, crit, _parent, limit=limit,
+                          page_size=page_size, resolve_parent=resolve_parent,
+                          fields=fields, include_children=include_notes)
+
     # TODO: Add function to get issues by project ID/name
     # TODO: Add function to get issues assigned to current user
     # TODO: Add function to get monitored issues (by current user)
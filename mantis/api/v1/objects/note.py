@@ -1,21 +1,33 @@
-from mantis.base import ObjectManagerBase, ObjectBase
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, Union
+
+from mantis import const
+from mantis.base import ObjectManagerBase, ObjectBase, ObjectListManager
+from mantis.decoders import decode_datetime, ObjectListDecoder, ObjectRefDecoder
 from mantis.mixins import (
-    ManagerBaseMixins, GetByCriteriaMixins
+    ManagerBaseMixins, CreateMixins, DeleteMixins, GetByCriteriaMixins
 )
+from .attachment import AttachmentManager
+from .user import UserManager
 
 
 class NoteObj(ObjectBase):
+    __slots__ = ()
+
     _repr_attrs = ['id', '{reporter[name]}']
 
 
 class NoteManager(
     ManagerBaseMixins,
     GetByCriteriaMixins,
+    CreateMixins,
+    DeleteMixins,
     ObjectManagerBase
 ):
     _path = 'issues'
     _id_attr = 'id'
     _key_response = ('issues', 0, 'notes')
+    _key_create_response = ('note', )
 
     # TODO: Review mandatory, optional and readonly attributes
     _mandatory_attr = ('id', 'text')
@@ -25,8 +37,99 @@ class NoteManager(
     _readonly_attr = tuple()
 
     _obj_cls = NoteObj
-    _parent_id_attr = 'id'
+    # The notes payload doesn't have the issue id, so the parent (issue) object
+    #   is always received from the caller (e.g: `IssueObj.get_notes()`)
+    _parent_id_attr = None
 
     _fixed_criteria = {
         'select': 'notes'
     }
+
+    _decoders = {
+        'reporter': ObjectRefDecoder(UserManager),
+        'created_at': decode_datetime,
+        'updated_at': decode_datetime,
+        'attachments': ObjectListDecoder(AttachmentManager)
+    }
+
+    def _get_issue_path(self, issue: Union[ObjectBase, Any, None]) -> str:
+        """Get the path of the notes of a issue (object or id)."""
+        if issue is None:
+            raise ValueError('The issue of the note is required')
+
+        issue_id = issue._id if isinstance(issue, ObjectBase) else issue
+        return f'{self._path}/{issue_id}/notes'
+
+    def _get_create_path(self, _parent: Union[ObjectBase, Any, None] = None) -> str:
+        return self._get_issue_path(_parent)
+
+    def _get_object_path(self, obj: Union[ObjectBase, Any]) -> str:
+        if not isinstance(obj, ObjectBase):
+            raise ValueError('The note object (with its issue) is required, not the id')
+
+        return f'{self._get_issue_path(obj._parent)}/{obj._id}'
+
+    @staticmethod
+    def _reset_issue_notes(issue: Union[ObjectBase, Any, None]) -> None:
+        # The notes kept in the issue are outdated (see `IssueObj.get_notes`)
+        if isinstance(issue, ObjectBase):
+            issue._set_children(None)
+
+    def create_one(self, attrs, _parent=None, resolve_parent=True):
+        """Create a note in a issue (`_parent`, object or id), see `CreateMixins.create_one`."""
+        note = super().create_one(attrs, _parent, resolve_parent)
+        self._reset_issue_notes(_parent)
+
+        return note
+
+    def delete_one(self, obj):
+        """Delete a note (the object, with its issue), see `DeleteMixins.delete_one`."""
+        id_ = super().delete_one(obj)
+        self._reset_issue_notes(obj._parent)
+
+        return id_
+
+    def get_for_issues(
+        self,
+        issues: Iterable[ObjectBase],
+        max_workers: int = const.GET_MANY_DEFAULT_MAX_WORKERS,
+        refresh: bool = False
+    ) -> ObjectListManager:
+        """Get the notes of many issues.
+
+        The notes already kept in the issues (e.g: received with `include_notes`)
+        are used, the others are requested concurrently (one request by issue).
+        The notes are kept in the issues, so the next `IssueObj.get_notes()`
+        doesn't request them.
+
+        Args:
+            issues (Iterable[ObjectBase]): The issues (`IssueObj`)
+            max_workers (int, optional): Maximum number of requests in flight at the
+                            same time. Defaults to const.GET_MANY_DEFAULT_MAX_WORKERS.
+            refresh (bool, optional): If True, the notes of all issues are requested again. Defaults to False.
+
+        Returns:
+            ObjectListManager: The notes of all issues, in the order of the issues. The issues
+                whose notes couldn't be retrieved are in the `errors` attribute (issue id -> exception).
+        """
+        issues = list(issues)
+        errors = {}
+
+        def _get_notes(issue):
+            try:
+                issue.get_notes(refresh=True)
+            except Exception as e:
+                errors[issue._id] = e
+
+        missing_issues = [issue for issue in issues
+                          if refresh or issue._get_cached_notes() is None]
+        if missing_issues:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(_get_notes, missing_issues))
+
+        notes = []
+        for issue in issues:
+            if issue._id not in errors:
+                notes.extend(issue.get_notes())
+
+        return ObjectListManager(notes, errors=errors)
@@ -7,15 +7,23 @@ from mantis.api.v1.objects.issue import IssueManager
 
 
 class ProjectObj(ObjectBase):
+    __slots__ = ()
+
     _repr_attrs = ('id', 'name', 'enabled')
 
     @property
     def issue_manager(self):
         return self.manager._child_manager_obj
 
-    def get_issues(self):
+    def get_issues(self, limit=None, page_size=None, fields=None, include_notes=False):
         return self.manager._child_manager_obj.get_by_crit(
-            {'project_id': self.id}, _parent=self)
+            {'project_id': self.id}, _parent=self, limit=limit,
+            page_size=page_size, fields=fields, include_notes=include_notes)
+
+    def iter_issues(self, limit=None, page_size=None, fields=None, include_notes=False):
+        return self.manager._child_manager_obj.iter_by_crit(
+            {'project_id': self.id}, _parent=self, limit=limit,
+            page_size=page_size, fields=fields, include_notes=include_notes)
 
 
 class ProjectManager(
@@ -1,9 +1,31 @@
-from mantis.base import ObjectManagerBase
+from mantis.base import ObjectBase, ObjectManagerBase
+from mantis.decoders import decode_datetime
+from mantis.mixins import ManagerBaseMixins
 
 
-class UserManager(ObjectManagerBase):
-    pass
+class UserObj(ObjectBase):
+    __slots__ = ()
 
+    _repr_attrs = ['id', 'name']
 
-class UserObj:
-    pass
+
+class UserManager(
+    ManagerBaseMixins,
+    ObjectManagerBase
+):
+    _path = 'users'
+    _id_attr = 'id'
+    _key_response = ('users', )
+
+    _mandatory_attr = ('id', 'name')
+    _optional_attr = ('real_name', 'email', 'language', 'timezone',
+                      'access_level', 'created_at', 'projects')
+
+    # Assigned by the server
+    _readonly_attr = ('id', 'created_at', 'projects')
+
+    _obj_cls = UserObj
+
+    _decoders = {
+        'created_at': decode_datetime
+    }
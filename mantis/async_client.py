@@ -0,0 +1,436 @@
+"""This module provides the asyncio client of the MantisBT API.
+
+Classes:
+    AsyncObjectManager: An awaitable mirror of a object manager (e.g: IssueManager).
+    AsyncMantisBT: A asyncio client for interacting with the MantisBT API.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator, Iterable, List, Union
+
+from mantis import const
+from mantis.base import ObjectBase, ObjectListManager
+from mantis.client import MantisBT
+from mantis.exceptions import MantisHTTPReponseClientError
+from mantis.mixins import GetMixins
+from mantis._requests import AsyncMantisRequests
+
+
+__all__ = ['AsyncObjectManager', 'AsyncMantisBT']
+
+
+class AsyncObjectManager:
+    """An awaitable mirror of a object manager.
+
+    The definitions (path, attributes, object class, etc), the objects building
+    and the internal cache are the same of the wrapped (sync) manager, only the
+    HTTP requests are awaitable. So, many calls can run concurrently, e.g:
+
+        issues = await asyncio.gather(*[client.issues.get_by_id(id_) for id_ in ids])
+
+    The returned objects are the same of the sync client, their helper methods
+    (e.g: `IssueObj.get_notes()`) and the lazy load of the attributes not
+    requested (see `fields`) are sync. Use the async managers instead
+    (e.g: `await client.notes.get_by_crit({'id': issue.id}, issue)`).
+
+    Atributes:
+        manager (GetMixins): The wrapped (sync) manager
+        request (AsyncMantisRequests): The request object to be used in the manager
+    """
+
+    def __init__(
+        self,
+        manager: GetMixins,
+        request: AsyncMantisRequests
+    ) -> None:
+        """Create a new AsyncObjectManager instance.
+
+        Args:
+            manager (GetMixins): The wrapped (sync) manager
+            request (AsyncMantisRequests): The request object to be used in the manager
+        """
+        self.manager = manager
+        self.request = request
+
+    async def _get_page(
+        self,
+        url: str,
+        params: Union[dict[str, Any], None] = None,
+        _parent=None,
+        resolve_parent: bool = True,
+        fields: Union[frozenset[str], None] = None
+    ) -> List[ObjectBase]:
+        """Execute a single GET HTTP request and build the objects of the response.
+
+        Args:
+            url (str): The URL to send the GET request to.
+            params (dict[str, Any], optional): A dictionary of query parameters to include in the request. Defaults to None.
+            _parent (optional): An optional parent object to associate with the retrieved objects. Defaults to None.
+            resolve_parent (bool, optional): If False, the parent objects aren't searched in the server. Defaults to True.
+            fields (frozenset[str], optional): The attributes requested (see `_get_fields`). Defaults to None (all attributes).
+
+        Returns:
+            List[ObjectBase]: A list of objects retrieved from the URL.
+        """
+        response = await self.request.http_get(url, params)
+        obj_list = self.manager._build_objs(response, fields)
+
+        await self._attach_parent_objs(obj_list, _parent, resolve_parent)
+
+        return obj_list
+
+    async def _attach_parent_objs(
+        self,
+        obj_list: List[ObjectBase],
+        _parent_obj=None,
+        resolve_parent: bool = True
+    ) -> None:
+        """Attach the parent object to each object of a list (see `ObjectManagerBase._attach_parent_objs`).
+
+        Args:
+            obj_list (List[ObjectBase]): The objects to attach the parent
+            _parent_obj (_type_, optional): The parent object (if already exists). Defaults to None.
+            resolve_parent (bool, optional): If False, the parent objects aren't
+                                  searched in the parent manager. Defaults to True.
+        """
+        if not self.manager._must_resolve_parent(_parent_obj, resolve_parent):
+            for obj in obj_list:
+                obj._parent = _parent_obj
+            return
+
+        parent_ids = self.manager._get_distinct_parent_ids(obj_list)
+        parent_manager = AsyncObjectManager(
+            self.manager._manager_parent_obj, self.request)
+
+        self.manager._set_parent_objs(
+            obj_list, await parent_manager._get_many_by_id(parent_ids))
+
+    async def _get_many_by_id(self, ids: List[Any]) -> dict[Any, ObjectBase]:
+        """Retrieves many objects by their IDs (see `GetMixins._get_many_by_id`).
+
+        The missing objects of paginated endpoints are requested concurrently.
+
+        Args:
+            ids (List[Any]): The IDs of the objects to retrieve
+
+        Returns:
+            dict[Any, ObjectBase]: The objects found, by ID
+        """
+        objs, missing_ids = self.manager._get_many_from_cache(ids)
+
+        if len(missing_ids) > 1 and not self.manager._paginated:
+            missing_ids = set(missing_ids)
+            for obj in await self._get(self.manager._path, resolve_parent=False):
+                if obj._id in missing_ids:
+                    objs[obj._id] = obj
+        else:
+            missing_objs = await asyncio.gather(*[
+                self.get_by_id(id_, use_cache=False) for id_ in missing_ids
+            ], return_exceptions=True)
+            for id_, obj in zip(missing_ids, missing_objs):
+                # E.g: a parent deleted (404), its objects are kept without parent
+                if isinstance(obj, MantisHTTPReponseClientError):
+                    continue
+                if isinstance(obj, BaseException):
+                    raise obj
+                objs[id_] = obj
+
+        return objs
+
+    async def _iter_pages(
+        self,
+        url: str,
+        params: Union[dict[str, Any], None] = None,
+        _parent=None,
+        paginate: bool = True,
+        page_size: Union[int, None] = None,
+        limit: Union[int, None] = None,
+        resolve_parent: bool = True,
+        fields: Union[Iterable[str], None] = None
+    ) -> AsyncIterator[List[ObjectBase]]:
+        """Lazily retrieves the objects from a given URL, one page (request) at a time.
+
+        See `GetMixins._iter_pages`.
+
+        Yields:
+            List[ObjectBase]: The list of objects of each page.
+        """
+        fields = self.manager._get_fields(fields)
+        params = self.manager._prepare_params(params, fields)
+
+        if not (paginate and self.manager._paginated):
+            obj_list = await self._get_page(url, params, _parent, resolve_parent,
+                                            fields)
+            yield obj_list[:limit] if limit is not None else obj_list
+            return
+
+        page_size = self.manager._get_page_size(page_size, limit)
+
+        remaining = limit
+        page = const.PAGINATION_FIRST_PAGE
+        while remaining is None or remaining > 0:
+            params[const.PAGINATION_PAGE_SIZE_PARAM] = page_size
+            params[const.PAGINATION_PAGE_PARAM] = page
+
+            obj_list = await self._get_page(url, params, _parent, resolve_parent,
+                                            fields)
+            if remaining is not None:
+                obj_list = obj_list[:remaining]
+                remaining -= len(obj_list)
+
+            if obj_list:
+                yield obj_list
+
+            # A page smaller than requested is the last page
+            if len(obj_list) < page_size:
+                break
+
+            page += 1
+
+    async def _iter(
+        self,
+        url: str,
+        params: Union[dict[str, Any], None] = None,
+        _parent=None,
+        **kwargs
+    ) -> AsyncIterator[ObjectBase]:
+        """Lazily retrieves the objects from a given URL, one by one.
+
+        Yields:
+            ObjectBase: The objects retrieved from the URL.
+        """
+        async for obj_list in self._iter_pages(url, params, _parent, **kwargs):
+            for obj in obj_list:
+                yield obj
+
+    async def _get(
+        self,
+        url: str,
+        params: dict[str, Any] = None,
+        _parent=None,
+        **kwargs
+    ) -> List[ObjectBase]:
+        """Retrieves a list of objects from a given URL (all pages, until `limit` is reached).
+
+        Returns:
+            List[ObjectBase]: A list of objects retrieved from the URL.
+        """
+        return ObjectListManager(
+            [obj async for obj in self._iter(url, params, _parent, **kwargs)])
+
+    async def get_all(
+        self,
+        _parent: ObjectBase = None,
+        limit: Union[int, None] = None,
+        page_size: Union[int, None] = None,
+        resolve_parent: bool = True,
+        fields: Union[Iterable[str], None] = None
+    ) -> List[ObjectBase]:
+        """Retrieves all objects from the server for this manager's path (see `GetMixins.get_all`).
+
+        Returns:
+            List[ObjectBase]: List of all objects retrieved from the server.
+        """
+        return await self._get(self.manager._path, _parent=_parent, limit=limit,
+                               page_size=page_size,
+                               resolve_parent=resolve_parent, fields=fields)
+
+    def iter_all(
+        self,
+        _parent: ObjectBase = None,
+        limit: Union[int, None] = None,
+        page_size: Union[int, None] = None,
+        resolve_parent: bool = True,
+        fields: Union[Iterable[str], None] = None
+    ) -> AsyncIterator[ObjectBase]:
+        """Lazily iterates (`async for`) over all objects from the server for
+            this manager's path (see `GetMixins.iter_all`).
+
+        Yields:
+            ObjectBase: The objects retrieved from the server.
+        """
+        return self._iter(self.manager._path, _parent=_parent, limit=limit,
+                          page_size=page_size, resolve_parent=resolve_parent,
+                          fields=fields)
+
+    async def get_by_id(
+        self,
+        id_: Any,
+        use_cache=True,
+        _parent=None,
+        resolve_parent: bool = True,
+        fields: Union[Iterable[str], None] = None
+    ) -> ObjectBase:
+        """Retrieves an object by its ID from the server or cache (see `GetMixins.get_by_id`).
+
+        Returns:
+            ObjectBase: The object with the specified ID
+        """
+        if use_cache:
+            obj = self.manager._get_object_from_cache(id_)
+            if obj:
+                if _parent and not obj._parent:
+                    obj._parent = _parent
+                return obj
+
+        objs = await self._get(f'{self.manager._path}/{id_}', _parent=_parent,
+                               paginate=False, resolve_parent=resolve_parent,
+                               fields=fields)
+        return objs[0]
+
+    async def get_many(
+        self,
+        ids: Iterable[Any],
+        use_cache: bool = True,
+        _parent=None,
+        resolve_parent: bool = True,
+        fields: Union[Iterable[str], None] = None
+    ) -> List[ObjectBase]:
+        """Retrieves many objects by their IDs, requesting them concurrently (see `GetMixins.get_many`).
+
+        The number of requests in flight is bounded by the client `max_connections`.
+
+        Returns:
+            List[ObjectBase]: The objects found, in the same order of `ids`. The IDs that
+                couldn't be retrieved are in the `errors` attribute (id -> exception).
+        """
+        ids = list(dict.fromkeys(ids))
+
+        if use_cache:
+            objs, missing_ids = self.manager._get_many_from_cache(ids)
+        else:
+            objs, missing_ids = {}, ids
+
+        errors = {}
+        if missing_ids:
+            results = await asyncio.gather(*[
+                self.get_by_id(id_, use_cache=False, resolve_parent=False,
+                               fields=fields)
+                for id_ in missing_ids
+            ], return_exceptions=True)
+
+            missing_objs = []
+            for id_, result in zip(missing_ids, results):
+                if isinstance(result, Exception):
+                    errors[id_] = result
+                else:
+                    missing_objs.append(result)
+
+            # The parents of all objects are resolved in batch
+            await self._attach_parent_objs(missing_objs, _parent, resolve_parent)
+            objs.update((obj._id, obj) for obj in missing_objs)
+
+        for obj in objs.values():
+            if _parent and not obj._parent:
+                obj._parent = _parent
+
+        return ObjectListManager(
+            [objs[id_] for id_ in ids if id_ in objs], errors=errors)
+
+    async def get_by_crit(
+        self,
+        crit: dict[str, Any],
+        _parent=None,
+        limit: Union[int, None] = None,
+        page_size: Union[int, None] = None,
+        resolve_parent: bool = True,
+        fields: Union[Iterable[str], None] = None
+    ) -> List[ObjectBase]:
+        """Get objects matching specified criteria from the Mantis server (see
+            `GetByCriteriaMixins.get_by_crit`).
+
+        Returns:
+            List[ObjectBase]: List of objects matching the specified criteria
+        """
+        return await self._get(self.manager._path, crit, _parent, limit=limit,
+                               page_size=page_size,
+                               resolve_parent=resolve_parent, fields=fields)
+
+    def iter_by_crit(
+        self,
+        crit: dict[str, Any],
+        _parent=None,
+        limit: Union[int, None] = None,
+        page_size: Union[int, None] = None,
+        resolve_parent: bool = True,
+        fields: Union[Iterable[str], None] = None
+    ) -> AsyncIterator[ObjectBase]:
+        """Lazily iterates (`async for`) over the objects matching specified
+            criteria from the Mantis server (see `GetByCriteriaMixins.iter_by_crit`).
+
+        Yields:
+            ObjectBase: The objects matching the specified criteria
+        """
+        return self._iter(self.manager._path, crit, _parent, limit=limit,
+                          page_size=page_size, resolve_parent=resolve_parent,
+                          fields=fields)
+
+    def __repr__(self) -> str:
+        """Return string representation of the async manager."""
+        return f'Async{self.manager.__class__.__name__}()'
+
+
+class AsyncMantisBT(MantisBT):
+    """A asyncio client for interacting with the MantisBT API.
+
+    The same of `MantisBT`, but the `projects`, `issues` and `notes` managers are
+    awaitable and the HTTP requests never block the event loop. Use it as a
+    async context manager (or call `close()`) to release the connections, e.g:
+
+        async with AsyncMantisBT(url, token) as client:
+            projects = await client.projects.get_all()
+
+    Attributes:
+        _async_requests (AsyncMantisRequests): Instance of AsyncMantisRequests
+                                                       for making API calls.
+        max_connections (int): Maximum number of simultaneous connections.
+
+        projects (AsyncObjectManager): Manager for project-related operations.
+        issues (AsyncObjectManager): Manager for issue-related operations.
+        notes (AsyncObjectManager): Manager for note-related operations.
+    """
+
+    def __init__(
+            self,
+            url: str,
+            user_api_token: str,
+            timeout: Union[str, None] = None,
+            mantis_api_version: str = 'v1',
+            max_connections: int = const.ASYNC_DEFAULT_MAX_CONNECTIONS,
+            **kwargs
+    ) -> None:
+        """
+        Initialize a new asyncio MantisBT API client.
+
+        Args:
+            url: Full URL of the MantisBT instance
+            user_api_token: API token for authentication
+            timeout: Request timeout value (optional)
+            mantis_api_version: Version of MantisBT API to use (optional)
+            max_connections: Maximum number of simultaneous connections (optional)
+            **kwargs: Other arguments of `MantisBT` (e.g: `cache_max_size`)
+        """
+        # The HTTP connection pool must have room for all connections
+        kwargs.setdefault('pool_maxsize', max_connections)
+
+        super().__init__(url, user_api_token, timeout, mantis_api_version,
+                         **kwargs)
+
+        self.max_connections = max_connections
+        self._async_requests = AsyncMantisRequests(
+            self._requests, max_connections)
+
+        self.projects = AsyncObjectManager(self.projects, self._async_requests)
+        self.issues = AsyncObjectManager(self.issues, self._async_requests)
+        self.notes = AsyncObjectManager(self.notes, self._async_requests)
+
+    async def close(self) -> None:
+        """Release the HTTP connections of the client."""
+        await self._async_requests.close()
+
+    async def __aenter__(self) -> AsyncMantisBT:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
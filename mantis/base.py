@@ -1,26 +1,157 @@
 from __future__ import annotations
 
 import operator
-from typing import TypeVar, Generic, Any, Union, List, Set
+import threading
+from itertools import islice
+from typing import TypeVar, Generic, Any, Callable, Iterable, Iterator, Union, List
 
+from mantis import const
 from mantis._requests.mantis_requests import MantisRequests
+from mantis.cache import ObjectCache
+from mantis.columns import Column, ColumnsBuilder, columns_to_arrow
+from mantis.decoders import encode_value
+from mantis.exceptions import UnknownFieldsError
+from mantis.query import QueryIndexes, compile_conditions, parse_conditions
 
 
-__all__ = ['ObjectBase', 'ObjectManagerBase']
+__all__ = ['LazyDecodedAttr', 'ObjectAttrsLayout', 'ObjectBase', 'ObjectManagerBase']
 
 
-# LIST of TODOs:
-# TODO: Create logic to mapping fields updated in the object, to be used in the `save()` method
+class LazyDecodedAttr:
+    """Descriptor of a attribute decoded (to a typed value) on the first access.
 
-# TODO: Implement convertion of attributes value in specific types (e.g: date, datetime, etc)
-#       e.g: `created_at` attribute is a string, but should be a datetime object
+    The raw value (as received from the server) is stored in a slot, the decoded
+    value is memoized in the `_decoded` dict of the object (created on the first
+    decoding). So, the attributes never read don't cost anything.
+    """
+
+    __slots__ = ('name', 'raw_slot', 'decoder')
+
+    def __init__(self, name: str, raw_slot: Any, decoder: Callable) -> None:
+        """Create a new LazyDecodedAttr instance.
+
+        Args:
+            name (str): The attribute name
+            raw_slot (Any): The slot descriptor of the raw value
+            decoder (Callable): The decoder (`decoder(obj, value) -> Any`)
+        """
+        self.name = name
+        self.raw_slot = raw_slot
+        self.decoder = decoder
+
+    def __get__(self, obj: Union[ObjectBase, None], objtype=None) -> Any:
+        if obj is None:
+            return self
+
+        decoded = obj._decoded
+        if decoded is not None and self.name in decoded:
+            return decoded[self.name]
+
+        value = self.raw_slot.__get__(obj, objtype)
+        if value is None:
+            return None
+
+        value = self.decoder(obj, value)
+        if decoded is None:
+            decoded = obj._decoded = {}
+        decoded[self.name] = value
+
+        return value
+
+    def __set__(self, obj: ObjectBase, value: Any) -> None:
+        self.raw_slot.__set__(obj, value)
+        if obj._decoded:
+            obj._decoded.pop(self.name, None)
+
+
+class ObjectAttrsLayout:
+    """The attributes layout of the objects of a manager class, precomputed once.
+
+    The objects don't have a `__dict__`: each attribute is stored in a slot of
+    a compact class, created once by layout (a subclass of the object class,
+    with the same name), e.g: `IssueObj` objects are instances of a `IssueObj`
+    subclass with one slot by issue attribute.
+
+    The attributes with a decoder (see `mantis.decoders`) keep the raw value in
+    a `_raw_<name>` slot and are decoded lazily by a `LazyDecodedAttr`.
+
+    Atributes:
+        names (tuple[str]): All attributes (mandatory + optional), without duplicates
+        all_names (frozenset[str]): All attributes, as a set
+        readonly (frozenset[str]): The read only attributes
+        decoders (dict[str, Callable]): The decoders of the attributes
+    """
+
+    __slots__ = ('names', 'all_names', 'readonly', 'decoders', '_obj_classes')
+
+    def __init__(self, manager_cls: type[ObjectManagerBase]) -> None:
+        """Create a new ObjectAttrsLayout instance.
+
+        Args:
+            manager_cls (type[ObjectManagerBase]): The manager class
+        """
+        self.names = tuple(dict.fromkeys(
+            manager_cls._mandatory_attr + manager_cls._optional_attr))
+        self.all_names = frozenset(self.names)
+        self.readonly = frozenset(manager_cls._readonly_attr)
+        self.decoders = dict(manager_cls._decoders)
+        self._obj_classes: dict[type, type] = {}
+
+    def get_obj_cls(self, cls: type[ObjectBase]) -> type[ObjectBase]:
+        """Get the compact class (of this layout) of a object class.
+
+        Args:
+            cls (type[ObjectBase]): The object class (e.g: IssueObj)
+
+        Returns:
+            type[ObjectBase]: The compact class
+        """
+        if cls.__dict__.get('_attrs_layout') is self:
+            return cls
+
+        obj_cls = self._obj_classes.get(cls)
+        if obj_cls is None:
+            # An attribute with the name of a method/property of the object
+            #   class can't be a slot, it's stored in the `_extra` dict
+            slot_attrs = tuple(
+                (name, f'_raw_{name}' if name in self.decoders else name)
+                for name in self.names if not hasattr(cls, name))
+            raw_slots = dict(slot_attrs)
+
+            obj_cls = type(cls)(cls.__name__, (cls,), {
+                '__slots__': tuple(raw_slots.values()),
+                '__module__': cls.__module__,
+                '__qualname__': cls.__qualname__,
+                '_attrs_layout': self,
+                '_slots': frozenset(raw_slots),
+                '_slot_attrs': slot_attrs,
+                '_raw_slots': raw_slots,
+                # The decoded attributes are accessed by name and by raw slot
+                '_fields_by_attr': {
+                    **{name: name for name, _ in slot_attrs},
+                    **{slot: name for name, slot in slot_attrs}
+                },
+                '_extra_attrs': tuple(
+                    name for name in self.names if name not in raw_slots)
+            })
+
+            for name, slot in slot_attrs:
+                if name != slot:
+                    setattr(obj_cls, name, LazyDecodedAttr(
+                        name, obj_cls.__dict__[slot], self.decoders[name]))
+
+            self._obj_classes[cls] = obj_cls
+
+        return obj_cls
 
-# TODO: Implement a way to has multiple childs. e.g: In NoteObj we have a attribute called `reporter` this attribute should be a `UserObj` object
 
 class ObjectBase:
     """A generic class to represent a object from Mantis.
     Use this class to create a object representation of a Mantis object.
 
+    The attributes are stored in slots (see `ObjectAttrsLayout`), so the subclasses
+    must define `__slots__` (e.g: `__slots__ = ()`) to keep the objects compact.
+
     Atributes to be replaced in your own class:
         _repr_attrs (list[str]): List of attributes to be shown in __repr__ method (mandatory)
         _read_only_obj (bool): If True, object cannot be changed. Default False (optional)
@@ -28,6 +159,12 @@ class ObjectBase:
     Atributes:
         manager (ObjectManagerBase): Manager of this object
         _parent (ObjectBase): The Parent object
+        _extra (dict): Attributes that are not in the manager definition (or that can't be slots)
+        _decoded (dict): The decoded values of the attributes already read (see `LazyDecodedAttr`)
+        _loaded_fields (frozenset[str]): The attributes received from the server, when only
+                        some of them were requested (see `fields`). None means all attributes.
+        _dirty (set[str]): The attributes changed (`obj[attr] = value`) and not sent to
+                                           the server yet. None means no changes.
 
         _id (Any): The id of the object
         mandatory_attrs (tuple[str]): List of mandatory attributes (obteined from manager object)
@@ -37,18 +174,38 @@ class ObjectBase:
     Raises:
         AttributeError: If try to set a read only attribute or the object is read only
     """
+    __slots__ = ('manager', '_parent', '_extra', '_decoded', '_loaded_fields', '_dirty')
+
     _repr_attrs: list[str] = ['id']
     _read_only_obj: bool = False
 
-    _parent: Union[ObjectBase, None] = None
+    _attrs_layout: ObjectAttrsLayout = None
+    _slots: frozenset[str] = frozenset()
+    _slot_attrs: tuple[tuple[str, str]] = ()
+    _raw_slots: dict[str, str] = {}
+    _fields_by_attr: dict[str, str] = {}
+    _extra_attrs: tuple[str] = ()
 
     manager: ObjectManagerBase[Any]
 
+    def __new__(
+        cls,
+        manager: Union[ObjectManagerBase, None] = None,
+        *args,
+        **kwargs
+    ) -> ObjectBase:
+        """Create the object as a instance of the compact class of the manager layout."""
+        if manager is not None:
+            cls = manager._get_attrs_layout().get_obj_cls(cls)
+
+        return super().__new__(cls)
+
     def __init__(
         self,
         manager: ObjectManagerBase,
         attrs: dict[Any],
-        _parent: Union[ObjectBase, None] = None
+        _parent: Union[ObjectBase, None] = None,
+        _fields: Union[frozenset[str], None] = None
     ) -> None:
         """Create a new ObjectBase instance.
 
@@ -56,19 +213,147 @@ class ObjectBase:
             manager (ObjectManagerBase): The manager object of this object
             attrs (dict[Any]): The all attributes of the object
             _parent (Union[ObjectBase, None], optional): The parent object. Defaults to None.
+            _fields (Union[frozenset[str], None], optional): The attributes requested to the
+                server, the others are loaded on the first access. Defaults to None (all).
         """
         self.manager = manager
         self._parent = _parent
+        self._extra = None
+        self._decoded = None
+        self._loaded_fields = _fields
+        self._dirty = None
+
+        get_value = attrs.get
+        if _fields is None:
+            for attr_name, slot_name in self._slot_attrs:
+                setattr(self, slot_name, get_value(attr_name))
+
+            for attr_name in self._extra_attrs:
+                self._set_extra(attr_name, get_value(attr_name))
+        else:
+            # The slots of the attributes not loaded stay empty, so the first
+            #   access goes to `__getattr__` (that loads them)
+            for attr_name, slot_name in self._slot_attrs:
+                if attr_name in _fields:
+                    setattr(self, slot_name, get_value(attr_name))
+
+            for attr_name in self._extra_attrs:
+                if attr_name in _fields:
+                    self._set_extra(attr_name, get_value(attr_name))
+
+    def __getattr__(self, name: str) -> Any:
+        """Called only when a slot is empty: load the attributes not requested
+            to the server (see `fields`) on the first access, with one request."""
+        field = self._fields_by_attr.get(name)
+        if field is None or self.is_loaded(field):
+            raise AttributeError(
+                f'{self.__class__.__name__!r} object has no attribute {name!r}')
+
+        self._load_missing_fields()
+
+        return getattr(self, name)
+
+    def is_loaded(self, field: str) -> bool:
+        """Check if a attribute was received from the server (see `fields`).
+
+        Args:
+            field (str): The attribute name
+
+        Returns:
+            bool: True if the attribute was loaded, False otherwise
+        """
+        return self._loaded_fields is None or field in self._loaded_fields
+
+    def _load_missing_fields(self) -> None:
+        """Request all attributes not loaded yet to the server (one request)."""
+        fields = [name for name in self._attrs_layout.names
+                  if not self.is_loaded(name)]
+        if fields:
+            self.manager._load_fields(self, fields)
+
+    def _set_fields(self, attrs: dict[str, Any], fields: Iterable[str]) -> None:
+        """Set (as loaded) some attributes of the object, received from the server.
 
-        for attr_name in self._get_all_attrs_definition():
-            self.__setitem__(attr_name, attrs.get(attr_name, None), True)
+        Args:
+            attrs (dict[str, Any]): The attributes received from the server
+            fields (Iterable[str]): The attributes requested
+        """
+        fields = [name for name in fields if name in self._attrs_layout.all_names]
+        for name in fields:
+            slot_name = self._raw_slots.get(name)
+            if slot_name is not None:
+                setattr(self, slot_name, attrs.get(name))
+            else:
+                self._set_extra(name, attrs.get(name))
+
+            if self._decoded:
+                self._decoded.pop(name, None)
+
+        self._mark_loaded(fields)
+
+        # The values of the server replace the changes not sent
+        if self._dirty:
+            self._dirty.difference_update(fields)
+
+    def _mark_loaded(self, fields: Iterable[str]) -> None:
+        """Mark some attributes as loaded (see `fields`)."""
+        if self._loaded_fields is None:
+            return
+
+        loaded_fields = self._loaded_fields.union(fields)
+        self._loaded_fields = (
+            None if loaded_fields >= self._attrs_layout.all_names
+            else loaded_fields)
+
+    def _set_extra(self, key: Any, value: Any) -> None:
+        """Set the value of a attribute that isn't stored in a slot."""
+        if self._extra is None:
+            self._extra = {}
+
+        self._extra[key] = value
+
+    def get_raw(self, key: Any, default: Any = None) -> Any:
+        """Get the raw value of a attribute (as received from the server, without decoding).
+
+        Args:
+            key (Any): The attribute name
+            default (Any, optional): The value if the attribute doesn't exist. Defaults to None.
+
+        Returns:
+            Any: The raw value
+        """
+        slot_name = self._raw_slots.get(key)
+        if slot_name is not None:
+            return getattr(self, slot_name)
+
+        if not self.is_loaded(key) and key in self._attrs_layout.all_names:
+            self._load_missing_fields()
+
+        if self._extra is not None:
+            return self._extra.get(key, default)
+
+        return default
 
     def __getitem__(self, item):
-        """Get the value of a attribute."""
-        return self.__dict__[item]
+        """Get the value of a attribute (decoded, see `mantis.decoders`)."""
+        if item in self._slots:
+            return getattr(self, item)
+
+        if self._extra is not None and item in self._extra:
+            return self._extra[item]
+
+        if not self.is_loaded(item) and item in self._attrs_layout.all_names:
+            self._load_missing_fields()
+            return self._extra[item]
+
+        raise KeyError(item)
 
     def __setitem__(self, key: Any, value: Any, force: bool = False) -> None:
-        """Set the value of a attribute.
+        """Set the value of a attribute. The attribute is marked as changed (see
+            `dirty_fields`), to be sent to the server by the `save()` method.
+
+        The typed values are stored as raw values (see `mantis.decoders.encode_value`),
+        e.g: `issue['handler'] = user` stores the reference `{'id': user.id}`.
 
         Args:
             key (Any): The attribute name
@@ -84,12 +369,49 @@ class ObjectBase:
                 raise AttributeError(
                     f'Object {self.__class__.__name__} is read only'
                 )
-            if key in self.readonly_attr:
+            if key in self._attrs_layout.readonly:
                 raise AttributeError(
                     f'Attribute {key} is read only'
                 )
 
-        self.__dict__[key] = value
+        value = encode_value(value)
+        if key in self._slots:
+            setattr(self, key, value)
+        else:
+            self._set_extra(key, value)
+
+        # A value set by the user is never replaced by a (lazy) load
+        if not self.is_loaded(key):
+            self._mark_loaded((key, ))
+
+        if self._dirty is None:
+            self._dirty = set()
+        self._dirty.add(key)
+
+    @property
+    def dirty_fields(self) -> frozenset[str]:
+        """The attributes changed and not sent to the server yet."""
+        return frozenset(self._dirty or ())
+
+    @property
+    def is_dirty(self) -> bool:
+        """True if some attribute was changed and not sent to the server yet."""
+        return bool(self._dirty)
+
+    def get_changes(self) -> dict[str, Any]:
+        """Get the raw values of the attributes changed (the payload of a update).
+
+        Returns:
+            dict[str, Any]: The raw values, by attribute
+        """
+        return {key: self.get_raw(key) for key in self._dirty or ()}
+
+    def _clear_dirty(self, fields: Union[Iterable[str], None] = None) -> None:
+        """Mark some attributes (None means all) as sent to the server."""
+        if fields is None or not self._dirty:
+            self._dirty = None
+        else:
+            self._dirty.difference_update(fields)
 
     @property
     def mandatory_attrs(self):
@@ -108,12 +430,12 @@ class ObjectBase:
 
     def __contains__(self, item: Any) -> bool:
         """Check if a attribute is in the object."""
-        return item in self.__dict__
+        return item in self._slots or (
+            self._extra is not None and item in self._extra)
 
-    def _get_all_attrs_definition(self) -> List[str]:
+    def _get_all_attrs_definition(self) -> tuple[str]:
         """Get all attributes definition(mandatory + optional) from the manager object."""
-        return (list(self.mandatory_attrs)
-                + list(self.optional_attrs))
+        return self._attrs_layout.names
 
     def _parse_attrs_to__repr(self):
         """Parse the attributes (from _repr_attr) to be shown in __repr__ method.
@@ -124,13 +446,19 @@ class ObjectBase:
         attrs = []
         for attr in self._repr_attrs:
             if attr.startswith('{') and attr.endswith('}'):
-                value = attr.format(**self.__dict__)
+                try:
+                    value = attr.format(**self.to_dict())
+                except (KeyError, TypeError):
+                    # Attribute not loaded (see `fields`) or empty
+                    continue
                 for pattern, value_to_replace in (
                     ('{', ''), ('}', ''), ('[', '.'), (']', '')
                 ):
                     attr = attr.replace(pattern, value_to_replace)
-            else:
+            elif self.is_loaded(attr):
                 value = self.get(attr, "")
+            else:
+                continue
 
             attrs.append(f'{attr}={value}')
 
@@ -138,7 +466,10 @@ class ObjectBase:
 
     def get(self, key, default=None):
         """Get the value of a attribute."""
-        return self.__dict__.get(key, default)
+        try:
+            return self[key]
+        except KeyError:
+            return default
 
     def _parse_class_name(self):
         """Parse the class name to be shown in __repr__ method."""
@@ -194,15 +525,14 @@ class ObjectBase:
     @property
     def _id(self):
         """Get the id of the object."""
-        return self[self.manager._id_attr]
+        return self.get(self.manager._id_attr)
 
     def to_dict(self):
-        """Return a dictionary representation of the object. Converting all attributes to a dictionary."""
-        _dict = {}
-        for attr in self._get_all_attrs_definition():
-            _dict[attr] = self.get(attr)
-
-        return _dict
+        """Return a dictionary representation of the object. Converting all attributes
+            to a dictionary (with the raw values, as received from the server).
+            Only the loaded attributes are converted (see `fields`)."""
+        return {attr: self.get_raw(attr) for attr in self._attrs_layout.names
+                if self.is_loaded(attr)}
 
     def _hash_string(self):
         """Return a string representation of the object to be used in the hash."""
@@ -227,16 +557,29 @@ class ObjectManagerBase(Generic[TObjBaseClass]):
         _id_attr (str): The attribute that represents the id of the object (mandatory)
         _key_response (tuple[str]): The key/keys to be used to get the object
                                              from the Mantis response (optional)
+        _key_create_response (tuple[str]): The key/keys to get the object created from the
+                       response of a creation (optional, default `_key_response`)
         _mandatory_attr (tuple[str]): List of mandatory attributes (mandatory)
         _optional_attr (tuple[str]): List of optional attributes (mandatory)
         _readonly_attr (tuple[str]): List of read only attributes (optional)
         _obj_cls (type): The class of the objects to be managed (mandatory)
-        _parent_id_attr (str): The attribute that represents the parent id (optional)
+        _parent_id_attr (Union[str, tuple[str]]): The attribute (or the nested keys to the
+                                            attribute) that represents the parent id (optional)
         _child_manager_cls (ObjectManagerBase): The manager of the child object (optional)
+        _children_attr (str): The attribute of the child objects, when the server can embed them
+                    in the response of the objects (e.g: the notes of the issues). The objects
+                                   must implement `_set_children` (optional)
         _fixed_criteria (dict): Fixed filter/criteria to be used in the requests (optional)
+        _decoders (dict[str, Callable]): The decoders of the attributes, decoded lazily
+                                                 (see `mantis.decoders`) (optional)
+        _select_param (str): The param to select the attributes returned by the server, used by
+                         `fields` (optional). When None, all attributes are always requested.
+        _paginated (bool): If True, the endpoint is paginated by Mantis (`page`/`page_size`
+                                                         params). Default False (optional)
+        _page_size (int): Default number of objects requested per page (optional)
 
     Atributes:
-        _managed_obj_lst (set): The list of managed objects (internal cache)
+        _cache (ObjectCache): The internal cache of objects (shared with the parent/child managers)
         request (MantisRequests): The request object to be used in the manage
         _manager_parent_obj (ObjectManagerBase): The parent manager object
         _child_manager_obj (ObjectManagerBase): The child manager object
@@ -246,6 +589,7 @@ class ObjectManagerBase(Generic[TObjBaseClass]):
     _path: str = None
     _id_attr: str = 'id'
     _key_response: Union[tuple[str], None] = None
+    _key_create_response: Union[tuple[str], None] = None
 
     _mandatory_attr: tuple[str] = tuple()
     _optional_attr: tuple[str] = tuple()
@@ -253,31 +597,137 @@ class ObjectManagerBase(Generic[TObjBaseClass]):
     _readonly_attr: tuple[str] = tuple()
 
     _obj_cls: type[TObjBaseClass]
-    _managed_obj_lst: Set[TObjBaseClass] = set()
 
-    _parent_id_attr: str = None
+    _parent_id_attr: Union[str, tuple[str], None] = None
 
     _child_manager_cls: Union[ObjectManagerBase[Any], None] = None
 
+    _children_attr: Union[str, None] = None
+
     _fixed_criteria: dict[str, Any] = {}
 
+    _decoders: dict[str, Callable[[ObjectBase, Any], Any]] = {}
+
+    _select_param: Union[str, None] = None
+
+    _paginated: bool = False
+    _page_size: int = const.PAGINATION_DEFAULT_PAGE_SIZE
+
+    _attrs_layout: ObjectAttrsLayout = None
+
     def __init__(
         self,
         request: MantisRequests,
-        manager_parent_obj: Union[TObjManagerClass, None] = None
+        manager_parent_obj: Union[TObjManagerClass, None] = None,
+        cache: Union[ObjectCache, None] = None
     ):
         """Create a new ObjectManagerBase instance.
 
         Args:
             request (MantisRequests): The request object to be used in the manager
             manager_parent_obj (Union[TObjManagerClass, None], optional): The parent manager object. Defaults to None.
+            cache (Union[ObjectCache, None], optional): The internal cache of objects. Defaults to None
+                                     (use the parent manager cache or create a new one).
         """
         self.request = request
         self._manager_parent_obj = manager_parent_obj
 
+        if cache is None:
+            cache = (manager_parent_obj._cache if manager_parent_obj
+                     else ObjectCache())
+        self._cache = cache
+        self._related_managers: dict[type, ObjectManagerBase] = {}
+
         if self._child_manager_cls:
             self._child_manager_obj = self._child_manager_cls(request, self)
 
+    @classmethod
+    def _get_attrs_layout(cls) -> ObjectAttrsLayout:
+        """Get the attributes layout of the objects (computed once by manager class).
+
+        Returns:
+            ObjectAttrsLayout: The attributes layout
+        """
+        layout = cls.__dict__.get('_attrs_layout')
+        if layout is None:
+            layout = cls._attrs_layout = ObjectAttrsLayout(cls)
+
+        return layout
+
+    def _get_related_manager(
+        self,
+        manager_cls: type[TObjManagerClass]
+    ) -> TObjManagerClass:
+        """Get a manager of other objects referenced by the objects of this manager
+            (e.g: the `UserManager` of the issue `reporter`), sharing the request and cache.
+
+        Args:
+            manager_cls (type[TObjManagerClass]): The manager class
+
+        Returns:
+            TObjManagerClass: The parent manager (if is of this class) or a new manager (created once)
+        """
+        if isinstance(self._manager_parent_obj, manager_cls):
+            return self._manager_parent_obj
+
+        manager = self._related_managers.get(manager_cls)
+        if manager is None:
+            manager = self._related_managers[manager_cls] = manager_cls(
+                self.request, cache=self._cache)
+
+        return manager
+
+    def _normalize_fields(
+        self,
+        fields: Union[Iterable[str], None]
+    ) -> Union[frozenset[str], None]:
+        """Normalize the attributes to be loaded, adding the attributes needed by
+            the manager (the id and the parent id).
+
+        Args:
+            fields (Union[Iterable[str], None]): The attributes names
+
+        Raises:
+            UnknownFieldsError: If a attribute isn't defined in the manager
+
+        Returns:
+            Union[frozenset[str], None]: The attributes or None (all attributes)
+        """
+        if fields is None:
+            return None
+
+        all_names = self._get_attrs_layout().all_names
+        fields = set(fields)
+        unknown_fields = fields - all_names
+        if unknown_fields:
+            raise UnknownFieldsError(sorted(unknown_fields), self._obj_cls.__name__)
+
+        fields.add(self._id_attr)
+        if self._parent_id_attr:
+            fields.add(self._parent_id_attr if isinstance(self._parent_id_attr, str)
+                       else self._parent_id_attr[0])
+
+        return None if fields >= all_names else frozenset(fields)
+
+    def _get_fields(
+        self,
+        fields: Union[Iterable[str], None]
+    ) -> Union[frozenset[str], None]:
+        """Get the attributes to be requested to the server (see `_normalize_fields`).
+
+        Args:
+            fields (Union[Iterable[str], None]): The attributes names
+
+        Returns:
+            Union[frozenset[str], None]: The attributes or None (all attributes, also
+                                         when the server can't select the attributes)
+        """
+        fields = self._normalize_fields(fields)
+        if not self._select_param:
+            return None
+
+        return fields
+
     def has_parent(self) -> bool:
         """Check if the manager has a parent object.
 
@@ -286,27 +736,100 @@ class ObjectManagerBase(Generic[TObjBaseClass]):
         """
         return bool(self._manager_parent_obj and self._parent_id_attr)
 
-    def _get_parent_obj_if_exist(
+    def _get_parent_id(self, obj: TObjBaseClass) -> Any:
+        """Get the parent id of a object, using the `_parent_id_attr`.
+
+        Args:
+            obj (TObjBaseClass): The object to get the parent id
+
+        Returns:
+            Any: The parent id or None
+        """
+        # The parent id can be a nested attribute, e.g: ('project', 'id')
+        if isinstance(self._parent_id_attr, str):
+            return obj.get_raw(self._parent_id_attr)
+
+        value = obj.get_raw(self._parent_id_attr[0])
+        for key in self._parent_id_attr[1:]:
+            if not value:
+                return None
+            value = value.get(key)
+
+        return value
+
+    def _must_resolve_parent(
         self,
-        obj: TObjBaseClass,
-        _parent_obj=None
-    ) -> Union[TObjBaseClass, None]:
-        """Get the parent object if exists.
+        _parent_obj=None,
+        resolve_parent: bool = True
+    ) -> bool:
+        """Check if the parent objects must be searched in the parent manager.
 
         Args:
-            obj (TObjBaseClass): The main object to get the parent
             _parent_obj (_type_, optional): The parent object (if already exists). Defaults to None.
+            resolve_parent (bool, optional): If False, the parent objects aren't
+                                  searched in the parent manager. Defaults to True.
+
+        Returns:
+            bool: True if the parent objects must be searched, False otherwise
+        """
+        return not _parent_obj and resolve_parent and self.has_parent()
+
+    def _get_distinct_parent_ids(self, obj_list: List[TObjBaseClass]) -> List[Any]:
+        """Get the distinct parent ids of a list of objects (keeping the order).
+
+        Args:
+            obj_list (List[TObjBaseClass]): The objects to get the parent ids
 
         Returns:
-            Union[TObjBaseClass, None]: The parent object or None
+            List[Any]: The distinct parent ids
+        """
+        parent_ids = {}
+        for obj in obj_list:
+            parent_id = self._get_parent_id(obj)
+            if parent_id:
+                parent_ids[parent_id] = None
+
+        return list(parent_ids)
+
+    def _set_parent_objs(
+        self,
+        obj_list: List[TObjBaseClass],
+        parent_objs: dict[Any, ObjectBase]
+    ) -> None:
+        """Set the parent object of each object of a list.
+
+        Args:
+            obj_list (List[TObjBaseClass]): The objects to set the parent
+            parent_objs (dict[Any, ObjectBase]): The parent objects, by id
         """
-        if self.has_parent():
-            if not _parent_obj:
-                parent_id = obj.get(self._parent_id_attr)
-                if parent_id:
-                    _parent_obj = self._manager_parent_obj.get_by_id(parent_id)
+        for obj in obj_list:
+            obj._parent = parent_objs.get(self._get_parent_id(obj))
+
+    def _attach_parent_objs(
+        self,
+        obj_list: List[TObjBaseClass],
+        _parent_obj=None,
+        resolve_parent: bool = True
+    ) -> None:
+        """Attach the parent object to each object of a list.
 
-        return _parent_obj
+        The parent objects are resolved in batch: the distinct parent ids are
+            collected and requested only once to the parent manager (internal cache first).
+
+        Args:
+            obj_list (List[TObjBaseClass]): The objects to attach the parent
+            _parent_obj (_type_, optional): The parent object (if already exists). Defaults to None.
+            resolve_parent (bool, optional): If False, the parent objects aren't
+                                  searched in the parent manager. Defaults to True.
+        """
+        if not self._must_resolve_parent(_parent_obj, resolve_parent):
+            for obj in obj_list:
+                obj._parent = _parent_obj
+            return
+
+        parent_ids = self._get_distinct_parent_ids(obj_list)
+        self._set_parent_objs(
+            obj_list, self._manager_parent_obj._get_many_by_id(parent_ids))
 
     def _update_cache(self, obj: TObjBaseClass) -> None:
         """Update a internal cache of objects.
@@ -314,11 +837,7 @@ class ObjectManagerBase(Generic[TObjBaseClass]):
         Args:
             obj (TObjBaseClass): The object to be updated in the cache
         """
-        if obj in self._managed_obj_lst:
-            self._managed_obj_lst.remove(obj)
-            self._managed_obj_lst.add(obj)
-        else:
-            self._managed_obj_lst.add(obj)
+        self._cache.set(obj, self._obj_cls)
 
     def _get_object_from_cache(self, id_: Any) -> Union[TObjBaseClass, None]:
         """Get a object from the internal cache
@@ -329,34 +848,182 @@ class ObjectManagerBase(Generic[TObjBaseClass]):
         Returns:
             Union[TObjBaseClass, None]: The object or None
         """
-        obj = None
+        return self._cache.get(self._obj_cls, id_)
+
+    def _get_many_from_cache(
+        self,
+        ids: List[Any]
+    ) -> tuple[dict[Any, TObjBaseClass], List[Any]]:
+        """Get many objects from the internal cache
+
+        Args:
+            ids (List[Any]): The ids of the objects to be get
 
-        fake_obj = self._obj_cls(self, {'id': id_})
-        if fake_obj in self._managed_obj_lst:
-            obj = self._managed_obj_lst.pop(fake_obj)
-            self._managed_obj_lst.add(obj)
+        Returns:
+            tuple[dict[Any, TObjBaseClass], List[Any]]: The objects found (by id)
+                                               and the ids not found in the cache
+        """
+        objs = {}
+        missing_ids = []
+        for id_ in ids:
+            obj = self._get_object_from_cache(id_)
+            if obj:
+                objs[id_] = obj
+            else:
+                missing_ids.append(id_)
 
-        return obj
+        return objs, missing_ids
 
 
 TObjManagerClass = TypeVar('TObjManagerClass', bound=ObjectManagerBase)
 
 
 class ObjectListManager:
-    """A class to manage lists of Mantis objects with iteration, filtering and sorting capabilities."""
+    """A class to manage lists of Mantis objects with iteration, filtering and sorting capabilities.
+
+    The list is a lazy view: the source can be a list or any iterable (e.g: a
+    paginated server iterator, `IssueManager.iter_by_crit`). The objects are
+    received on demand (indexing only receives the objects until the index) and
+    kept, so the list can be iterated many times (each `iter()` is independent).
+
+    `filter`, `sort`, `map` and the slices return new views, executed on demand:
+    a chain of filters/maps/slices is executed in one pass over the source. When
+    the source is complete, the filters use the indexes (see `mantis.query`).
 
-    def __init__(self, objects: List[ObjectBase]):
+    Atributes:
+        objects (List[ObjectBase]): All objects (received from the source, if needed)
+        errors (dict[Any, Exception]): The errors of the objects that couldn't be retrieved, by ID
+        current_index (int): The position of the cursor (see `next`/`previous`)
+    """
+
+    def __init__(
+        self,
+        objects: Union[Iterable[ObjectBase], None] = None,
+        errors: Union[dict[Any, Exception], None] = None,
+        _parent: Union[ObjectListManager, None] = None,
+        _op: Union[tuple, None] = None
+    ):
         """Initialize with list of objects.
 
         Args:
-            objects (List[ObjectBase]): List of Mantis objects to manage
+            objects (Union[Iterable[ObjectBase], None], optional): List of Mantis objects to manage, or a
+                        iterable (received on demand). Defaults to None (empty list).
+            errors (Union[dict[Any, Exception], None], optional): The errors of the objects that
+                couldn't be retrieved, by ID (e.g: in `get_many`). Defaults to None.
         """
-        self.objects = objects
+        self.errors = errors or {}
         self.current_index = -1
+        self._query_indexes = None
+        self._lock = threading.Lock()
+
+        self._parent = _parent
+        self._op = _op
+        self._source = None
+        self._error = None
+        if isinstance(objects, list):
+            self._cache, self._done = objects, True
+        elif objects is None and _parent is None:
+            self._cache, self._done = [], True
+        else:
+            self._cache, self._done = [], False
+            if objects is not None:
+                self._source = iter(objects)
+
+    @property
+    def objects(self) -> List[ObjectBase]:
+        """All objects (the objects not received yet are received from the source)."""
+        if not self._done:
+            self._fetch()
+
+        return self._cache
+
+    @objects.setter
+    def objects(self, objects: Iterable[ObjectBase]) -> None:
+        self._cache = objects if isinstance(objects, list) else list(objects)
+        self._done = True
+        self._source = self._parent = self._op = None
+
+    @property
+    def is_lazy(self) -> bool:
+        """True, while there are objects not received from the source."""
+        return not self._done
+
+    def _fetch(self, count: Union[int, None] = None) -> bool:
+        """Receive the objects from the source until there are `count` objects (all, if None).
+
+        Returns:
+            bool: True if there are `count` objects
+        """
+        cache = self._cache
+        with self._lock:
+            if self._error is not None:
+                # The source can't be resumed (e.g: a HTTP error in a page)
+                raise self._error
+
+            if self._source is None and not self._done:
+                self._source = self._iter_view()
+
+            while not self._done and (count is None or len(cache) < count):
+                try:
+                    cache.append(next(self._source))
+                except StopIteration:
+                    self._done = True
+                    self._source = self._parent = self._op = None
+                except Exception as e:
+                    self._error = e
+                    raise
+
+        return count is None or len(cache) >= count
+
+    def _iter_cached(self) -> Iterator[ObjectBase]:
+        """Iterate over the objects, receiving them from the source on demand."""
+        cache = self._cache
+        position = 0
+        while position < len(cache) or self._fetch(position + 1):
+            yield cache[position]
+            position += 1
+
+    def _iter_view(self) -> Iterator[Any]:
+        """Execute the operation of the view over the objects of the parent
+            (without keeping the objects of the parent, when it's a view too)."""
+        parent, (op, arg) = self._parent, self._op
+        if op == const.LIST_OP_FILTER:
+            if parent._done:
+                cache = parent._cache
+                yield from (cache[position] for position in parent._query.match(arg))
+            else:
+                match = compile_conditions(arg)
+                yield from (obj for obj in parent._iter_pass() if match(obj))
+        elif op == const.LIST_OP_MAP:
+            yield from (arg(obj) for obj in parent._iter_pass())
+        elif op == const.LIST_OP_SLICE:
+            if parent._done or arg.step is not None and arg.step < 0 or any(
+                    value is not None and value < 0 for value in (arg.start, arg.stop)):
+                objects = parent.objects
+                yield from (objects[position]
+                            for position in range(*arg.indices(len(objects))))
+            else:
+                yield from islice(parent._iter_pass(), arg.start, arg.stop, arg.step)
+        elif op == const.LIST_OP_SORT:
+            objects = parent.objects
+            yield from (objects[position] for position in parent._query.sort(*arg))
+
+    def _iter_pass(self) -> Iterator[Any]:
+        """Iterate over the objects, in one pass with the views of this view."""
+        if self._done or self._op is None or self._cache:
+            return self._iter_cached()
+
+        return self._iter_view()
 
-    def __iter__(self):
-        """Make class iterable."""
-        return self
+    def _view(self, op: str, arg: Any) -> ObjectListManager:
+        return ObjectListManager(_parent=self, _op=(op, arg))
+
+    def __iter__(self) -> Iterator[ObjectBase]:
+        """Iterate over the objects (each iterator is independent)."""
+        if self._done:
+            return iter(self._cache)
+
+        return self._iter_cached()
 
     def __next__(self) -> ObjectBase:
         """Get next object in list.
@@ -368,10 +1035,10 @@ class ObjectListManager:
             StopIteration: When end of list is reached
         """
         self.current_index += 1
-        if self.current_index >= len(self.objects):
+        if not self._fetch(self.current_index + 1):
             self.current_index = -1
             raise StopIteration
-        return self.objects[self.current_index]
+        return self._cache[self.current_index]
 
     def next(self) -> Union[ObjectBase, None]:
         """Get next object without raising StopIteration.
@@ -392,54 +1059,193 @@ class ObjectListManager:
         """
         if self.current_index > 0:
             self.current_index -= 1
-            return self.objects[self.current_index]
+            return self._cache[self.current_index]
         return None
 
-    # TODO: Predict more condition: e.g contains(in), !=, ==, etc
-    def filter(self, *args) -> ObjectListManager:
-        """Filter objects by attribute values.
+    def map(self, func: Callable[[ObjectBase], Any]) -> ObjectListManager:
+        """Apply a function to the objects (on demand).
+
+        Args:
+            func (Callable[[ObjectBase], Any]): The function
+
+        Returns:
+            ObjectListManager: New manager (view) with the results
+        """
+        return self._view(const.LIST_OP_MAP, func)
+
+    @property
+    def _query(self) -> QueryIndexes:
+        """The columns and indexes of the objects (built lazily, see `mantis.query`)."""
+        query = self._query_indexes
+        if query is None or query.objects is not self.objects:
+            query = self._query_indexes = QueryIndexes(self.objects)
+
+        return query
+
+    def reindex(self) -> None:
+        """Remove the indexes of the queries (e.g: after updating the objects in place)."""
+        self._query.clear()
+
+    def _from_positions(self, positions: Iterable[int]) -> ObjectListManager:
+        objects = self.objects
+        return ObjectListManager([objects[position] for position in positions])
+
+    def filter(self, *args, **kwargs) -> ObjectListManager:
+        """Filter objects by conditions (all conditions must match).
+
+        The indexes (by attribute/path) are built on the first query and reused
+            by the next queries on the same list (see `mantis.query`).
+
+        Operators: `eq`, `ne`, `in`, `nin`, `contains`, `icontains`, `lt`, `le`,
+            `gt`, `ge`, `between` (inclusive) and `isnull`.
+
+        Examples:
+            issues.filter(status='new', handler=2)
+            issues.filter(status__in=['new', 'feedback'], priority__ge=IssuePriority.high)
+            issues.filter(('reporter.name', 'eq', 'administrator'),
+                                      updated_at__between=('2024-01-01', '2024-02-01'))
+            issues.filter(lambda issue: 'crash' in issue.summary.lower())
 
         Args:
-            **kwargs: Attribute names and values to filter by
+            *args: `(path, operator, value)` tuples, `(path, value)` tuples or functions (`func(obj) -> bool`)
+            **kwargs: `path__operator=value`, the nested paths use `__` (e.g: `reporter__name='administrator'`)
 
         Returns:
             ObjectListManager: New manager with filtered objects
         """
-        filtered = []
-        for obj in self.objects:
-            matches = True
-            for key, value in kwargs.items():
-                if obj.get(key) != value:
-                    matches = False
-                    break
-            if matches:
-                filtered.append(obj)
-        return ObjectListManager(filtered)
+        return self._view(const.LIST_OP_FILTER, parse_conditions(args, kwargs))
 
-    def sort(self, key: str, reverse: bool = False) -> ObjectListManager:
-        """Sort objects by an attribute.
+    def sort(self, *keys: str, reverse: bool = False) -> ObjectListManager:
+        """Sort objects by some attributes/paths (stable, the null values are the last).
+
+        Examples:
+            issues.sort('updated_at', reverse=True)
+            issues.sort('-priority', 'status', 'id')
 
         Args:
-            key (str): Attribute name to sort by
+            *keys (str): Attribute names (or paths) to sort by, prefixed by '-' for descending order
             reverse (bool): Sort in reverse order if True
 
         Returns:
             ObjectListManager: New manager with sorted objects
         """
-        sorted_objects = sorted(
-            self.objects,
-            key=lambda x: x.get(key),
-            reverse=reverse
-        )
-        return ObjectListManager(sorted_objects)
+        if keys and isinstance(keys[-1], bool):
+            # Old signature: `sort(key, reverse)`
+            *keys, reverse = keys
+
+        return self._view(const.LIST_OP_SORT, (keys, reverse))
+
+    def group_by(self, key: str) -> dict[Any, ObjectListManager]:
+        """Group the objects by the value of a attribute/path.
+
+        The references (e.g: `handler`) are grouped by id, use a path (e.g:
+            'handler.name') to group them by other value.
+
+        Args:
+            key (str): Attribute name (or path)
+
+        Returns:
+            dict[Any, ObjectListManager]: The objects by value (in order of the first appearance)
+        """
+        index = self._query.hash_index(key)
+        if index is None:
+            raise TypeError(f'The values of {key!r} are not hashable')
+
+        return {value: self._from_positions(positions)
+                for value, positions in index.positions.items()}
+
+    def count_by(self, key: str) -> dict[Any, int]:
+        """Count the objects by the value of a attribute/path (see `group_by`).
+
+        Args:
+            key (str): Attribute name (or path)
+
+        Returns:
+            dict[Any, int]: The number of objects by value (most common first)
+        """
+        index = self._query.hash_index(key)
+        if index is None:
+            raise TypeError(f'The values of {key!r} are not hashable')
+
+        counts = {value: len(positions) for value, positions in index.positions.items()}
+        return dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
+
+    @staticmethod
+    def _get_loaded_raw(obj: ObjectBase, field: str) -> Any:
+        """Get the raw value of a attribute, without loading it (None when not loaded)."""
+        return obj.get_raw(field) if obj.is_loaded(field) else None
+
+    def to_columns(self, fields: Union[Iterable[str], None] = None) -> dict[str, Column]:
+        """Build typed columns (e.g: for a dataframe) from the raw values of the objects.
+
+        The values are converted column by column (see `mantis.columns`), the
+            attributes not loaded (see `fields`) are null.
+
+        Args:
+            fields (Union[Iterable[str], None], optional): The fields (or paths, e.g: 'handler.id').
+                                            Defaults to None (all attributes of the objects).
+
+        Returns:
+            dict[str, Column]: The columns, by field
+        """
+        if not self.objects:
+            return {field: Column(field) for field in fields or ()}
+
+        builder = ColumnsBuilder.from_manager(self.objects[0].manager, fields)
+        builder.append_rows(self.objects, self._get_loaded_raw)
+
+        return builder.columns
+
+    def to_arrow(self, fields: Union[Iterable[str], None] = None) -> Any:
+        """Build a Arrow table from the objects (requires `pyarrow`), see `to_columns`.
+
+        Args:
+            fields (Union[Iterable[str], None], optional): The fields (or paths). Defaults to None (all attributes).
+
+        Returns:
+            pyarrow.Table: The table
+        """
+        return columns_to_arrow(self.to_columns(fields))
+
+    def to_parquet(
+        self,
+        path: str,
+        fields: Union[Iterable[str], None] = None,
+        compression: str = 'zstd'
+    ) -> None:
+        """Write the objects to a Parquet file (requires `pyarrow`), see `to_columns`.
+
+        Args:
+            path (str): The path of the Parquet file
+            fields (Union[Iterable[str], None], optional): The fields (or paths). Defaults to None (all attributes).
+            compression (str, optional): The Parquet compression. Defaults to 'zstd'.
+        """
+        table = self.to_arrow(fields)
+        import pyarrow.parquet as pq
+        pq.write_table(table, path, compression=compression)
 
     def __len__(self) -> int:
-        """Get number of objects in list."""
+        """Get number of objects in list (all objects are received from the source)."""
+        if not self._done and self._op is not None and self._op[0] == const.LIST_OP_SLICE:
+            if self._parent._done:
+                return len(range(*self._op[1].indices(len(self._parent._cache))))
+
         return len(self.objects)
 
-    def __getitem__(self, index: int) -> ObjectBase:
-        """Get object at index."""
-        return self.objects[index]
+    def __bool__(self) -> bool:
+        """Check if there is any object (only the first object is received from the source)."""
+        return self._fetch(1)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[ObjectBase, ObjectListManager]:
+        """Get object at index (the objects are received from the source until the index),
+            or a view of a slice (without copying the objects)."""
+        if isinstance(index, slice):
+            return self._view(const.LIST_OP_SLICE, index)
+
+        if index < 0 or not self._fetch(index + 1):
+            return self.objects[index]
+
+        return self._cache[index]
 
     def __repr__(self) -> str:
         """Return string representation of the list manager.
@@ -447,12 +1253,15 @@ class ObjectListManager:
         Returns:
             str: String showing number of objects and current index
         """
-        return f"ObjectListManager(objects={len(self.objects)}, current_index={self.current_index})"
+        count = len(self._cache) if self._done else f'{len(self._cache)}+'
+        return f"ObjectListManager(objects={count}, current_index={self.current_index})"
 
     def __str__(self) -> str:
         """Return string representation showing all objects.
 
         Returns:
-            str: String listing all managed objects
+            str: String listing all managed objects (only the objects received, when the source is lazy)
         """
+        if not self._done and self._op is None:
+            return "ObjectListManager[%s...]" % ''.join(f'{obj!r}, ' for obj in self._cache)
         return "ObjectListManager%s" % self.objects
@@ -0,0 +1,205 @@
+"""This module provides the helpers of the bulk operations (see `create_many`,
+        `update_many` and `delete_many` of the managers).
+
+The items are sent concurrently (a bounded pool of workers, one request by
+item). A failure of one item doesn't abort the others: the errors are
+reported by item. With a checkpoint, the items done are recorded (in a
+journal file) as soon as they succeed, so a interrupted run can be resumed:
+the items already done are skipped.
+
+Classes:
+    BulkResult: The result of a bulk operation, by item.
+    BulkCheckpoint: A journal of the items done, to resume a bulk operation.
+
+Functions:
+    run_bulk: Run a operation on many items, concurrently.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Union
+
+from mantis.base import ObjectBase, ObjectListManager
+
+
+__all__ = ['BulkResult', 'BulkCheckpoint', 'run_bulk']
+
+
+class BulkResult:
+    """The result of a bulk operation, by item.
+
+    The items are identified by a key: the position of the item (or a custom
+    key) in the creations, the object id in the updates/deletions.
+
+    Atributes:
+        operation (str): The operation (`create`, `update` or `delete`)
+        results (dict[Any, Any]): The objects created/updated (the ids deleted), by key
+        errors (dict[Any, Exception]): The errors (validation or request), by key
+        skipped (dict[Any, Any]): The ids of the items done in a previous run (see `BulkCheckpoint`), by key
+    """
+
+    def __init__(self, operation: str) -> None:
+        """Create a new BulkResult instance.
+
+        Args:
+            operation (str): The operation (`create`, `update` or `delete`)
+        """
+        self.operation = operation
+        self.results: dict[Any, Any] = {}
+        self.errors: dict[Any, Exception] = {}
+        self.skipped: dict[Any, Any] = {}
+
+    @property
+    def ok(self) -> bool:
+        """True if all items were done (now or in a previous run)."""
+        return not self.errors
+
+    @property
+    def objects(self) -> ObjectListManager:
+        """The objects created/updated (in the order of the items)."""
+        return ObjectListManager([value for value in self.results.values()
+                                  if isinstance(value, ObjectBase)])
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __repr__(self) -> str:
+        return (f'{self.__class__.__name__}(operation={self.operation!r}, '
+                f'done={len(self.results)}, skipped={len(self.skipped)}, '
+                f'errors={len(self.errors)})')
+
+
+class BulkCheckpoint:
+    """A journal (JSON lines file) of the items done by the bulk operations.
+
+    Each item is appended (and flushed) as soon as it succeeds, so the journal
+    survives a crash/restart. Using the same checkpoint in the next run, the
+    items already done are skipped.
+
+    Atributes:
+        path (str): The path of the journal file
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        """Create a new BulkCheckpoint instance (the journal is created on the first item done).
+
+        Args:
+            path (Union[str, os.PathLike]): The path of the journal file
+        """
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._file = None
+
+    def get_done(self, operation: str) -> dict[Any, Any]:
+        """Get the items done of a operation.
+
+        Args:
+            operation (str): The operation (`create`, `update` or `delete`)
+
+        Returns:
+            dict[Any, Any]: The ids of the objects, by item key
+        """
+        done = {}
+        if not os.path.exists(self.path):
+            return done
+
+        with open(self.path, encoding='utf-8') as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A line not complete (the process was killed while writing)
+                    continue
+                if record.get('operation') == operation:
+                    done[self._load_key(record['key'])] = record.get('id')
+
+        return done
+
+    @staticmethod
+    def _load_key(key: Any) -> Any:
+        # The tuple keys are stored as JSON lists
+        return tuple(key) if isinstance(key, list) else key
+
+    def add(self, operation: str, key: Any, id_: Any) -> None:
+        """Record a item done.
+
+        Args:
+            operation (str): The operation (`create`, `update` or `delete`)
+            key (Any): The key of the item (JSON serializable)
+            id_ (Any): The id of the object
+        """
+        line = json.dumps({'operation': operation, 'key': key, 'id': id_})
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(f'{line}\n')
+            self._file.flush()
+
+    def close(self) -> None:
+        """Close the journal file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.path!r})'
+
+
+def run_bulk(
+    operation: str,
+    func: Callable[[Any], Any],
+    items: Iterable[tuple[Any, Any]],
+    max_workers: int,
+    checkpoint: Union[BulkCheckpoint, None] = None
+) -> BulkResult:
+    """Run a operation on many items, concurrently (a failure doesn't abort the others).
+
+    Args:
+        operation (str): The operation (`create`, `update` or `delete`)
+        func (Callable[[Any], Any]): The operation of a item, returns the object (or the id)
+        items (Iterable[tuple[Any, Any]]): The items, with their keys: `(key, item)`
+        max_workers (int): Maximum number of requests in flight at the same time
+        checkpoint (Union[BulkCheckpoint, None], optional): The journal of the items done,
+                                     the items already done are skipped. Defaults to None.
+
+    Returns:
+        BulkResult: The results/errors by item key
+    """
+    result = BulkResult(operation)
+    done = checkpoint.get_done(operation) if checkpoint else {}
+
+    pending = []
+    for key, item in items:
+        if key in done:
+            result.skipped[key] = done[key]
+        else:
+            pending.append((key, item))
+
+    results = {}
+
+    def _run(key_item):
+        key, item = key_item
+        try:
+            value = func(item)
+        except Exception as e:
+            result.errors[key] = e
+            return
+
+        results[key] = value
+        if checkpoint:
+            checkpoint.add(operation, key,
+                           value._id if isinstance(value, ObjectBase) else value)
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for _ in executor.map(_run, pending):
+                pass
+
+    # In the order of the items
+    result.results = {key: results[key] for key, _ in pending if key in results}
+
+    return result
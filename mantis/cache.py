@@ -0,0 +1,175 @@
+"""This module provides the ObjectCache class, the internal cache (identity map)
+        of the Mantis objects.
+
+Classes:
+    ObjectCache: A thread-safe identity map of Mantis objects keyed by
+        (object class, object id), with LRU eviction and TTL per object type.
+"""
+
+from collections import OrderedDict
+from threading import RLock
+from time import monotonic
+from typing import Any, Union
+
+from mantis import const
+
+
+__all__ = ['ObjectCache']
+
+
+class ObjectCache:
+    """A thread-safe identity map of Mantis objects keyed by (object class, id).
+
+    The lookups are O(1). When the cache is full, the least recently used object
+    is evicted. The objects can expire after a TTL (time to live), that can be
+    configured by object type.
+
+    Attributes:
+        max_size (int): Maximum number of objects in the cache.
+        ttl (Union[float, None]): Default time to live of the objects (in seconds).
+                                                   None means that never expire.
+        ttl_by_type (dict[Union[type, str], float]): Time to live by object type,
+                                 by class or class name (e.g: {'IssueObj': 60}).
+        hits (int): Number of lookups that found the object.
+        misses (int): Number of lookups that didn't find the object.
+    """
+
+    def __init__(
+        self,
+        max_size: int = const.CACHE_DEFAULT_MAX_SIZE,
+        ttl: Union[float, None] = None,
+        ttl_by_type: Union[dict[Union[type, str], float], None] = None
+    ) -> None:
+        """Initializes the ObjectCache instance
+
+        Args:
+            max_size (int, optional): Maximum number of objects in the cache.
+                                     Defaults to const.CACHE_DEFAULT_MAX_SIZE.
+            ttl (Union[float, None], optional): Default time to live of the
+                   objects (in seconds). Defaults to None (never expire).
+            ttl_by_type (Union[dict[Union[type, str], float], None], optional):
+                Time to live by object type (class or class name). Defaults to None.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.ttl_by_type = ttl_by_type or {}
+
+        self.hits = 0
+        self.misses = 0
+
+        self._objects: OrderedDict[tuple[type, Any], tuple[Any, float]] = \
+            OrderedDict()
+        self._lock = RLock()
+
+    def _get_ttl(self, cls: type) -> Union[float, None]:
+        """Get the time to live of a object type.
+
+        Args:
+            cls (type): The class of the object
+
+        Returns:
+            Union[float, None]: The time to live (in seconds) or None
+        """
+        if cls in self.ttl_by_type:
+            return self.ttl_by_type[cls]
+
+        return self.ttl_by_type.get(cls.__name__, self.ttl)
+
+    def get(self, cls: type, id_: Any) -> Any:
+        """Get a object from the cache.
+
+        Args:
+            cls (type): The class of the object
+            id_ (Any): The id of the object
+
+        Returns:
+            Any: The object or None (not found or expired)
+        """
+        key = (cls, id_)
+        with self._lock:
+            item = self._objects.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+
+            obj, expires_at = item
+            if expires_at is not None and expires_at <= monotonic():
+                del self._objects[key]
+                self.misses += 1
+                return None
+
+            self._objects.move_to_end(key)
+            self.hits += 1
+
+            return obj
+
+    def set(self, obj: Any, cls: Union[type, None] = None) -> None:
+        """Add (or replace) a object in the cache.
+
+        Args:
+            obj (Any): The object to be cached (the key is the class + `obj._id`)
+            cls (Union[type, None], optional): The class of the key. Defaults
+                                                to None (the class of the object).
+        """
+        if self.max_size <= 0:
+            return
+
+        cls = cls or type(obj)
+        key = (cls, obj._id)
+
+        ttl = self._get_ttl(cls)
+        expires_at = monotonic() + ttl if ttl is not None else None
+
+        with self._lock:
+            self._objects[key] = (obj, expires_at)
+            self._objects.move_to_end(key)
+
+            while len(self._objects) > self.max_size:
+                self._objects.popitem(last=False)
+
+    def remove(self, cls: type, id_: Any) -> None:
+        """Remove a object from the cache (if exists).
+
+        Args:
+            cls (type): The class of the object
+            id_ (Any): The id of the object
+        """
+        with self._lock:
+            self._objects.pop((cls, id_), None)
+
+    def clear(self) -> None:
+        """Remove all objects from the cache."""
+        with self._lock:
+            self._objects.clear()
+
+    def __contains__(self, key: tuple[type, Any]) -> bool:
+        """Check if a (class, id) key is in the cache (and not expired)."""
+        with self._lock:
+            item = self._objects.get(key)
+
+        return bool(item) and (item[1] is None or item[1] > monotonic())
+
+    def purge_expired(self) -> int:
+        """Remove the expired objects from the cache.
+
+        Returns:
+            int: The number of objects removed
+        """
+        now = monotonic()
+        with self._lock:
+            expired = [key for key, (_, expires_at) in self._objects.items()
+                       if expires_at is not None and expires_at <= now]
+            for key in expired:
+                del self._objects[key]
+
+        return len(expired)
+
+    def __len__(self) -> int:
+        """Get number of objects in the cache (the expired ones are removed first)."""
+        self.purge_expired()
+        return len(self._objects)
+
+    def __repr__(self) -> str:
+        """Return string representation of the cache."""
+        return (f'ObjectCache(objects={len(self)}, max_size={self.max_size}, '
+                f'hits={self.hits}, misses={self.misses})')
@@ -1,8 +1,72 @@
+import argparse
+import os
 import sys
 
 import mantis
+from mantis import const
+from mantis.export import export_issues, export_notes
+
+ENV_URL = 'MANTIS_URL'
+ENV_TOKEN = 'MANTIS_TOKEN'
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m mantis',
+        description='A python API to manage everything about Mantis Bug Tracker')
+    subparsers = parser.add_subparsers(dest='command')
+
+    export = subparsers.add_parser(
+        'export',
+        help='Export the issues (or their notes) as NDJSON or CSV',
+        description='Export the issues (or their notes) page by page, with constant memory')
+    export.add_argument('objects', choices=('issues', 'notes'),
+                        help='The objects to be exported')
+    export.add_argument('--url', default=os.environ.get(ENV_URL),
+                        help=f'The Mantis server URL (default: ${ENV_URL})')
+    export.add_argument('--token', default=os.environ.get(ENV_TOKEN),
+                        help=f'The API token (default: ${ENV_TOKEN})')
+    export.add_argument('--project', type=int,
+                        help='The project id (default: all projects)')
+    export.add_argument('--format', dest='fmt', choices=const.EXPORT_FORMATS,
+                        default=const.EXPORT_FORMAT_NDJSON)
+    export.add_argument('--fields',
+                        help="Comma separated fields or paths, e.g: 'id,summary,status.name'")
+    export.add_argument('-o', '--output', default='-',
+                        help="The output file, '.gz' is compressed (default: standard output)")
+    export.add_argument('--gzip', action='store_true', default=None,
+                        help='Compress the output with gzip')
+    export.add_argument('--page-size', type=int,
+                        help='Number of issues by request')
+    export.add_argument('--limit', type=int,
+                        help='Maximum number of issues')
+
+    return parser
+
+
+def _export(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    if not args.url or not args.token:
+        parser.error(f'the server URL and token are required (--url/--token or ${ENV_URL}/${ENV_TOKEN})')
+
+    client = mantis.MantisBT(args.url, args.token)
+    fields = [field.strip() for field in args.fields.split(',')
+              if field.strip()] if args.fields else None
+    export_func = export_issues if args.objects == 'issues' else export_notes
+
+    count = export_func(client.issues, args.output, project=args.project,
+                        fmt=args.fmt, fields=fields, compress=args.gzip,
+                        page_size=args.page_size, limit=args.limit)
+    print(f'{count} {args.objects} exported', file=sys.stderr)
+
 
 def main() -> None:
     if '--version' in sys.argv:
         print(mantis.__version__)
         sys.exit(1)
+
+    parser = _get_parser()
+    args = parser.parse_args()
+    if args.command == 'export':
+        _export(parser, args)
+    else:
+        parser.print_help()
@@ -2,9 +2,15 @@
 from typing import Union
 from urllib.parse import urljoin
 
+from requests.adapters import BaseAdapter
+
 from mantis import utils, const
 from mantis.api.v1 import objects as objects_v1
-from mantis._requests import MantisRequests
+from mantis._requests import (
+    CircuitBreaker, HTTPCache, JSONCodec, MantisRequests, RateLimiter,
+    RetryPolicy, RetryStats, SingleFlight
+)
+from mantis.cache import ObjectCache
 
 
 class MantisBT:
@@ -13,6 +19,7 @@ class MantisBT:
     Attributes:
         _base_url (str): Base URL of the MantisBT instance.
         _requests (MantisRequests): Instance of MantisRequests for making API calls.
+        _cache (ObjectCache): Internal cache of objects, shared by all managers.
 
         timeout (Union[str, None]): Request timeout value.
         url (str): Full API URL.
@@ -26,12 +33,21 @@ class MantisBT:
         filters (FilterManager): Manager for filter-related operations.
         notes (NoteManager): Manager for note-related operations.
         users (UserManager): Manager for user-related operations.
+        attachments (AttachmentManager): Manager for attachment-related operations
+                                  (streamed downloads/uploads).
 
     Methods:
-        __init__(url, user_api_token, timeout=None, mantis_api_version='v1'):
+        __init__(url, user_api_token, timeout=None, mantis_api_version='v1',
+                 cache_max_size=10000, cache_ttl=None, cache_ttl_by_type=None,
+                 pool_connections=10, pool_maxsize=10, max_retries=0,
+                 transport=None, session_per_thread=False, retry_policy=None,
+                 rate_limiter=None, circuit_breaker=None, http_cache=None,
+                 single_flight=None, json_codec=None):
             Initialize a new MantisBT API client.
         get_api_url():
             Constructs and returns the full API URL.
+        close() -> None:
+            Closes the HTTP sessions and connections of the client.
         enable_debug(hide_credencials=True) -> None:
             Enables debug logging.
     """
@@ -41,7 +57,21 @@ class MantisBT:
             url: str,
             user_api_token: str,
             timeout: Union[str, None] = None,
-            mantis_api_version: str = 'v1'
+            mantis_api_version: str = 'v1',
+            cache_max_size: int = const.CACHE_DEFAULT_MAX_SIZE,
+            cache_ttl: Union[float, None] = None,
+            cache_ttl_by_type: Union[dict, None] = None,
+            pool_connections: int = const.HTTP_DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize: int = const.HTTP_DEFAULT_POOL_MAXSIZE,
+            max_retries: int = const.HTTP_DEFAULT_MAX_RETRIES,
+            transport: Union[BaseAdapter, None] = None,
+            session_per_thread: bool = False,
+            retry_policy: Union[RetryPolicy, None] = None,
+            rate_limiter: Union[RateLimiter, None] = None,
+            circuit_breaker: Union[CircuitBreaker, None] = None,
+            http_cache: Union[HTTPCache, None] = None,
+            single_flight: Union[SingleFlight, None] = None,
+            json_codec: Union[str, JSONCodec, None] = None
     ) -> None:
         """
         Initialize a new MantisBT API client.
@@ -51,6 +81,37 @@ class MantisBT:
             user_api_token: API token for authentication
             timeout: Request timeout value (optional)
             mantis_api_version: Version of MantisBT API to use (optional)
+            cache_max_size: Maximum number of objects in the internal cache,
+                                   least recently used are evicted (optional)
+            cache_ttl: Time to live (in seconds) of the cached objects, None
+                                                  means never expire (optional)
+            cache_ttl_by_type: Time to live by object type, e.g:
+                                                 {'IssueObj': 60} (optional)
+            pool_connections: Number of connection pools (hosts) to cache (optional)
+            pool_maxsize: Maximum number of connections kept alive, use at least
+                              the number of threads sending requests (optional)
+            max_retries: Number of retries of each failed connection (optional)
+            transport: A custom `requests` transport adapter, mounted for HTTP
+                    and HTTPS URLs (ignores the pool and retries options) (optional)
+            session_per_thread: If True, each thread uses its own session, sharing
+                                     the connections of the transport (optional)
+            retry_policy: When and how long to wait before retrying a failed
+                request, e.g: `RetryPolicy(max_attempts=5)`. The counters are in
+                `client.retry_stats` (optional)
+            rate_limiter: Limit of requests per second and in flight, shared by
+                all managers of the client (and by other clients, if the same
+                object is used), e.g: `RateLimiter(rate=20)` (optional)
+            circuit_breaker: Fails fast (raising `MantisCircuitOpenError`)
+                while the server is failing, e.g: `CircuitBreaker()` (optional)
+            http_cache: Cache of the GET responses, revalidated with conditional
+                requests (ETag/Last-Modified), e.g: `MemoryHTTPCache()` or
+                `DiskHTTPCache('/tmp/mantis-cache')` (optional)
+            single_flight: Coalesces the identical GET requests in flight at the
+                same time (threads and asyncio tasks), sharing one response, e.g:
+                `SingleFlight()`. The counters are in the object (optional)
+            json_codec: The JSON codec of the requests/responses: `json` (the
+                default), `orjson`, `msgspec`, `auto` (the fastest installed) or
+                a `JSONCodec` object (optional)
         """
         self._url = url
         self._server_protocol, self._url_information, self._base_url = \
@@ -63,16 +124,39 @@ class MantisBT:
         self.url = self.get_api_url()
 
         self._requests = MantisRequests(
-            self.url, self._auth, self.timeout)
+            self.url, self._auth, self.timeout,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+            transport=transport,
+            session_per_thread=session_per_thread,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            http_cache=http_cache,
+            single_flight=single_flight,
+            json_codec=json_codec
+        )
+
+        self._cache = ObjectCache(
+            cache_max_size, cache_ttl, cache_ttl_by_type)
 
         self.objects = self._get_objects_cls()
 
-        self.projects = self.objects.ProjectManager(self._requests)
-        self.issues = self.objects.IssueManager(self._requests)
-        self.configs = self.objects.ConfigManager(self._requests)
-        self.filters = self.objects.FilterManager(self._requests)
-        self.notes = self.objects.NoteManager(self._requests)
-        self.users = self.objects.UserManager(self._requests)
+        self.projects = self.objects.ProjectManager(
+            self._requests, cache=self._cache)
+        self.issues = self.objects.IssueManager(
+            self._requests, cache=self._cache)
+        self.configs = self.objects.ConfigManager(
+            self._requests, cache=self._cache)
+        self.filters = self.objects.FilterManager(
+            self._requests, cache=self._cache)
+        self.notes = self.objects.NoteManager(
+            self._requests, cache=self._cache)
+        self.users = self.objects.UserManager(
+            self._requests, cache=self._cache)
+        self.attachments = self.objects.AttachmentManager(
+            self._requests, cache=self._cache)
 
     def _get_objects_cls(self):
         """Get the objects module for the current API version.
@@ -91,6 +175,11 @@ class MantisBT:
         """
         return urljoin(self._base_url, const.API[self._mantis_api_version].PATH)
 
+    @property
+    def retry_stats(self) -> RetryStats:
+        """Returns the counters of the attempts and retries of the requests"""
+        return self._requests.retry_stats
+
     @property
     def api_version(self) -> str:
         """Returns the MantisBT API version being used"""
@@ -101,6 +190,10 @@ class MantisBT:
         """Returns the protocol used to communication with mantis server"""
         return self._server_protocol
 
+    def close(self) -> None:
+        """Closes the HTTP sessions and connections of the client."""
+        self._requests.close()
+
     # TODO: Implement this method
     def enable_debug(self, hide_credencials: bool = True) -> None:
         """Enables debug logging"""
@@ -0,0 +1,568 @@
+"""This module provides the columnar representation of the Mantis objects
+        (e.g: to load a set of issues as a dataframe).
+
+The columns are built directly from the raw values (as received from the
+server), one column at a time, with typed arrays (`array.array`):
+
+    - integers/floats/booleans: `array('q')`/`array('d')`/`array('b')`
+    - dates: `array('q')` of POSIX timestamps (seconds, UTC)
+    - references/enumerations (e.g: `status`, `handler`): dictionary-encoded
+      categories (`array('i')` codes + the list of names)
+    - strings and other values: lists
+
+With the optional `pyarrow` package (`pip install python-mantis[parquet]`),
+the columns are converted to Arrow arrays and written to Parquet files, in
+batches (one row group by batch).
+
+Classes:
+    Column: A typed column.
+    ColumnsBuilder: Build the columns incrementally, batch by batch.
+
+Functions:
+    columns_to_arrow: Convert some columns to a Arrow table.
+    iter_column_batches: Request the objects of a manager page by page, as batches of columns.
+    write_parquet: Write the objects of a manager to a Parquet file, batch by batch.
+"""
+from __future__ import annotations
+
+import os
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Iterator, List, Union
+
+from mantis import const
+from mantis.decoders import EnumDecoder, ObjectListDecoder, ObjectRefDecoder, decode_datetime
+
+
+__all__ = ['Column', 'ColumnsBuilder', 'columns_to_arrow', 'iter_column_batches',
+           'write_parquet']
+
+_ARRAY_TYPECODES = {
+    const.COLUMN_KIND_INT: 'q',
+    const.COLUMN_KIND_FLOAT: 'd',
+    const.COLUMN_KIND_BOOL: 'b',
+    const.COLUMN_KIND_TIMESTAMP: 'q',
+    const.COLUMN_KIND_CATEGORY: 'i'
+}
+
+_NULL_VALUES = {
+    const.COLUMN_KIND_INT: 0,
+    const.COLUMN_KIND_FLOAT: float('nan'),
+    const.COLUMN_KIND_BOOL: 0,
+    const.COLUMN_KIND_TIMESTAMP: 0,
+    const.COLUMN_KIND_CATEGORY: -1
+}
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            'The package `pyarrow` is required to use Arrow/Parquet '
+            '(pip install python-mantis[parquet])') from e
+
+    return pyarrow
+
+
+def _infer_kind(value: Any) -> str:
+    if isinstance(value, bool):
+        return const.COLUMN_KIND_BOOL
+    if isinstance(value, int):
+        return const.COLUMN_KIND_INT
+    if isinstance(value, float):
+        return const.COLUMN_KIND_FLOAT
+    if isinstance(value, str):
+        return const.COLUMN_KIND_STRING
+    if isinstance(value, dict) and 'name' in value:
+        return const.COLUMN_KIND_CATEGORY
+
+    return const.COLUMN_KIND_OBJECT
+
+
+def _to_timestamp(value: Any) -> int:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+
+    return int(value.timestamp())
+
+
+def _category_value(value: Any) -> Any:
+    # The same value of a category (the name of a reference/enumeration)
+    return value.get('name') if isinstance(value, dict) else value
+
+
+def _timestamp_value(value: Any) -> Any:
+    # The same value of a date (see `Column.to_list`), the invalid dates as received
+    try:
+        return datetime.fromtimestamp(_to_timestamp(value), timezone.utc)
+    except (TypeError, ValueError, AttributeError, OverflowError):
+        return value
+
+
+# The values of a column demoted to `object`, as the values already converted
+_DEMOTED_VALUES = {
+    const.COLUMN_KIND_CATEGORY: _category_value,
+    const.COLUMN_KIND_TIMESTAMP: _timestamp_value
+}
+
+
+class Column:
+    """A typed column (see the module documentation for the types).
+
+    Atributes:
+        name (str): The field (or path, e.g: 'handler.id') of the column
+        kind (Union[str, None]): The kind of the values (`int`, `float`, `bool`,
+                `timestamp`, `category`, `string` or `object`). None, while
+                                                    all values are null.
+        values (Union[array, list]): The values (the null values are 0/NaN/-1 in the arrays)
+        nulls (bytearray): 1 for each null value, 0 otherwise
+        categories (List[str]): The names of the categories (`category` kind), by code
+    """
+
+    __slots__ = ('name', 'kind', 'values', 'nulls', 'categories', '_codes', '_demoted_value')
+
+    def __init__(self, name: str, kind: Union[str, None] = None) -> None:
+        """Create a new (empty) Column instance.
+
+        Args:
+            name (str): The field (or path) of the column
+            kind (Union[str, None], optional): The kind of the values. Defaults to None (inferred
+                                                                from the first value not null).
+        """
+        self.name = name
+        self.kind = None
+        self.values = []
+        self.nulls = bytearray()
+        self.categories = []
+        self._codes = {}
+        self._demoted_value = None
+        if kind is not None:
+            self._set_kind(kind)
+
+    def _set_kind(self, kind: str) -> None:
+        if kind not in const.COLUMN_KINDS:
+            raise ValueError(f'Unknown column kind: {kind!r}')
+
+        pending = len(self.nulls)
+        self.kind = kind
+        if kind in _ARRAY_TYPECODES:
+            self.values = array(_ARRAY_TYPECODES[kind], [_NULL_VALUES[kind]]) * pending
+        else:
+            self.values = [None] * pending
+
+    def _demote(self) -> None:
+        """Convert the column to the `object` kind (values of mixed types).
+
+        The values already converted (e.g: the names of the categories, see `to_list`)
+        can't be restored as received, so the next values are converted the same way.
+        """
+        values = self.to_list()
+        self._demoted_value = _DEMOTED_VALUES.get(self.kind)
+        self.kind = const.COLUMN_KIND_OBJECT
+        self.values = values
+        self.categories = []
+        self._codes = {}
+
+    def _get_code(self, value: Any) -> int:
+        name = value.get('name') if isinstance(value, dict) else value
+        code = self._codes.get(name)
+        if code is None:
+            code = self._codes[name] = len(self.categories)
+            self.categories.append(name)
+
+        return code
+
+    def extend(self, values: List[Any]) -> None:
+        """Append the raw values of a batch (converted at once, by kind).
+
+        Args:
+            values (List[Any]): The raw values (as received from the server)
+        """
+        if self.kind is None:
+            first = next((value for value in values if value is not None), None)
+            if first is None:
+                self.nulls.extend(b'\x01' * len(values))
+                return
+
+            self._set_kind(_infer_kind(first))
+
+        nulls = bytes(value is None for value in values)
+        kind = self.kind
+        try:
+            if kind == const.COLUMN_KIND_CATEGORY:
+                converted = [-1 if value is None else self._get_code(value)
+                             for value in values]
+            elif kind == const.COLUMN_KIND_TIMESTAMP:
+                converted = [0 if value is None else _to_timestamp(value)
+                             for value in values]
+            elif kind in _ARRAY_TYPECODES:
+                if kind == const.COLUMN_KIND_BOOL and not all(
+                        isinstance(value, bool) for value in values if value is not None):
+                    raise TypeError('Not a boolean')
+
+                converted = values
+                if 1 in nulls:
+                    null_value = _NULL_VALUES[kind]
+                    converted = [null_value if value is None else value
+                                 for value in values]
+
+            if kind in _ARRAY_TYPECODES:
+                # The array creation checks the types (e.g: a string in a int column)
+                self.values.extend(array(_ARRAY_TYPECODES[kind], converted))
+            elif kind == const.COLUMN_KIND_STRING and not all(
+                    isinstance(value, str) for value in values if value is not None):
+                raise TypeError('Not a string')
+            elif self._demoted_value is not None:
+                demoted_value = self._demoted_value
+                self.values.extend(None if value is None else demoted_value(value)
+                                   for value in values)
+            else:
+                self.values.extend(values)
+        except (TypeError, ValueError, AttributeError, OverflowError):
+            if kind == const.COLUMN_KIND_INT and all(
+                    isinstance(value, (int, float)) for value in values if value is not None):
+                self.values = array('d', self.values)
+                self.kind = const.COLUMN_KIND_FLOAT
+            else:
+                self._demote()
+
+            self.extend(values)
+            return
+
+        self.nulls.extend(nulls)
+
+    def clear(self) -> None:
+        """Remove all values (the kind and the categories are kept, e.g: for the next batch)."""
+        self.nulls = bytearray()
+        if self.kind is not None:
+            self._set_kind(self.kind)
+        else:
+            self.values = []
+
+    def copy(self) -> Column:
+        """Return a copy of the column."""
+        column = Column(self.name)
+        column.kind = self.kind
+        column.values = self.values[:]
+        column.nulls = self.nulls[:]
+        column.categories = self.categories[:]
+        column._codes = self._codes.copy()
+        column._demoted_value = self._demoted_value
+
+        return column
+
+    @property
+    def null_count(self) -> int:
+        """The number of null values."""
+        return self.nulls.count(1)
+
+    def to_list(self) -> List[Any]:
+        """Return the values as a list (dates as `datetime`, categories as names, nulls as None)."""
+        if self.kind is None:
+            return [None] * len(self.nulls)
+
+        values = self.values
+        if self.kind == const.COLUMN_KIND_CATEGORY:
+            categories = self.categories
+            values = [categories[code] for code in values]
+        elif self.kind == const.COLUMN_KIND_TIMESTAMP:
+            values = [datetime.fromtimestamp(value, timezone.utc) for value in values]
+        elif self.kind == const.COLUMN_KIND_BOOL:
+            values = [bool(value) for value in values]
+        else:
+            values = list(values)
+
+        if 1 in self.nulls:
+            values = [None if null else value for value, null in zip(values, self.nulls)]
+
+        return values
+
+    def to_arrow(self) -> Any:
+        """Convert the column to a Arrow array (requires `pyarrow`).
+
+        Returns:
+            pyarrow.Array: The array (`dictionary<int32, string>` for the categories,
+                                        `timestamp[s, UTC]` for the dates)
+        """
+        pa = _import_pyarrow()
+
+        if self.kind is None:
+            return pa.nulls(len(self.nulls))
+
+        values = self.values
+        if 1 in self.nulls:
+            values = [None if null else value for value, null in zip(values, self.nulls)]
+
+        if self.kind == const.COLUMN_KIND_CATEGORY:
+            return pa.DictionaryArray.from_arrays(
+                pa.array(values, pa.int32()), pa.array(self.categories, pa.string()))
+        if self.kind == const.COLUMN_KIND_TIMESTAMP:
+            return pa.array(values, pa.timestamp('s', tz='UTC'))
+        if self.kind == const.COLUMN_KIND_BOOL:
+            return pa.array([None if value is None else bool(value) for value in values], pa.bool_())
+        if self.kind == const.COLUMN_KIND_OBJECT:
+            return pa.array([None if value is None else str(value) for value in values], pa.string())
+
+        return pa.array(values)
+
+    def __len__(self) -> int:
+        return len(self.nulls)
+
+    def __getitem__(self, index: int) -> Any:
+        if self.nulls[index]:
+            return None
+
+        value = self.values[index]
+        if self.kind == const.COLUMN_KIND_CATEGORY:
+            return self.categories[value]
+        if self.kind == const.COLUMN_KIND_TIMESTAMP:
+            return datetime.fromtimestamp(value, timezone.utc)
+        if self.kind == const.COLUMN_KIND_BOOL:
+            return bool(value)
+
+        return value
+
+    def __repr__(self) -> str:
+        return f'Column(name={self.name!r}, kind={self.kind!r}, len={len(self)})'
+
+
+class ColumnsBuilder:
+    """Build the columns of some fields incrementally, batch by batch.
+
+    Use `from_manager` to declare the kinds of the fields by the decoders of the
+    manager (dates, enumerations and references), so all batches have the same
+    types. The other kinds are inferred from the values.
+
+    Atributes:
+        fields (List[str]): The fields (or paths, e.g: 'handler.id')
+        columns (dict[str, Column]): The columns, by field
+    """
+
+    _path_sep = '.'
+
+    def __init__(
+        self,
+        fields: Iterable[str],
+        kinds: Union[dict[str, str], None] = None
+    ) -> None:
+        """Create a new ColumnsBuilder instance.
+
+        Args:
+            fields (Iterable[str]): The fields (or paths) of the columns
+            kinds (Union[dict[str, str], None], optional): The kinds of some fields. Defaults to None (inferred).
+        """
+        kinds = kinds or {}
+        self.fields = list(fields)
+        self.columns = {field: Column(field, kinds.get(field))
+                        for field in self.fields}
+
+    @classmethod
+    def get_manager_kinds(cls, manager: Any, fields: Iterable[str]) -> dict[str, str]:
+        """Get the kinds of some fields by the decoders of a manager.
+
+        Args:
+            manager (ObjectManagerBase): The manager of the objects
+            fields (Iterable[str]): The fields (or paths)
+
+        Returns:
+            dict[str, str]: The kinds, by field (the fields not declared aren't returned)
+        """
+        kinds = {}
+        for field in fields:
+            if field == manager._id_attr:
+                kinds[field] = const.COLUMN_KIND_INT
+                continue
+
+            decoder = manager._decoders.get(field)
+            if decoder is decode_datetime:
+                kinds[field] = const.COLUMN_KIND_TIMESTAMP
+            elif isinstance(decoder, ObjectListDecoder):
+                kinds[field] = const.COLUMN_KIND_OBJECT
+            elif isinstance(decoder, (EnumDecoder, ObjectRefDecoder)):
+                kinds[field] = const.COLUMN_KIND_CATEGORY
+
+        return kinds
+
+    @classmethod
+    def from_manager(
+        cls,
+        manager: Any,
+        fields: Union[Iterable[str], None] = None
+    ) -> ColumnsBuilder:
+        """Create a builder with the kinds declared by the decoders of a manager.
+
+        Args:
+            manager (ObjectManagerBase): The manager of the objects
+            fields (Union[Iterable[str], None], optional): The fields (or paths).
+                                        Defaults to None (all attributes of the manager).
+
+        Returns:
+            ColumnsBuilder: The builder
+        """
+        if fields is None:
+            fields = manager._get_attrs_layout().names
+        fields = list(fields)
+
+        return cls(fields, cls.get_manager_kinds(manager, fields))
+
+    def _get_values(
+        self,
+        rows: List[Any],
+        field: str,
+        get: Callable[[Any, str], Any]
+    ) -> List[Any]:
+        if self._path_sep not in field:
+            return [get(row, field) for row in rows]
+
+        root, *path = field.split(self._path_sep)
+        values = []
+        for row in rows:
+            value = get(row, root)
+            for key in path:
+                value = value.get(key) if isinstance(value, dict) else None
+            values.append(value)
+
+        return values
+
+    def append_rows(
+        self,
+        rows: Iterable[Any],
+        get: Union[Callable[[Any, str], Any], None] = None
+    ) -> None:
+        """Append a batch of rows, column by column.
+
+        Args:
+            rows (Iterable[Any]): The rows (raw dicts, by default)
+            get (Union[Callable[[Any, str], Any], None], optional): The function to get the raw
+                    value of a field of a row. Defaults to None (`dict.get`).
+        """
+        rows = rows if isinstance(rows, list) else list(rows)
+        if get is None:
+            get = dict.get
+
+        for field, column in self.columns.items():
+            column.extend(self._get_values(rows, field, get))
+
+    def flush(self) -> dict[str, Column]:
+        """Get the columns of the rows appended and clear them (e.g: to build the next batch).
+
+        Returns:
+            dict[str, Column]: The columns, by field
+        """
+        columns = {field: column.copy() for field, column in self.columns.items()}
+        for column in self.columns.values():
+            column.clear()
+
+        return columns
+
+    def __len__(self) -> int:
+        """Get the number of rows appended."""
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+
+def columns_to_arrow(columns: dict[str, Column]) -> Any:
+    """Convert some columns to a Arrow table (requires `pyarrow`).
+
+    Args:
+        columns (dict[str, Column]): The columns, by field
+
+    Returns:
+        pyarrow.Table: The table
+    """
+    pa = _import_pyarrow()
+
+    return pa.Table.from_arrays([column.to_arrow() for column in columns.values()],
+                                names=list(columns))
+
+
+def iter_column_batches(
+    manager: Any,
+    crit: Union[dict[str, Any], None] = None,
+    fields: Union[Iterable[str], None] = None,
+    batch_size: int = const.COLUMNS_BATCH_SIZE,
+    page_size: Union[int, None] = None,
+    limit: Union[int, None] = None
+) -> Iterator[dict[str, Column]]:
+    """Request the objects of a manager page by page (raw, without building
+        objects) and yield them as batches of columns.
+
+    Only the top level attributes of `fields` are requested to the server.
+
+    Args:
+        manager (ObjectManagerBase): The manager (e.g: `client.issues`)
+        crit (Union[dict[str, Any], None], optional): The criteria of the request (e.g: {'project_id': 1}). Defaults to None.
+        fields (Union[Iterable[str], None], optional): The fields (or paths). Defaults to None (all attributes).
+        batch_size (int, optional): Number of rows by batch (at least one page). Defaults to 50000.
+        page_size (Union[int, None], optional): Number of objects by request. Defaults to None.
+        limit (Union[int, None], optional): Maximum number of objects. Defaults to None (no limit).
+
+    Yields:
+        dict[str, Column]: The columns of each batch, by field
+    """
+    builder = ColumnsBuilder.from_manager(manager, fields)
+    all_names = manager._get_attrs_layout().all_names
+    root_fields = [field for field in dict.fromkeys(
+        field.split(builder._path_sep, 1)[0] for field in builder.fields) if field in all_names]
+
+    for data in manager._iter_pages(manager._path, dict(crit or {}), page_size=page_size,
+                                    limit=limit, fields=root_fields or None, raw=True):
+        builder.append_rows(data)
+        if len(builder) >= batch_size:
+            yield builder.flush()
+
+    if len(builder):
+        yield builder.flush()
+
+
+def write_parquet(
+    manager: Any,
+    path: Union[str, os.PathLike],
+    crit: Union[dict[str, Any], None] = None,
+    fields: Union[Iterable[str], None] = None,
+    batch_size: int = const.COLUMNS_BATCH_SIZE,
+    page_size: Union[int, None] = None,
+    limit: Union[int, None] = None,
+    compression: str = 'zstd'
+) -> int:
+    """Write the objects of a manager to a Parquet file, one row group by batch
+        (requires `pyarrow`). See `iter_column_batches`.
+
+    Args:
+        manager (ObjectManagerBase): The manager (e.g: `client.issues`)
+        path (Union[str, os.PathLike]): The path of the Parquet file
+        crit (Union[dict[str, Any], None], optional): The criteria of the request. Defaults to None.
+        fields (Union[Iterable[str], None], optional): The fields (or paths). Defaults to None (all attributes).
+        batch_size (int, optional): Number of rows by batch. Defaults to 50000.
+        page_size (Union[int, None], optional): Number of objects by request. Defaults to None.
+        limit (Union[int, None], optional): Maximum number of objects. Defaults to None (no limit).
+        compression (str, optional): The Parquet compression. Defaults to 'zstd'.
+
+    Returns:
+        int: The number of rows written
+    """
+    _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    count = 0
+    writer = None
+    try:
+        for columns in iter_column_batches(manager, crit, fields, batch_size,
+                                           page_size, limit):
+            table = columns_to_arrow(columns)
+            if writer is None:
+                writer = pq.ParquetWriter(os.fspath(path), table.schema,
+                                          compression=compression)
+            elif table.schema != writer.schema:
+                # e.g: a column with only null values in the first batch
+                table = table.cast(writer.schema)
+
+            writer.write_table(table)
+            count += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return count
@@ -16,11 +16,55 @@ HTTP_METHOD_PATCH = 'PATCH'
 #    HTTP Status codes
 HTTP_MIN_SUCCESS_STATUS_CODE = 200
 HTTP_MAX_SUCCESS_STATUS_CODE = 299
+HTTP_NOT_MODIFIED_STATUS_CODE = 304
 HTTP_MIN_CLIENT_ERROR_STATUS_CODE = 400
 HTTP_MAX_CLIENT_ERROR_STATUS_CODE = 499
 HTTP_MIN_SERVER_ERROR_STATUS_CODE = 500
 HTTP_MAX_SERVER_ERROR_STATUS_CODE = 599
 
+#    HTTP Transport
+HTTP_DEFAULT_POOL_CONNECTIONS = 10
+HTTP_DEFAULT_POOL_MAXSIZE = 10
+HTTP_DEFAULT_MAX_RETRIES = 0
+
+#    HTTP Retry policy
+RETRY_DEFAULT_MAX_ATTEMPTS = 3
+RETRY_DEFAULT_BACKOFF_BASE = 0.5
+RETRY_DEFAULT_BACKOFF_CAP = 30.0
+RETRY_DEFAULT_STATUS_CODES = (429, 502, 503, 504)
+RETRY_DEFAULT_METHODS = (HTTP_METHOD_GET, HTTP_METHOD_PUT, HTTP_METHOD_DELETE,
+                         'HEAD', 'OPTIONS')
+
+#    HTTP Rate limit
+RATE_LIMIT_ASYNC_POLL_INTERVAL = 0.005
+
+#    HTTP Circuit breaker
+CIRCUIT_BREAKER_DEFAULT_FAILURE_THRESHOLD = 5
+CIRCUIT_BREAKER_DEFAULT_OPEN_INTERVAL = 30.0
+
+#    HTTP Response cache
+HTTP_CACHE_DEFAULT_MAX_ENTRIES = 1024
+HTTP_CACHE_DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+# PAGINATION CONSTANTS
+PAGINATION_PAGE_PARAM = 'page'
+PAGINATION_PAGE_SIZE_PARAM = 'page_size'
+PAGINATION_FIRST_PAGE = 1
+PAGINATION_DEFAULT_PAGE_SIZE = 50
+
+# BULK CONSTANTS
+GET_MANY_DEFAULT_MAX_WORKERS = 10
+BULK_DEFAULT_MAX_WORKERS = 10
+BULK_OP_CREATE = 'create'
+BULK_OP_UPDATE = 'update'
+BULK_OP_DELETE = 'delete'
+
+# CACHE CONSTANTS
+CACHE_DEFAULT_MAX_SIZE = 10000
+
+# ASYNC CONSTANTS
+ASYNC_DEFAULT_MAX_CONNECTIONS = 10
+
 
 class REST(BaseStrEnum):
     HEADER_CONTENT_TYPE_JSON = 'application/json'
@@ -47,3 +91,35 @@ SUPPORTED_PROTOCOLS = [
     'http',
     'https'
 ]
+
+# Export
+EXPORT_FORMAT_NDJSON = 'ndjson'
+EXPORT_FORMAT_CSV = 'csv'
+EXPORT_FORMATS = (EXPORT_FORMAT_NDJSON, EXPORT_FORMAT_CSV)
+EXPORT_GZIP_SUFFIX = '.gz'
+
+# Columns
+COLUMN_KIND_INT = 'int'
+COLUMN_KIND_FLOAT = 'float'
+COLUMN_KIND_BOOL = 'bool'
+COLUMN_KIND_TIMESTAMP = 'timestamp'
+COLUMN_KIND_CATEGORY = 'category'
+COLUMN_KIND_STRING = 'string'
+COLUMN_KIND_OBJECT = 'object'
+COLUMN_KINDS = (COLUMN_KIND_INT, COLUMN_KIND_FLOAT, COLUMN_KIND_BOOL,
+                COLUMN_KIND_TIMESTAMP, COLUMN_KIND_CATEGORY, COLUMN_KIND_STRING,
+                COLUMN_KIND_OBJECT)
+COLUMNS_BATCH_SIZE = 50000
+
+# Operations of the lazy lists (ObjectListManager views)
+LIST_OP_FILTER = 'filter'
+LIST_OP_MAP = 'map'
+LIST_OP_SLICE = 'slice'
+LIST_OP_SORT = 'sort'
+
+# ATTACHMENT CONSTANTS
+# Bytes read by chunk from the download responses / the uploaded files (multiple of 3)
+ATTACHMENT_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+ATTACHMENT_UPLOAD_CHUNK_SIZE = 3 * 64 * 1024
+ATTACHMENT_DEFAULT_MAX_WORKERS = 4
+ATTACHMENT_TEMP_SUFFIX = '.part'
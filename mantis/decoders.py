@@ -0,0 +1,174 @@
+"""This module provides the decoders of the attributes of the Mantis objects.
+
+A decoder converts the raw value of a attribute (as received from the server)
+to a typed value. The decoders are declared by manager (`_decoders`) and are
+called lazily, on the first access of the attribute (see `LazyDecodedAttr`).
+
+Signature of a decoder: `decoder(obj, value) -> Any`, the value is never None.
+
+Functions:
+    decode_datetime: Decode a ISO 8601 string to a datetime.
+    encode_value: Encode a typed value to its raw value (the inverse of the decoders).
+
+Classes:
+    EnumDecoder: Decode a raw value to a member of a `MantisEnum`.
+    ObjectRefDecoder: Decode a nested reference (e.g: {'id': 1, 'name': 'administrator'})
+        to a object of other manager.
+    ObjectListDecoder: Decode a list of nested objects (e.g: the attachments of a issue)
+        to a list of objects of other manager, children of the object.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Callable, Union
+
+
+__all__ = ['decode_datetime', 'encode_value', 'EnumDecoder', 'ObjectRefDecoder',
+           'ObjectListDecoder']
+
+
+def decode_datetime(obj: Any, value: Any) -> Union[datetime, Any]:
+    """Decode a ISO 8601 string (e.g: '2024-01-01T10:00:00+00:00') to a datetime.
+
+    Args:
+        obj (Any): The object of the attribute
+        value (Any): The raw value
+
+    Returns:
+        Union[datetime, Any]: The datetime (or the raw value, if isn't a valid date)
+    """
+    if not isinstance(value, str):
+        return value
+
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return value
+
+
+def encode_value(value: Any) -> Any:
+    """Encode a typed value to its raw value, as sent to the server (the inverse
+        of the decoders): a object to its reference (e.g: {'id': 1}), a enum member
+        to its dict, a datetime to a ISO 8601 string. Other values are returned as is.
+
+    Args:
+        value (Any): The typed value
+
+    Returns:
+        Any: The raw value
+    """
+    # Exact types: the enum members are integers
+    if value is None or type(value) in (str, int, float, bool, dict):
+        return value
+
+    if isinstance(value, datetime):
+        return value.isoformat()
+
+    if hasattr(value, 'to_dict'):
+        manager = getattr(value, 'manager', None)
+        # A object (e.g: a user): only its reference
+        if manager is not None:
+            return {manager._id_attr: value._id}
+
+        return value.to_dict()
+
+    if isinstance(value, (list, tuple)):
+        return [encode_value(item) for item in value]
+
+    # The base module imports the columns module, that imports this module
+    from mantis.base import ObjectListManager
+
+    if isinstance(value, ObjectListManager):
+        return [encode_value(item) for item in value]
+
+    return value
+
+
+class EnumDecoder:
+    """Decode a raw value (e.g: {'id': 10, 'name': 'new'}) to a member of a `MantisEnum`."""
+
+    __slots__ = ('enum_cls',)
+
+    def __init__(self, enum_cls: type) -> None:
+        """Create a new EnumDecoder instance.
+
+        Args:
+            enum_cls (type): The enumeration (subclass of `MantisEnum`)
+        """
+        self.enum_cls = enum_cls
+
+    def __call__(self, obj: Any, value: Any) -> Any:
+        if not isinstance(value, (dict, int)):
+            return value
+
+        return self.enum_cls.decode(value)
+
+
+class ObjectRefDecoder:
+    """Decode a nested reference (e.g: {'id': 1, 'name': 'administrator'}) to a
+        object of other manager.
+
+    When the reference is the parent of the object, the parent object is used.
+    Otherwise a new object is built with the attributes of the reference (it
+    isn't added to the internal cache, because it's incomplete). The other
+    attributes are loaded on the first access (see `fields`).
+    """
+
+    __slots__ = ('_manager_cls',)
+
+    def __init__(self, manager_cls: Union[type, Callable[[], type]]) -> None:
+        """Create a new ObjectRefDecoder instance.
+
+        Args:
+            manager_cls (Union[type, Callable[[], type]]): The manager class of
+                the referenced object, or a function that returns it (to avoid
+                                                              circular imports).
+        """
+        self._manager_cls = manager_cls
+
+    @property
+    def manager_cls(self) -> type:
+        """The manager class of the referenced object."""
+        if not isinstance(self._manager_cls, type):
+            self._manager_cls = self._manager_cls()
+
+        return self._manager_cls
+
+    def __call__(self, obj: Any, value: Any) -> Any:
+        if not isinstance(value, dict):
+            return value
+
+        manager_cls = self.manager_cls
+        parent = obj._parent
+        if (isinstance(parent, manager_cls._obj_cls)
+                and parent._id == value.get(manager_cls._id_attr)):
+            return parent
+
+        manager = obj.manager._get_related_manager(manager_cls)
+        fields = manager._normalize_fields(
+            manager._get_attrs_layout().all_names.intersection(value))
+
+        return manager._obj_cls(manager, value, _fields=fields)
+
+
+class ObjectListDecoder(ObjectRefDecoder):
+    """Decode a list of nested objects (e.g: the attachments of a issue) to a list
+        (`ObjectListManager`) of objects of other manager, children of the object.
+
+    The nested objects are complete (not references), so all attributes are
+    loaded. The objects aren't added to the internal cache.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, obj: Any, value: Any) -> Any:
+        if not isinstance(value, list):
+            return value
+
+        # The base module imports the columns module, that imports this module
+        from mantis.base import ObjectListManager
+
+        manager = obj.manager._get_related_manager(self.manager_cls)
+
+        return ObjectListManager([manager._obj_cls(manager, item, _parent=obj)
+                                  for item in value if isinstance(item, dict)])
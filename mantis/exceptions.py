@@ -9,7 +9,11 @@ __all__ = [
     'MantisHTTPConnError',
     'MantisConnectionError',
     'MantisConnectionTimeout',
-    'MantisReadTimeout'
+    'MantisReadTimeout',
+    'MantisCircuitOpenError',
+    'UnknownFieldsError',
+    'MantisAttachmentError',
+    'MantisValidationError'
 ]
 
 from typing import Any
@@ -31,7 +35,6 @@ class MantisHTTPError(MantisGenericError):
         _original_exception: Exception = None
     ):
         self.response = response
-        print(dir(_original_exception))
         self._request_cls = mantis_request_cls
         self._original_exception = _original_exception
 
@@ -67,7 +70,8 @@ class MantisHTTPConnError(MantisGenericError):
                 f'Request data: {self._get_prepared_request_info()}')
 
     def _get_prepared_request_info(self) -> str:
-        headers = self.preparred_request.headers
+        # Copy: the prepared request can be sent again (e.g: retries)
+        headers = dict(self.preparred_request.headers)
         headers.pop('Authorization', None)
 
         req_info = {
@@ -91,6 +95,21 @@ class MantisReadTimeout(MantisHTTPConnError):
     ...
 
 
+class MantisCircuitOpenError(MantisGenericError):
+    def __init__(
+        self,
+        failures: int,
+        retry_in: float
+    ):
+        self.failures = failures
+        self.retry_in = retry_in
+
+        super().__init__(
+            f'Circuit open after {failures} consecutive failures of the Mantis '
+            f'server, the request was not sent. Next probe in {retry_in:.1f}s'
+        )
+
+
 class UnsupportedProtocolError(MantisGenericError):
     def __init__(
         self,
@@ -101,3 +120,50 @@ class UnsupportedProtocolError(MantisGenericError):
             f'Protocol `{protocol}` is not supported! '
             f'Use one of supported protocol list: {supported_protocols}'
         )
+
+
+class UnknownFieldsError(MantisGenericError):
+    def __init__(
+        self,
+        fields: list[str],
+        obj_name: str
+    ):
+        self.fields = fields
+
+        super().__init__(
+            f'Unknown fields of {obj_name}: {fields}'
+        )
+
+
+class MantisAttachmentError(MantisGenericError):
+    def __init__(
+        self,
+        attachment_id: Any,
+        message: str
+    ):
+        self.attachment_id = attachment_id
+
+        super().__init__(
+            f'Attachment {attachment_id}: {message}'
+        )
+
+
+class MantisValidationError(MantisGenericError):
+    def __init__(
+        self,
+        obj_name: str,
+        missing: list[str] = (),
+        readonly: list[str] = ()
+    ):
+        self.missing = list(missing)
+        self.readonly = list(readonly)
+
+        errors = []
+        if self.missing:
+            errors.append(f'missing mandatory attributes {self.missing}')
+        if self.readonly:
+            errors.append(f'read only attributes {self.readonly}')
+
+        super().__init__(
+            f'Invalid {obj_name}: {", ".join(errors)}'
+        )
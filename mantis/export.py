@@ -0,0 +1,363 @@
+"""This module provides the streaming export of the Mantis issues and notes
+        (NDJSON or CSV, optionally compressed with gzip).
+
+The objects are requested page by page and written row by row, as raw dicts
+(they aren't built nor added to the internal cache), so the memory used is
+bounded by the page size, not by the number of objects exported.
+
+Classes:
+    ObjectExporter: Write rows (raw dicts or objects) as NDJSON or CSV.
+
+Functions:
+    export_issues: Export the issues of a manager (optionally filtered).
+    export_notes: Export the notes of the issues of a manager (optionally filtered).
+"""
+from __future__ import annotations
+
+import csv
+import gzip
+import itertools
+import json
+import os
+import sys
+import warnings
+from contextlib import contextmanager
+from typing import IO, Any, Iterable, Iterator, List, Union
+
+from mantis import const
+from mantis.base import ObjectBase, ObjectManagerBase
+
+
+__all__ = ['ObjectExporter', 'export_issues', 'export_notes']
+
+_MISSING = object()
+
+
+class ObjectExporter:
+    """Write rows (raw dicts or objects) as NDJSON (one JSON object by line) or CSV.
+
+    The fields are the top level attributes or paths of nested values, e.g:
+    `['id', 'summary', 'status.name', 'handler.name']`. In CSV, the nested
+    values (dicts/lists) are written as JSON.
+
+    A CSV file has one header for all rows: without `fields`, the header is
+    `default_fields` (e.g: all the attributes of the exported objects), else
+    the attributes of the first object (or the keys of the first raw dict, a
+    warning is emitted if a next row has other keys, as they aren't written).
+
+    Atributes:
+        fmt (str): The format (`ndjson` or `csv`)
+        fields (Union[List[str], None]): The fields of the rows (None means all fields)
+        default_fields (Union[List[str], None]): The fields of the CSV rows when
+                    `fields` is None
+    """
+
+    _path_sep = '.'
+
+    def __init__(
+        self,
+        fmt: str = const.EXPORT_FORMAT_NDJSON,
+        fields: Union[Iterable[str], None] = None,
+        default_fields: Union[Iterable[str], None] = None
+    ) -> None:
+        """Create a new ObjectExporter instance.
+
+        Args:
+            fmt (str, optional): The format, `ndjson` or `csv`. Defaults to `ndjson`.
+            fields (Union[Iterable[str], None], optional): The fields (or paths) of the rows. Defaults to None.
+            default_fields (Union[Iterable[str], None], optional): The fields of the CSV rows
+                                                when `fields` is None. Defaults to None.
+
+        Raises:
+            ValueError: If the format isn't supported
+        """
+        if fmt not in const.EXPORT_FORMATS:
+            raise ValueError(
+                f'Unsupported export format: {fmt!r} '
+                f'(use one of: {", ".join(const.EXPORT_FORMATS)})')
+
+        self.fmt = fmt
+        self.fields = list(fields) if fields else None
+        self.default_fields = list(default_fields) if default_fields else None
+
+    @classmethod
+    def get_root_fields(cls, fields: Union[Iterable[str], None]) -> Union[List[str], None]:
+        """Get the top level attributes of some fields/paths (e.g: to request only them).
+
+        Args:
+            fields (Union[Iterable[str], None]): The fields (or paths)
+
+        Returns:
+            Union[List[str], None]: The top level attributes (None, when `fields` is None)
+        """
+        if not fields:
+            return None
+
+        return list(dict.fromkeys(field.split(cls._path_sep, 1)[0] for field in fields))
+
+    def _get_value(self, data: dict[str, Any], field: str) -> Any:
+        value = data.get(field, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        value = data
+        for key in field.split(self._path_sep):
+            if isinstance(value, dict):
+                value = value.get(key)
+            elif isinstance(value, list) and key.isdigit() and int(key) < len(value):
+                value = value[int(key)]
+            else:
+                return None
+
+        return value
+
+    def get_row(self, row: Union[ObjectBase, dict[str, Any]]) -> dict[str, Any]:
+        """Get the exported values of a row.
+
+        Args:
+            row (Union[ObjectBase, dict[str, Any]]): The object or raw dict
+
+        Returns:
+            dict[str, Any]: The values by field (raw, as received from the server)
+        """
+        return self._get_row(row, self.fields)
+
+    def _get_row(
+        self,
+        row: Union[ObjectBase, dict[str, Any]],
+        fields: Union[List[str], None]
+    ) -> dict[str, Any]:
+        data = row.to_dict() if isinstance(row, ObjectBase) else row
+        if fields is None:
+            return data
+
+        return {field: self._get_value(data, field) for field in fields}
+
+    @staticmethod
+    def _get_cell(value: Any) -> Any:
+        if value is None:
+            return ''
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+        return value
+
+    @staticmethod
+    @contextmanager
+    def _open(
+        output: Union[str, os.PathLike, IO[str]],
+        compress: Union[bool, None]
+    ) -> Iterator[IO[str]]:
+        if not isinstance(output, (str, os.PathLike)):
+            if compress:
+                output.flush()
+                with gzip.open(output.buffer if hasattr(output, 'buffer') else output,
+                               'wt', encoding='utf-8', newline='') as stream:
+                    yield stream
+            else:
+                yield output
+            return
+
+        path = os.fspath(output)
+        if path == '-':
+            with ObjectExporter._open(sys.stdout, compress) as stream:
+                yield stream
+            return
+
+        if compress is None:
+            compress = path.endswith(const.EXPORT_GZIP_SUFFIX)
+
+        if compress:
+            stream = gzip.open(path, 'wt', encoding='utf-8', newline='')
+        else:
+            stream = open(path, 'w', encoding='utf-8', newline='')
+
+        with stream:
+            yield stream
+
+    def _write_ndjson(self, rows: Iterable[Any], stream: IO[str]) -> int:
+        count = 0
+        for row in rows:
+            stream.write(json.dumps(self.get_row(row), ensure_ascii=False,
+                                    separators=(',', ':'), default=str))
+            stream.write('\n')
+            count += 1
+
+        return count
+
+    def _write_csv(self, rows: Iterable[Any], stream: IO[str]) -> int:
+        fields = self.fields or self.default_fields
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            if fields:
+                csv.writer(stream).writerow(fields)
+            return 0
+
+        if fields is None and isinstance(first, ObjectBase):
+            fields = list(first._attrs_layout.names)
+
+        # The header of the raw dicts without fields is the keys of the first one
+        header = fields or list(self._get_row(first, None))
+        check_keys = frozenset(header) if fields is None else None
+        writer = csv.DictWriter(stream, header, restval='', extrasaction='ignore')
+        writer.writeheader()
+
+        get_cell = self._get_cell
+        count = 0
+        for row in itertools.chain((first,), rows):
+            data = self._get_row(row, fields)
+            if check_keys is not None and not check_keys.issuperset(data):
+                warnings.warn(
+                    f'The CSV header (the keys of the first row) misses some keys '
+                    f'of the row {count + 1} ({", ".join(sorted(data.keys() - check_keys))}),'
+                    f' their values aren\'t written: use `fields`', RuntimeWarning, stacklevel=3)
+                check_keys = None
+            writer.writerow({key: get_cell(value) for key, value in data.items()})
+            count += 1
+
+        return count
+
+    def write(
+        self,
+        rows: Iterable[Union[ObjectBase, dict[str, Any]]],
+        output: Union[str, os.PathLike, IO[str]],
+        compress: Union[bool, None] = None
+    ) -> int:
+        """Write the rows, one by one (the rows are consumed lazily).
+
+        Args:
+            rows (Iterable[Union[ObjectBase, dict[str, Any]]]): The objects or raw dicts
+            output (Union[str, os.PathLike, IO[str]]): The file path ('-' is the
+                          standard output) or a text stream
+            compress (Union[bool, None], optional): If True, the output is compressed
+                    with gzip. Defaults to None (True when the path ends with '.gz').
+
+        Returns:
+            int: The number of rows written
+        """
+        with self._open(output, compress) as stream:
+            if self.fmt == const.EXPORT_FORMAT_CSV:
+                return self._write_csv(rows, stream)
+
+            return self._write_ndjson(rows, stream)
+
+
+def _iter_issues_data(
+    manager: ObjectManagerBase,
+    crit: Union[dict[str, Any], None],
+    page_size: Union[int, None],
+    limit: Union[int, None],
+    fields: Union[Iterable[str], None]
+) -> Iterator[dict[str, Any]]:
+    if fields is not None:
+        layout = manager._get_attrs_layout()
+        fields = [field for field in fields if field in layout.all_names]
+
+    return manager._iter_raw(manager._path, dict(crit or {}), page_size=page_size,
+                             limit=limit, fields=fields or None)
+
+
+def _get_crit(
+    crit: Union[dict[str, Any], None],
+    project: Union[ObjectBase, int, None]
+) -> Union[dict[str, Any], None]:
+    if project is None:
+        return crit
+
+    project_id = project._id if isinstance(project, ObjectBase) else project
+    return {**(crit or {}), 'project_id': project_id}
+
+
+def export_issues(
+    manager: ObjectManagerBase,
+    output: Union[str, os.PathLike, IO[str]],
+    project: Union[ObjectBase, int, None] = None,
+    crit: Union[dict[str, Any], None] = None,
+    fmt: str = const.EXPORT_FORMAT_NDJSON,
+    fields: Union[Iterable[str], None] = None,
+    compress: Union[bool, None] = None,
+    page_size: Union[int, None] = None,
+    limit: Union[int, None] = None
+) -> int:
+    """Export the issues (page by page, with constant memory).
+
+    Only the top level attributes of `fields` are requested to the server. Without
+    `fields`, the CSV columns are all the attributes of the issues (see the
+    `_mandatory_attr` and `_optional_attr` of the manager).
+
+    Args:
+        manager (ObjectManagerBase): The issue manager (e.g: `client.issues`)
+        output (Union[str, os.PathLike, IO[str]]): The file path ('-' is the standard output) or a text stream
+        project (Union[ObjectBase, int, None], optional): The project (or its id). Defaults to None (all projects).
+        crit (Union[dict[str, Any], None], optional): Other criteria of the request. Defaults to None.
+        fmt (str, optional): The format, `ndjson` or `csv`. Defaults to `ndjson`.
+        fields (Union[Iterable[str], None], optional): The fields (or paths, e.g: 'status.name').
+                                                            Defaults to None (all fields).
+        compress (Union[bool, None], optional): If True, the output is compressed with gzip.
+                                    Defaults to None (True when the path ends with '.gz').
+        page_size (Union[int, None], optional): Number of issues by request. Defaults to None.
+        limit (Union[int, None], optional): Maximum number of issues. Defaults to None (no limit).
+
+    Returns:
+        int: The number of issues exported
+    """
+    exporter = ObjectExporter(fmt, fields, manager._get_attrs_layout().names)
+    rows = _iter_issues_data(manager, _get_crit(crit, project), page_size, limit,
+                             exporter.get_root_fields(exporter.fields))
+
+    return exporter.write(rows, output, compress)
+
+
+def _iter_notes_data(
+    manager: ObjectManagerBase,
+    issues: Iterable[dict[str, Any]]
+) -> Iterator[dict[str, Any]]:
+    note_manager = manager._child_manager_obj
+    issue_id_attr = manager._id_attr
+    for issue in issues:
+        issue_id = issue.get(issue_id_attr)
+        for note in note_manager._iter_raw(note_manager._path, {'id': issue_id}):
+            yield {'issue_id': issue_id, **note}
+
+
+def export_notes(
+    manager: ObjectManagerBase,
+    output: Union[str, os.PathLike, IO[str]],
+    project: Union[ObjectBase, int, None] = None,
+    crit: Union[dict[str, Any], None] = None,
+    fmt: str = const.EXPORT_FORMAT_NDJSON,
+    fields: Union[Iterable[str], None] = None,
+    compress: Union[bool, None] = None,
+    page_size: Union[int, None] = None,
+    limit: Union[int, None] = None
+) -> int:
+    """Export the notes of the issues (issue by issue, with constant memory).
+
+    The rows have the id of the issue (`issue_id`) plus the note attributes (without
+    `fields`, the CSV columns are `issue_id` and all the attributes of the notes).
+
+    Args:
+        manager (ObjectManagerBase): The issue manager (e.g: `client.issues`)
+        output (Union[str, os.PathLike, IO[str]]): The file path ('-' is the standard output) or a text stream
+        project (Union[ObjectBase, int, None], optional): The project (or its id) of the issues.
+                                                              Defaults to None (all projects).
+        crit (Union[dict[str, Any], None], optional): Other criteria of the issues. Defaults to None.
+        fmt (str, optional): The format, `ndjson` or `csv`. Defaults to `ndjson`.
+        fields (Union[Iterable[str], None], optional): The fields (or paths, e.g: 'reporter.name').
+                                                            Defaults to None (all fields).
+        compress (Union[bool, None], optional): If True, the output is compressed with gzip.
+                                    Defaults to None (True when the path ends with '.gz').
+        page_size (Union[int, None], optional): Number of issues by request. Defaults to None.
+        limit (Union[int, None], optional): Maximum number of issues. Defaults to None (no limit).
+
+    Returns:
+        int: The number of notes exported
+    """
+    note_names = manager._child_manager_obj._get_attrs_layout().names
+    exporter = ObjectExporter(fmt, fields, ('issue_id',) + note_names)
+    issues = _iter_issues_data(manager, _get_crit(crit, project), page_size, limit,
+                               [manager._id_attr])
+    rows = _iter_notes_data(manager, issues)
+
+    return exporter.write(rows, output, compress)
@@ -0,0 +1,585 @@
+"""This module provides a local (SQLite) mirror of the Mantis projects, issues
+        and notes, to serve the reads locally.
+
+The objects fetched through the managers are stored as raw JSON (the same of
+the server responses) + indexed columns (project, status, handler, category,
+dates). The queries return the same objects of the managers (e.g: `IssueObj`).
+
+Use:
+    mirror = MantisMirror(client, 'mantis.db')
+    mirror.sync()                       # incremental, see `IssueManager.changes_since`
+    mirror.issues(status=IssueStatus.new, handler=2, updated_after='2024-01-01')
+    mirror.search('crash on startup')   # full-text search (summary/description)
+
+Classes:
+    MantisMirror: The local mirror.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime, timezone
+from threading import RLock
+from typing import Any, Iterable, List, Union
+
+from mantis.api.v1.objects import IssueStatus
+from mantis.base import ObjectBase, ObjectListManager
+from mantis.client import MantisBT
+from mantis.sync import SyncChanges
+
+
+__all__ = ['MantisMirror']
+
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS issues (
+    id INTEGER PRIMARY KEY,
+    project_id INTEGER,
+    status_id INTEGER,
+    handler_id INTEGER,
+    reporter_id INTEGER,
+    category TEXT,
+    priority_id INTEGER,
+    severity_id INTEGER,
+    created_at TEXT,
+    updated_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS issues_project_id ON issues (project_id);
+CREATE INDEX IF NOT EXISTS issues_status_id ON issues (status_id);
+CREATE INDEX IF NOT EXISTS issues_handler_id ON issues (handler_id);
+CREATE INDEX IF NOT EXISTS issues_category ON issues (category);
+CREATE INDEX IF NOT EXISTS issues_updated_at ON issues (updated_at);
+CREATE TABLE IF NOT EXISTS notes (
+    id INTEGER PRIMARY KEY,
+    issue_id INTEGER NOT NULL,
+    reporter_id INTEGER,
+    created_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS notes_issue_id ON notes (issue_id);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+'''
+
+_FTS_SCHEMA = '''
+CREATE VIRTUAL TABLE IF NOT EXISTS issues_fts USING fts5 (summary, description);
+CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5 (text);
+'''
+
+_ISSUE_ORDER_COLUMNS = ('id', 'project_id', 'status_id', 'handler_id',
+                        'priority_id', 'severity_id', 'created_at', 'updated_at')
+
+
+def _ref_id(value: Any) -> Any:
+    """Get the id of a nested reference (e.g: {'id': 1, 'name': 'administrator'})."""
+    if isinstance(value, dict):
+        return value.get('id')
+
+    return getattr(value, 'id', value)
+
+
+def _to_utc(value: Union[datetime, str, None]) -> Union[str, None]:
+    """Normalize a date (datetime or ISO 8601 string) to a UTC ISO 8601 string,
+        so the dates can be compared as strings."""
+    if value is None or value == '':
+        return None
+
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+
+    return value.astimezone(timezone.utc).isoformat()
+
+
+class MantisMirror:
+    """A local (SQLite) mirror of the Mantis projects, issues and notes.
+
+    The mirror is filled by `sync()` (incremental, only the changes since the last
+    sync are requested) or by the `store_*` methods (with objects fetched through
+    the managers). The issues deleted in the server are kept (the Mantis API
+    doesn't report deletions), use `delete_issues` or a new database to drop them.
+
+    Atributes:
+        client (MantisBT): The client (its managers build the objects)
+        path (str): The SQLite database path
+        fts (bool): If True, the full-text search uses FTS5 (otherwise `LIKE`)
+    """
+
+    def __init__(self, client: MantisBT, path: str = ':memory:') -> None:
+        """Create a new MantisMirror instance (the tables are created if needed).
+
+        Args:
+            client (MantisBT): The client (its managers build the objects)
+            path (str, optional): The SQLite database path. Defaults to ':memory:'.
+        """
+        self.client = client
+        self.path = path
+
+        self._lock = RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(_SCHEMA)
+
+        try:
+            self._conn.executescript(_FTS_SCHEMA)
+            self.fts = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5
+            self.fts = False
+
+        self._conn.commit()
+
+    # Writing
+
+    def _write(self, statements: Iterable[tuple[str, tuple]]) -> None:
+        """Execute some statements in a single transaction."""
+        with self._lock, self._conn:
+            for sql, params in statements:
+                self._conn.execute(sql, params)
+
+    def _get_stored_data(self, table: str, id_: Any) -> dict[str, Any]:
+        """Get the stored raw data of a object (or a empty dict)."""
+        with self._lock:
+            row = self._conn.execute(
+                f'SELECT data FROM {table} WHERE id = ?', (id_, )).fetchone()
+
+        return json.loads(row['data']) if row else {}
+
+    def _get_data(self, table: str, obj: ObjectBase) -> dict[str, Any]:
+        """Get the raw data of a object to be stored. The attributes not loaded
+            (see `fields`) are kept from the stored data."""
+        data = obj.to_dict()
+        if obj._loaded_fields is not None:
+            data = {**self._get_stored_data(table, obj._id), **data}
+
+        return data
+
+    def store_projects(self, projects: Iterable[ObjectBase]) -> None:
+        """Store (insert or update) some projects.
+
+        Args:
+            projects (Iterable[ObjectBase]): The projects (`ProjectObj`)
+        """
+        statements = []
+        for project in projects:
+            data = self._get_data('projects', project)
+            statements.append((
+                'INSERT OR REPLACE INTO projects (id, name, data) VALUES (?, ?, ?)',
+                (project._id, data.get('name'), json.dumps(data))
+            ))
+
+        self._write(statements)
+
+    def store_issues(self, issues: Iterable[ObjectBase]) -> None:
+        """Store (insert or update) some issues.
+
+        Args:
+            issues (Iterable[ObjectBase]): The issues (`IssueObj`)
+        """
+        statements = []
+        for issue in issues:
+            data = self._get_data('issues', issue)
+            statements.append((
+                'INSERT OR REPLACE INTO issues (id, project_id, status_id, handler_id, '
+                'reporter_id, category, priority_id, severity_id, created_at, '
+                'updated_at, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (issue._id, _ref_id(data.get('project')), _ref_id(data.get('status')),
+                 _ref_id(data.get('handler')), _ref_id(data.get('reporter')),
+                 (data.get('category') or {}).get('name'),
+                 _ref_id(data.get('priority')), _ref_id(data.get('severity')),
+                 _to_utc(data.get('created_at')), _to_utc(data.get('updated_at')),
+                 json.dumps(data))
+            ))
+
+            if self.fts:
+                statements.append((
+                    'DELETE FROM issues_fts WHERE rowid = ?', (issue._id, )))
+                statements.append((
+                    'INSERT INTO issues_fts (rowid, summary, description) VALUES (?, ?, ?)',
+                    (issue._id, data.get('summary'), data.get('description'))
+                ))
+
+        self._write(statements)
+
+    def store_notes(self, issue: Union[ObjectBase, int], notes: Iterable[ObjectBase]) -> None:
+        """Store (insert or update) the notes of a issue.
+
+        Args:
+            issue (Union[ObjectBase, int]): The issue (object or ID)
+            notes (Iterable[ObjectBase]): The notes (`NoteObj`)
+        """
+        issue_id = _ref_id(issue)
+
+        statements = []
+        for note in notes:
+            data = self._get_data('notes', note)
+            statements.append((
+                'INSERT OR REPLACE INTO notes (id, issue_id, reporter_id, created_at, data) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (note._id, issue_id, _ref_id(data.get('reporter')),
+                 _to_utc(data.get('created_at')), json.dumps(data))
+            ))
+
+            if self.fts:
+                statements.append((
+                    'DELETE FROM notes_fts WHERE rowid = ?', (note._id, )))
+                statements.append((
+                    'INSERT INTO notes_fts (rowid, text) VALUES (?, ?)',
+                    (note._id, data.get('text'))
+                ))
+
+        self._write(statements)
+
+    def delete_issues(self, ids: Iterable[int]) -> None:
+        """Delete some issues (and their notes) from the mirror.
+
+        Args:
+            ids (Iterable[int]): The issue IDs
+        """
+        statements = []
+        for id_ in ids:
+            statements.append(('DELETE FROM issues WHERE id = ?', (id_, )))
+            if self.fts:
+                statements.append(('DELETE FROM issues_fts WHERE rowid = ?', (id_, )))
+                statements.append((
+                    'DELETE FROM notes_fts WHERE rowid IN '
+                    '(SELECT id FROM notes WHERE issue_id = ?)', (id_, )))
+            statements.append(('DELETE FROM notes WHERE issue_id = ?', (id_, )))
+
+        self._write(statements)
+
+    def _store_missing_projects(self, ids: List[Any]) -> None:
+        """Request (in batch, internal cache first) and store the projects not stored yet."""
+        if not ids:
+            return
+
+        stored_ids = {row['id'] for row in self._query(
+            f'SELECT id FROM projects WHERE id IN ({",".join("?" * len(ids))})', ids)}
+        missing_ids = [id_ for id_ in ids if id_ not in stored_ids]
+        if missing_ids:
+            self.store_projects(
+                self.client.projects._get_many_by_id(missing_ids).values())
+
+    def _get_state(self, key: str) -> Union[str, None]:
+        """Get a value of the sync state (e.g: the watermark token)."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT value FROM sync_state WHERE key = ?', (key, )).fetchone()
+
+        return row['value'] if row else None
+
+    def _set_state(self, key: str, value: str) -> None:
+        """Set a value of the sync state."""
+        self._write([(
+            'INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)',
+            (key, value)
+        )])
+
+    def sync(
+        self,
+        project: Union[ObjectBase, int, None] = None,
+        notes: bool = True,
+        page_size: Union[int, None] = None
+    ) -> SyncChanges:
+        """Request the issues (and their notes) created/updated since the last sync
+            and store them (see `IssueManager.changes_since`).
+
+        Args:
+            project (Union[ObjectBase, int, None], optional): Only the issues of this project
+                                                       (object or ID). Defaults to None (all).
+            notes (bool, optional): If True, the notes of the changed issues are requested
+                                            too (in the same pages). Defaults to True.
+            page_size (int, optional): Number of issues per page. Defaults to None (use the manager `_page_size`).
+
+        Returns:
+            SyncChanges: The created/updated issues and the new watermark
+        """
+        project_id = _ref_id(project)
+        state_key = f'issues:{project_id or "*"}'
+
+        changes = self.client.issues.changes_since(
+            self._get_state(state_key), project=project_id, page_size=page_size,
+            include_notes=notes)
+
+        self.store_issues(changes)
+        self._store_missing_projects(
+            self.client.issues._get_distinct_parent_ids(list(changes)))
+
+        if notes:
+            for issue in changes:
+                self.store_notes(issue, issue.get_notes())
+
+        self._set_state(state_key, changes.watermark.to_token())
+
+        return changes
+
+    # Reading
+
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> List[sqlite3.Row]:
+        """Execute a query and fetch all rows."""
+        with self._lock:
+            return self._conn.execute(sql, tuple(params)).fetchall()
+
+    def _build_projects(self, ids: Iterable[Any]) -> dict[Any, ObjectBase]:
+        """Build the stored projects of some ids (the parents of the issues)."""
+        ids = [id_ for id_ in set(ids) if id_ is not None]
+        if not ids:
+            return {}
+
+        manager = self.client.projects
+        rows = self._query(
+            f'SELECT data FROM projects WHERE id IN ({",".join("?" * len(ids))})', ids)
+
+        projects = (manager._obj_cls(manager, json.loads(row['data'])) for row in rows)
+
+        return {project._id: project for project in projects}
+
+    def _build_issues(self, rows: List[sqlite3.Row]) -> ObjectListManager:
+        """Build the issues of some rows (with the `data` column)."""
+        manager = self.client.issues
+        issues = [manager._obj_cls(manager, json.loads(row['data'])) for row in rows]
+
+        manager._set_parent_objs(
+            issues, self._build_projects(manager._get_parent_id(issue) for issue in issues))
+
+        return ObjectListManager(issues)
+
+    def _build_notes(
+        self,
+        rows: List[sqlite3.Row],
+        issues: Union[dict[Any, ObjectBase], None] = None
+    ) -> ObjectListManager:
+        """Build the notes of some rows (with the `data` and `issue_id` columns)."""
+        if issues is None:
+            issues = {issue._id: issue for issue in self.get_issues(
+                {row['issue_id'] for row in rows})}
+
+        manager = self.client.notes
+        return ObjectListManager([
+            manager._obj_cls(manager, json.loads(row['data']), issues.get(row['issue_id']))
+            for row in rows
+        ])
+
+    @staticmethod
+    def _add_in_condition(
+        conditions: List[str],
+        params: List[Any],
+        column: str,
+        values: Any
+    ) -> None:
+        """Add a `column IN (...)` (or `column = ?`) condition to the query."""
+        if values is None:
+            return
+
+        if isinstance(values, (str, int, dict, ObjectBase)):
+            values = [values]
+        values = [_ref_id(value) for value in values]
+
+        conditions.append(f'{column} IN ({",".join("?" * len(values))})')
+        params.extend(values)
+
+    def issues(
+        self,
+        project: Any = None,
+        status: Any = None,
+        handler: Any = None,
+        reporter: Any = None,
+        category: Union[str, Iterable[str], None] = None,
+        priority: Any = None,
+        severity: Any = None,
+        updated_after: Union[datetime, str, None] = None,
+        updated_before: Union[datetime, str, None] = None,
+        created_after: Union[datetime, str, None] = None,
+        created_before: Union[datetime, str, None] = None,
+        order_by: str = 'updated_at',
+        desc: bool = True,
+        limit: Union[int, None] = None
+    ) -> ObjectListManager:
+        """Query the stored issues. The filters can be a value or a list of values
+            (objects, IDs or, for the status, names), e.g: `status=['new', 'feedback']`.
+
+        Args:
+            project (Any, optional): The project(s). Defaults to None.
+            status (Any, optional): The status(es) (`IssueStatus`, ID or name). Defaults to None.
+            handler (Any, optional): The handler(s) (`UserObj` or ID). Defaults to None.
+            reporter (Any, optional): The reporter(s) (`UserObj` or ID). Defaults to None.
+            category (Union[str, Iterable[str], None], optional): The category name(s). Defaults to None.
+            priority (Any, optional): The priority(ies) (`IssuePriority` or ID). Defaults to None.
+            severity (Any, optional): The severity(ies) (`IssueSeverity` or ID). Defaults to None.
+            updated_after (Union[datetime, str, None], optional): Updated after (>=) this date. Defaults to None.
+            updated_before (Union[datetime, str, None], optional): Updated before (<) this date. Defaults to None.
+            created_after (Union[datetime, str, None], optional): Created after (>=) this date. Defaults to None.
+            created_before (Union[datetime, str, None], optional): Created before (<) this date. Defaults to None.
+            order_by (str, optional): The order column (id, project_id, status_id, handler_id,
+                   priority_id, severity_id, created_at or updated_at). Defaults to 'updated_at'.
+            desc (bool, optional): If True, descending order. Defaults to True.
+            limit (Union[int, None], optional): Maximum number of issues. Defaults to None (no limit).
+
+        Raises:
+            ValueError: If `order_by` isn't a valid column
+
+        Returns:
+            ObjectListManager: The issues (`IssueObj`)
+        """
+        if order_by not in _ISSUE_ORDER_COLUMNS:
+            raise ValueError(
+                f'Invalid order_by `{order_by}`, use one of: {_ISSUE_ORDER_COLUMNS}')
+
+        # The status can be filtered by name (e.g: 'new')
+        if status is not None:
+            if isinstance(status, (str, int, dict, ObjectBase)):
+                status = [status]
+            status = [IssueStatus[value] if isinstance(value, str) else value
+                      for value in status]
+
+        conditions, params = [], []
+        for column, values in (
+            ('project_id', project), ('status_id', status), ('handler_id', handler),
+            ('reporter_id', reporter), ('category', category),
+            ('priority_id', priority), ('severity_id', severity)
+        ):
+            self._add_in_condition(conditions, params, column, values)
+
+        for column, operator_, value in (
+            ('updated_at', '>=', updated_after), ('updated_at', '<', updated_before),
+            ('created_at', '>=', created_after), ('created_at', '<', created_before)
+        ):
+            if value is not None:
+                conditions.append(f'{column} {operator_} ?')
+                params.append(_to_utc(value))
+
+        sql = 'SELECT data FROM issues'
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += f' ORDER BY {order_by} {"DESC" if desc else "ASC"}'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+
+        return self._build_issues(self._query(sql, params))
+
+    def get_issue(self, id_: int) -> Union[ObjectBase, None]:
+        """Get a stored issue by ID.
+
+        Args:
+            id_ (int): The issue ID
+
+        Returns:
+            Union[ObjectBase, None]: The issue (`IssueObj`) or None
+        """
+        issues = self.get_issues([id_])
+
+        return issues[0] if len(issues) else None
+
+    def get_issues(self, ids: Iterable[int]) -> ObjectListManager:
+        """Get some stored issues by ID.
+
+        Args:
+            ids (Iterable[int]): The issue IDs
+
+        Returns:
+            ObjectListManager: The issues found (`IssueObj`)
+        """
+        ids = list(ids)
+        if not ids:
+            return ObjectListManager([])
+
+        return self._build_issues(self._query(
+            f'SELECT data FROM issues WHERE id IN ({",".join("?" * len(ids))})', ids))
+
+    def notes(self, issue: Union[ObjectBase, int]) -> ObjectListManager:
+        """Get the stored notes of a issue.
+
+        Args:
+            issue (Union[ObjectBase, int]): The issue (object or ID)
+
+        Returns:
+            ObjectListManager: The notes (`NoteObj`), oldest first
+        """
+        issue_id = _ref_id(issue)
+        rows = self._query(
+            'SELECT data, issue_id FROM notes WHERE issue_id = ? ORDER BY created_at, id',
+            (issue_id, ))
+
+        issues = {issue_id: issue} if isinstance(issue, ObjectBase) else None
+
+        return self._build_notes(rows, issues)
+
+    def search(self, text: str, limit: Union[int, None] = None) -> ObjectListManager:
+        """Full-text search of the stored issues (summary and description).
+
+        Args:
+            text (str): The text (FTS5 query syntax, e.g: 'crash AND startup')
+            limit (Union[int, None], optional): Maximum number of issues. Defaults to None (no limit).
+
+        Returns:
+            ObjectListManager: The issues (`IssueObj`), best matches first
+        """
+        if self.fts:
+            sql = ('SELECT issues.data FROM issues_fts JOIN issues ON issues.id = issues_fts.rowid '
+                   'WHERE issues_fts MATCH ? ORDER BY rank')
+            params = [text]
+        else:
+            sql = ("SELECT data FROM issues WHERE json_extract(data, '$.summary') LIKE ? "
+                   "OR json_extract(data, '$.description') LIKE ?")
+            params = [f'%{text}%'] * 2
+
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+
+        return self._build_issues(self._query(sql, params))
+
+    def search_notes(self, text: str, limit: Union[int, None] = None) -> ObjectListManager:
+        """Full-text search of the stored notes.
+
+        Args:
+            text (str): The text (FTS5 query syntax)
+            limit (Union[int, None], optional): Maximum number of notes. Defaults to None (no limit).
+
+        Returns:
+            ObjectListManager: The notes (`NoteObj`, with the issue as parent), best matches first
+        """
+        if self.fts:
+            sql = ('SELECT notes.data, notes.issue_id FROM notes_fts '
+                   'JOIN notes ON notes.id = notes_fts.rowid WHERE notes_fts MATCH ? ORDER BY rank')
+            params = [text]
+        else:
+            sql = "SELECT data, issue_id FROM notes WHERE json_extract(data, '$.text') LIKE ?"
+            params = [f'%{text}%']
+
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+
+        return self._build_notes(self._query(sql, params))
+
+    def count(self) -> dict[str, int]:
+        """Get the number of stored objects, by table."""
+        return {
+            table: self._query(f'SELECT COUNT(*) FROM {table}')[0][0]
+            for table in ('projects', 'issues', 'notes')
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> MantisMirror:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'MantisMirror(path={self.path!r})'
@@ -3,62 +3,107 @@
 This module provides mixin classes that implement common functionality for object managers:
 """
 
-from copy import deepcopy
-from typing import Any, List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Iterable, Iterator, List, Union
 
+from mantis import const
 from mantis.base import ObjectManagerBase, ObjectBase, ObjectListManager
+from mantis.bulk import BulkCheckpoint, BulkResult, run_bulk
+from mantis.decoders import encode_value
+from mantis.exceptions import MantisHTTPReponseClientError, MantisValidationError
+from mantis.sync import SyncChanges, SyncWatermark
 
 
-# TODO: Add support for pagination (limit of response)
-
 # TODO: Add refresh method
 #       1. Implement a method called `refresh` that will get new data from the server (method used in ObjectBase)
 
-# TODO: Add support for update:
-#       update_many (?)
-#       update_one:
-#       1. Mapping atrributes updated in the object (implement in ObjectBase?)
-#       2. Implement a method called `save` that will update the object in the server
-#       3. Call the method  `refresh` to get new data from the server ()
-
-# TODO: Add support for delete
-#    delete_many (?)
-#    delete_one (?)
-
-# TODO: Add support for create
-#    - Create object in the server
-#    - mandatory, optional and read-only fields must be used to create the object
-#    - Default values to optional fields is necessary?
-#    - Implement a method called `create` that will create the object in the server
 
 class GetMixins(ObjectManagerBase):
-    # TODO: Add a new parameter `search_for_parent`? (bool). If not, don't search
-    #   in the mantis server the _parent object
-    def _get(
+    def _get_page(
         self,
         url: str,
-        params: dict[str, Any] = None,
-        _parent=None
+        params: Union[dict[str, Any], None] = None,
+        _parent=None,
+        resolve_parent: bool = True,
+        fields: Union[frozenset[str], None] = None,
+        in_place: bool = True,
+        raw: bool = False,
+        include_children: bool = False
     ) -> List[ObjectBase]:
-        """The generic function to execute GET HTTP and retrieves a list of objects from a given URL with optional parameters.
+        """Execute a single GET HTTP request and build the objects of the response.
 
         Args:
             url (str): The URL to send the GET request to.
             params (dict[str, Any], optional): A dictionary of query parameters to include in the request. Defaults to None.
             _parent (optional): An optional parent object to associate with the retrieved objects. Defaults to None.
+            resolve_parent (bool, optional): If False, the parent objects aren't searched in the server. Defaults to True.
+            fields (frozenset[str], optional): The attributes requested (see `_get_fields`). Defaults to None (all attributes).
+            in_place (bool, optional): If True, the cached objects are updated in place (see `_build_objs`). Defaults to True.
+            raw (bool, optional): If True, the raw objects (dicts) of the response are returned, without
+                                        building objects or updating the internal cache. Defaults to False.
+            include_children (bool, optional): If True, the child objects embedded in the response
+                                        are attached to the objects (see `_attach_children`). Defaults to False.
 
         Returns:
             List[ObjectBase]: A list of objects retrieved from the URL.
         """
-        # The object manager has a fixed criteria to execute in all get request?
-        if self._fixed_criteria:
-            if params:
-                params.update(self._fixed_criteria)
-            else:
-                params = deepcopy(self._fixed_criteria)
-
         response = self.request.http_get(url, params)
+        if raw:
+            return self._get_response_objs(response)
+
+        data = self._get_response_objs(response)
+        obj_list = self._build_objs_from_data(data, fields, in_place)
+
+        # Use the received _parent object
+        #   **OR**
+        # Getting in batch (cache first, then the server) the parent objects
+        self._attach_parent_objs(obj_list, _parent, resolve_parent)
+
+        if include_children:
+            self._attach_children(obj_list, data)
+
+        return obj_list
+
+    def _attach_children(self, obj_list: List[ObjectBase], data: List[dict[str, Any]]) -> None:
+        """Build the child objects embedded in the response (the `_children_attr` of
+            each object, e.g: the notes of the issues) and attach them to the objects.
+
+        Args:
+            obj_list (List[ObjectBase]): The objects built from the response
+            data (List[dict[str, Any]]): The objects of the response (dicts), in the same order
+        """
+        child_manager = self._child_manager_obj
+        for obj, obj_dict in zip(obj_list, data):
+            # The server omits the attribute when there are no child objects
+            obj._set_children(child_manager._build_children(
+                obj, obj_dict.get(self._children_attr) or []))
 
+    def _build_children(self, parent: ObjectBase, data: List[dict[str, Any]]) -> ObjectListManager:
+        """Build the child objects of a parent object, embedded in its response.
+
+        Args:
+            parent (ObjectBase): The parent object
+            data (List[dict[str, Any]]): The child objects (dicts)
+
+        Returns:
+            ObjectListManager: The child objects
+        """
+        obj_list = self._build_objs_from_data(data)
+        for obj in obj_list:
+            obj._parent = parent
+
+        return ObjectListManager(obj_list)
+
+    def _get_response_objs(self, response: Any) -> List[dict[str, Any]]:
+        """Get the list of objects (dicts) of a response, using the `_key_response`.
+
+        Args:
+            response (Any): The (JSON) response of the server
+
+        Returns:
+            List[dict[str, Any]]: The objects of the response
+        """
         # If the object manager has a tuple of key response, we'll get
         #   the response recursivally.
         # TODO: Predict a exception for empty response or similar
@@ -66,42 +111,373 @@ class GetMixins(ObjectManagerBase):
             for key in self._key_response:
                 response = response[key]
 
+        return response
+
+    def _build_objs(
+        self,
+        response: Any,
+        fields: Union[frozenset[str], None] = None,
+        in_place: bool = True
+    ) -> List[ObjectBase]:
+        """Build the objects of a response and update the internal cache.
+
+        Args:
+            response (Any): The (JSON) response of the server
+            fields (frozenset[str], optional): The attributes requested (see `_get_fields`). Defaults to None (all attributes).
+            in_place (bool, optional): If True, the objects already in the cache are updated in
+                place and returned (one instance by class and id: the references to them see the
+                new values), instead of replaced. Defaults to True.
+
+        Returns:
+            List[ObjectBase]: A list of objects built from the response.
+        """
+        return self._build_objs_from_data(self._get_response_objs(response), fields, in_place)
+
+    def _build_objs_from_data(
+        self,
+        data: List[dict[str, Any]],
+        fields: Union[frozenset[str], None] = None,
+        in_place: bool = True
+    ) -> List[ObjectBase]:
+        """Build the objects of a list of dicts and update the internal cache (see `_build_objs`).
+
+        Args:
+            data (List[dict[str, Any]]): The objects (dicts), as received from the server
+            fields (frozenset[str], optional): The attributes requested. Defaults to None (all attributes).
+            in_place (bool, optional): If True, the cached objects are updated in place. Defaults to True.
+
+        Returns:
+            List[ObjectBase]: A list of objects built from the dicts.
+        """
         obj_list = []
-        for obj_dict in response:
+        for obj_dict in data:
+            if in_place:
+                obj = self._get_object_from_cache(obj_dict.get(self._id_attr))
+                if obj is not None:
+                    obj._set_fields(
+                        obj_dict, obj._attrs_layout.names if fields is None else fields)
+                    self._update_cache(obj)
+                    obj_list.append(obj)
+                    continue
+
             # Creating a new object using _obj_cls provide in the ObjManager class.
             #    The attrs is obj_dict (based on the server response).
-            obj = self._obj_cls(self, obj_dict)
-
-            # Use the received _parent object
-            #   **OR**
-            # Getting manually (trhought a new get request to server) the parent object
-            obj._parent = self._get_parent_obj_if_exist(obj, _parent)
+            obj = self._obj_cls(self, obj_dict, _fields=fields)
 
             # Update object in our internal cache
             self._update_cache(obj)
 
             obj_list.append(obj)
 
-        return ObjectListManager(obj_list)
+        return obj_list
+
+    def _load_fields(self, obj: ObjectBase, fields: Iterable[str]) -> None:
+        """Request (one request) some attributes of a object, not loaded yet (see `fields`).
+
+        Args:
+            obj (ObjectBase): The object to be loaded
+            fields (Iterable[str]): The attributes to be requested
+        """
+        params = self._prepare_params(fields=self._get_fields(fields))
+        response = self.request.http_get(f'{self._path}/{obj._id}', params)
+
+        obj._set_fields(self._get_response_objs(response)[0], fields)
+
+    def _prepare_params(
+        self,
+        params: Union[dict[str, Any], None] = None,
+        fields: Union[frozenset[str], None] = None,
+        include_children: bool = False
+    ) -> dict[str, Any]:
+        """Prepare the params of a GET request, without changing the params
+            received from the caller.
+
+        Args:
+            params (dict[str, Any], optional): A dictionary of query parameters. Defaults to None.
+            fields (frozenset[str], optional): The attributes to be requested (see `_get_fields`).
+                                     Defaults to None (the manager fixed criteria).
+            include_children (bool, optional): If True, the child objects (`_children_attr`) are
+                                                        requested too. Defaults to False.
+
+        Returns:
+            dict[str, Any]: A new dictionary with the params + fixed criteria of the manager.
+        """
+        params = dict(params) if params else {}
+
+        # The object manager has a fixed criteria to execute in all get request?
+        if self._fixed_criteria:
+            params.update(self._fixed_criteria)
+
+        # Only the requested attributes (in the order of the manager definition)
+        if fields is not None:
+            params[self._select_param] = ','.join(
+                name for name in self._get_attrs_layout().names if name in fields)
 
-    def get_all(self, _parent: ObjectBase = None) -> List[ObjectBase]:
+        select = params.get(self._select_param)
+        if include_children and self._children_attr and select:
+            params[self._select_param] = f'{select},{self._children_attr}'
+
+        return params
+
+    def _get_page_size(
+        self,
+        page_size: Union[int, None] = None,
+        limit: Union[int, None] = None
+    ) -> int:
+        """Get the number of objects to request per page.
+
+        Args:
+            page_size (int, optional): Number of objects per page. Defaults to None (use the manager `_page_size`).
+            limit (int, optional): Maximum number of objects to retrieve. Defaults to None (no limit).
+
+        Returns:
+            int: The number of objects per page.
+        """
+        page_size = page_size or self._page_size
+        # There is no reason to request more objects than the limit
+        if limit is not None:
+            page_size = min(page_size, limit)
+
+        return page_size
+
+    def _get_many_by_id(self, ids: List[Any]) -> dict[Any, ObjectBase]:
+        """Retrieves many objects by their IDs with the fewest possible requests.
+
+        The internal cache is used first. The missing objects are requested in a
+            single request to the manager's path when the endpoint isn't paginated
+            (it returns all objects at once), otherwise one by one. The objects not
+            found (or not visible to the user, 4xx) are left out of the result.
+
+        Args:
+            ids (List[Any]): The IDs of the objects to retrieve
+
+        Returns:
+            dict[Any, ObjectBase]: The objects found, by ID
+        """
+        objs, missing_ids = self._get_many_from_cache(ids)
+
+        if len(missing_ids) > 1 and not self._paginated:
+            missing_ids = set(missing_ids)
+            for obj in self._get(self._path, resolve_parent=False):
+                if obj._id in missing_ids:
+                    objs[obj._id] = obj
+        else:
+            for id_ in missing_ids:
+                try:
+                    objs[id_] = self.get_by_id(id_, use_cache=False)
+                except MantisHTTPReponseClientError:
+                    # E.g: a parent deleted (404), its objects are kept without parent
+                    continue
+
+        return objs
+
+    def _iter_pages(
+        self,
+        url: str,
+        params: Union[dict[str, Any], None] = None,
+        _parent=None,
+        paginate: bool = True,
+        page_size: Union[int, None] = None,
+        limit: Union[int, None] = None,
+        resolve_parent: bool = True,
+        fields: Union[Iterable[str], None] = None,
+        in_place: bool = True,
+        raw: bool = False,
+        include_children: bool = False
+    ) -> Iterator[List[ObjectBase]]:
+        """Lazily retrieves the objects from a given URL, one page (request) at a time.
+
+        The next page is only requested when the previous one was consumed, so
+        the memory used is bounded by the page size.
+
+        Args:
+            url (str): The URL to send the GET requests to.
+            params (dict[str, Any], optional): A dictionary of query parameters to include in the request. Defaults to None.
+            _parent (optional): An optional parent object to associate with the retrieved objects. Defaults to None.
+            paginate (bool, optional): If False, only one request is made, even if the manager is paginated. Defaults to True.
+            page_size (int, optional): Number of objects per page. Defaults to None (use the manager `_page_size`).
+            limit (int, optional): Maximum number of objects to retrieve. Defaults to None (no limit).
+            resolve_parent (bool, optional): If False, the parent objects aren't searched in the server. Defaults to True.
+            fields (Iterable[str], optional): The attributes to be requested (the others are loaded on the
+                    first access, with one request by object). Defaults to None (all attributes).
+            in_place (bool, optional): If True, the cached objects are updated in place (see `_build_objs`). Defaults to True.
+            raw (bool, optional): If True, the raw objects (dicts) are yielded (see `_get_page`). Defaults to False.
+            include_children (bool, optional): If True, the child objects embedded in the response
+                                        are attached to the objects (see `_attach_children`). Defaults to False.
+
+        Yields:
+            List[ObjectBase]: The list of objects of each page.
+        """
+        fields = self._get_fields(fields)
+        params = self._prepare_params(params, fields, include_children)
+
+        if not (paginate and self._paginated):
+            obj_list = self._get_page(url, params, _parent, resolve_parent,
+                                      fields, in_place, raw, include_children)
+            yield obj_list[:limit] if limit is not None else obj_list
+            return
+
+        page_size = self._get_page_size(page_size, limit)
+
+        remaining = limit
+        page = const.PAGINATION_FIRST_PAGE
+        while remaining is None or remaining > 0:
+            params[const.PAGINATION_PAGE_SIZE_PARAM] = page_size
+            params[const.PAGINATION_PAGE_PARAM] = page
+
+            obj_list = self._get_page(url, params, _parent, resolve_parent,
+                                      fields, in_place, raw, include_children)
+            if remaining is not None:
+                obj_list = obj_list[:remaining]
+                remaining -= len(obj_list)
+
+            if obj_list:
+                yield obj_list
+
+            # A page smaller than requested is the last page
+            if len(obj_list) < page_size:
+                break
+
+            page += 1
+
+    def _iter(
+        self,
+        url: str,
+        params: Union[dict[str, Any], None] = None,
+        _parent=None,
+        **kwargs
+    ) -> Iterator[ObjectBase]:
+        """Lazily retrieves the objects from a given URL, one by one.
+
+        Args:
+            url (str): The URL to send the GET requests to.
+            params (dict[str, Any], optional): A dictionary of query parameters to include in the request. Defaults to None.
+            _parent (optional): An optional parent object to associate with the retrieved objects. Defaults to None.
+            **kwargs: Pagination arguments (`paginate`, `page_size`, `limit`,
+                              `resolve_parent` and `fields`), see `_iter_pages`.
+
+        Yields:
+            ObjectBase: The objects retrieved from the URL.
+        """
+        for obj_list in self._iter_pages(url, params, _parent, **kwargs):
+            yield from obj_list
+
+    def _iter_raw(
+        self,
+        url: str,
+        params: Union[dict[str, Any], None] = None,
+        **kwargs
+    ) -> Iterator[dict[str, Any]]:
+        """Lazily retrieves the raw objects (dicts, as received from the server) from a given URL, one by one.
+
+        The objects aren't built nor added to the internal cache, so only one
+            page of dicts is held in memory at a time (e.g: to export them).
+
+        Args:
+            url (str): The URL to send the GET requests to.
+            params (dict[str, Any], optional): A dictionary of query parameters to include in the request. Defaults to None.
+            **kwargs: Pagination arguments (`paginate`, `page_size`, `limit`
+                              and `fields`), see `_iter_pages`.
+
+        Yields:
+            dict[str, Any]: The raw objects retrieved from the URL.
+        """
+        for data in self._iter_pages(url, params, raw=True, **kwargs):
+            yield from data
+
+    def _get(
+        self,
+        url: str,
+        params: dict[str, Any] = None,
+        _parent=None,
+        **kwargs
+    ) -> List[ObjectBase]:
+        """The generic function to execute GET HTTP and retrieves a list of objects from a given URL with optional parameters.
+
+        When the manager is paginated, all pages are requested (until `limit` is reached).
+
+        Args:
+            url (str): The URL to send the GET request to.
+            params (dict[str, Any], optional): A dictionary of query parameters to include in the request. Defaults to None.
+            _parent (optional): An optional parent object to associate with the retrieved objects. Defaults to None.
+            **kwargs: Pagination arguments (`paginate`, `page_size`, `limit`,
+                              `resolve_parent` and `fields`), see `_iter_pages`.
+
+        Returns:
+            List[ObjectBase]: A list of objects retrieved from the URL.
+        """
+        return ObjectListManager(list(self._iter(url, params, _parent, **kwargs)))
+
+    def get_all(
+        self,
+        _parent: ObjectBase = None,
+        limit: Union[int, None] = None,
+        page_size: Union[int, None] = None,
+        resolve_parent: bool = True,
+        fields: Union[Iterable[str], None] = None
+    ) -> List[ObjectBase]:
         """Retrieves all objects from the server for this manager's path.
 
         Args:
             _parent (ObjectBase, optional): Parent object to associate with retrieved objects. Defaults to None.
+            limit (int, optional): Maximum number of objects to retrieve. No more pages are requested after
+                                                           the limit is reached. Defaults to None (no limit).
+            page_size (int, optional): Number of objects per page. Defaults to None (use the manager `_page_size`).
+            resolve_parent (bool, optional): If False, the parent objects aren't searched in the server. Defaults to True.
+            fields (Iterable[str], optional): The attributes to be requested (the others are loaded on the
+                    first access, with one request by object). Defaults to None (all attributes).
 
         Returns:
             List[ObjectBase]: List of all objects retrieved from the server.
         """
-        return self._get(self._path, _parent=_parent)
+        return self._get(self._path, _parent=_parent, limit=limit,
+                         page_size=page_size, resolve_parent=resolve_parent,
+                         fields=fields)
+
+    def iter_all(
+        self,
+        _parent: ObjectBase = None,
+        limit: Union[int, None] = None,
+        page_size: Union[int, None] = None,
+        resolve_parent: bool = True,
+        fields: Union[Iterable[str], None] = None
+    ) -> Iterator[ObjectBase]:
+        """Lazily iterates over all objects from the server for this manager's path.
 
-    def get_by_id(self, id_: Any, use_cache=True, _parent=None) -> ObjectBase:
+        Only one page of objects is held in memory at a time.
+
+        Args:
+            _parent (ObjectBase, optional): Parent object to associate with retrieved objects. Defaults to None.
+            limit (int, optional): Maximum number of objects to retrieve. Defaults to None (no limit).
+            page_size (int, optional): Number of objects per page. Defaults to None (use the manager `_page_size`).
+            resolve_parent (bool, optional): If False, the parent objects aren't searched in the server. Defaults to True.
+            fields (Iterable[str], optional): The attributes to be requested (the others are loaded on the
+                    first access, with one request by object). Defaults to None (all attributes).
+
+        Yields:
+            ObjectBase: The objects retrieved from the server.
+        """
+        return self._iter(self._path, _parent=_parent, limit=limit,
+                          page_size=page_size, resolve_parent=resolve_parent,
+                          fields=fields)
+
+    def get_by_id(
+        self,
+        id_: Any,
+        use_cache=True,
+        _parent=None,
+        resolve_parent: bool = True,
+        fields: Union[Iterable[str], None] = None
+    ) -> ObjectBase:
         """Retrieves an object by its ID from the server or cache.
 
         Args:
             id_ (Any): The ID of the object to retrieve
             use_cache (bool, optional): Whether to check the cache before making a server request. Defaults to True.
             _parent (ObjectBase, optional): Parent object to associate with the retrieved object. Defaults to None.
+            resolve_parent (bool, optional): If False, the parent object isn't searched in the server. Defaults to True.
+            fields (Iterable[str], optional): The attributes to be requested (the others are loaded on the
+                    first access, with one request by object). Defaults to None (all attributes).
 
         Returns:
             ObjectBase: The object with the specified ID
@@ -118,21 +494,476 @@ class GetMixins(ObjectManagerBase):
                     obj._parent = _parent
                 return obj
 
-        return self._get(f'{self._path}/{id_}', _parent=_parent)[0]
+        return self._get(f'{self._path}/{id_}', _parent=_parent,
+                         paginate=False, resolve_parent=resolve_parent,
+                         fields=fields)[0]
+
+    def get_many(
+        self,
+        ids: Iterable[Any],
+        max_workers: int = const.GET_MANY_DEFAULT_MAX_WORKERS,
+        use_cache: bool = True,
+        _parent=None,
+        resolve_parent: bool = True,
+        fields: Union[Iterable[str], None] = None
+    ) -> List[ObjectBase]:
+        """Retrieves many objects by their IDs, requesting them concurrently.
+
+        Args:
+            ids (Iterable[Any]): The IDs of the objects to retrieve
+            max_workers (int, optional): Maximum number of requests in flight at the
+                            same time. Defaults to const.GET_MANY_DEFAULT_MAX_WORKERS.
+            use_cache (bool, optional): Whether to check the cache before making a server request. Defaults to True.
+            _parent (ObjectBase, optional): Parent object to associate with the retrieved objects. Defaults to None.
+            resolve_parent (bool, optional): If False, the parent objects aren't searched in the server. Defaults to True.
+            fields (Iterable[str], optional): The attributes to be requested (the others are loaded on the
+                    first access, with one request by object). Defaults to None (all attributes).
+
+        Returns:
+            List[ObjectBase]: The objects found, in the same order of `ids`. The IDs that
+                couldn't be retrieved are in the `errors` attribute (id -> exception).
+
+        Notes:
+            - The objects found in cache are returned without any request
+            - A failure of one ID doesn't abort the others
+        """
+        ids = list(dict.fromkeys(ids))
+
+        if use_cache:
+            objs, missing_ids = self._get_many_from_cache(ids)
+        else:
+            objs, missing_ids = {}, ids
+
+        errors = {}
+
+        def _get_by_id(id_):
+            try:
+                return self.get_by_id(id_, use_cache=False, resolve_parent=False,
+                                      fields=fields)
+            except Exception as e:
+                errors[id_] = e
+
+        if missing_ids:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                missing_objs = [
+                    obj for obj in executor.map(_get_by_id, missing_ids) if obj
+                ]
+
+            # The parents of all objects are resolved in batch
+            self._attach_parent_objs(missing_objs, _parent, resolve_parent)
+            objs.update((obj._id, obj) for obj in missing_objs)
+
+        for obj in objs.values():
+            if _parent and not obj._parent:
+                obj._parent = _parent
+
+        return ObjectListManager(
+            [objs[id_] for id_ in ids if id_ in objs], errors=errors)
 
 
 class GetByCriteriaMixins(GetMixins):
-    def get_by_crit(self, crit: dict[str, Any], _parent=None) -> List[ObjectBase]:
+    def get_by_crit(
+        self,
+        crit: dict[str, Any],
+        _parent=None,
+        limit: Union[int, None] = None,
+        page_size: Union[int, None] = None,
+        resolve_parent: bool = True,
+        fields: Union[Iterable[str], None] = None
+    ) -> List[ObjectBase]:
         """Get objects matching specified criteria from the Mantis server.
 
         Args:
             crit (dict[str, Any]): Dictionary of criteria to filter objects by
             _parent (ObjectBase, optional): Parent object to associate with retrieved objects. Defaults to None.
+            limit (int, optional): Maximum number of objects to retrieve. No more pages are requested after
+                                                           the limit is reached. Defaults to None (no limit).
+            page_size (int, optional): Number of objects per page. Defaults to None (use the manager `_page_size`).
+            resolve_parent (bool, optional): If False, the parent objects aren't searched in the server. Defaults to True.
+            fields (Iterable[str], optional): The attributes to be requested (the others are loaded on the
+                    first access, with one request by object). Defaults to None (all attributes).
 
         Returns:
             List[ObjectBase]: List of objects matching the specified criteria
         """
-        return self._get(self._path, crit, _parent)
+        return self._get(self._path, crit, _parent, limit=limit,
+                         page_size=page_size, resolve_parent=resolve_parent,
+                         fields=fields)
+
+    def iter_by_crit(
+        self,
+        crit: dict[str, Any],
+        _parent=None,
+        limit: Union[int, None] = None,
+        page_size: Union[int, None] = None,
+        resolve_parent: bool = True,
+        fields: Union[Iterable[str], None] = None
+    ) -> Iterator[ObjectBase]:
+        """Lazily iterates over the objects matching specified criteria from the Mantis server.
+
+        Only one page of objects is held in memory at a time.
+
+        Args:
+            crit (dict[str, Any]): Dictionary of criteria to filter objects by
+            _parent (ObjectBase, optional): Parent object to associate with retrieved objects. Defaults to None.
+            limit (int, optional): Maximum number of objects to retrieve. Defaults to None (no limit).
+            page_size (int, optional): Number of objects per page. Defaults to None (use the manager `_page_size`).
+            resolve_parent (bool, optional): If False, the parent objects aren't searched in the server. Defaults to True.
+            fields (Iterable[str], optional): The attributes to be requested (the others are loaded on the
+                    first access, with one request by object). Defaults to None (all attributes).
+
+        Yields:
+            ObjectBase: The objects matching the specified criteria
+        """
+        return self._iter(self._path, crit, _parent, limit=limit,
+                          page_size=page_size, resolve_parent=resolve_parent,
+                          fields=fields)
+
+
+class ChangesSinceMixins(GetMixins):
+    """Incremental synchronization of the objects, using the `updated_at` watermarks.
+
+    The server must return the objects ordered by `_updated_attr` (newest first),
+    as the Mantis issues endpoint does by default.
+    """
+
+    _created_attr: str = 'created_at'
+    _updated_attr: str = 'updated_at'
+
+    def changes_since(
+        self,
+        since: Union[SyncWatermark, datetime, str, None] = None,
+        crit: Union[dict[str, Any], None] = None,
+        page_size: Union[int, None] = None,
+        resolve_parent: bool = True,
+        fields: Union[Iterable[str], None] = None,
+        include_children: bool = False
+    ) -> SyncChanges:
+        """Get the objects created/updated since a watermark.
+
+        The server returns the objects newest first (the REST API has no ordering
+        param), so the pages are requested only until a page with objects older than the
+        watermark: the cost is proportional to the number of changes, not to the number of
+        objects. When a page isn't in that order, all the pages are requested (until a
+        short page). The objects already in the internal cache are updated in place.
+
+        The objects whose `updated_at` isn't a valid date can't be compared with the
+        watermark, so they're skipped (and don't change the watermark).
+
+        Args:
+            since (Union[SyncWatermark, datetime, str, None], optional): The watermark of the
+                last synchronization (or its token, see `SyncWatermark.to_token`) or a date.
+                                       Defaults to None (all objects, the first synchronization).
+            crit (dict[str, Any], optional): Dictionary of criteria to filter objects by. Defaults to None.
+            page_size (int, optional): Number of objects per page. Defaults to None (use the manager `_page_size`).
+            resolve_parent (bool, optional): If False, the parent objects aren't searched in the server. Defaults to True.
+            fields (Iterable[str], optional): The attributes to be requested (the dates are always
+                                                  requested). Defaults to None (all attributes).
+            include_children (bool, optional): If True, the child objects are requested in the same
+                                        pages (see `_attach_children`). Defaults to False.
+
+        Returns:
+            SyncChanges: The created/updated objects and the new watermark
+        """
+        watermark = SyncWatermark.parse(since)
+        new_watermark = watermark
+
+        if fields is not None:
+            fields = set(fields) | {self._created_attr, self._updated_attr}
+
+        created, updated = [], []
+        seen_ids = set()
+        requests = 0
+
+        pages = self._iter_pages(self._path, crit, page_size=page_size,
+                                 resolve_parent=resolve_parent, fields=fields,
+                                 in_place=True, include_children=include_children)
+        ordered = True
+        previous = None
+        try:
+            for obj_list in pages:
+                requests += 1
+                reached = False
+                for obj in obj_list:
+                    updated_at = obj[self._updated_attr]
+                    if updated_at is not None and not isinstance(updated_at, datetime):
+                        continue
+
+                    if updated_at is not None:
+                        if previous is not None and updated_at > previous:
+                            ordered = False
+                        previous = updated_at
+
+                    if not watermark.is_new(obj._id, updated_at):
+                        # Objects updated at the same time of the watermark can
+                        #   still be new, the older ones can't
+                        if updated_at < watermark.timestamp:
+                            reached = True
+                        continue
+
+                    # The pages can shift while they're requested (objects updated meanwhile)
+                    if obj._id in seen_ids:
+                        continue
+                    seen_ids.add(obj._id)
+
+                    new_watermark = new_watermark.advance(obj._id, updated_at)
+
+                    created_at = obj[self._created_attr]
+                    if not isinstance(created_at, datetime):
+                        created_at = None
+                    if (watermark.timestamp is None or created_at is None
+                            or created_at > watermark.timestamp):
+                        created.append(obj)
+                    else:
+                        updated.append(obj)
+
+                # The rest of the pages are older (only if the order is the expected one)
+                if reached and ordered:
+                    break
+        finally:
+            pages.close()
+
+        return SyncChanges(created, updated, new_watermark, requests)
+
+
+class CreateMixins(GetMixins):
+    def _get_create_path(self, _parent: Union[ObjectBase, Any, None] = None) -> str:
+        """Get the path of the creation requests (e.g: the notes are created in the issue path).
+
+        Args:
+            _parent (Union[ObjectBase, Any, None], optional): The parent object (or its id). Defaults to None.
+
+        Returns:
+            str: The path
+        """
+        return self._path
+
+    def _validate_create(self, attrs: dict[str, Any]) -> None:
+        """Validate the attributes of a new object, before sending it.
+
+        The mandatory attributes (except the read only and the id, set by the server)
+        must be present and the read only attributes must not.
+
+        Args:
+            attrs (dict[str, Any]): The attributes of the new object
+
+        Raises:
+            MantisValidationError: If some attribute is missing or read only
+        """
+        layout = self._get_attrs_layout()
+        missing = [name for name in self._mandatory_attr
+                   if name != self._id_attr and name not in layout.readonly
+                   and attrs.get(name) is None]
+        readonly = [name for name in attrs if name in layout.readonly]
+        if missing or readonly:
+            raise MantisValidationError(self._obj_cls.__name__, missing, readonly)
+
+    def create_one(
+        self,
+        attrs: dict[str, Any],
+        _parent: Union[ObjectBase, Any, None] = None,
+        resolve_parent: bool = True
+    ) -> ObjectBase:
+        """Create a object in the server (validated before sending, see `_validate_create`).
+
+        Args:
+            attrs (dict[str, Any]): The attributes of the new object (typed values are
+                                 encoded, e.g: a user object to its reference)
+            _parent (Union[ObjectBase, Any, None], optional): The parent object (or its id),
+                           e.g: the issue of a note. Defaults to None.
+            resolve_parent (bool, optional): If False, the parent object isn't searched in the server. Defaults to True.
+
+        Raises:
+            MantisValidationError: If some attribute is missing or read only
+
+        Returns:
+            ObjectBase: The object created (added to the internal cache)
+        """
+        attrs = {name: encode_value(value) for name, value in attrs.items()}
+        self._validate_create(attrs)
+
+        response = self.request.http_post(self._get_create_path(_parent), data=attrs)
+
+        if self._key_create_response is not None:
+            for key in self._key_create_response:
+                response = response[key]
+            data = [response]
+        else:
+            data = self._get_response_objs(response)
+
+        obj_list = self._build_objs_from_data(data)
+        self._attach_parent_objs(
+            obj_list, _parent if isinstance(_parent, ObjectBase) else None, resolve_parent)
+
+        return obj_list[0]
+
+    def create_many(
+        self,
+        items: Iterable[Union[dict[str, Any], tuple[Any, dict[str, Any]]]],
+        max_workers: int = const.BULK_DEFAULT_MAX_WORKERS,
+        checkpoint: Union[BulkCheckpoint, None] = None,
+        key: Union[Callable[[Any], Any], None] = None,
+        resolve_parent: bool = True
+    ) -> BulkResult:
+        """Create many objects, concurrently (one request by object, see `create_one`).
+
+        Args:
+            items (Iterable[Union[dict[str, Any], tuple[Any, dict[str, Any]]]]): The attributes of
+                        the new objects, or tuples `(parent, attrs)` (e.g: the issue of each note)
+            max_workers (int, optional): Maximum number of requests in flight at the
+                                same time. Defaults to const.BULK_DEFAULT_MAX_WORKERS.
+            checkpoint (Union[BulkCheckpoint, None], optional): The journal of the objects created,
+                        the items already created (in a previous run) are skipped. Defaults to None.
+            key (Union[Callable[[Any], Any], None], optional): A function returning the key of a item
+                        (e.g: the id in the source system), used by the result and the checkpoint.
+                        Must be JSON serializable. Defaults to None (the position of the item).
+            resolve_parent (bool, optional): If False, the parent objects aren't searched in the server. Defaults to True.
+
+        Returns:
+            BulkResult: The objects created and the errors, by item key
+        """
+        def _create(item):
+            _parent, attrs = item if isinstance(item, tuple) else (None, item)
+            return self.create_one(attrs, _parent, resolve_parent)
+
+        items = ((key(item) if key else index, item) for index, item in enumerate(items))
+
+        return run_bulk(const.BULK_OP_CREATE, _create, items, max_workers, checkpoint)
+
+
+class UpdateMixins(GetMixins):
+    def _get_object(self, obj: Union[ObjectBase, Any]) -> ObjectBase:
+        """Get a object by its id, from the cache (or a object with only the id, without request)."""
+        if isinstance(obj, ObjectBase):
+            return obj
+
+        cached_obj = self._get_object_from_cache(obj)
+        if cached_obj is not None:
+            return cached_obj
+
+        return self._obj_cls(self, {self._id_attr: obj},
+                             _fields=frozenset((self._id_attr, )))
+
+    def update_one(self, obj: ObjectBase) -> ObjectBase:
+        """Send the attributes changed of a object to the server (a PATCH request
+            with only the changed attributes, see `ObjectBase.dirty_fields`).
+
+        The object is updated in place (and in the internal cache) with the response,
+        without other request.
+
+        Args:
+            obj (ObjectBase): The object changed
+
+        Returns:
+            ObjectBase: The same object, updated
+        """
+        changes = obj.get_changes()
+        if not changes:
+            return obj
+
+        readonly = [name for name in changes if name in self._get_attrs_layout().readonly]
+        if readonly:
+            raise MantisValidationError(self._obj_cls.__name__, readonly=readonly)
+
+        response = self.request.http_patch(f'{self._path}/{obj._id}', changes)
+
+        data = None
+        if isinstance(response, dict):
+            data = self._get_response_objs(response)
+        if data:
+            # The server omits the empty attributes: the changed ones are always set
+            attrs = data[0]
+            obj._set_fields(attrs, set(attrs).union(changes))
+            self._update_cache(obj)
+
+        obj._clear_dirty(changes)
+
+        return obj
+
+    def update_many(
+        self,
+        items: Iterable[Union[ObjectBase, tuple[Any, dict[str, Any]]]],
+        max_workers: int = const.BULK_DEFAULT_MAX_WORKERS,
+        checkpoint: Union[BulkCheckpoint, None] = None
+    ) -> BulkResult:
+        """Update many objects, concurrently (one PATCH by object, with only the
+            changed attributes, see `update_one`).
+
+        Args:
+            items (Iterable[Union[ObjectBase, tuple[Any, dict[str, Any]]]]): The objects changed,
+                        or tuples `(object or id, changes)`. A id not cached isn't requested.
+            max_workers (int, optional): Maximum number of requests in flight at the
+                                same time. Defaults to const.BULK_DEFAULT_MAX_WORKERS.
+            checkpoint (Union[BulkCheckpoint, None], optional): The journal of the objects updated,
+                        the objects already updated (in a previous run) are skipped. Defaults to None.
+
+        Returns:
+            BulkResult: The objects updated and the errors, by object id
+        """
+        def _update(item):
+            obj, changes = item
+            obj = self._get_object(obj)
+            for name, value in changes.items():
+                obj.__setitem__(name, value, force=True)
+
+            return self.update_one(obj)
+
+        def _get_items():
+            for item in items:
+                obj, changes = item if isinstance(item, tuple) else (item, {})
+                yield (obj._id if isinstance(obj, ObjectBase) else obj), (obj, changes)
+
+        return run_bulk(const.BULK_OP_UPDATE, _update, _get_items(), max_workers, checkpoint)
+
+
+class DeleteMixins(ObjectManagerBase):
+    def _get_object_path(self, obj: Union[ObjectBase, Any]) -> str:
+        """Get the path of a object (e.g: the notes are in the issue path).
+
+        Args:
+            obj (Union[ObjectBase, Any]): The object (or its id)
+
+        Returns:
+            str: The path
+        """
+        return f'{self._path}/{obj._id if isinstance(obj, ObjectBase) else obj}'
+
+    def delete_one(self, obj: Union[ObjectBase, Any]) -> Any:
+        """Delete a object in the server (and in the internal cache).
+
+        Args:
+            obj (Union[ObjectBase, Any]): The object (or its id)
+
+        Returns:
+            Any: The id of the object deleted
+        """
+        id_ = obj._id if isinstance(obj, ObjectBase) else obj
+        self.request.http_delete(self._get_object_path(obj))
+        self._cache.remove(self._obj_cls, id_)
+
+        return id_
+
+    def delete_many(
+        self,
+        items: Iterable[Union[ObjectBase, Any]],
+        max_workers: int = const.BULK_DEFAULT_MAX_WORKERS,
+        checkpoint: Union[BulkCheckpoint, None] = None
+    ) -> BulkResult:
+        """Delete many objects, concurrently (one request by object, see `delete_one`).
+
+        Args:
+            items (Iterable[Union[ObjectBase, Any]]): The objects (or their ids)
+            max_workers (int, optional): Maximum number of requests in flight at the
+                                same time. Defaults to const.BULK_DEFAULT_MAX_WORKERS.
+            checkpoint (Union[BulkCheckpoint, None], optional): The journal of the objects deleted,
+                        the objects already deleted (in a previous run) are skipped. Defaults to None.
+
+        Returns:
+            BulkResult: The ids deleted and the errors, by object id
+        """
+        items = ((obj._id if isinstance(obj, ObjectBase) else obj, obj) for obj in items)
+
+        return run_bulk(const.BULK_OP_DELETE, self.delete_one, items, max_workers, checkpoint)
 
 
 class ManagerBaseMixins(GetMixins):
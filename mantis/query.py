@@ -0,0 +1,540 @@
+"""This module provides the in-memory query engine of the lists of objects
+        (see `ObjectListManager.filter`, `sort`, `group_by` and `count_by`).
+
+The conditions are `(path, operator, value)`, the path is a attribute or a
+nested value (e.g: 'reporter.name', 'status.name'). The values of a path are
+extracted once by list (a column) and the indexes are built lazily, on the
+first query that needs them, and reused by the next queries on the same list:
+
+    - hash index (value -> positions): `eq`, `ne`, `in`, `nin`, `group_by`, `count_by`
+    - sorted index: `lt`, `le`, `gt`, `ge`, `between` (binary search) and `sort`
+
+The references (objects or dicts with `id`, e.g: `handler`, `category`) are
+compared by id and the enumerations (e.g: `status`) by value or name.
+
+Classes:
+    HashIndex: The positions of the objects by value.
+    SortedIndex: The positions of the objects sorted by value.
+    QueryIndexes: The columns and indexes of a list of objects.
+
+Functions:
+    compile_conditions: Convert some conditions to a function (without indexes).
+    get_path_value: Get the value of a path of a object.
+    parse_conditions: Convert the arguments of `filter` to conditions.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Callable, Iterable, List, Sequence, Union
+
+
+__all__ = ['HashIndex', 'SortedIndex', 'QueryIndexes', 'compile_conditions',
+           'get_path_value', 'parse_conditions']
+
+OP_EQ = 'eq'
+OP_NE = 'ne'
+OP_IN = 'in'
+OP_NOT_IN = 'nin'
+OP_CONTAINS = 'contains'
+OP_ICONTAINS = 'icontains'
+OP_LT = 'lt'
+OP_LE = 'le'
+OP_GT = 'gt'
+OP_GE = 'ge'
+OP_BETWEEN = 'between'
+OP_ISNULL = 'isnull'
+
+OPERATORS = (OP_EQ, OP_NE, OP_IN, OP_NOT_IN, OP_CONTAINS, OP_ICONTAINS, OP_LT,
+             OP_LE, OP_GT, OP_GE, OP_BETWEEN, OP_ISNULL)
+
+_HASH_OPERATORS = (OP_EQ, OP_NE, OP_IN, OP_NOT_IN)
+_RANGE_OPERATORS = (OP_LT, OP_LE, OP_GT, OP_GE, OP_BETWEEN)
+
+_PATH_SEP = '.'
+_KWARGS_SEP = '__'
+
+
+def _normalize(value: Any) -> Any:
+    """Get the value to be compared/indexed (the references by id)."""
+    if isinstance(value, dict) and 'id' in value:
+        return value['id']
+    if hasattr(value, '_id') and hasattr(value, 'manager'):
+        return value._id
+
+    return value
+
+
+def get_path_value(obj: Any, path: str) -> Any:
+    """Get the value of a path of a object (e.g: 'reporter.name').
+
+    The first attribute is decoded (see `mantis.decoders`), the nested values are
+        read from the raw value (so, the references aren't loaded from the server).
+
+    Args:
+        obj (Any): The object (`ObjectBase`) or a dict
+        path (str): The path
+
+    Returns:
+        Any: The value (None, if the path doesn't exist)
+    """
+    if _PATH_SEP not in path:
+        return obj.get(path)
+
+    root, *keys = path.split(_PATH_SEP)
+    value = obj.get_raw(root) if hasattr(obj, 'get_raw') else obj.get(root)
+    for key in keys:
+        if isinstance(value, dict):
+            value = value.get(key)
+        elif isinstance(value, (list, tuple)) and key.isdigit() and int(key) < len(value):
+            value = value[int(key)]
+        else:
+            return None
+
+    return value
+
+
+def parse_conditions(args: Sequence[Any], kwargs: dict[str, Any]) -> List[tuple]:
+    """Convert the arguments of `filter` to conditions.
+
+    Args:
+        args (Sequence[Any]): `(path, operator, value)` tuples, `(path, value)`
+                    tuples (equality) or functions (`func(obj) -> bool`)
+        kwargs (dict[str, Any]): `path__operator=value` (e.g: `priority__ge=30`,
+                        `reporter__name='administrator'`, `status='new'`)
+
+    Returns:
+        List[tuple]: The conditions, `(path, operator, value)` (`(None, func, None)` for functions)
+
+    Raises:
+        ValueError: If a operator is unknown
+    """
+    conditions = []
+    for arg in args:
+        if callable(arg):
+            conditions.append((None, arg, None))
+            continue
+
+        if len(arg) == 2:
+            arg = (arg[0], OP_EQ, arg[1])
+        conditions.append(tuple(arg))
+
+    for key, value in kwargs.items():
+        path, _, op = key.rpartition(_KWARGS_SEP)
+        if not path or op not in OPERATORS:
+            path, op = key, OP_EQ
+        conditions.append((path.replace(_KWARGS_SEP, _PATH_SEP), op, value))
+
+    for _, op, _ in conditions:
+        if not callable(op) and op not in OPERATORS:
+            raise ValueError(f'Unknown operator: {op!r} (use one of: {", ".join(OPERATORS)})')
+
+    return conditions
+
+
+def _coerce(value: Any, sample: Any) -> Any:
+    """Convert a value of a condition to the type of the values of the column
+        (e.g: a enumeration name to the member, a ISO 8601 string to a datetime)."""
+    if isinstance(sample, Enum) and isinstance(value, str):
+        member = type(sample).__members__.get(value)
+        return value if member is None else member
+    if isinstance(sample, datetime):
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if (isinstance(value, datetime) and value.tzinfo is None
+                and sample.tzinfo is not None):
+            value = value.replace(tzinfo=timezone.utc)
+        return value
+
+    return _normalize(value)
+
+
+def _contains(value: Any, item: Any, ignore_case: bool = False) -> bool:
+    if value is None:
+        return False
+    if isinstance(value, str):
+        if ignore_case:
+            return str(item).lower() in value.lower()
+        return str(item) in value
+    if isinstance(value, (list, tuple)):
+        for element in value:
+            if element == item or (isinstance(element, dict) and item in (
+                    element.get('id'), element.get('name'))):
+                return True
+        return False
+
+    return False
+
+
+def _match_value(value: Any, op: str, expected: Any) -> bool:
+    if op == OP_ISNULL:
+        return (value is None) == bool(expected)
+    if op == OP_CONTAINS:
+        return _contains(value, expected)
+    if op == OP_ICONTAINS:
+        return _contains(value, expected, ignore_case=True)
+    if op in (OP_EQ, OP_NE):
+        equal = value == expected or (
+            isinstance(value, Enum) and isinstance(expected, str) and value.name == expected)
+        return equal if op == OP_EQ else not equal
+    if op in (OP_IN, OP_NOT_IN):
+        found = any(_match_value(value, OP_EQ, item) for item in expected)
+        return found if op == OP_IN else not found
+    if value is None:
+        return False
+    if op == OP_BETWEEN:
+        return expected[0] <= value <= expected[1]
+    if op == OP_LT:
+        return value < expected
+    if op == OP_LE:
+        return value <= expected
+    if op == OP_GT:
+        return value > expected
+
+    return value >= expected
+
+
+def _coerce_expected(op: str, expected: Any, sample: Any) -> Any:
+    if op == OP_BETWEEN:
+        return tuple(_coerce(item, sample) for item in expected)
+    if op in (OP_IN, OP_NOT_IN):
+        return [_coerce(item, sample) for item in expected]
+    if op in (OP_CONTAINS, OP_ICONTAINS, OP_ISNULL):
+        return expected
+
+    return _coerce(expected, sample)
+
+
+def compile_conditions(conditions: List[tuple]) -> Callable[[Any], bool]:
+    """Convert some conditions to a function that checks a object (without indexes,
+        e.g: to filter the objects while they are received).
+
+    Args:
+        conditions (List[tuple]): The conditions (see `parse_conditions`)
+
+    Returns:
+        Callable[[Any], bool]: The function, `func(obj) -> bool`
+    """
+    # The values of the conditions converted, by condition and type of the object value
+    coerced = {}
+
+    def match(obj: Any) -> bool:
+        for position, (path, op, expected) in enumerate(conditions):
+            if path is None:
+                if not op(obj):
+                    return False
+                continue
+
+            value = _normalize(get_path_value(obj, path))
+            key = (position, type(value))
+            if key not in coerced:
+                coerced[key] = _coerce_expected(op, expected, value)
+
+            try:
+                if not _match_value(value, op, coerced[key]):
+                    return False
+            except TypeError:
+                return False
+
+        return True
+
+    return match
+
+
+class HashIndex:
+    """The positions of the objects by value (in the order of the list)."""
+
+    __slots__ = ('positions', '_names')
+
+    def __init__(self, column: Sequence[Any]) -> None:
+        """Create a new HashIndex instance.
+
+        Args:
+            column (Sequence[Any]): The values (normalized) of the objects
+
+        Raises:
+            TypeError: If a value isn't hashable (e.g: a list)
+        """
+        positions = {}
+        for position, value in enumerate(column):
+            positions.setdefault(value, []).append(position)
+
+        self.positions = positions
+        self._names = None
+
+    @property
+    def names(self) -> dict[str, Any]:
+        """The enumeration members, by name."""
+        if self._names is None:
+            self._names = {key.name: key for key in self.positions
+                           if isinstance(key, Enum)}
+
+        return self._names
+
+    def lookup(self, value: Any) -> List[int]:
+        """Get the positions of a value.
+
+        Args:
+            value (Any): The value (a enumeration member can be searched by name)
+
+        Returns:
+            List[int]: The positions
+        """
+        try:
+            positions = self.positions.get(value)
+        except TypeError:
+            return []
+        if positions is None and isinstance(value, str) and self.names:
+            member = self.names.get(value)
+            if member is not None:
+                positions = self.positions.get(member)
+
+        return positions or []
+
+
+class SortedIndex:
+    """The positions of the objects sorted by value (the null values aren't indexed)."""
+
+    __slots__ = ('order', 'keys', 'nulls')
+
+    def __init__(self, column: Sequence[Any]) -> None:
+        """Create a new SortedIndex instance.
+
+        Args:
+            column (Sequence[Any]): The values (normalized) of the objects
+
+        Raises:
+            TypeError: If the values aren't comparable
+        """
+        order = [position for position, value in enumerate(column) if value is not None]
+        order.sort(key=column.__getitem__)
+
+        self.order = order
+        self.keys = [column[position] for position in order]
+        self.nulls = [position for position, value in enumerate(column) if value is None]
+
+    def range(
+        self,
+        low: Any = None,
+        high: Any = None,
+        include_low: bool = True,
+        include_high: bool = True
+    ) -> List[int]:
+        """Get the positions of the values in a range (binary search).
+
+        Args:
+            low (Any, optional): The lower bound. Defaults to None (no bound).
+            high (Any, optional): The upper bound. Defaults to None (no bound).
+            include_low (bool, optional): If True, the lower bound is included. Defaults to True.
+            include_high (bool, optional): If True, the upper bound is included. Defaults to True.
+
+        Returns:
+            List[int]: The positions (sorted by value)
+        """
+        start = 0
+        if low is not None:
+            start = (bisect_left if include_low else bisect_right)(self.keys, low)
+
+        stop = len(self.keys)
+        if high is not None:
+            stop = (bisect_right if include_high else bisect_left)(self.keys, high)
+
+        return self.order[start:stop]
+
+
+class QueryIndexes:
+    """The columns (values by path) and indexes of a list of objects, built
+        lazily and reused by the queries on the same list.
+
+    The indexes are rebuilt when the list changes (other list or length), use
+    `clear()` after updating the objects in place.
+    """
+
+    __slots__ = ('objects', '_signature', '_columns', '_hash_indexes', '_sorted_indexes')
+
+    def __init__(self, objects: List[Any]) -> None:
+        """Create a new QueryIndexes instance.
+
+        Args:
+            objects (List[Any]): The objects
+        """
+        self.objects = objects
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove all columns and indexes."""
+        self._signature = (id(self.objects), len(self.objects))
+        self._columns = {}
+        self._hash_indexes = {}
+        self._sorted_indexes = {}
+
+    def _check(self) -> None:
+        if self._signature != (id(self.objects), len(self.objects)):
+            self.clear()
+
+    def column(self, path: str) -> List[Any]:
+        """Get the values (normalized) of a path of all objects.
+
+        Args:
+            path (str): The path (e.g: 'status', 'reporter.name')
+
+        Returns:
+            List[Any]: The values, in the order of the list
+        """
+        self._check()
+        column = self._columns.get(path)
+        if column is None:
+            column = self._columns[path] = [
+                _normalize(get_path_value(obj, path)) for obj in self.objects]
+
+        return column
+
+    def hash_index(self, path: str) -> Union[HashIndex, None]:
+        """Get the hash index of a path (None, if the values aren't hashable)."""
+        self._check()
+        if path not in self._hash_indexes:
+            try:
+                self._hash_indexes[path] = HashIndex(self.column(path))
+            except TypeError:
+                self._hash_indexes[path] = None
+
+        return self._hash_indexes[path]
+
+    def sorted_index(self, path: str) -> Union[SortedIndex, None]:
+        """Get the sorted index of a path (None, if the values aren't comparable)."""
+        self._check()
+        if path not in self._sorted_indexes:
+            try:
+                self._sorted_indexes[path] = SortedIndex(self.column(path))
+            except TypeError:
+                self._sorted_indexes[path] = None
+
+        return self._sorted_indexes[path]
+
+    def _sample(self, path: str) -> Any:
+        return next((value for value in self.column(path) if value is not None), None)
+
+    def _match_hash(self, path: str, op: str, value: Any) -> Union[set[int], None]:
+        index = self.hash_index(path)
+        if index is None:
+            return None
+
+        values = value if op in (OP_IN, OP_NOT_IN) else (value, )
+        sample = self._sample(path)
+        positions = set()
+        for item in values:
+            positions.update(index.lookup(_coerce(item, sample)))
+
+        if op in (OP_NE, OP_NOT_IN):
+            positions = set(range(len(self.objects))).difference(positions)
+
+        return positions
+
+    def _match_range(self, path: str, op: str, value: Any) -> Union[set[int], None]:
+        index = self.sorted_index(path)
+        if index is None:
+            return None
+
+        sample = self._sample(path)
+        try:
+            if op == OP_BETWEEN:
+                low, high = value
+                return set(index.range(_coerce(low, sample), _coerce(high, sample)))
+
+            value = _coerce(value, sample)
+            if op in (OP_LT, OP_LE):
+                return set(index.range(high=value, include_high=op == OP_LE))
+
+            return set(index.range(low=value, include_low=op == OP_GE))
+        except TypeError:
+            return None
+
+    def _scan(
+        self,
+        path: Union[str, None],
+        op: Union[str, Callable],
+        value: Any,
+        positions: Iterable[int]
+    ) -> set[int]:
+        if path is None:
+            objects = self.objects
+            return {position for position in positions if op(objects[position])}
+
+        column = self.column(path)
+        value = _coerce_expected(op, value, self._sample(path))
+
+        match = _match_value
+        result = set()
+        for position in positions:
+            try:
+                if match(column[position], op, value):
+                    result.add(position)
+            except TypeError:
+                pass
+
+        return result
+
+    def match(self, conditions: List[tuple]) -> List[int]:
+        """Get the positions of the objects matching all conditions.
+
+        The conditions with a index (hash/sorted) are evaluated first, the others
+            are evaluated only over the objects matched.
+
+        Args:
+            conditions (List[tuple]): The conditions (see `parse_conditions`)
+
+        Returns:
+            List[int]: The positions, in the order of the list
+        """
+        self._check()
+        positions = None
+        scans = []
+        for path, op, value in conditions:
+            matched = None
+            if op in _HASH_OPERATORS:
+                matched = self._match_hash(path, op, value)
+            elif op in _RANGE_OPERATORS:
+                matched = self._match_range(path, op, value)
+
+            if matched is None:
+                scans.append((path, op, value))
+                continue
+
+            positions = matched if positions is None else positions.intersection(matched)
+
+        if positions is None:
+            positions = range(len(self.objects))
+
+        for path, op, value in scans:
+            positions = self._scan(path, op, value, positions)
+
+        return sorted(positions)
+
+    def sort(self, keys: Sequence[str], reverse: bool = False) -> List[int]:
+        """Get the positions of the objects sorted by some paths (stable, null values last).
+
+        Args:
+            keys (Sequence[str]): The paths, prefixed by '-' for descending order
+            reverse (bool, optional): If True, the order of all keys is reversed. Defaults to False.
+
+        Returns:
+            List[int]: The positions, sorted
+        """
+        self._check()
+        positions = list(range(len(self.objects)))
+        for key in reversed(keys):
+            descending = key.startswith('-') != reverse
+            path = key.lstrip('-')
+
+            index = self.sorted_index(path)
+            if index is not None and not descending and len(keys) == 1:
+                return index.order + index.nulls
+
+            column = self.column(path)
+            values = [position for position in positions if column[position] is not None]
+            nulls = [position for position in positions if column[position] is None]
+            values.sort(key=column.__getitem__, reverse=descending)
+            positions = values + nulls
+
+        return positions
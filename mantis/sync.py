@@ -0,0 +1,204 @@
+"""This module provides the helpers of the incremental synchronization
+        (see `ChangesSinceMixins.changes_since`).
+
+Classes:
+    SyncWatermark: The position of the last synchronization (the last `updated_at`
+        seen + the ids updated at that time), serializable as a token.
+    SyncChanges: The objects created/updated since a watermark + the new watermark.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Iterable, Iterator, Union
+
+from mantis.base import ObjectBase, ObjectListManager
+
+
+__all__ = ['SyncWatermark', 'SyncChanges']
+
+
+class SyncWatermark:
+    """The position of the last synchronization.
+
+    Mantis dates have a resolution of seconds, so many objects can be updated at
+    the same time of the watermark. The ids of the objects already seen at that
+    time are kept, so they aren't returned again (and the objects updated in the
+    same second, after the synchronization, aren't lost).
+
+    Use `to_token()`/`from_token()` to store the watermark between the runs.
+
+    Atributes:
+        timestamp (Union[datetime, None]): The last `updated_at` seen (None means the beginning)
+        ids (frozenset[Any]): The ids of the objects updated at `timestamp`
+    """
+
+    __slots__ = ('timestamp', 'ids')
+
+    _token_sep = '|'
+    _ids_sep = ','
+
+    def __init__(
+        self,
+        timestamp: Union[datetime, None] = None,
+        ids: Iterable[Any] = ()
+    ) -> None:
+        """Create a new SyncWatermark instance.
+
+        Args:
+            timestamp (Union[datetime, None], optional): The last `updated_at` seen. A naive
+                          datetime is considered UTC. Defaults to None (the beginning).
+            ids (Iterable[Any], optional): The ids of the objects updated at `timestamp`. Defaults to ().
+        """
+        if timestamp is not None and timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+
+        self.timestamp = timestamp
+        self.ids = frozenset(ids)
+
+    @classmethod
+    def from_token(cls, token: str) -> SyncWatermark:
+        """Create a watermark from a token (see `to_token`) or a ISO 8601 date.
+
+        Args:
+            token (str): The token
+
+        Returns:
+            SyncWatermark: The watermark
+        """
+        if not token:
+            return cls()
+
+        timestamp, _, ids = token.partition(cls._token_sep)
+        ids = [int(id_) if id_.isdigit() else id_
+               for id_ in ids.split(cls._ids_sep) if id_]
+
+        return cls(datetime.fromisoformat(timestamp), ids)
+
+    @classmethod
+    def parse(
+        cls,
+        since: Union[SyncWatermark, datetime, str, None]
+    ) -> SyncWatermark:
+        """Create a watermark from a watermark, a datetime, a token or None.
+
+        Args:
+            since (Union[SyncWatermark, datetime, str, None]): The value
+
+        Returns:
+            SyncWatermark: The watermark
+        """
+        if isinstance(since, cls):
+            return since
+        if isinstance(since, datetime):
+            return cls(since)
+        if isinstance(since, str):
+            return cls.from_token(since)
+
+        return cls()
+
+    def to_token(self) -> str:
+        """Serialize the watermark as a string (e.g: '2024-01-01T10:00:00+00:00|12,13').
+
+        Returns:
+            str: The token (empty, when the watermark is the beginning)
+        """
+        if self.timestamp is None:
+            return ''
+
+        ids = self._ids_sep.join(str(id_) for id_ in sorted(self.ids, key=str))
+
+        return f'{self.timestamp.isoformat()}{self._token_sep}{ids}'
+
+    def is_new(self, id_: Any, updated_at: Union[datetime, None]) -> bool:
+        """Check if a object was updated after the watermark.
+
+        Args:
+            id_ (Any): The object id
+            updated_at (Union[datetime, None]): The `updated_at` of the object
+
+        Returns:
+            bool: True if the object is new/updated, False otherwise
+        """
+        if self.timestamp is None or updated_at is None:
+            return True
+
+        return updated_at > self.timestamp or (
+            updated_at == self.timestamp and id_ not in self.ids)
+
+    def advance(self, id_: Any, updated_at: Union[datetime, None]) -> SyncWatermark:
+        """Get the watermark after seeing a object.
+
+        Args:
+            id_ (Any): The object id
+            updated_at (Union[datetime, None]): The `updated_at` of the object
+
+        Returns:
+            SyncWatermark: The new watermark (or this watermark, when it doesn't change)
+        """
+        if updated_at is None or (
+                self.timestamp is not None and updated_at < self.timestamp):
+            return self
+
+        if updated_at == self.timestamp:
+            return SyncWatermark(updated_at, self.ids | {id_})
+
+        return SyncWatermark(updated_at, (id_, ))
+
+    def __str__(self) -> str:
+        return self.to_token()
+
+    def __repr__(self) -> str:
+        return f'SyncWatermark({self.to_token()!r})'
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, SyncWatermark):
+            return (self.timestamp, self.ids) == (other.timestamp, other.ids)
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.timestamp, self.ids))
+
+
+class SyncChanges:
+    """The objects created/updated since a watermark + the new watermark.
+
+    Atributes:
+        created (ObjectListManager): The objects created after the watermark
+        updated (ObjectListManager): The objects (created before) updated after the watermark
+        watermark (SyncWatermark): The watermark to be used in the next synchronization
+        requests (int): The number of requests (pages) made
+    """
+
+    def __init__(
+        self,
+        created: list[ObjectBase],
+        updated: list[ObjectBase],
+        watermark: SyncWatermark,
+        requests: int = 0
+    ) -> None:
+        """Create a new SyncChanges instance.
+
+        Args:
+            created (list[ObjectBase]): The objects created after the watermark
+            updated (list[ObjectBase]): The objects updated after the watermark
+            watermark (SyncWatermark): The new watermark
+            requests (int, optional): The number of requests made. Defaults to 0.
+        """
+        self.created = ObjectListManager(created)
+        self.updated = ObjectListManager(updated)
+        self.watermark = watermark
+        self.requests = requests
+
+    def __iter__(self) -> Iterator[ObjectBase]:
+        """Iterate over all changed objects (created + updated)."""
+        yield from self.created.objects
+        yield from self.updated.objects
+
+    def __len__(self) -> int:
+        """Get the number of changed objects."""
+        return len(self.created) + len(self.updated)
+
+    def __repr__(self) -> str:
+        return (f'SyncChanges(created={len(self.created)}, '
+                f'updated={len(self.updated)}, watermark={self.watermark!r})')
@@ -0,0 +1,15 @@
+import pytest
+
+from mantis import MantisBT
+
+from .fake_transport import BASE_URL, TOKEN, FakeMantisTransport
+
+
+@pytest.fixture
+def transport():
+    return FakeMantisTransport()
+
+
+@pytest.fixture
+def client(transport):
+    return MantisBT(BASE_URL, TOKEN, transport=transport)
@@ -0,0 +1,276 @@
+"""A fake MantisBT REST API, served by a `requests` transport adapter.
+
+Mounted with the `transport` option of the clients, no request goes to the
+network. The data is kept in memory (`projects`, `issues`) and each request
+received is recorded (`requests`), so the tests can check what was sent.
+"""
+import base64
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+from urllib.parse import parse_qsl, urlsplit
+
+from requests import Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+BASE_URL = 'http://mantis.local/'
+API_PATH = '/api/rest/'
+TOKEN = 'token'
+
+_CREATED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_UPDATED_AT = datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+_STATUSES = [(10, 'new'), (50, 'assigned'), (80, 'resolved'), (90, 'closed')]
+
+
+def make_issue(id_, project_id=1):
+    """A issue payload. The newest issues (by `updated_at`) have the greatest ids."""
+    status_id, status_name = _STATUSES[id_ % len(_STATUSES)]
+    return {
+        'id': id_, 'summary': f'issue {id_}', 'description': 'description',
+        'project': {'id': project_id, 'name': f'P{project_id}'},
+        'steps_to_reproduce': '', 'category': {'id': 1, 'name': 'General'},
+        'reporter': {'id': 1, 'name': 'administrator'},
+        'handler': {'id': 2, 'name': 'developer'} if id_ % 2 else None,
+        'status': {'id': status_id, 'name': status_name, 'label': status_name},
+        'resolution': {'id': 10, 'name': 'open'},
+        'view_state': {'id': 10, 'name': 'public'},
+        'priority': {'id': 30, 'name': 'normal'},
+        'severity': {'id': 50, 'name': 'minor'},
+        'reproducibility': {'id': 70, 'name': 'have not tried'},
+        'platform': '', 'sticky': False,
+        'created_at': (_CREATED_AT + timedelta(hours=id_)).isoformat(),
+        'updated_at': (_UPDATED_AT + timedelta(hours=id_)).isoformat(),
+        'custom_fields': [], 'history': [],
+        'notes': [make_note(id_, index) for index in range(2)]
+    }
+
+
+def make_note(issue_id, index):
+    return {
+        'id': issue_id * 100 + index, 'text': f'note {index} of {issue_id}',
+        'reporter': {'id': 1, 'name': 'administrator'},
+        'view_state': {'id': 10, 'name': 'public'}, 'attachments': [],
+        'type': 'note', 'created_at': '2024-01-01T00:00:00+00:00',
+        'updated_at': '2024-01-01T00:00:00+00:00'
+    }
+
+
+def _select(payload, select):
+    if not select:
+        return payload
+
+    keys = select.split(',')
+    return {key: value for key, value in payload.items() if key in keys}
+
+
+class FakeMantisTransport(BaseAdapter):
+    """A in-memory MantisBT REST API (projects, issues and notes).
+
+    Attributes:
+        projects (list[dict]): The projects payloads.
+        issues (dict[int, dict]): The issues payloads, by id.
+        requests (list[tuple]): The requests received: (method, path, params, headers).
+        bodies (list[Any]): The (decoded) bodies of the POST/PATCH requests received.
+        statuses (list[Union[int, Exception]]): The next responses are errors with these
+                status codes (or these exceptions are raised), one by request.
+        retry_after (Union[str, None]): The `Retry-After` header of the error responses.
+        delay (float): Time (in seconds) to answer each request.
+        newest_first (bool): If False, the issues pages aren't sorted by `updated_at`.
+        max_in_flight (int): The maximum number of requests received at the same time.
+        projects_etag (str): The `ETag` of the projects list (the only conditional GET).
+        files (dict[int, bytes]): The contents of the attachments, by id (see `add_file`).
+    """
+
+    def __init__(self, issues_count=60, projects_count=3):
+        super().__init__()
+        self.projects = [
+            {'id': id_, 'name': f'P{id_}', 'enabled': True,
+             'status': {'id': 10, 'name': 'development'}}
+            for id_ in range(1, projects_count + 1)
+        ]
+        self.issues = {id_: make_issue(id_, 1 + id_ % projects_count)
+                       for id_ in range(1, issues_count + 1)}
+        self.requests = []
+        self.bodies = []
+        self.statuses = []
+        self.retry_after = None
+        self.delay = 0
+        self.newest_first = True
+        self.max_in_flight = 0
+        self.projects_etag = '"projects-v1"'
+        self.files = {}
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def add_file(self, issue_id, filename, content):
+        """Attach a file to a issue (its metadata is added to the issue `attachments`)."""
+        with self._lock:
+            id_ = len(self.files) + 1
+            self.files[id_] = content
+            self.issues[issue_id].setdefault('attachments', []).append({
+                'id': id_, 'filename': filename, 'size': len(content),
+                'content_type': 'application/octet-stream',
+                'reporter': {'id': 1, 'name': 'administrator'},
+                'created_at': '2024-01-01T00:00:00+00:00'
+            })
+
+        return id_
+
+    def paths(self, method='GET'):
+        """Get the paths of the requests received (of a method)."""
+        return [path for method_, path, _, _ in self.requests if method_ == method]
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        url = urlsplit(request.url)
+        path = url.path[len(API_PATH):].strip('/')
+        params = dict(parse_qsl(url.query))
+        with self._lock:
+            self.requests.append((request.method, path, params, dict(request.headers)))
+            error = self.statuses.pop(0) if self.statuses else None
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+        if isinstance(error, Exception):
+            raise error
+        if error is not None:
+            headers = {'Retry-After': self.retry_after} if self.retry_after else {}
+            return self._build_response(request, error, {'message': 'error'}, headers)
+
+        body = request.body
+        if body is not None and not isinstance(body, (bytes, str)):
+            # A streamed body (e.g: the files uploaded)
+            body = b''.join(body)
+        if body:
+            body = json.loads(body)
+            self.bodies.append(body)
+
+        handler = getattr(self, f'_{request.method.lower()}', None)
+        status, payload, headers = handler(path.split('/'), params, request.headers, body)
+
+        return self._build_response(request, status, payload, headers)
+
+    def close(self):
+        pass
+
+    def _build_response(self, request, status, payload=None, headers=None):
+        response = Response()
+        response.status_code = status
+        response.reason = {200: 'OK', 201: 'Created', 204: 'No Content',
+                           304: 'Not Modified', 404: 'Not Found'}.get(status, 'Error')
+        response.url = request.url
+        response.request = request
+        response.headers = CaseInsensitiveDict(headers or {})
+        content = payload if isinstance(payload, bytes) else (
+            json.dumps(payload).encode() if payload is not None else b'')
+        response.headers['Content-Type'] = 'application/json'
+        response.headers['Content-Length'] = str(len(content))
+        response.raw = BytesIO(content)
+
+        return response
+
+    def _get(self, parts, params, headers, body):
+        if parts[0] == 'projects':
+            if len(parts) == 2:
+                projects = [project for project in self.projects
+                            if project['id'] == int(parts[1])]
+                if not projects:
+                    return 404, {'message': f'Project #{parts[1]} not found'}, {}
+                return 200, {'projects': projects}, {}
+            if headers.get('If-None-Match') == self.projects_etag:
+                return 304, None, {'ETag': self.projects_etag}
+            return 200, {'projects': self.projects}, {'ETag': self.projects_etag}
+
+        if parts[0] != 'issues':
+            return 404, {'message': 'not found'}, {}
+
+        if len(parts) == 4 and parts[2] == 'files':
+            content = self.files.get(int(parts[3]))
+            if content is None:
+                return 404, {'message': 'not found'}, {}
+            # As sent by PHP `json_encode` (escaped slashes)
+            payload = json.dumps({'files': [{
+                'id': int(parts[3]), 'filename': 'file',
+                'content': base64.b64encode(content).decode()
+            }]}).replace('/', '\\/')
+            return 200, payload.encode(), {}
+
+        select = params.get('select')
+        id_ = int(parts[1]) if len(parts) > 1 else params.get('id')
+        if id_ is not None:
+            issue = self.issues.get(int(id_))
+            if issue is None:
+                return 404, {'message': f'Issue #{id_} not found'}, {}
+            return 200, {'issues': [_select(issue, select)]}, {}
+
+        issues = list(self.issues.values())
+        if self.newest_first:
+            issues.sort(key=lambda issue: issue['updated_at'], reverse=True)
+        if 'project_id' in params:
+            issues = [issue for issue in issues
+                      if issue['project']['id'] == int(params['project_id'])]
+
+        page_size = int(params.get('page_size', 50))
+        page = int(params.get('page', 1))
+        issues = issues[(page - 1) * page_size:page * page_size]
+
+        return 200, {'issues': [_select(issue, select) for issue in issues]}, {}
+
+    def _post(self, parts, params, headers, body):
+        if parts[0] != 'issues':
+            return 404, {'message': 'not found'}, {}
+
+        if len(parts) == 3 and parts[2] == 'files':
+            if int(parts[1]) not in self.issues:
+                return 404, {'message': 'not found'}, {}
+            for file in body['files']:
+                self.add_file(int(parts[1]), file['name'], base64.b64decode(file['content']))
+            return 201, None, {}
+
+        if len(parts) == 3 and parts[2] == 'notes':
+            issue = self.issues.get(int(parts[1]))
+            if issue is None:
+                return 404, {'message': 'not found'}, {}
+            with self._lock:
+                note = dict(body, id=issue['id'] * 100 + len(issue['notes']))
+                issue['notes'].append(note)
+            return 201, {'note': note, 'issue': issue}, {}
+
+        with self._lock:
+            id_ = max(self.issues, default=0) + 1
+            issue = make_issue(id_, body.get('project', {}).get('id', 1))
+            issue.update(body, id=id_)
+            self.issues[id_] = issue
+
+        return 201, {'issue': issue}, {}
+
+    def _patch(self, parts, params, headers, body):
+        issue = self.issues.get(int(parts[1]))
+        if issue is None:
+            return 404, {'message': 'not found'}, {}
+
+        issue.update(body)
+        return 200, {'issues': [issue]}, {}
+
+    def _delete(self, parts, params, headers, body):
+        issue = self.issues.get(int(parts[1]))
+        if issue is None:
+            return 404, {'message': 'not found'}, {}
+
+        if len(parts) == 4:
+            issue['notes'] = [note for note in issue['notes'] if note['id'] != int(parts[3])]
+        else:
+            del self.issues[issue['id']]
+
+        return 204, None, {}
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from mantis import AsyncMantisBT, MantisHTTPReponseClientError
+
+from .fake_transport import BASE_URL, TOKEN
+
+
+def run(transport, coro_func, **kwargs):
+    async def main():
+        async with AsyncMantisBT(BASE_URL, TOKEN, transport=transport, **kwargs) as client:
+            return await coro_func(client)
+
+    return asyncio.run(main())
+
+
+def test_get_all(transport):
+    async def main(client):
+        return await client.projects.get_all()
+
+    assert [project.id for project in run(transport, main)] == [1, 2, 3]
+
+
+def test_concurrent_requests_bounded_by_max_connections(transport):
+    transport.delay = 0.02
+
+    async def main(client):
+        return await asyncio.gather(*[client.issues.get_by_id(id_) for id_ in range(1, 21)])
+
+    issues = run(transport, main, max_connections=5)
+
+    assert [issue.id for issue in issues] == list(range(1, 21))
+    assert 1 < transport.max_in_flight <= 5
+
+
+def test_iter_by_crit_requests_pages_on_demand(transport):
+    async def main(client):
+        ids = []
+        async for issue in client.issues.iter_by_crit({'project_id': 2}, page_size=5,
+                                                      resolve_parent=False):
+            ids.append(issue.id)
+            if len(ids) == 3:
+                break
+        return ids
+
+    assert run(transport, main) == [58, 55, 52]
+    assert len(transport.requests) == 1
+
+
+def test_get_all_with_limit(transport):
+    async def main(client):
+        return await client.issues.get_all(limit=12, page_size=5)
+
+    assert len(run(transport, main)) == 12
+    assert len(transport.paths()) == 3
+
+
+def test_same_objects_of_the_sync_client(transport):
+    async def main(client):
+        issue = await client.issues.get_by_id(7)
+        return issue, client.issues.manager.get_by_id(7)
+
+    issue, sync_issue = run(transport, main)
+    assert issue is sync_issue
+    assert transport.paths() == ['issues/7']
+
+
+def test_notes_of_a_issue(transport):
+    async def main(client):
+        issue = await client.issues.get_by_id(7)
+        return issue, await client.notes.get_by_crit({'id': issue.id}, issue)
+
+    issue, notes = run(transport, main)
+    assert [note.id for note in notes] == [700, 701]
+    assert all(note._parent is issue for note in notes)
+
+
+def test_errors_are_raised(transport):
+    async def main(client):
+        return await client.issues.get_by_id(1000)
+
+    with pytest.raises(MantisHTTPReponseClientError):
+        run(transport, main)
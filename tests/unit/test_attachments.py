@@ -0,0 +1,201 @@
+import base64
+import io
+import json
+
+import pytest
+
+from mantis._requests.streaming import Base64FilesBody, Base64JSONStringDecoder
+from mantis.exceptions import MantisAttachmentError
+
+
+# All byte values: the base64 string has '+' and '/' (escaped as '\/' by PHP)
+CONTENT = bytes(range(256)) * 3 + b'end'
+
+
+def php_document(content, key='content'):
+    document = {'files': [{'id': 1, 'filename': 'a\\"b/c',
+                           key: base64.b64encode(content).decode()}]}
+    return json.dumps(document).replace('/', '\\/').encode()
+
+
+def decode_chunks(chunks, key='content'):
+    output = bytearray()
+    decoder = Base64JSONStringDecoder(output.extend, key)
+    for chunk in chunks:
+        decoder.feed(chunk)
+    decoder.close()
+
+    assert decoder.size == len(output)
+    return bytes(output)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 4, 5, 7, 64, 10 ** 6])
+def test_decoder_chunk_sizes(chunk_size):
+    document = php_document(CONTENT)
+    chunks = [document[pos:pos + chunk_size] for pos in range(0, len(document), chunk_size)]
+
+    assert decode_chunks(chunks) == CONTENT
+
+
+def test_decoder_splits_at_every_position():
+    # Splitting the quads of base64 chars, the escapes ('\/') and the key
+    document = php_document(CONTENT[:60])
+
+    for pos in range(len(document) + 1):
+        assert decode_chunks([document[:pos], document[pos:]]) == CONTENT[:60]
+
+
+def test_decoder_uses_the_key_only():
+    # A string value equal to the key isn't the key
+    document = b'{"name": "content", "other": "x", "content" : "' + base64.b64encode(b'ok') + b'"}'
+
+    assert decode_chunks([document]) == b'ok'
+    assert decode_chunks([php_document(b'data', key='data')], key='data') == b'data'
+
+
+def test_decoder_errors():
+    with pytest.raises(ValueError):
+        decode_chunks([b'{"content": "YWJj'])
+    with pytest.raises(ValueError):
+        decode_chunks([b'{"content": "YWJjZ"}'])
+    with pytest.raises(ValueError):
+        decode_chunks([b'{"content": 12}'])
+    with pytest.raises(ValueError):
+        decode_chunks([b'{"other": "YWJj"}'])
+
+
+@pytest.mark.parametrize('chunk_size', [3, 4, 100, 10 ** 6])
+def test_files_body(tmp_path, chunk_size):
+    path = tmp_path / 'a.bin'
+    path.write_bytes(CONTENT)
+    empty = tmp_path / 'empty.bin'
+    empty.write_bytes(b'')
+    stream = io.BytesIO(b'skip' + CONTENT)
+    stream.seek(4)
+
+    body = Base64FilesBody([('a.bin', path), ('b "/é', CONTENT), ('c', stream),
+                            ('empty', empty)], extra={'note': 'x'}, chunk_size=chunk_size)
+
+    data = b''.join(body)
+    assert len(body) == len(data)
+    document = json.loads(data)
+    assert document['note'] == 'x'
+    assert [file['name'] for file in document['files']] == ['a.bin', 'b "/é', 'c', 'empty']
+    assert [base64.b64decode(file['content']) for file in document['files']] == [
+        CONTENT, CONTENT, CONTENT, b'']
+    # Iterated again (e.g: retries), from the initial position of the streams
+    assert b''.join(body) == data
+
+
+def test_files_body_not_seekable():
+    class Pipe(io.RawIOBase):
+        def __init__(self, data):
+            self.data = io.BytesIO(data)
+
+        def readable(self):
+            return True
+
+        def read(self, size=-1):
+            # Short reads
+            return self.data.read(min(size, 5))
+
+    body = Base64FilesBody([('pipe', Pipe(CONTENT))], chunk_size=30)
+
+    assert len(body) == 0
+    data = json.loads(b''.join(body))
+    assert base64.b64decode(data['files'][0]['content']) == CONTENT
+
+
+@pytest.fixture
+def issue(client, transport):
+    transport.add_file(4, 'a.log', CONTENT)
+    transport.add_file(4, 'a.log', b'other')
+    transport.issues[4]['notes'][0]['attachments'] = [
+        dict(transport.issues[4]['attachments'][0], id=3, filename='../note.txt', size=4)]
+    transport.files[3] = b'note'
+
+    return client.issues.get_by_id(4)
+
+
+def test_get_for_issue(client, issue, transport):
+    transport.requests.clear()
+
+    attachments = client.attachments.get_for_issue(issue, include_notes=True)
+
+    assert [attachment.id for attachment in attachments] == [1, 2, 3]
+    assert attachments[0].filename == 'a.log'
+    assert attachments[2]._parent.id == 400
+    # Only the notes are requested, no content is downloaded
+    assert [params for _, _, params, _ in transport.requests] == [{'id': '4', 'select': 'notes'}]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 1024])
+def test_download(issue, tmp_path, chunk_size):
+    attachment = issue.attachments[0]
+
+    output = io.BytesIO()
+    assert attachment.download(output, chunk_size) == len(CONTENT)
+    assert output.getvalue() == CONTENT
+
+    assert attachment.download(tmp_path, chunk_size) == len(CONTENT)
+    assert (tmp_path / 'a.log').read_bytes() == CONTENT
+
+
+def test_download_size_mismatch(issue, transport, tmp_path):
+    transport.files[1] = b'truncated'
+
+    with pytest.raises(MantisAttachmentError):
+        issue.attachments[0].download(tmp_path / 'a.log')
+    # The temporary file is removed, no file is written
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_download_many(client, issue, transport, tmp_path):
+    attachments = client.attachments.get_for_issue(issue, include_notes=True)
+
+    downloaded = client.attachments.download_many(attachments, tmp_path / 'files', max_workers=3)
+
+    assert [attachment.id for attachment in downloaded] == [1, 2, 3]
+    assert downloaded.errors == {}
+    # Same names prefixed with the id, no directories in the names
+    assert sorted(path.name for path in (tmp_path / 'files').iterdir()) == [
+        '1-a.log', '2-a.log', 'note.txt']
+    assert (tmp_path / 'files' / '1-a.log').read_bytes() == CONTENT
+    assert (tmp_path / 'files' / '2-a.log').read_bytes() == b'other'
+
+
+def test_download_many_errors(client, issue, transport, tmp_path):
+    del transport.files[2]
+
+    downloaded = client.attachments.download_many(issue.attachments, tmp_path)
+
+    assert [attachment.id for attachment in downloaded] == [1]
+    assert list(downloaded.errors) == [2]
+
+
+def test_upload(client, transport, tmp_path):
+    path = tmp_path / 'dump.log'
+    path.write_bytes(CONTENT)
+
+    attachments = client.attachments.upload(5, [path, ('report.txt', b'report')], chunk_size=10)
+
+    assert [attachment.filename for attachment in attachments] == ['dump.log', 'report.txt']
+    assert [transport.files[attachment.id] for attachment in attachments] == [CONTENT, b'report']
+    # The body is streamed with its length
+    post = [request for request in transport.requests if request[0] == 'POST'][0]
+    assert post[1] == 'issues/5/files'
+    assert int(post[3]['Content-Length']) == len(json.dumps(
+        transport.bodies[0], separators=(',', ':')).encode())
+
+    # Round-trip
+    output = io.BytesIO()
+    attachments[0].download(output)
+    assert output.getvalue() == CONTENT
+
+
+def test_upload_many(client, transport):
+    attachments = client.attachments.upload_many(
+        [(1, [('a', b'a')]), (999, [('b', b'b')]), (2, [('c', b'c')])])
+
+    assert sorted(attachment.filename for attachment in attachments) == ['a', 'c']
+    assert list(attachments.errors) == [999]
@@ -0,0 +1,89 @@
+import json
+
+from mantis import MantisHTTPReponseClientError
+from mantis.bulk import BulkCheckpoint
+from mantis.exceptions import MantisValidationError
+
+
+def new_issue(summary):
+    return {'summary': summary, 'description': 'description', 'steps_to_reproduce': '',
+            'category': {'name': 'General'}, 'project': {'id': 1}}
+
+
+def test_create_many(client, transport):
+    result = client.issues.create_many(
+        [new_issue('a'), {'summary': 'b'}, new_issue('c')], max_workers=2)
+
+    assert [issue.summary for issue in result.objects] == ['a', 'c']
+    assert list(result.results) == [0, 2]
+    assert isinstance(result.errors[1], MantisValidationError)
+    assert not result.ok
+    # The invalid item isn't sent
+    assert len(transport.paths('POST')) == 2
+
+
+def test_create_many_with_keys(client):
+    items = [new_issue('a'), new_issue('b')]
+
+    result = client.issues.create_many(items, key=lambda item: item['summary'])
+
+    assert list(result.results) == ['a', 'b']
+    assert result.ok
+
+
+def test_create_many_resumes_from_the_checkpoint(client, transport, tmp_path):
+    path = tmp_path / 'create.jsonl'
+    items = [new_issue('a'), new_issue('b'), new_issue('c')]
+    transport.statuses = [None, 400]
+
+    first = client.issues.create_many(items, max_workers=1, checkpoint=BulkCheckpoint(path))
+
+    assert list(first.results) == [0, 2]
+    assert list(first.errors) == [1]
+    assert [json.loads(line)['key'] for line in path.read_text().splitlines()] == [0, 2]
+
+    transport.requests.clear()
+    second = client.issues.create_many(items, checkpoint=BulkCheckpoint(path))
+
+    assert second.skipped == {0: first.results[0].id, 2: first.results[2].id}
+    assert [issue.summary for issue in second.objects] == ['b']
+    assert len(transport.paths('POST')) == 1
+
+
+def test_a_incomplete_line_of_the_checkpoint_is_ignored(tmp_path):
+    path = tmp_path / 'delete.jsonl'
+    path.write_text('{"operation": "delete", "key": 1, "id": 1}\n{"operation": "del')
+
+    assert BulkCheckpoint(path).get_done('delete') == {1: 1}
+    assert BulkCheckpoint(path).get_done('create') == {}
+
+
+def test_update_many(client, transport):
+    issue = client.issues.get_by_id(4)
+    issue['summary'] = 'changed'
+    transport.requests.clear()
+
+    result = client.issues.update_many([(3, {'summary': 'z'}), issue, (999, {'summary': 'x'})])
+
+    assert [issue.summary for issue in result.objects] == ['z', 'changed']
+    assert set(result.errors) == {999}
+    # Only the changes are sent (also for a id, without requesting the object)
+    assert sorted(body['summary'] for body in transport.bodies) == ['changed', 'x', 'z']
+    assert all(list(body) == ['summary'] for body in transport.bodies)
+    assert transport.paths() == []
+
+
+def test_delete_many(client, transport):
+    result = client.issues.delete_many([1, client.issues.get_by_id(2), 999])
+
+    assert result.results == {1: 1, 2: 2}
+    assert isinstance(result.errors[999], MantisHTTPReponseClientError)
+    assert 1 not in transport.issues and 2 not in transport.issues
+
+
+def test_create_notes(client, transport):
+    result = client.notes.create_many([(999, {'text': 'x'}), (2, {'text': 'y'})])
+
+    assert [note.text for note in result.objects] == ['y']
+    assert set(result.errors) == {0}
+    assert transport.issues[2]['notes'][-1]['text'] == 'y'
@@ -0,0 +1,119 @@
+import pytest
+
+from mantis import MantisBT
+from mantis.cache import ObjectCache
+
+from .fake_transport import BASE_URL, TOKEN
+
+
+class Obj:
+    def __init__(self, id_):
+        self._id = id_
+
+
+class OtherObj(Obj):
+    pass
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('mantis.cache.monotonic', lambda: now[0])
+    return now
+
+
+def test_lru_eviction():
+    cache = ObjectCache(max_size=2)
+    first, second, third = Obj(1), Obj(2), Obj(3)
+    cache.set(first)
+    cache.set(second)
+
+    # The first one is the most recently used now
+    assert cache.get(Obj, 1) is first
+    cache.set(third)
+
+    assert cache.get(Obj, 2) is None
+    assert cache.get(Obj, 1) is first
+    assert cache.get(Obj, 3) is third
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_keyed_by_class_and_id():
+    cache = ObjectCache()
+    obj, other = Obj(1), OtherObj(1)
+    cache.set(obj)
+    cache.set(other)
+
+    assert cache.get(Obj, 1) is obj
+    assert cache.get(OtherObj, 1) is other
+
+
+def test_ttl_by_type(clock):
+    cache = ObjectCache(ttl=10, ttl_by_type={'OtherObj': 1})
+    cache.set(Obj(1))
+    cache.set(OtherObj(1))
+
+    clock[0] += 2
+    assert cache.get(OtherObj, 1) is None
+    assert cache.get(Obj, 1) is not None
+
+    clock[0] += 10
+    assert cache.get(Obj, 1) is None
+
+
+def test_len_doesnt_count_expired(clock):
+    cache = ObjectCache(ttl=1)
+    cache.set(Obj(1))
+    cache.set(Obj(2))
+    assert len(cache) == 2
+
+    clock[0] += 2
+    assert len(cache) == 0
+    assert (Obj, 1) not in cache
+
+
+def test_disabled_cache():
+    cache = ObjectCache(max_size=0)
+    cache.set(Obj(1))
+
+    assert cache.get(Obj, 1) is None
+    assert len(cache) == 0
+
+
+def test_identity_map(client, transport):
+    issues = client.issues.get_all(limit=5, resolve_parent=False)
+    transport.requests.clear()
+
+    assert client.issues.get_by_id(issues[0].id) is issues[0]
+    assert transport.requests == []
+
+
+def test_objects_updated_in_place(client, transport):
+    issue = client.issues.get_by_id(60)
+    transport.issues[60]['summary'] = 'changed'
+
+    issues = client.issues.get_all(limit=1, resolve_parent=False)
+
+    assert issues[0] is issue
+    assert issue.summary == 'changed'
+
+
+def test_cache_shared_by_managers(client):
+    project = client.projects.get_by_id(1)
+
+    project_issues = client.projects._child_manager_obj
+    assert project_issues._cache is client._cache
+    assert project_issues.get_all(limit=1)[0]._parent is project
+
+
+def test_client_ttl_by_type(clock, transport):
+    client = MantisBT(BASE_URL, TOKEN, transport=transport,
+                      cache_ttl_by_type={'ProjectObj': 5})
+    project = client.projects.get_by_id(1)
+
+    assert client.projects.get_by_id(1) is project
+    assert transport.paths() == ['projects/1']
+
+    clock[0] += 10
+    client.projects.get_by_id(1)
+    assert transport.paths() == ['projects/1', 'projects/1']
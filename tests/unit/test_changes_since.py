@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta, timezone
+
+from mantis.sync import SyncWatermark
+
+
+def updated_at(id_):
+    return datetime(2024, 2, 1, tzinfo=timezone.utc) + timedelta(hours=id_)
+
+
+def test_first_sync_returns_all_issues(client, transport):
+    changes = client.issues.changes_since(None, page_size=25)
+
+    assert len(changes.created) == 60
+    assert len(changes.updated) == 0
+    assert changes.requests == 3
+    assert changes.watermark == SyncWatermark(updated_at(60), [60])
+
+
+def test_only_the_pages_after_the_watermark_are_requested(client, transport):
+    changes = client.issues.changes_since(SyncWatermark(updated_at(50), [50]), page_size=5)
+
+    assert sorted(issue.id for issue in changes) == list(range(51, 61))
+    # 60..56, 55..51 and 50..46 (older than the watermark)
+    assert changes.requests == 3
+    assert len(transport.paths()) == 3
+
+
+def test_created_and_updated(client, transport):
+    transport.issues[10]['updated_at'] = '2024-03-01T00:00:00+00:00'
+
+    changes = client.issues.changes_since(SyncWatermark(updated_at(60), [60]), page_size=5)
+
+    assert [issue.id for issue in changes.created] == []
+    assert [issue.id for issue in changes.updated] == [10]
+    assert changes.watermark.to_token() == '2024-03-01T00:00:00+00:00|10'
+
+
+def test_issues_updated_at_the_same_second(client, transport):
+    transport.issues[59]['updated_at'] = transport.issues[60]['updated_at']
+
+    changes = client.issues.changes_since(SyncWatermark(updated_at(60), [60]), page_size=5)
+
+    assert [issue.id for issue in changes] == [59]
+    assert changes.watermark == SyncWatermark(updated_at(60), [59, 60])
+
+
+def test_unordered_pages_are_all_requested(client, transport):
+    transport.newest_first = False
+
+    changes = client.issues.changes_since(SyncWatermark(updated_at(50), [50]), page_size=5)
+
+    assert sorted(issue.id for issue in changes) == list(range(51, 61))
+    assert changes.requests >= 12
+
+
+def test_invalid_dates_are_skipped(client, transport):
+    transport.issues[60]['updated_at'] = 'invalid'
+
+    changes = client.issues.changes_since(SyncWatermark(updated_at(55), [55]), page_size=5)
+
+    assert sorted(issue.id for issue in changes) == [56, 57, 58, 59]
+    assert changes.watermark == SyncWatermark(updated_at(59), [59])
+
+
+def test_token_roundtrip(client, transport):
+    token = client.issues.changes_since(None).watermark.to_token()
+
+    assert SyncWatermark.from_token(token) == SyncWatermark(updated_at(60), [60])
+    assert SyncWatermark.from_token('') == SyncWatermark()
+
+    transport.requests.clear()
+    changes = client.issues.changes_since(token, page_size=10)
+
+    assert len(changes) == 0
+    assert changes.requests == 1
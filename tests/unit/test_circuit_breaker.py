@@ -0,0 +1,135 @@
+import pytest
+from requests.exceptions import ChunkedEncodingError
+
+from mantis import (
+    CircuitBreaker, MantisBT, MantisCircuitOpenError, MantisHTTPReponseClientError,
+    MantisHTTPReponseServerError, RetryPolicy
+)
+
+from .fake_transport import BASE_URL, TOKEN
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('mantis._requests.circuit_breaker.monotonic', lambda: now[0])
+    monkeypatch.setattr('mantis._requests.mantis_requests.sleep', lambda delay: None)
+    return now
+
+
+@pytest.fixture
+def breaker():
+    return CircuitBreaker(failure_threshold=2, open_interval=10)
+
+
+@pytest.fixture
+def client(transport, breaker):
+    return MantisBT(BASE_URL, TOKEN, transport=transport, circuit_breaker=breaker,
+                    retry_policy=RetryPolicy(max_attempts=3))
+
+
+def test_opened_after_consecutive_failures(client, transport, breaker, clock):
+    transport.statuses = [503] * 6
+
+    # A request retried is one failure, its error is the real one
+    for _ in range(2):
+        with pytest.raises(MantisHTTPReponseServerError):
+            client.projects.get_all()
+
+    assert len(transport.requests) == 6
+    assert (breaker.state, breaker.failures) == ('open', 2)
+
+    with pytest.raises(MantisCircuitOpenError):
+        client.projects.get_all()
+
+    # Failed fast, without any request
+    assert len(transport.requests) == 6
+    assert breaker.rejected == 1
+
+
+def test_success_resets_the_failures(client, transport, breaker, clock):
+    transport.statuses = [503] * 3
+    with pytest.raises(MantisHTTPReponseServerError):
+        client.projects.get_all()
+
+    client.projects.get_all()
+
+    assert (breaker.state, breaker.failures) == ('closed', 0)
+
+
+def test_retry_success_isnt_a_failure(client, transport, breaker, clock):
+    transport.statuses = [503, 503]
+
+    client.projects.get_all()
+
+    assert (breaker.state, breaker.failures) == ('closed', 0)
+
+
+def test_client_errors_arent_failures(client, transport, breaker, clock):
+    transport.statuses = [404] * 3
+
+    for _ in range(3):
+        with pytest.raises(MantisHTTPReponseClientError):
+            client.projects.get_all()
+
+    assert breaker.state == 'closed'
+
+
+def test_half_open_probe_closes_the_circuit(client, transport, breaker, clock):
+    transport.statuses = [503] * 6
+    for _ in range(2):
+        with pytest.raises(MantisHTTPReponseServerError):
+            client.projects.get_all()
+
+    clock[0] += 11
+    assert len(client.projects.get_all()) == 3
+    assert breaker.state == 'closed'
+
+
+def test_failed_probe_opens_the_circuit_again(client, transport, breaker, clock):
+    transport.statuses = [503] * 9
+    for _ in range(2):
+        with pytest.raises(MantisHTTPReponseServerError):
+            client.projects.get_all()
+
+    clock[0] += 11
+    with pytest.raises(MantisHTTPReponseServerError):
+        client.projects.get_all()
+    assert breaker.state == 'open'
+
+    with pytest.raises(MantisCircuitOpenError):
+        client.projects.get_all()
+
+
+def test_other_transport_errors_are_failures(transport, clock):
+    breaker = CircuitBreaker(failure_threshold=1, open_interval=0)
+    client = MantisBT(BASE_URL, TOKEN, transport=transport, circuit_breaker=breaker)
+    transport.statuses = [503, ChunkedEncodingError()]
+
+    with pytest.raises(MantisHTTPReponseServerError):
+        client.projects.get_all()
+    # The probe of the half open circuit fails with other error
+    with pytest.raises(ChunkedEncodingError):
+        client.projects.get_all()
+    assert (breaker.state, breaker.failures) == ('open', 2)
+
+    # The next probe is sent (the circuit isn't stuck half open)
+    assert len(client.projects.get_all()) == 3
+    assert breaker.state == 'closed'
+
+
+def test_half_open_allows_only_the_probes(breaker, clock):
+    for _ in range(2):
+        breaker.before_request()
+        breaker.record_failure()
+
+    clock[0] += 11
+    breaker.before_request()
+    assert breaker.state == 'half_open'
+
+    with pytest.raises(MantisCircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_success()
+    breaker.before_request()
+    assert breaker.state == 'closed'
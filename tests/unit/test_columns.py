@@ -0,0 +1,185 @@
+import math
+from array import array
+from datetime import datetime, timezone
+
+import pytest
+
+from mantis.columns import Column, ColumnsBuilder, iter_column_batches
+
+
+@pytest.mark.parametrize('values, kind, typecode', [
+    ([1, None, 3], 'int', 'q'),
+    ([1.5, None], 'float', 'd'),
+    ([True, None, False], 'bool', 'b'),
+    ([{'id': 10, 'name': 'new'}, None, {'id': 10, 'name': 'new'}], 'category', 'i'),
+    (['a', None], 'string', None),
+    ([[1], None], 'object', None),
+])
+def test_kind_inference(values, kind, typecode):
+    column = Column('field')
+    column.extend([None])
+    column.extend(values)
+
+    assert column.kind == kind
+    if typecode:
+        assert isinstance(column.values, array) and column.values.typecode == typecode
+    assert column.null_count == 1 + values.count(None)
+    assert column.to_list()[0] is None
+    assert len(column) == len(values) + 1
+
+
+def test_to_list_roundtrip():
+    values = [{'id': 10, 'name': 'new'}, None, {'id': 50, 'name': 'assigned'},
+              {'id': 10, 'name': 'new'}]
+    column = Column('status')
+    column.extend(values)
+
+    assert column.categories == ['new', 'assigned']
+    assert list(column.values) == [0, -1, 1, 0]
+    assert column.to_list() == ['new', None, 'assigned', 'new']
+    assert [column[index] for index in range(4)] == column.to_list()
+
+
+def test_timestamps():
+    column = Column('created_at', 'timestamp')
+    column.extend(['2024-01-01T10:00:00+00:00', None, datetime(2024, 1, 2)])
+
+    assert list(column.values) == [1704103200, 0, 1704153600]
+    assert column.to_list() == [datetime(2024, 1, 1, 10, tzinfo=timezone.utc), None,
+                                datetime(2024, 1, 2, tzinfo=timezone.utc)]
+
+
+def test_int_promoted_to_float():
+    column = Column('value')
+    column.extend([1, 2])
+    column.extend([None, 2.5])
+
+    assert column.kind == 'float'
+    assert column.to_list() == [1.0, 2.0, None, 2.5]
+    assert math.isnan(column.values[2])
+
+
+def test_demoted_to_object():
+    column = Column('value')
+    column.extend([1, None])
+    column.extend(['a'])
+
+    assert column.kind == 'object'
+    assert column.to_list() == [1, None, 'a']
+
+    bools = Column('flag')
+    bools.extend([True, 1])
+    assert bools.kind == 'object'
+    assert bools.to_list() == [True, 1]
+
+
+def test_demoted_categories_have_the_same_shape():
+    column = Column('category')
+    column.extend([{'id': 2, 'name': 'b'}])
+    column.extend(['y', [1], {'id': 2, 'name': 'b'}, None])
+
+    assert column.kind == 'object'
+    # The values already stored and the next ones (in any batch) are names
+    assert column.to_list() == ['b', 'y', [1], 'b', None]
+    column.extend([{'id': 3, 'name': 'c'}])
+    assert column.to_list()[-1] == 'c'
+
+
+def test_demoted_timestamps_have_the_same_shape():
+    column = Column('updated_at', 'timestamp')
+    column.extend(['2024-01-01T00:00:00+00:00'])
+    column.extend(['invalid', '2024-01-02T00:00:00+00:00'])
+
+    assert column.to_list() == [datetime(2024, 1, 1, tzinfo=timezone.utc), 'invalid',
+                                datetime(2024, 1, 2, tzinfo=timezone.utc)]
+
+
+def test_only_nulls():
+    column = Column('handler')
+    column.extend([None, None])
+
+    assert column.kind is None
+    assert column.to_list() == [None, None]
+
+    column.extend([{'id': 2, 'name': 'developer'}])
+    assert column.to_list() == [None, None, 'developer']
+
+
+def test_unknown_kind():
+    with pytest.raises(ValueError):
+        Column('field', 'decimal')
+
+
+def test_builder_batches():
+    builder = ColumnsBuilder(['id', 'handler.name', 'missing'])
+    builder.append_rows([{'id': 1, 'handler': {'name': 'a'}}, {'id': 2}])
+
+    first = builder.flush()
+    assert first['id'].to_list() == [1, 2]
+    assert first['handler.name'].to_list() == ['a', None]
+    assert first['missing'].to_list() == [None, None]
+    assert len(builder) == 0
+
+    builder.append_rows([{'id': 3, 'handler': {'name': 'b'}}])
+    assert builder.columns['handler.name'].to_list() == ['b']
+
+
+def test_manager_kinds(client):
+    kinds = ColumnsBuilder.get_manager_kinds(
+        client.issues, ['id', 'status', 'handler', 'created_at', 'summary'])
+
+    assert kinds == {'id': 'int', 'status': 'category', 'handler': 'category',
+                     'created_at': 'timestamp'}
+
+
+def test_list_to_columns(client):
+    issues = client.issues.get_all(limit=4)
+
+    columns = issues.to_columns(['id', 'status', 'handler', 'handler.id', 'created_at'])
+
+    assert columns['id'].to_list() == [60, 59, 58, 57]
+    assert columns['status'].to_list() == ['new', 'closed', 'resolved', 'assigned']
+    assert columns['handler'].to_list() == [None, 'developer', None, 'developer']
+    assert columns['handler.id'].to_list() == [None, 2, None, 2]
+    assert columns['created_at'][0] == datetime(2024, 1, 3, 12, tzinfo=timezone.utc)
+
+
+def test_iter_column_batches(client, transport):
+    batches = list(iter_column_batches(client.issues, {'project_id': 1}, ['id', 'status.name'],
+                                       batch_size=15, page_size=10))
+
+    assert [len(batch['id']) for batch in batches] == [20]
+    assert transport.requests[0][2]['select'] == 'id,project,status'
+
+    batches = list(iter_column_batches(client.issues, fields=['id'], batch_size=10,
+                                       page_size=10, limit=25))
+    assert [batch['id'].to_list()[0] for batch in batches] == [60, 50, 40]
+
+
+def test_arrow(client, tmp_path):
+    pa = pytest.importorskip('pyarrow')
+    from mantis.columns import columns_to_arrow, write_parquet
+    import pyarrow.parquet as pq
+
+    columns = client.issues.get_all(limit=4).to_columns(
+        ['id', 'status', 'handler.id', 'created_at', 'sticky', 'history'])
+    columns['nulls'] = Column('nulls')
+    columns['nulls'].extend([None] * 4)
+
+    table = columns_to_arrow(columns)
+    assert table.column('id').to_pylist() == [60, 59, 58, 57]
+    assert table.column('status').type == pa.dictionary(pa.int32(), pa.string())
+    assert table.column('status').to_pylist() == ['new', 'closed', 'resolved', 'assigned']
+    assert table.column('handler.id').to_pylist() == [None, 2, None, 2]
+    assert table.column('created_at').type == pa.timestamp('s', tz='UTC')
+    assert table.column('sticky').to_pylist() == [False] * 4
+    assert table.column('nulls').null_count == 4
+
+    path = tmp_path / 'issues.parquet'
+    count = write_parquet(client.issues, path, fields=['id', 'status', 'handler.id'],
+                          batch_size=10, page_size=10)
+
+    assert count == 60
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 6
+    assert parquet.read().column('id').to_pylist() == list(range(60, 0, -1))
@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from mantis.api.v1.objects import (
+    AttachmentManager, AttachmentObj, IssuePriority, IssueStatus, UserManager, UserObj)
+from mantis.decoders import (
+    EnumDecoder, ObjectListDecoder, ObjectRefDecoder, decode_datetime, encode_value)
+
+
+@pytest.fixture
+def issue(client):
+    return client.issues.get_by_id(4)
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2024-01-01T10:00:00+00:00', datetime(2024, 1, 1, 10, tzinfo=timezone.utc)),
+    ('2024-01-01T10:00:00+02:00', datetime(2024, 1, 1, 8, tzinfo=timezone.utc)),
+    ('2024-01-01', datetime(2024, 1, 1)),
+])
+def test_decode_datetime(value, expected):
+    assert decode_datetime(None, value) == expected
+
+
+@pytest.mark.parametrize('value', ['', 'invalid', '2024-13-01T00:00:00', 1704103200, {}])
+def test_decode_invalid_datetime(value):
+    assert decode_datetime(None, value) is value
+
+
+def test_enum_decoder():
+    decoder = EnumDecoder(IssueStatus)
+
+    assert decoder(None, {'id': 50, 'name': 'assigned', 'label': 'assigned'}) is IssueStatus.assigned
+    assert decoder(None, 80) is IssueStatus.resolved
+    assert decoder(None, IssueStatus.new) is IssueStatus.new
+    # The dict-like access of the raw value
+    assert decoder(None, {'id': 10, 'name': 'new'})['name'] == 'new'
+    assert decoder(None, 'new') == 'new'
+
+
+def test_enum_decoder_custom_values():
+    # A status added in the config of the server
+    status = EnumDecoder(IssueStatus)(None, {'id': 55, 'name': 'testing'})
+
+    assert isinstance(status, IssueStatus)
+    assert status == 55 and IssueStatus.assigned < status < IssueStatus.resolved
+    assert status.name == 'testing'
+    assert status.to_dict() == {'id': 55, 'name': 'testing'}
+    assert encode_value(status) == {'id': 55, 'name': 'testing'}
+    assert IssuePriority.decode(99).name == '99'
+
+
+def test_enum_decoder_name_only():
+    decoder = EnumDecoder(IssueStatus)
+
+    assert decoder(None, {'name': 'closed'}) is IssueStatus.closed
+    assert decoder(None, {'id': None, 'name': 'closed'}) is IssueStatus.closed
+    # Unknown: the raw value
+    for value in ({'name': 'testing'}, {'label': 'new'}, {'name': ['new']}, {'id': 'x'}):
+        assert decoder(None, value) is value
+
+
+def test_enum_attrs(client, transport):
+    transport.issues[4]['status'] = {'name': 'testing'}
+    transport.issues[4]['priority'] = {'id': 70, 'name': 'blocker'}
+
+    issue = client.issues.get_by_id(4)
+
+    assert issue.status == {'name': 'testing'}
+    assert issue.priority.name == 'blocker'
+    assert issue.to_dict()['priority'] == {'id': 70, 'name': 'blocker'}
+
+
+def test_object_ref_decoder(issue, transport):
+    reporter = ObjectRefDecoder(UserManager)(issue, {'id': 1, 'name': 'administrator'})
+
+    assert isinstance(reporter, UserObj)
+    assert reporter.id == 1 and reporter.name == 'administrator'
+    # Not cached (incomplete)
+    assert ObjectRefDecoder(UserManager)(issue, {'id': 1, 'name': 'administrator'}) is not reporter
+    assert ObjectRefDecoder(UserManager)(issue, 1) == 1
+    # The referenced manager class can be resolved lazily
+    decoder = ObjectRefDecoder(lambda: UserManager)
+    assert decoder(issue, {'id': 2}).id == 2
+    assert decoder.manager_cls is UserManager
+
+
+def test_object_ref_decoder_parent(client):
+    issue = client.issues.get_by_id(4)
+    note = issue.get_notes()[0]
+
+    # The reference of the parent is the parent object
+    assert ObjectRefDecoder(type(issue.manager))(note, {'id': 4}) is issue
+    assert ObjectRefDecoder(type(issue.manager))(note, {'id': 5}) is not issue
+
+
+def test_object_list_decoder(issue, transport):
+    attachments = ObjectListDecoder(AttachmentManager)(issue, [
+        {'id': 1, 'filename': 'a.log', 'size': 3}, None, {'id': 2, 'filename': 'b.log'}])
+
+    assert [attachment.id for attachment in attachments] == [1, 2]
+    assert all(isinstance(attachment, AttachmentObj) for attachment in attachments)
+    assert attachments[0]._parent is issue
+    assert encode_value(attachments) == [{'id': 1}, {'id': 2}]
+    assert ObjectListDecoder(AttachmentManager)(issue, 'x') == 'x'
+
+
+def test_encode_value(issue):
+    assert encode_value(issue.reporter) == {'id': 1}
+    assert encode_value(IssueStatus.new) == {'id': 10, 'name': 'new'}
+    assert encode_value(datetime(2024, 1, 1, tzinfo=timezone.utc)) == '2024-01-01T00:00:00+00:00'
+    assert encode_value([IssueStatus.new, None, (1, 'a')]) == [
+        {'id': 10, 'name': 'new'}, None, [1, 'a']]
+    for value in (None, 'a', 1, 1.5, True, {'id': 1}):
+        assert encode_value(value) is value
+    delta = timedelta(days=1)
+    assert encode_value(delta) is delta
@@ -0,0 +1,49 @@
+from mantis.api.v1.objects import IssueStatus
+
+
+def test_changes_are_tracked(client):
+    issue = client.issues.get_by_id(4)
+    assert not issue.is_dirty
+
+    issue['status'] = IssueStatus.resolved
+    issue['handler'] = issue.reporter
+
+    assert issue.dirty_fields == {'status', 'handler'}
+    # The typed values are encoded as raw values
+    assert issue.get_changes() == {'handler': {'id': 1},
+                                   'status': {'id': 80, 'name': 'resolved'}}
+    assert issue.status == IssueStatus.resolved
+
+
+def test_save_sends_only_the_changes(client, transport):
+    issue = client.issues.get_by_id(4)
+    issue['summary'] = 'changed'
+    transport.requests.clear()
+
+    assert issue.save() is issue
+
+    assert [request[:2] for request in transport.requests] == [('PATCH', 'issues/4')]
+    assert transport.bodies == [{'summary': 'changed'}]
+    assert not issue.is_dirty
+    assert issue.summary == transport.issues[4]['summary'] == 'changed'
+    assert client.issues.get_by_id(4) is issue
+
+
+def test_save_without_changes(client, transport):
+    issue = client.issues.get_by_id(4)
+    transport.requests.clear()
+
+    issue.save()
+
+    assert transport.requests == []
+
+
+def test_server_values_replace_the_changes(client, transport):
+    issue = client.issues.get_by_id(4)
+    issue['summary'] = 'changed'
+    issue['description'] = 'changed'
+
+    client.issues.get_all(limit=60)
+
+    assert issue.dirty_fields == set()
+    assert issue.summary == 'issue 4'
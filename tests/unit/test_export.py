@@ -0,0 +1,120 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from mantis.export import ObjectExporter, export_issues, export_notes
+
+
+def test_export_issues_ndjson(client, transport):
+    output = io.StringIO()
+
+    count = export_issues(client.issues, output, project=2, page_size=10)
+
+    rows = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert count == len(rows) == 20
+    # The notes aren't requested (see `export_notes`)
+    assert rows[0] == {key: value for key, value in transport.issues[58].items()
+                       if key != 'notes'}
+    assert transport.requests[0][2]['page_size'] == '10'
+
+
+def test_export_issues_csv(client, transport):
+    output = io.StringIO()
+
+    count = export_issues(client.issues, output, project=1, fmt='csv', page_size=10,
+                          fields=['id', 'summary', 'status.name', 'handler.name', 'project'])
+
+    rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+    assert count == len(rows) == 20
+    assert rows[1] == {'id': '57', 'summary': 'issue 57', 'status.name': 'assigned',
+                       'handler.name': 'developer',
+                       'project': '{"id":1,"name":"P1"}'}
+    assert rows[0]['handler.name'] == ''
+    # Only the top level attributes are requested
+    assert transport.requests[0][2]['select'] == 'id,summary,project,handler,status'
+
+
+def test_export_issues_gzip(client, tmp_path):
+    path = tmp_path / 'issues.ndjson.gz'
+
+    count = export_issues(client.issues, path, fields=['id'], limit=5)
+
+    with gzip.open(path, 'rt') as f:
+        assert [json.loads(line) for line in f] == [{'id': id_} for id_ in range(60, 55, -1)]
+    assert count == 5
+
+
+def test_export_notes(client, transport):
+    output = io.StringIO()
+
+    count = export_notes(client.issues, output, project=1, limit=2,
+                         fields=['issue_id', 'id', 'text'])
+
+    assert count == 4
+    assert [json.loads(line) for line in output.getvalue().splitlines()] == [
+        {'issue_id': 60, 'id': 6000, 'text': 'note 0 of 60'},
+        {'issue_id': 60, 'id': 6001, 'text': 'note 1 of 60'},
+        {'issue_id': 57, 'id': 5700, 'text': 'note 0 of 57'},
+        {'issue_id': 57, 'id': 5701, 'text': 'note 1 of 57'},
+    ]
+
+
+def test_export_empty_csv():
+    output = io.StringIO()
+
+    assert ObjectExporter('csv', ['id', 'summary']).write([], output) == 0
+    assert output.getvalue() == 'id,summary\r\n'
+
+
+def test_unsupported_format():
+    with pytest.raises(ValueError):
+        ObjectExporter('xml')
+
+
+def test_export_issues_csv_all_fields(client, transport):
+    # The first issue doesn't have some attributes (e.g: not set)
+    del transport.issues[60]['handler']
+    del transport.issues[60]['custom_fields']
+    output = io.StringIO()
+
+    count = export_issues(client.issues, output, project=1, fmt='csv', limit=2)
+
+    rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+    assert count == len(rows) == 2
+    assert list(rows[0]) == list(client.issues._get_attrs_layout().names)
+    assert rows[0]['handler'] == ''
+    assert rows[1]['handler'] == '{"id":2,"name":"developer"}'
+
+
+def test_export_notes_csv_all_fields(client):
+    output = io.StringIO()
+
+    export_notes(client.issues, output, project=1, fmt='csv', limit=1)
+
+    rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+    assert list(rows[0]) == ['issue_id', 'id', 'text', 'reporter', 'view_state',
+                             'attachments', 'type', 'created_at', 'updated_at']
+    assert rows[0]['text'] == 'note 0 of 60'
+
+
+def test_export_csv_objects_without_fields(client):
+    output = io.StringIO()
+    issues = client.issues.get_all(limit=2)
+
+    ObjectExporter('csv').write(issues, output)
+
+    rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+    assert list(rows[0]) == list(client.issues._get_attrs_layout().names)
+
+
+def test_export_csv_dicts_without_fields():
+    output = io.StringIO()
+
+    with pytest.warns(RuntimeWarning, match='handler'):
+        count = ObjectExporter('csv').write([{'id': 1}, {'id': 2, 'handler': 'a'}], output)
+
+    assert count == 2
+    assert output.getvalue() == 'id\r\n1\r\n2\r\n'
@@ -0,0 +1,54 @@
+import pytest
+
+from mantis.exceptions import UnknownFieldsError
+
+
+def test_only_the_fields_are_requested(client, transport):
+    issues = client.issues.get_all(limit=3, fields=['summary', 'status'])
+
+    # The id and the parent id are always requested
+    assert transport.requests[0][2]['select'] == 'id,summary,project,status'
+    assert issues[0]._loaded_fields == {'id', 'summary', 'project', 'status'}
+    assert issues[0].to_dict() == {
+        key: transport.issues[60][key] for key in ('id', 'summary', 'project', 'status')}
+
+
+def test_the_other_fields_are_loaded_once(client, transport):
+    issue = client.issues.get_all(limit=1, fields=['summary'])[0]
+    transport.requests.clear()
+
+    assert issue.description == 'description'
+    assert issue.handler is None
+    assert issue.get_raw('created_at') == transport.issues[60]['created_at']
+
+    # One request, with the fields not loaded only
+    assert transport.paths() == ['issues/60']
+    assert 'summary' not in transport.requests[0][2]['select'].split(',')
+    assert issue._loaded_fields is None
+
+
+def test_a_field_set_is_not_loaded(client, transport):
+    issue = client.issues.get_all(limit=1, fields=['summary'])[0]
+    issue['description'] = 'changed'
+    transport.requests.clear()
+
+    assert issue.is_loaded('description')
+    assert issue.description == 'changed'
+    assert transport.requests == []
+
+
+def test_cached_objects_are_back_filled(client, transport):
+    issue = client.issues.get_all(limit=1, fields=['summary'])[0]
+
+    issues = client.issues.get_all(limit=2)
+
+    assert issues[0] is issue
+    assert issue._loaded_fields is None
+    assert issue.get_raw('history') == []
+
+
+def test_unknown_fields(client, transport):
+    with pytest.raises(UnknownFieldsError):
+        client.issues.get_all(fields=['summary', 'unknown'])
+
+    assert transport.requests == []
@@ -0,0 +1,61 @@
+import asyncio
+
+from mantis import AsyncMantisBT, MantisHTTPReponseClientError
+
+from .fake_transport import BASE_URL, TOKEN
+
+
+def test_get_many_keeps_the_order_of_the_ids(client, transport):
+    issues = client.issues.get_many([9, 7, 3, 9, 5], max_workers=4)
+
+    assert [issue.id for issue in issues] == [9, 7, 3, 5]
+    # The duplicated id is requested once
+    assert sorted(transport.paths()) == ['issues/3', 'issues/5', 'issues/7', 'issues/9']
+    assert issues.errors == {}
+
+
+def test_get_many_collects_the_errors(client, transport):
+    issues = client.issues.get_many([1, 999, 2, 1000])
+
+    assert [issue.id for issue in issues] == [1, 2]
+    assert set(issues.errors) == {999, 1000}
+    assert all(isinstance(error, MantisHTTPReponseClientError)
+               for error in issues.errors.values())
+
+
+def test_get_many_uses_the_cache(client, transport):
+    cached = client.issues.get_by_id(7)
+    transport.requests.clear()
+
+    issues = client.issues.get_many([7, 8])
+
+    assert issues[0] is cached
+    assert transport.paths() == ['issues/8']
+
+
+def test_get_many_requests_concurrently(client, transport):
+    transport.delay = 0.02
+
+    issues = client.issues.get_many(range(1, 21), max_workers=5)
+
+    assert len(issues) == 20
+    assert 1 < transport.max_in_flight <= 5
+
+
+def test_get_many_resolves_the_parents_in_batch(client, transport):
+    issues = client.projects._child_manager_obj.get_many([1, 2, 3, 4])
+
+    assert transport.paths()[-1] == 'projects'
+    assert transport.paths().count('projects') == 1
+    assert all(issue._parent.id == issue.project.id for issue in issues)
+
+
+def test_async_get_many_collects_the_errors(transport):
+    async def main():
+        async with AsyncMantisBT(BASE_URL, TOKEN, transport=transport) as client:
+            return await client.issues.get_many([5, 1000, 6])
+
+    issues = asyncio.run(main())
+
+    assert [issue.id for issue in issues] == [5, 6]
+    assert list(issues.errors) == [1000]
@@ -0,0 +1,100 @@
+import pytest
+
+from mantis import DiskHTTPCache, MantisBT, MemoryHTTPCache
+from mantis._requests import HTTPCache, HTTPCacheEntry
+
+from .fake_transport import BASE_URL, TOKEN
+
+
+@pytest.fixture(params=['memory', 'disk'])
+def http_cache(request, tmp_path):
+    if request.param == 'memory':
+        return MemoryHTTPCache()
+    return DiskHTTPCache(str(tmp_path))
+
+
+@pytest.fixture
+def client(transport, http_cache):
+    return MantisBT(BASE_URL, TOKEN, transport=transport, http_cache=http_cache)
+
+
+def get_raw_projects(client):
+    return client._requests.http_get('projects')
+
+
+def test_not_modified_response_reused(client, transport, http_cache):
+    first = get_raw_projects(client)
+    second = get_raw_projects(client)
+
+    assert second == first
+    assert 'If-None-Match' not in transport.requests[0][3]
+    assert transport.requests[1][3]['If-None-Match'] == transport.projects_etag
+    assert (http_cache.hits, http_cache.misses) == (1, 1)
+
+
+def test_changed_response_replaces_the_entry(client, transport, http_cache):
+    get_raw_projects(client)
+    transport.projects.append({'id': 4, 'name': 'P4', 'enabled': True})
+    transport.projects_etag = '"projects-v2"'
+
+    assert len(get_raw_projects(client)['projects']) == 4
+    assert len(get_raw_projects(client)['projects']) == 4
+    assert (http_cache.hits, http_cache.misses) == (1, 2)
+
+
+def test_objects_built_from_the_cached_response(client, transport):
+    client.projects.get_all()
+    client._cache.clear()
+
+    projects = client.projects.get_all()
+
+    assert [project.name for project in projects] == ['P1', 'P2', 'P3']
+
+
+def test_responses_without_validators_arent_cached(client, transport, http_cache):
+    client._requests.http_get('issues/1')
+    client._requests.http_get('issues/1')
+
+    assert all('If-None-Match' not in headers for _, _, _, headers in transport.requests)
+    assert http_cache.hits == 0
+
+
+def test_key_by_authentication(transport, http_cache):
+    get_raw_projects(MantisBT(BASE_URL, TOKEN, transport=transport, http_cache=http_cache))
+    get_raw_projects(MantisBT(BASE_URL, 'other', transport=transport, http_cache=http_cache))
+
+    assert 'If-None-Match' not in transport.requests[1][3]
+
+
+def test_memory_cache_limits():
+    cache = MemoryHTTPCache(max_entries=2, max_size=100)
+    for key in ('a', 'b', 'c'):
+        cache.set(key, HTTPCacheEntry({}, '"x"', size=10))
+
+    assert cache.get('a') is None
+    assert len(cache) == 2
+
+    cache.set('d', HTTPCacheEntry({}, '"x"', size=95))
+    assert (cache.get('b'), cache.get('c')) == (None, None)
+    assert cache.get('d') is not None
+
+    cache.set('e', HTTPCacheEntry({}, '"x"', size=101))
+    assert cache.get('e') is None
+
+
+def test_disk_cache_limits(tmp_path):
+    cache = DiskHTTPCache(str(tmp_path), max_size=300)
+    cache.set('a', HTTPCacheEntry({'value': 'a' * 100}, '"a"', size=100))
+    cache.set('b', HTTPCacheEntry({'value': 'b' * 100}, '"b"', size=100))
+    cache.set('c', HTTPCacheEntry({'value': 'c' * 100}, '"c"', size=100))
+
+    assert cache.get('c').body == {'value': 'c' * 100}
+    assert cache.get('a') is None
+
+    cache.clear()
+    assert cache.get('c') is None
+
+
+def test_base_class_is_abstract():
+    with pytest.raises(TypeError):
+        HTTPCache()
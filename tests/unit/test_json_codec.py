@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from mantis import MantisBT
+from mantis._requests import get_json_codec
+from mantis._requests.json_codec import JSONCodec, StdlibJSONCodec
+
+from .fake_transport import BASE_URL, TOKEN
+
+
+DOCUMENT = {'issues': [{'id': 1, 'summary': 'é☃ \\/', 'sticky': False, 'handler': None}]}
+
+
+def installed_codecs():
+    codecs = []
+    for name in ('json', 'orjson', 'msgspec'):
+        try:
+            codecs.append(get_json_codec(name))
+        except ImportError:
+            continue
+
+    return codecs
+
+
+@pytest.mark.parametrize('codec', installed_codecs(), ids=lambda codec: codec.name)
+def test_roundtrip(codec):
+    data = json.dumps(DOCUMENT).encode()
+
+    assert codec.loads(data) == DOCUMENT
+    assert codec.loads(data.decode()) == DOCUMENT
+    assert json.loads(codec.dumps(DOCUMENT)) == DOCUMENT
+
+    with pytest.raises(ValueError):
+        codec.loads(b'{"id": ')
+
+
+def test_get_json_codec():
+    assert isinstance(get_json_codec(), StdlibJSONCodec)
+    # The fastest installed
+    names = [codec.name for codec in installed_codecs()]
+    assert get_json_codec('auto').name == next(
+        name for name in ('orjson', 'msgspec', 'json') if name in names)
+
+    codec = StdlibJSONCodec()
+    assert get_json_codec(codec) is codec
+
+    with pytest.raises(ValueError):
+        get_json_codec('yaml')
+
+
+def test_json_codec_is_abstract():
+    with pytest.raises(TypeError):
+        JSONCodec()
+
+
+def test_orjson_big_integers():
+    pytest.importorskip('orjson')
+    codec = get_json_codec('orjson')
+
+    assert json.loads(codec.dumps({'id': 2 ** 70})) == {'id': 2 ** 70}
+
+
+def test_msgspec_codec():
+    pytest.importorskip('msgspec')
+
+    assert get_json_codec('msgspec').loads(b'[1, 2]') == [1, 2]
+
+
+@pytest.mark.parametrize('codec', installed_codecs(), ids=lambda codec: codec.name)
+def test_client_codec(transport, codec):
+    client = MantisBT(BASE_URL, TOKEN, transport=transport, json_codec=codec.name)
+
+    issue = client.issues.get_by_id(4)
+    issue['summary'] = 'é☃'
+    issue.save()
+
+    assert issue.reporter.name == 'administrator'
+    assert transport.bodies == [{'summary': 'é☃'}]
@@ -0,0 +1,68 @@
+import pytest
+
+from mantis import MantisHTTPReponseServerError
+from mantis.base import ObjectListManager
+
+
+@pytest.fixture
+def issues(client):
+    return ObjectListManager(client.issues.iter_all(page_size=10))
+
+
+def test_pages_are_requested_on_demand(issues, transport):
+    assert transport.requests == []
+
+    assert issues[5].id == 55
+    assert bool(issues)
+    assert len(transport.paths()) == 1
+
+    assert issues[15].id == 45
+    assert len(transport.paths()) == 2
+    assert issues.is_lazy
+
+
+def test_len_requests_all_pages(issues, transport):
+    assert len(issues) == 60
+    assert not issues.is_lazy
+    # 6 full pages + 1 empty page
+    assert len(transport.paths()) == 7
+
+
+def test_views_are_executed_in_one_pass(issues, transport):
+    ids = issues.filter(status='new').map(lambda issue: issue.id)[:3]
+    assert transport.requests == []
+
+    assert list(ids) == [60, 56, 52]
+    assert len(transport.paths()) == 1
+    # Re-iterable, without new requests
+    assert list(ids) == [60, 56, 52]
+    assert len(transport.paths()) == 1
+
+
+def test_iterators_are_independent(issues, transport):
+    first, second = iter(issues), iter(issues)
+
+    assert next(first).id == 60
+    assert next(first).id == 59
+    assert next(second).id == 60
+    assert len(transport.paths()) == 1
+
+
+def test_views_of_a_complete_list(client):
+    issues = client.issues.get_all()
+
+    assert not issues.is_lazy
+    assert [issue.id for issue in issues[-2:]] == [2, 1]
+    assert [issue.id for issue in issues.filter(id__le=3).sort('id')] == [1, 2, 3]
+
+
+def test_errors_of_the_source_are_kept(issues, transport):
+    issues[0]
+    # The second page fails
+    transport.statuses = [500]
+
+    with pytest.raises(MantisHTTPReponseServerError):
+        issues[15]
+    with pytest.raises(MantisHTTPReponseServerError):
+        list(issues)
+    assert len(transport.paths()) == 2
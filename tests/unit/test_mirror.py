@@ -0,0 +1,80 @@
+import pytest
+
+from mantis import MantisMirror
+from mantis.api.v1.objects import IssueStatus
+
+
+@pytest.fixture
+def mirror(client, tmp_path):
+    with MantisMirror(client, str(tmp_path / 'mantis.db')) as mirror:
+        mirror.sync(page_size=25)
+        yield mirror
+
+
+def test_sync_stores_issues_notes_and_projects(mirror, transport):
+    assert mirror.count() == {'projects': 3, 'issues': 60, 'notes': 120}
+    assert transport.paths() == ['issues', 'issues', 'issues', 'projects']
+
+
+def test_sync_is_incremental(mirror, transport):
+    transport.requests.clear()
+    transport.issues[5]['summary'] = 'crash at startup'
+    transport.issues[5]['updated_at'] = '2024-03-01T00:00:00+00:00'
+
+    changes = mirror.sync(page_size=25)
+
+    assert [issue.id for issue in changes.updated] == [5]
+    assert transport.paths() == ['issues']
+    assert mirror.get_issue(5).summary == 'crash at startup'
+    assert mirror.count()['issues'] == 60
+
+
+def test_the_state_is_kept_in_the_database(client, mirror, transport, tmp_path):
+    transport.requests.clear()
+
+    with MantisMirror(client, str(tmp_path / 'mantis.db')) as other:
+        assert len(other.sync(page_size=25)) == 0
+
+    assert transport.paths() == ['issues']
+
+
+def test_query_issues(mirror):
+    issues = mirror.issues(status='assigned', handler=2)
+
+    assert sorted(issue.id for issue in issues) == list(range(1, 61, 4))
+    assert all(issue.status == IssueStatus.assigned for issue in issues)
+
+    issues = mirror.issues(status=['new', IssueStatus.closed], order_by='id', desc=False, limit=3)
+    assert [issue.id for issue in issues] == [3, 4, 7]
+
+    issues = mirror.issues(project=1, updated_after='2024-02-03T09:00:00+00:00')
+    assert [issue.id for issue in issues] == [60, 57]
+
+    with pytest.raises(ValueError):
+        mirror.issues(order_by='summary')
+
+
+def test_issues_are_built_with_their_project(mirror, transport):
+    transport.requests.clear()
+
+    issue = mirror.get_issue(5)
+
+    assert issue._parent.id == 3
+    assert mirror.get_issue(999) is None
+    assert transport.requests == []
+
+
+def test_search(mirror, transport):
+    transport.issues[5]['summary'] = 'crash at startup'
+    transport.issues[5]['updated_at'] = '2024-03-01T00:00:00+00:00'
+    mirror.sync()
+
+    assert [issue.id for issue in mirror.search('crash')] == [5]
+    assert [note.id for note in mirror.search_notes('"note 1 of 7"')] == [701]
+
+
+def test_notes(mirror):
+    notes = mirror.notes(5)
+
+    assert [note.id for note in notes] == [500, 501]
+    assert all(note._parent.id == 5 for note in notes)
@@ -0,0 +1,50 @@
+from mantis import MantisHTTPReponseServerError
+
+
+def test_notes_are_requested_concurrently(client, transport):
+    issues = client.issues.get_all(limit=4)
+    transport.requests.clear()
+    transport.delay = 0.02
+
+    notes = client.notes.get_for_issues(issues, max_workers=4)
+
+    assert [note.id for note in notes] == [6000, 6001, 5900, 5901, 5800, 5801, 5700, 5701]
+    assert sorted(params['id'] for _, _, params, _ in transport.requests) == [
+        '57', '58', '59', '60']
+    assert transport.max_in_flight > 1
+    assert all(note._parent is issue for issue in issues for note in issue.get_notes())
+
+
+def test_notes_are_kept_in_the_issues(client, transport):
+    issues = client.issues.get_all(limit=4)
+    client.notes.get_for_issues(issues)
+    transport.requests.clear()
+
+    assert [note.id for note in issues[0].get_notes()] == [6000, 6001]
+    assert len(client.notes.get_for_issues(issues)) == 8
+    assert transport.requests == []
+
+    client.notes.get_for_issues(issues[:2], refresh=True)
+    assert len(transport.requests) == 2
+
+
+def test_notes_received_with_the_issues(client, transport):
+    issues = client.issues.get_all(limit=4, include_notes=True)
+    assert transport.requests[0][2]['select'].endswith(',notes')
+    transport.requests.clear()
+
+    notes = client.notes.get_for_issues(issues)
+
+    assert len(notes) == 8
+    assert transport.requests == []
+
+
+def test_errors_by_issue(client, transport):
+    issues = client.issues.get_all(limit=2)
+    transport.statuses = [500]
+
+    notes = client.notes.get_for_issues(issues, max_workers=1)
+
+    assert len(notes) == 2
+    assert list(notes.errors) == [60]
+    assert isinstance(notes.errors[60], MantisHTTPReponseServerError)
@@ -0,0 +1,87 @@
+from datetime import datetime
+
+import pytest
+
+from mantis.base import ObjectBase, ObjectManagerBase
+from mantis.api.v1.objects import AttachmentObj, IssueObj
+
+
+class ItemObj(ObjectBase):
+    __slots__ = ()
+
+    def notes(self):
+        return 'method'
+
+
+class ItemManager(ObjectManagerBase):
+    _path = 'items'
+    _id_attr = 'id'
+    _key_response = ('items', )
+
+    _mandatory_attr = ('id', 'name')
+    _optional_attr = ('notes', )
+    _readonly_attr = ('id', )
+
+    _obj_cls = ItemObj
+
+
+@pytest.fixture
+def item_manager(client):
+    return ItemManager(client._requests)
+
+
+def test_objects_are_compact(client):
+    issue = client.issues.get_by_id(3)
+
+    assert not hasattr(issue, '__dict__')
+    assert isinstance(issue, IssueObj)
+    assert type(issue).__name__ == 'IssueObj'
+    # One compact class by layout
+    assert type(client.issues.get_by_id(4)) is type(issue)
+
+
+def test_decoded_attrs_keep_the_raw_value(client, transport):
+    issue = client.issues.get_by_id(3)
+
+    assert issue._raw_created_at == transport.issues[3]['created_at']
+    assert issue.get_raw('created_at') == transport.issues[3]['created_at']
+    assert isinstance(issue.created_at, datetime)
+    assert issue.created_at is issue.created_at
+    assert issue.to_dict()['status'] == transport.issues[3]['status']
+
+
+def test_set_resets_the_decoded_value(client):
+    issue = client.issues.get_by_id(3)
+    created_at = issue.created_at
+
+    issue['created_at'] = '2030-01-01T00:00:00+00:00'
+
+    assert issue.created_at != created_at
+    assert issue.created_at.year == 2030
+
+
+def test_attrs_named_as_methods_are_extra(item_manager):
+    item = ItemObj(item_manager, {'id': 1, 'name': 'a', 'notes': [1, 2]})
+
+    assert item._extra == {'notes': [1, 2]}
+    assert item['notes'] == [1, 2]
+    assert item.notes() == 'method'
+    assert item.to_dict() == {'id': 1, 'name': 'a', 'notes': [1, 2]}
+
+
+def test_read_only_attrs(client, item_manager):
+    item = ItemObj(item_manager, {'id': 1, 'name': 'a'})
+
+    with pytest.raises(AttributeError):
+        item['id'] = 2
+    item['name'] = 'b'
+    item.__setitem__('id', 2, force=True)
+
+    assert (item.id, item.name) == (2, 'b')
+
+
+def test_read_only_objects(client):
+    attachment = AttachmentObj(client.attachments, {'id': 1, 'filename': 'a.log'})
+
+    with pytest.raises(AttributeError):
+        attachment['filename'] = 'b.log'
@@ -0,0 +1,46 @@
+def test_get_all_requests_all_pages(client, transport):
+    issues = client.issues.get_all(page_size=25, resolve_parent=False)
+
+    assert len(issues) == 60
+    # 25 + 25 + 10: the short page is the last one
+    assert [params['page'] for _, _, params, _ in transport.requests] == ['1', '2', '3']
+    assert all(params['page_size'] == '25' for _, _, params, _ in transport.requests)
+
+
+def test_get_all_requests_one_more_page_when_full(client, transport):
+    issues = client.issues.get_all(page_size=30, resolve_parent=False)
+
+    assert len(issues) == 60
+    # The last page is full, so a empty page ends the pagination
+    assert len(transport.requests) == 3
+
+
+def test_limit_stops_requesting_pages(client, transport):
+    issues = client.issues.get_all(limit=7, page_size=5, resolve_parent=False)
+
+    assert len(issues) == 7
+    assert len(transport.requests) == 2
+
+
+def test_limit_smaller_than_the_page_size(client, transport):
+    issues = client.issues.get_all(limit=3, resolve_parent=False)
+
+    assert [issue.id for issue in issues] == [60, 59, 58]
+    # The page size is reduced to the limit
+    assert transport.requests[0][2]['page_size'] == '3'
+
+
+def test_iter_by_crit_requests_pages_on_demand(client, transport):
+    crit = {'project_id': 2}
+    issues = client.issues.iter_by_crit(crit, page_size=5, resolve_parent=False)
+
+    first = next(issues)
+    assert first.project.id == 2
+    assert len(transport.requests) == 1
+
+    assert sum(1 for _ in issues) + 1 == 20
+    assert len(transport.requests) == 5
+    assert all(params['project_id'] == '2' for _, _, params, _ in transport.requests)
+    # The criteria of the caller isn't changed
+    assert crit == {'project_id': 2}
+
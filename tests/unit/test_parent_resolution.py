@@ -0,0 +1,59 @@
+import pytest
+
+
+@pytest.fixture
+def project_issues(client):
+    # The issues manager of the projects: the parents of the issues are projects
+    return client.projects._child_manager_obj
+
+
+def test_parents_resolved_in_one_request(project_issues, transport):
+    issues = project_issues.get_all(limit=50)
+
+    assert transport.paths() == ['issues', 'projects']
+    for issue in issues:
+        assert issue._parent.id == issue.project.id
+
+    # The same object for all issues of a project
+    assert len({id(issue._parent) for issue in issues}) == 3
+
+
+def test_parents_from_cache(project_issues, transport):
+    project_issues.get_all(limit=10)
+    transport.requests.clear()
+
+    issues = project_issues.get_all(limit=10)
+
+    assert transport.paths() == ['issues']
+    assert all(issue._parent is not None for issue in issues)
+
+
+def test_resolve_parent_disabled(project_issues, transport):
+    issues = project_issues.get_all(limit=10, resolve_parent=False)
+
+    assert transport.paths() == ['issues']
+    assert all(issue._parent is None for issue in issues)
+
+
+def test_parent_not_found_in_batch(project_issues, transport):
+    del transport.projects[2]
+
+    issues = project_issues.get_all(limit=12)
+
+    assert transport.paths() == ['issues', 'projects']
+    assert {issue.project.id for issue in issues if issue._parent is None} == {3}
+    assert all(issue._parent.id == issue.project.id
+               for issue in issues if issue.project.id != 3)
+
+
+def test_parent_not_found_by_id(client, project_issues, transport):
+    client.projects.get_by_id(1)
+    client.projects.get_by_id(2)
+    del transport.projects[2]
+    transport.requests.clear()
+
+    issues = project_issues.get_all(limit=12)
+
+    # Only the missing parent is requested, its 404 isn't raised
+    assert transport.paths() == ['issues', 'projects/3']
+    assert {issue.project.id for issue in issues if issue._parent is None} == {3}
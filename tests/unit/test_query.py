@@ -0,0 +1,84 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from mantis.api.v1.objects import IssueStatus
+from mantis.base import ObjectListManager
+from mantis.query import compile_conditions, parse_conditions
+
+
+CONDITIONS = [
+    {'status': 'new'},
+    {'status': IssueStatus.resolved},
+    {'status__ne': 'new'},
+    {'status__in': ['new', 'closed']},
+    {'status__nin': [IssueStatus.new, 'closed']},
+    {'status__ge': IssueStatus.resolved},
+    {'handler': 2},
+    {'handler__isnull': True},
+    {'handler__name': 'developer'},
+    {'project': 1, 'status__lt': IssueStatus.resolved},
+    {'id__gt': 50},
+    {'id__between': (10, 20)},
+    {'summary__contains': 'issue 1'},
+    {'summary__icontains': 'ISSUE 5'},
+    {'created_at__lt': '2024-01-01T10:00:00+00:00'},
+    {'updated_at__between': ('2024-02-02', datetime(2024, 2, 2, 5, tzinfo=timezone.utc))},
+]
+
+
+@pytest.fixture
+def issues(client):
+    return client.issues.get_all()
+
+
+@pytest.mark.parametrize('kwargs', CONDITIONS)
+def test_indexed_filter_matches_brute_force(issues, kwargs):
+    match = compile_conditions(parse_conditions((), kwargs))
+    expected = [issue.id for issue in issues.objects if match(issue)]
+
+    assert expected
+    assert [issue.id for issue in issues.filter(**kwargs)] == expected
+    # Without indexes (the source isn't complete)
+    lazy = ObjectListManager(iter(issues.objects))
+    assert [issue.id for issue in lazy.filter(**kwargs)] == expected
+
+
+def test_filter_examples(issues):
+    assert [issue.id for issue in issues.filter(status='new', handler__isnull=False)] == []
+    assert {issue.id for issue in issues.filter(('handler.name', 'eq', 'developer'))} == set(
+        range(1, 61, 2))
+    assert [issue.id for issue in issues.filter(lambda issue: issue.id < 3)] == [2, 1]
+    assert [issue.id for issue in issues.filter(id__le=10).filter(status='new')] == [8, 4]
+
+
+def test_indexes_are_reused(issues):
+    issues.filter(status='new')
+    index = issues._query.hash_index('status')
+
+    issues.filter(status='closed')
+
+    assert issues._query.hash_index('status') is index
+
+
+def test_sort(issues):
+    ids = [issue.id for issue in issues.sort('-status', 'id')]
+
+    assert ids[:3] == [3, 7, 11]
+    assert ids[-1] == 60
+    assert [issue.id for issue in issues.sort('id', reverse=True)][:2] == [60, 59]
+    # The null values are the last
+    assert issues.sort('handler.name')[-1].handler is None
+
+
+def test_group_by_and_count_by(issues):
+    groups = issues.group_by('status')
+
+    assert set(groups) == {IssueStatus.new, IssueStatus.assigned,
+                           IssueStatus.resolved, IssueStatus.closed}
+    assert [issue.id for issue in groups[IssueStatus.new]][:2] == [60, 56]
+    assert issues.count_by('handler.name') == {'developer': 30, None: 30}
+    assert issues.count_by('project') == {1: 20, 2: 20, 3: 20}
+
+    with pytest.raises(TypeError):
+        issues.group_by('history')
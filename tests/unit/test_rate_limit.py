@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from mantis import MantisBT, RateLimiter
+
+from .fake_transport import BASE_URL, TOKEN
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    delays = []
+    monkeypatch.setattr('mantis._requests.rate_limit.monotonic', lambda: now[0])
+    monkeypatch.setattr('mantis._requests.rate_limit.sleep', delays.append)
+    return now, delays
+
+
+def test_burst_then_turns_in_order(clock):
+    _, delays = clock
+    limiter = RateLimiter(rate=10, burst=2)
+
+    for _ in range(5):
+        with limiter:
+            pass
+
+    # The waiting requests reserve the next turns
+    assert delays == pytest.approx([0.1, 0.2, 0.3])
+    assert limiter.waits == 3
+    assert limiter.wait_time == pytest.approx(0.6)
+
+
+def test_bucket_refilled_with_time(clock):
+    now, delays = clock
+    limiter = RateLimiter(rate=10, burst=2)
+    for _ in range(2):
+        limiter.acquire()
+
+    now[0] += 0.2
+    for _ in range(2):
+        limiter.acquire()
+
+    assert delays == []
+
+
+def test_no_rate_never_waits(clock):
+    _, delays = clock
+    limiter = RateLimiter()
+    for _ in range(100):
+        limiter.acquire()
+
+    assert (delays, limiter.waits) == ([], 0)
+
+
+def test_requests_in_flight_limited(transport):
+    limiter = RateLimiter(max_in_flight=3)
+    client = MantisBT(BASE_URL, TOKEN, transport=transport, rate_limiter=limiter)
+    transport.delay = 0.02
+
+    issues = client.issues.get_many(range(1, 21), max_workers=10)
+
+    assert len(issues) == 20
+    assert transport.max_in_flight <= 3
+    assert limiter.waits > 0
+
+
+def test_shared_by_asyncio_tasks():
+    limiter = RateLimiter(max_in_flight=2)
+    in_flight = []
+    max_in_flight = []
+
+    async def request():
+        async with limiter:
+            in_flight.append(1)
+            max_in_flight.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.pop()
+
+    async def main():
+        await asyncio.gather(*[request() for _ in range(10)])
+
+    asyncio.run(main())
+
+    assert max(max_in_flight) == 2
@@ -0,0 +1,121 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+from requests import ConnectionError, Response
+
+from mantis import (
+    MantisBT, MantisConnectionError, MantisHTTPReponseClientError,
+    MantisHTTPReponseServerError, RetryPolicy
+)
+
+from .fake_transport import BASE_URL, TOKEN
+
+
+@pytest.fixture
+def delays(monkeypatch):
+    delays = []
+    monkeypatch.setattr('mantis._requests.mantis_requests.sleep', delays.append)
+    return delays
+
+
+def build_client(transport, **kwargs):
+    kwargs.setdefault('jitter', False)
+    return MantisBT(BASE_URL, TOKEN, transport=transport,
+                    retry_policy=RetryPolicy(**kwargs))
+
+
+def test_retried_until_success(transport, delays):
+    client = build_client(transport, max_attempts=4, backoff_base=0.1)
+    transport.statuses = [503, 429]
+
+    assert len(client.projects.get_all()) == 3
+    assert delays == [0.1, 0.2]
+    stats = client.retry_stats
+    assert (stats.attempts, stats.retries, stats.exhausted) == (3, 2, 0)
+    assert stats.retry_time == pytest.approx(0.3)
+
+
+def test_backoff_is_capped(transport, delays):
+    client = build_client(transport, max_attempts=5, backoff_base=1, backoff_cap=3)
+    transport.statuses = [503] * 4
+
+    client.projects.get_all()
+
+    assert delays == [1, 2, 3, 3]
+
+
+def test_jitter_is_up_to_the_backoff(transport, delays):
+    client = build_client(transport, max_attempts=5, backoff_base=1, jitter=True)
+    transport.statuses = [503] * 4
+
+    client.projects.get_all()
+
+    assert all(0 <= delay <= 2 ** attempt for attempt, delay in enumerate(delays))
+
+
+def test_retry_after_header(transport, delays):
+    client = build_client(transport, max_attempts=3, backoff_base=0.1)
+    transport.statuses = [429]
+    transport.retry_after = '7'
+
+    client.projects.get_all()
+
+    assert delays == [7.0]
+
+
+def test_retry_after_http_date():
+    policy = RetryPolicy(backoff_base=0.1, jitter=False)
+    response = Response()
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    response.headers['Retry-After'] = format_datetime(retry_at, usegmt=True)
+
+    assert 25 < policy.get_delay(1, response) <= 30
+
+    response.headers['Retry-After'] = 'invalid'
+    assert policy.get_delay(1, response) == 0.1
+
+
+def test_retries_exhausted(transport, delays):
+    client = build_client(transport, max_attempts=3, backoff_base=0.1)
+    transport.statuses = [503] * 5
+
+    with pytest.raises(MantisHTTPReponseServerError):
+        client.projects.get_all()
+
+    assert len(transport.requests) == 3
+    assert (client.retry_stats.attempts, client.retry_stats.exhausted) == (3, 1)
+
+
+def test_connection_errors_are_retried(transport, delays):
+    client = build_client(transport, max_attempts=3, backoff_base=0.1)
+    transport.statuses = [ConnectionError('refused')]
+
+    assert len(client.projects.get_all()) == 3
+    assert client.retry_stats.retries == 1
+
+    transport.statuses = [ConnectionError('refused')] * 3
+    with pytest.raises(MantisConnectionError):
+        client.projects.get_all()
+
+
+def test_not_idempotent_methods_arent_retried(transport, delays):
+    client = build_client(transport, max_attempts=3, backoff_base=0.1)
+    transport.statuses = [503]
+
+    with pytest.raises(MantisHTTPReponseServerError):
+        client.issues.create_one({'summary': 'new', 'description': 'new',
+                                  'project': {'id': 1}, 'steps_to_reproduce': ''})
+
+    assert transport.paths('POST') == ['issues']
+    assert delays == []
+
+
+def test_client_errors_arent_retried(transport, delays):
+    client = build_client(transport, max_attempts=3)
+    transport.statuses = [404]
+
+    with pytest.raises(MantisHTTPReponseClientError):
+        client.projects.get_all()
+
+    assert len(transport.requests) == 1
@@ -0,0 +1,116 @@
+import threading
+
+import pytest
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from mantis import MantisBT
+
+from .fake_transport import BASE_URL, TOKEN
+
+
+class RecordingSession(Session):
+    closed = []
+
+    def close(self):
+        self.closed.append(self)
+        super().close()
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    RecordingSession.closed = []
+    monkeypatch.setattr('mantis._requests.mantis_requests.Session', RecordingSession)
+    return RecordingSession.closed
+
+
+def test_pool_settings():
+    client = MantisBT(BASE_URL, TOKEN, pool_connections=3, pool_maxsize=20, max_retries=2)
+    requests = client._requests
+
+    adapter = requests._session.get_adapter(BASE_URL)
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter is requests.transport
+    assert adapter is requests._session.get_adapter('https://mantis.local/')
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 20
+    assert adapter.max_retries.total == 2
+    assert adapter.poolmanager.connection_pool_kw['maxsize'] == 20
+
+
+def test_custom_transport(client, transport):
+    assert client._requests._session.get_adapter(BASE_URL) is transport
+
+    client.projects.get_all()
+    assert transport.paths() == ['projects']
+
+
+def test_shared_session(client):
+    sessions = []
+    threads = [threading.Thread(target=lambda: sessions.append(client._requests._session))
+               for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(session is client._requests._session for session in sessions)
+
+
+def test_session_per_thread(transport):
+    client = MantisBT(BASE_URL, TOKEN, transport=transport, session_per_thread=True)
+    requests = client._requests
+    barrier = threading.Barrier(3)
+    sessions = []
+
+    def _run(issue_id):
+        session = requests._session
+        # The same session in the same thread
+        assert requests._session is session
+        sessions.append(session)
+        barrier.wait()
+        client.issues.get_by_id(issue_id)
+
+    threads = [threading.Thread(target=_run, args=(issue_id,)) for issue_id in (1, 2, 3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(session) for session in sessions}) == 3
+    # The transport (and its connections) is shared
+    assert all(session.get_adapter(BASE_URL) is transport for session in sessions)
+    assert len(transport.requests) == 3
+
+
+def test_close_closes_all_sessions(transport, sessions):
+    client = MantisBT(BASE_URL, TOKEN, transport=transport, session_per_thread=True)
+    requests = client._requests
+    created = [requests._session]
+
+    def _run():
+        created.append(requests._session)
+
+    threads = [threading.Thread(target=_run) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    client.close()
+
+    assert len(created) == 3
+    assert {id(session) for session in sessions} == {id(session) for session in created}
+
+
+def test_close_shared_session(transport, sessions, monkeypatch):
+    closed = []
+    monkeypatch.setattr(transport, 'close', lambda: closed.append(transport))
+    client = MantisBT(BASE_URL, TOKEN, transport=transport)
+    session = client._requests._session
+
+    client.close()
+
+    assert sessions == [session]
+    # The connections of the transport are closed too
+    assert closed
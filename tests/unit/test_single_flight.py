@@ -0,0 +1,95 @@
+import asyncio
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mantis import AsyncMantisBT, MantisBT, MantisHTTPReponseClientError, SingleFlight
+
+from .fake_transport import BASE_URL, TOKEN
+
+
+@pytest.fixture
+def single_flight():
+    return SingleFlight()
+
+
+@pytest.fixture
+def requests(transport, single_flight):
+    return MantisBT(BASE_URL, TOKEN, transport=transport, single_flight=single_flight)._requests
+
+
+def run_threads(func, count=8):
+    barrier = threading.Barrier(count)
+
+    def _run(_):
+        barrier.wait()
+        try:
+            return func()
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        return list(executor.map(_run, range(count)))
+
+
+def test_identical_requests_share_the_response(requests, transport, single_flight):
+    transport.delay = 0.1
+
+    responses = run_threads(lambda: requests.http_get('issues/1'))
+
+    assert len(transport.requests) == 1
+    assert all(response is responses[0] for response in responses)
+    assert (single_flight.calls, single_flight.executed, single_flight.deduplicated) == (8, 1, 7)
+    assert single_flight.in_flight == 0
+
+
+def test_the_response_is_not_kept(requests, transport, single_flight):
+    requests.http_get('issues/1')
+    requests.http_get('issues/1')
+
+    assert len(transport.requests) == 2
+    assert single_flight.deduplicated == 0
+
+
+def test_different_params_are_not_coalesced(requests, transport):
+    transport.delay = 0.1
+    pages = itertools.count(1)
+
+    run_threads(lambda: requests.http_get('issues', {'page': next(pages)}))
+
+    assert len(transport.requests) == 8
+
+
+def test_errors_are_shared(requests, transport, single_flight):
+    transport.delay = 0.1
+
+    errors = run_threads(lambda: requests.http_get('issues/999'))
+
+    assert len(transport.requests) == 1
+    assert all(isinstance(error, MantisHTTPReponseClientError) for error in errors)
+
+
+def test_updates_are_not_coalesced(requests, transport):
+    transport.delay = 0.05
+
+    run_threads(lambda: requests.http_patch('issues/1', {'summary': 'changed'}), count=4)
+
+    assert len(transport.paths('PATCH')) == 4
+
+
+def test_asyncio_tasks_share_the_response(transport, single_flight):
+    transport.delay = 0.05
+
+    async def main():
+        async with AsyncMantisBT(BASE_URL, TOKEN, transport=transport,
+                                 single_flight=single_flight) as client:
+            return await asyncio.gather(*[
+                client.projects.get_all() for _ in range(5)])
+
+    results = asyncio.run(main())
+
+    assert transport.paths() == ['projects']
+    assert all([project.id for project in projects] == [1, 2, 3] for projects in results)
+    assert single_flight.deduplicated == 4